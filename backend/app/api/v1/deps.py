@@ -2,53 +2,138 @@
 의존성 주입 (Dependency Injection)
 
 FastAPI의 Depends를 사용하여:
-- 데이터베이스 세션 관리
+- 데이터베이스 세션 관리 (쓰기용 get_db, 조회용 get_db_readonly → 복제본 라우팅)
 - Clerk 인증 검증
 - 현재 사용자 조회
 """
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status, Header
+import asyncio
+import hashlib
+import logging
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, HTTPException, Request, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.exc import OperationalError, InterfaceError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import AsyncSessionLocal
+from app.db.session import AsyncSessionLocal, AsyncReadOnlySessionLocal, LazyAsyncSession, replica_router
 from app.core.clerk import verify_clerk_token, get_clerk_user
 from app.crud.account import account as account_crud
+from app.crud.loader import DataLoader
 from app.models.account import Account
 
+logger = logging.getLogger(__name__)
+
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer(auto_error=False)
 
 
-async def get_db() -> Generator:
+# DB 연결 실패로 볼 예외 (이 경우에만 503으로 변환)
+_DB_CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, OperationalError, InterfaceError)
+
+
+def _sticky_key(request: Optional[Request]) -> Optional[str]:
     """
-    데이터베이스 세션 의존성
-    
-    각 요청마다 DB 세션을 생성하고, 요청 끝나면 자동으로 닫습니다.
+    read-your-writes 판단용 요청자 키
+
+    인증 토큰이 있으면 토큰 해시, 없으면 클라이언트 IP를 사용합니다.
+    """
+    if request is None:
+        return None
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return "auth:" + hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    if request.client:
+        return "ip:" + request.client.host
+    return None
+
+
+@asynccontextmanager
+async def _db_session(factory, *, read_only: bool, sticky_key: Optional[str] = None, bind=None):
+    """
+    요청 단위 DB 세션 관리
     
-    Yields:
-        AsyncSession: 데이터베이스 세션
+    - 세션은 처음 사용할 때 만들어짐 (LazyAsyncSession)
+    - 쓰기 세션은 정상 종료 시 commit, 읽기 전용 세션은 commit 없이 종료
+    - 쓰기가 있었던 요청은 sticky_key를 기록해서 잠시 동안 Primary에서 읽도록 함
+    - 예외 시 rollback, DB 연결 실패만 503으로 변환 (HTTPException 등은 그대로 전달)
     """
+    session = LazyAsyncSession(factory)
     try:
-        async with AsyncSessionLocal() as session:
-            try:
-                yield session
-                await session.commit()
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
-    except Exception as e:
+        yield session
+        if not read_only:
+            await session.commit()
+            if sticky_key and session.is_started and session.info.get("has_writes"):
+                await replica_router.sticky.mark_write(sticky_key)
+    except _DB_CONNECTION_ERRORS as e:
         # PostgreSQL 연결 실패 시 예외 처리
-        # Redis만 사용하는 엔드포인트에서는 이 오류가 발생하지 않아야 함
-        import logging
-        logger = logging.getLogger(__name__)
+        # Redis만 사용하는 엔드포인트에서는 세션을 만들지 않으므로 이 오류가 발생하지 않음
         logger.warning(f"⚠️ 데이터베이스 연결 실패: {e}")
+        # 복제본 연결 실패면 다음 헬스체크 전까지 라우팅에서 제외
+        replica_router.mark_unhealthy(bind)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="데이터베이스 연결에 실패했습니다. 잠시 후 다시 시도해주세요."
         )
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        # 읽기 전용 트랜잭션은 close 시 롤백됨
+        await session.close()
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    데이터베이스 세션 의존성 (Primary)
+    
+    각 요청마다 DB 세션을 생성하고, 요청 끝나면 자동으로 커밋 후 닫습니다.
+    세션을 실제로 사용하지 않은 요청은 커넥션을 가져오지 않습니다.
+    
+    Yields:
+        AsyncSession: 데이터베이스 세션
+    """
+    async with _db_session(
+        AsyncSessionLocal,
+        read_only=False,
+        sticky_key=_sticky_key(request) if replica_router.enabled else None
+    ) as session:
+        yield session
+
+
+async def get_db_readonly(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    읽기 전용 데이터베이스 세션 의존성
+    
+    조회만 하는 API용입니다.
+    - 트랜잭션을 `SET TRANSACTION READ ONLY`로 시작 (쓰기 쿼리는 에러)
+    - 요청이 끝나도 commit하지 않음
+    - 세션을 실제로 사용하지 않은 요청은 커넥션을 가져오지 않음
+    - 복제본이 설정되어 있으면 라운드로빈으로 복제본 사용
+      (같은 사용자가 최근에 쓰기를 했으면 Primary 사용)
+    
+    Yields:
+        AsyncSession: 읽기 전용 데이터베이스 세션
+    """
+    bind = None
+    factory = AsyncReadOnlySessionLocal
+    if replica_router.enabled:
+        bind = await replica_router.engine_for_read(_sticky_key(request))
+        factory = partial(AsyncReadOnlySessionLocal, bind=bind)
+
+    async with _db_session(factory, read_only=True, bind=bind) as session:
+        yield session
+
+
+def get_loader(db: AsyncSession = Depends(get_db)) -> DataLoader:
+    """
+    요청 단위 DataLoader 의존성
+    
+    같은 요청의 get_db 세션을 공유하며, 같은 틱에 들어온 기본키 조회를
+    모델별 쿼리 한 번(WHERE pk = ANY(:ids))으로 합칩니다.
+    """
+    return DataLoader(db)
 
 
 async def get_current_user(
@@ -107,10 +192,11 @@ async def get_current_user(
             }
         )
     
-    # DB에서 사용자 조회
-    user = await account_crud.get_by_clerk_user_id(
+    # DB에서 사용자 조회 + 마지막 로그인 시간 기록 (UPDATE ... RETURNING 한 번, 커밋은 get_db가 처리)
+    user = await account_crud.update_last_login(
         db,
-        clerk_user_id=clerk_user_id
+        clerk_user_id=clerk_user_id,
+        commit=False
     )
     
     if not user:
@@ -165,13 +251,16 @@ async def get_current_user(
         nickname = nickname[:50] if nickname else "사용자"
         
         try:
-            # 새 사용자 생성
-            user = await account_crud.create_from_clerk(
+            # 새 사용자 생성 (INSERT ... ON CONFLICT ... RETURNING 한 번)
+            # 웹훅이 먼저 만들었으면 웹훅이 저장한 정보를 그대로 사용
+            user = await account_crud.upsert_from_clerk(
                 db,
                 clerk_user_id=clerk_user_id,
                 email=email,
                 nickname=nickname,
-                profile_image_url=profile_image_url
+                profile_image_url=profile_image_url,
+                update_existing=False,
+                touch_login=True
             )
             logger.info(f"사용자 자동 생성 완료: {user.account_id}, email={email}, nickname={nickname}")
         except Exception as e:
@@ -183,9 +272,16 @@ async def get_current_user(
                     "message": f"사용자 생성에 실패했습니다: {str(e)}"
                 }
             )
-    
-    # 마지막 로그인 시간 업데이트
-    await account_crud.update_last_login(db, clerk_user_id=clerk_user_id)
+        
+        if user.is_deleted:
+            # 소프트 삭제된 계정은 자동으로 복구하지 않음
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail={
+                    "code": "ACCOUNT_DELETED",
+                    "message": "삭제된 계정입니다."
+                }
+            )
     
     return user
 
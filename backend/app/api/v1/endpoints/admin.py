@@ -4,16 +4,28 @@
 DB 조회 및 관리 기능을 제공합니다.
 개발/테스트 환경에서만 사용하세요.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import literal_column, select, table, text
 from typing import List, Optional
 
-from app.api.v1.deps import get_db
+from app.api.v1.deps import get_db, get_db_readonly
+from app.core.metrics import metrics
+from app.crud.account import account as account_crud
 from app.models.account import Account
+from app.db.session import replica_router
+from app.services.table_export import EXPORT_EXTENSIONS, EXPORT_MEDIA_TYPES, arrow_available, export_table_stream
+from app.services.table_stats import count_rows
+from app.utils.pagination import InvalidCursorError
 
 router = APIRouter()
 
+# 조회를 허용하는 테이블 목록 (SQL Injection 방지)
+ALLOWED_TABLES = ["accounts", "states", "cities", "apartments", "transactions",
+                  "favorite_apartments", "favorite_locations", "my_properties",
+                  "house_prices", "recent_searches"]
+
 
 @router.get(
     "/accounts",
@@ -24,28 +36,55 @@ router = APIRouter()
 async def get_all_accounts(
     skip: int = 0,
     limit: int = 100,
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    count_mode: str = Query("estimate", pattern="^(estimate|exact|none)$"),
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     모든 계정 조회 API
     
-    - skip: 건너뛸 레코드 수
+    - cursor: 이전 응답의 next_cursor (커서 페이지네이션, 권장)
+    - skip: 건너뛸 레코드 수 (cursor가 없을 때만 사용, 뒤 페이지일수록 느림)
     - limit: 가져올 레코드 수 (최대 100)
+    - count_mode: total 계산 방식 (estimate: 통계 기반 추정, exact: COUNT(*), none: 계산 안 함)
+    
+    최신 가입순 (created_at, account_id 내림차순)으로 정렬합니다.
     """
-    result = await db.execute(
-        select(Account)
-        .where(Account.is_deleted == False)
-        .offset(skip)
-        .limit(min(limit, 100))
-        .order_by(Account.created_at.desc())
-    )
-    accounts = result.scalars().all()
+    limit = min(limit, 100)
+    next_cursor = None
+    
+    if cursor or skip == 0:
+        # 커서 페이지네이션: 몇 번째 페이지든 첫 페이지와 비용이 같음
+        try:
+            accounts, next_cursor = await account_crud.get_multi_keyset(
+                db,
+                order_by=[Account.created_at.desc(), Account.account_id.desc()],
+                cursor=cursor,
+                limit=limit,
+                filters=[Account.is_deleted == False]
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "INVALID_CURSOR", "message": str(e)}
+            )
+    else:
+        result = await db.execute(
+            select(Account)
+            .where(Account.is_deleted == False)
+            .order_by(Account.created_at.desc(), Account.account_id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        accounts = result.scalars().all()
     
-    # 총 개수 조회
-    count_result = await db.execute(
-        select(text("COUNT(*)")).select_from(Account).where(Account.is_deleted == False)
+    # 총 개수 조회 (기본은 EXPLAIN 추정값, 캐시됨)
+    total, total_is_estimate = await count_rows(
+        db,
+        select(Account.account_id).where(Account.is_deleted == False),
+        mode=count_mode,
+        cache_key="accounts:active"
     )
-    total = count_result.scalar()
     
     return {
         "success": True,
@@ -65,8 +104,10 @@ async def get_all_accounts(
                 for acc in accounts
             ],
             "total": total,
+            "total_is_estimate": total_is_estimate,
             "skip": skip,
-            "limit": limit
+            "limit": limit,
+            "next_cursor": next_cursor
         }
     }
 
@@ -79,7 +120,7 @@ async def get_all_accounts(
 )
 async def get_account_by_id(
     account_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     특정 계정 조회 API
@@ -261,7 +302,7 @@ async def hard_delete_account(
     description="DB에 있는 모든 테이블 목록을 조회합니다."
 )
 async def get_tables(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     테이블 목록 조회 API
@@ -294,29 +335,40 @@ async def get_tables(
 async def query_table(
     table_name: str,
     limit: int = 50,
-    db: AsyncSession = Depends(get_db)
+    count_mode: str = Query("estimate", pattern="^(estimate|exact|none)$"),
+    sample: Optional[float] = Query(None, gt=0, le=100, description="무작위 샘플 비율 (%)"),
+    sample_method: str = Query("system", pattern="^(system|bernoulli)$"),
+    seed: Optional[int] = Query(None, description="같은 값이면 같은 샘플 (REPEATABLE)"),
+    db: AsyncSession = Depends(get_db_readonly)
 ):
     """
     테이블 데이터 조회 API
     
+    - count_mode: total 계산 방식 (estimate: pg_class 통계, exact: COUNT(*), none: 계산 안 함)
+    - sample: 지정하면 TABLESAMPLE로 무작위 행을 가져옴
+      (system: 블록 단위라 빠름, bernoulli: 행 단위라 더 고르지만 전체를 읽음)
+    
     주의: SQL Injection 방지를 위해 테이블명 화이트리스트 적용
     """
-    # 허용된 테이블 목록 (SQL Injection 방지)
-    allowed_tables = ["accounts", "states", "cities", "apartments", "transactions", 
-                      "favorite_apartments", "favorite_locations", "my_properties", 
-                      "house_prices", "recent_searches"]
-    
-    if table_name not in allowed_tables:
+    if table_name not in ALLOWED_TABLES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "INVALID_TABLE", "message": f"허용되지 않은 테이블입니다. 허용: {allowed_tables}"}
+            detail={"code": "INVALID_TABLE", "message": f"허용되지 않은 테이블입니다. 허용: {ALLOWED_TABLES}"}
         )
     
     try:
         # 테이블 데이터 조회
+        params = {"limit": min(limit, 100)}
+        sample_clause = ""
+        if sample is not None:
+            sample_clause = f" TABLESAMPLE {sample_method.upper()} (:sample)"
+            params["sample"] = sample
+            if seed is not None:
+                sample_clause += " REPEATABLE (:seed)"
+                params["seed"] = seed
         result = await db.execute(
-            text(f"SELECT * FROM {table_name} LIMIT :limit"),
-            {"limit": min(limit, 100)}
+            text(f"SELECT * FROM {table_name}{sample_clause} LIMIT :limit"),
+            params
         )
         rows = result.fetchall()
         columns = result.keys()
@@ -333,9 +385,14 @@ async def query_table(
                 row_dict[col] = value
             data.append(row_dict)
         
-        # 총 개수 조회
-        count_result = await db.execute(text(f"SELECT COUNT(*) FROM {table_name}"))
-        total = count_result.scalar()
+        # 총 개수 조회 (기본은 pg_class.reltuples 추정값, 캐시됨)
+        total, total_is_estimate = await count_rows(
+            db,
+            select(literal_column("1")).select_from(table(table_name)),
+            mode=count_mode,
+            cache_key=table_name,
+            table_name=table_name
+        )
         
         return {
             "success": True,
@@ -344,7 +401,9 @@ async def query_table(
                 "columns": list(columns),
                 "rows": data,
                 "total": total,
-                "limit": limit
+                "total_is_estimate": total_is_estimate,
+                "limit": limit,
+                "sample": sample
             }
         }
     except Exception as e:
@@ -352,3 +411,80 @@ async def query_table(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"code": "QUERY_ERROR", "message": str(e)}
         )
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="서버 메트릭 조회",
+    description="""
+    현재 워커 프로세스의 메트릭을 조회합니다. (커넥션 풀 사용량, 대기 시간, 타임아웃 등)
+    
+    - format=json: JSON 응답 (기본값)
+    - format=prometheus: Prometheus 텍스트 형식
+    - prefix: 메트릭 이름 접두사로 필터링 (예: db_pool_)
+    
+    ⚠️ uvicorn 워커별로 따로 집계됩니다.
+    """
+)
+async def get_metrics(
+    format: str = Query("json", pattern="^(json|prometheus)$"),
+    prefix: str = ""
+):
+    """
+    메트릭 조회 API
+    """
+    if format == "prometheus":
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+    
+    return {
+        "success": True,
+        "data": metrics.snapshot(prefix)
+    }
+
+
+@router.get(
+    "/db/export",
+    status_code=status.HTTP_200_OK,
+    summary="테이블 전체 내보내기 (스트리밍)",
+    description="""
+    허용된 테이블 전체를 스트리밍으로 내려받습니다. (개발용)
+    
+    - format=ndjson: 한 줄에 JSON 객체 하나 (기본값)
+    - format=csv: 첫 줄 컬럼명, UTF-8 BOM 포함
+    - format=arrow: Arrow IPC 스트림 (서버에 pyarrow 필요)
+    
+    서버 사이드 커서로 batch_size 행씩 읽어서 바로 내보내므로 테이블 크기와 관계없이
+    서버 메모리 사용량이 일정합니다.
+    """
+)
+async def export_table(
+    table_name: str,
+    format: str = Query("ndjson", pattern="^(ndjson|csv|arrow)$"),
+    batch_size: int = Query(5000, ge=100, le=50000),
+    limit: Optional[int] = Query(None, ge=1, description="최대 행 수 (없으면 전체)")
+):
+    """
+    테이블 스트리밍 내보내기 API
+    
+    주의: SQL Injection 방지를 위해 테이블명 화이트리스트 적용
+    """
+    if table_name not in ALLOWED_TABLES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_TABLE", "message": f"허용되지 않은 테이블입니다. 허용: {ALLOWED_TABLES}"}
+        )
+    if format == "arrow" and not arrow_available():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "FORMAT_UNAVAILABLE", "message": "Arrow 형식을 사용하려면 서버에 pyarrow를 설치하세요."}
+        )
+    
+    # 세션은 스트림 안에서 만들기 때문에 (의존성은 본문 전송 전에 정리됨) 엔진만 여기서 고름
+    bind = await replica_router.engine_for_read(None) if replica_router.enabled else None
+    filename = f"{table_name}.{EXPORT_EXTENSIONS[format]}"
+    return StreamingResponse(
+        export_table_stream(table_name, format, batch_size=batch_size, limit=limit, bind=bind),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
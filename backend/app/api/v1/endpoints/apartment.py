@@ -0,0 +1,222 @@
+"""
+아파트 상세 API 엔드포인트
+
+담당 기능:
+- 평당가 추이 차트 (GET /apartments/{apt_id}/price-trend) - P0
+- 거래량 추이 차트 (GET /apartments/{apt_id}/volume-trend) - P1
+- 주변 단지 비교 (GET /apartments/{apt_id}/nearby-comparison) - P2
+- 유사 단지 추천 (GET /apartments/{apt_id}/similar) - P2
+
+추이 차트는 실거래 원본이 아니라 월별 집계 테이블(transaction_monthly_stats)을 읽습니다.
+(app/services/monthly_stats.py가 실거래 적재 때 바뀐 달만 갱신)
+주변 단지 비교는 PostGIS KNN으로 찾은 이웃 집합을 캐시하고 시세는 월별 집계에서 읽습니다.
+유사 단지 추천은 프로세스 메모리의 특성 행렬에서 계산합니다. (app/services/similar.py)
+"""
+from datetime import date
+from typing import Optional
+
+from dateutil.relativedelta import relativedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.deps import get_db_readonly
+from app.crud.transaction_stat import transaction_stat as transaction_stat_crud
+from app.models.transaction_stat import ALL_AREAS, AREA_BUCKETS, area_bucket_of
+from app.services.nearby import get_nearby_comparison
+from app.services.similar import find_similar
+
+router = APIRouter()
+
+# 기간 → 개월 수
+TREND_PERIOD_MONTHS = {"1y": 12, "2y": 24, "3y": 36, "5y": 60}
+
+TREND_META = {
+    "data_source": "국토교통부",
+    "disclaimer": "본 서비스는 과거 데이터 기반 시각화이며 투자 판단/권유를 제공하지 않습니다."
+}
+
+
+def _trend_since(period: str) -> date:
+    """기간의 첫 달 1일 (이번 달 포함)"""
+    this_month = date.today().replace(day=1)
+    return this_month - relativedelta(months=TREND_PERIOD_MONTHS[period] - 1)
+
+
+def _area_range(area_bucket: int) -> Optional[dict]:
+    """전용면적 구간 → {min, max} (㎡, 전체면 None)"""
+    if area_bucket == ALL_AREAS:
+        return None
+    lower = None
+    for bucket, upper in AREA_BUCKETS:
+        if bucket == area_bucket:
+            return {"min": lower, "max": upper}
+        lower = upper
+    return None
+
+
+@router.get(
+    "/{apt_id}/price-trend",
+    status_code=status.HTTP_200_OK,
+    summary="평당가 추이",
+    description="""
+    월별 평균 평당가(만원/평) 추이를 반환합니다. 거래가 있는 달만 포함됩니다.
+
+    - exclusive_area를 주면 그 면적이 속한 전용면적 구간
+      (60㎡ 이하 / 85 / 102 / 135 / 135㎡ 초과)의 거래만 집계합니다.
+    - trans_type=JEONSE / MONTHLY이면 보증금 기준 평당가입니다.
+    """
+)
+async def get_price_trend(
+    apt_id: int,
+    period: str = Query("2y", pattern="^(1y|2y|3y|5y)$", description="기간 (1y, 2y, 3y, 5y)"),
+    exclusive_area: Optional[float] = Query(None, gt=0, description="전용면적 필터 (㎡)"),
+    trans_type: str = Query("SALE", pattern="^(SALE|JEONSE|MONTHLY)$", description="거래 유형"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    평당가 추이 API
+
+    ### Response
+    - data_points[].date: YYYY-MM
+    - data_points[].avg_price_per_pyeong / median_price_per_pyeong / min / max: 만원/평
+    - data_points[].transaction_count: 거래 건수
+    """
+    area_bucket = ALL_AREAS if exclusive_area is None else area_bucket_of(exclusive_area)
+    data_points = await transaction_stat_crud.get_price_trend(
+        db,
+        apt_id=apt_id,
+        trans_type=trans_type,
+        area_bucket=area_bucket,
+        since=_trend_since(period)
+    )
+    return {
+        "success": True,
+        "data": {
+            "apt_id": apt_id,
+            "chart_type": "price_trend",
+            "period": period,
+            "trans_type": trans_type,
+            "area_range": _area_range(area_bucket),
+            "data_points": data_points,
+            "unit": "만원/평"
+        },
+        "meta": TREND_META
+    }
+
+
+@router.get(
+    "/{apt_id}/volume-trend",
+    status_code=status.HTTP_200_OK,
+    summary="거래량 추이",
+    description="월별 매매 / 전세 / 월세 거래 건수를 반환합니다. 거래가 없는 달은 0으로 채웁니다."
+)
+async def get_volume_trend(
+    apt_id: int,
+    period: str = Query("2y", pattern="^(1y|2y|3y|5y)$", description="기간 (1y, 2y, 3y, 5y)"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    거래량 추이 API
+    """
+    since = _trend_since(period)
+    counts = await transaction_stat_crud.get_monthly_counts(db, apt_id=apt_id, since=since)
+
+    data_points = []
+    for offset in range(TREND_PERIOD_MONTHS[period]):
+        month = since + relativedelta(months=offset)
+        month_counts = counts.get(month, {})
+        data_points.append({
+            "month": month.strftime("%Y-%m"),
+            "sale_count": month_counts.get("SALE", 0),
+            "jeonse_count": month_counts.get("JEONSE", 0),
+            "monthly_count": month_counts.get("MONTHLY", 0)
+        })
+
+    return {
+        "success": True,
+        "data": {
+            "apt_id": apt_id,
+            "chart_type": "volume_trend",
+            "period": period,
+            "data_points": data_points
+        },
+        "meta": TREND_META
+    }
+
+
+@router.get(
+    "/{apt_id}/nearby-comparison",
+    status_code=status.HTTP_200_OK,
+    summary="주변 단지 비교",
+    description="""
+    반경(기본 500m) 안의 단지를 가까운 순으로 반환하고 평당가를 비교합니다.
+
+    - price_per_pyeong: 최근 매매가 있었던 가장 최근 달의 평균 평당가 (만원/평, price_month)
+    - difference_rate: 대상 단지 대비 차이 (%), 어느 한쪽 시세가 없으면 null
+    """
+)
+async def get_apartment_nearby_comparison(
+    apt_id: int,
+    radius: int = Query(500, ge=100, le=2000, description="반경 (미터)"),
+    limit: int = Query(10, ge=1, le=30, description="최대 단지 수"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    주변 단지 비교 API
+    """
+    comparison = await get_nearby_comparison(db, apt_id, radius=radius, limit=limit)
+    if comparison is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "APARTMENT_NOT_FOUND", "message": "아파트를 찾을 수 없습니다."}
+        )
+    return {
+        "success": True,
+        "data": comparison,
+        "meta": {
+            "radius": radius,
+            "count": len(comparison["nearby_apartments"]),
+            "data_source": "국토교통부"
+        }
+    }
+
+
+@router.get(
+    "/{apt_id}/similar",
+    status_code=status.HTTP_200_OK,
+    summary="유사 단지 추천",
+    description="""
+    세대수, 준공연도, 최고층, 세대당 주차대수, 난방방식, 지하철 도보시간, 평당가 수준이
+    비슷한 단지를 유사한 순으로 반환합니다.
+
+    - similarity: 0~1, 1에 가까울수록 유사
+    - same_region=true이면 같은 시군구 안에서만 찾습니다.
+    """
+)
+async def get_similar_apartments(
+    apt_id: int,
+    limit: int = Query(5, ge=1, le=30, description="추천 단지 수"),
+    same_region: bool = Query(False, description="같은 시군구 안에서만 추천"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    유사 단지 추천 API
+    """
+    result = await find_similar(db, apt_id, limit=limit, same_sigungu=same_region)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "APARTMENT_NOT_FOUND", "message": "아파트를 찾을 수 없습니다."}
+        )
+    return {
+        "success": True,
+        "data": {
+            "target_apartment": result["target"],
+            "similar_apartments": result["similar_apartments"]
+        },
+        "meta": {
+            "same_region": same_region,
+            "count": len(result["similar_apartments"]),
+            "catalog_version": result["version"]
+        }
+    }
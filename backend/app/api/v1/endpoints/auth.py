@@ -6,6 +6,8 @@ Clerk 인증을 사용하므로:
 - 웹훅: Clerk → 백엔드 사용자 동기화
 - 프로필: 백엔드에서 조회/수정
 """
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status, Header, Request, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,8 +18,15 @@ from app.schemas.account import (
     ClerkWebhookEvent
 )
 from app.services.auth import auth_service
+from app.crud.account import account as account_crud
 from app.models.account import Account
 from app.core.clerk import verify_webhook_signature
+from app.core.clerk_client import get_clerk_client
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.services.webhook_queue import enqueue_webhook_event
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -44,6 +53,11 @@ router = APIRouter()
     ### 보안
     - `svix_signature` 헤더를 사용하여 요청이 실제로 Clerk에서 온 것인지 검증합니다.
     - 서명 검증 실패 시 401 에러를 반환합니다.
+    
+    ### 큐 모드 (`WEBHOOK_QUEUE_ENABLED=true`)
+    - 서명 검증 후 이벤트를 Redis Stream에 넣고 바로 응답합니다 (`queued: true`).
+    - DB 반영은 웹훅 워커(`scripts/webhook_worker.py`)가 `svix_id` 중복 제거 후 배치로 처리합니다.
+    - Redis에 넣지 못하면 기존처럼 즉시 처리합니다.
     """,
     responses={
         200: {
@@ -105,7 +119,7 @@ async def clerk_webhook(
     - user.deleted: 사용자 삭제
     
     ### 웹훅 서명 검증
-    - svix_signature 헤더를 사용하여 요청이 실제로 Clerk에서 온 것인지 검증합니다.
+    - svix-id, svix-timestamp, svix-signature 헤더로 요청이 실제로 Clerk에서 온 것인지 검증합니다. (실패 시 401, 큐에 넣지 않음)
     
     ### 처리 이벤트
     - **user.created**: 백엔드 DB에 새 사용자 생성
@@ -118,11 +132,13 @@ async def clerk_webhook(
     3. 이벤트 선택: user.created, user.updated, user.deleted
     4. Webhook Secret을 환경변수 CLERK_WEBHOOK_SECRET에 설정
     """
-    # 웹훅 서명 검증
+    # 웹훅 서명 검증 (큐에 넣기 전에, 파싱 전 원본 본문으로)
     body = await request.body()
     if not verify_webhook_signature(
-        payload=body.decode("utf-8"),
-        signature=svix_signature
+        body,
+        svix_id=svix_id,
+        svix_timestamp=svix_timestamp,
+        svix_signature=svix_signature
     ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -132,13 +148,14 @@ async def clerk_webhook(
             }
         )
     
-    # 이벤트 타입에 따라 처리
-    user_data = event.data
-    clerk_user_id = user_data.id
+    # 이벤트에서 프로필 추출
+    profile = auth_service.build_profile_from_webhook(event.data)
+    clerk_user_id = profile["clerk_user_id"]
+    email = profile["email"]
+    nickname = profile["nickname"]
     
-    # 이메일 추출 (첫 번째 이메일 사용)
-    email = user_data.email_addresses[0].email_address if user_data.email_addresses else None
-    if not email:
+    # 생성/수정 이벤트는 이메일이 필수 (삭제 이벤트에는 id만 포함됨)
+    if event.type in ("user.created", "user.updated") and not email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -147,31 +164,29 @@ async def clerk_webhook(
             }
         )
     
-    # 닉네임 추출 (소셜 로그인 지원)
-    # 우선순위: username > first_name + last_name > first_name > 이메일 앞부분
-    nickname = None
-    
-    # 1. username이 있으면 사용 (사용자가 직접 설정한 경우)
-    if user_data.username:
-        nickname = user_data.username
-    # 2. first_name과 last_name이 있으면 조합 (소셜 로그인 시)
-    elif user_data.first_name or user_data.last_name:
-        first_name = user_data.first_name or ""
-        last_name = user_data.last_name or ""
-        nickname = f"{first_name} {last_name}".strip()
-    # 3. first_name만 있으면 사용
-    elif user_data.first_name:
-        nickname = user_data.first_name
-    # 4. 이메일 앞부분 사용 (기본값)
-    else:
-        nickname = email.split("@")[0] if email else "사용자"
-    
-    # 닉네임이 없거나 비어있으면 기본값 설정
-    if not nickname or not nickname.strip():
-        nickname = email.split("@")[0] if email else "사용자"
+    # 프로필이 바뀌었을 수 있으므로 Clerk 사용자 캐시 무효화
+    get_clerk_client().invalidate(clerk_user_id)
     
-    # 닉네임 길이 제한 (DB 필드 크기에 맞춤: 최대 50자)
-    nickname = nickname[:50] if nickname else "사용자"
+    # 큐 모드: Redis Stream에 넣고 바로 응답 (DB 반영은 웹훅 워커가 배치로 처리)
+    # db 세션은 실제 쿼리 전까지 커넥션을 가져오지 않으므로 이 경로에서는 DB를 쓰지 않습니다.
+    if settings.WEBHOOK_QUEUE_ENABLED:
+        try:
+            await enqueue_webhook_event(
+                get_redis(),
+                svix_id=svix_id,
+                event_type=event.type,
+                profile=profile
+            )
+            return {
+                "success": True,
+                "data": {
+                    "message": "웹훅 이벤트가 접수되었습니다.",
+                    "queued": True
+                }
+            }
+        except Exception as e:
+            # Redis 장애 시 즉시 처리로 전환
+            logger.warning(f"웹훅 큐 추가 실패, 즉시 처리합니다: {e}")
     
     if event.type == "user.created":
         # 새 사용자 생성
@@ -180,7 +195,7 @@ async def clerk_webhook(
             clerk_user_id=clerk_user_id,
             email=email,
             nickname=nickname,
-            profile_image_url=user_data.image_url
+            profile_image_url=profile["profile_image_url"]
         )
         return {
             "success": True,
@@ -197,7 +212,7 @@ async def clerk_webhook(
             clerk_user_id=clerk_user_id,
             email=email,
             nickname=nickname,
-            profile_image_url=user_data.image_url
+            profile_image_url=profile["profile_image_url"]
         )
         return {
             "success": True,
@@ -208,21 +223,17 @@ async def clerk_webhook(
         }
     
     elif event.type == "user.deleted":
-        # 사용자 소프트 삭제
-        user = await auth_service.get_user_by_clerk_id(
+        # 사용자 소프트 삭제 (UPDATE ... RETURNING 한 번)
+        account_id = await account_crud.soft_delete_by_clerk_id(
             db,
             clerk_user_id=clerk_user_id
         )
-        if user:
-            # 소프트 삭제 구현 (is_deleted = True)
-            user.is_deleted = True
-            db.add(user)
-            await db.commit()
+        if account_id is not None:
             return {
                 "success": True,
                 "data": {
                     "message": "사용자가 삭제되었습니다.",
-                    "user_id": user.account_id
+                    "user_id": account_id
                 }
             }
         else:
@@ -0,0 +1,90 @@
+"""
+대시보드 API 엔드포인트
+
+담당 기능:
+- 랭킹 (GET /dashboard/rankings) - P1
+
+랭킹은 Redis 정렬 집합에서 바로 읽습니다. (app/services/rankings.py)
+Redis 장애 시 503 RANKINGS_UNAVAILABLE을 반환합니다.
+"""
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from redis.exceptions import RedisError
+
+from app.services.rankings import ALL_REGIONS, RANKING_TYPES, get_rankings, ranking_periods
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/rankings",
+    status_code=status.HTTP_200_OK,
+    summary="랭킹 조회",
+    description="""
+    상승률 / 하락률 / 거래량 / 가격 랭킹을 반환합니다. (매매 기준)
+
+    - rise / fall: 최근 기간과 직전 같은 길이 기간의 평균 평당가 변동률(%)
+      (두 기간 모두 거래가 RANKING_MIN_TRANSACTIONS건 이상인 단지만)
+    - volume: 최근 기간 매매 건수
+    - price_high / price_low: 최근 기간 평균 평당가 (만원/평)
+
+    region은 시군구 코드 5자리 (예: 11680), 없으면 전국입니다.
+    """
+)
+async def get_dashboard_rankings(
+    type: str = Query(..., pattern="^(rise|fall|volume|price_high|price_low)$", description="랭킹 유형"),
+    region: Optional[str] = Query(None, pattern=r"^\d{5}$", description="시군구 코드 5자리 (예: 11680)"),
+    period: str = Query("1m", description="기간 (1m, 3m)"),
+    skip: int = Query(0, ge=0, description="건너뛸 순위 수"),
+    limit: int = Query(10, ge=1, le=100, description="개수")
+):
+    """
+    랭킹 API
+
+    ### Response
+    - rankings[].rank / value: 순위와 랭킹 기준 값 (유형별 단위는 description 참고)
+    - meta.total: 해당 랭킹의 전체 단지 수 (페이지네이션용)
+    """
+    if period not in ranking_periods():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_PERIOD", "message": f"period는 {ranking_periods()} 중 하나여야 합니다."}
+        )
+
+    try:
+        result = await get_rankings(type, period=period, region=region or ALL_REGIONS, skip=skip, limit=limit)
+    except RedisError as e:
+        logger.warning(f"⚠️ 랭킹 조회 실패 (Redis): {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "RANKINGS_UNAVAILABLE", "message": "랭킹을 일시적으로 조회할 수 없습니다. 잠시 후 다시 시도해주세요."}
+        )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "RANKINGS_NOT_READY", "message": "랭킹 데이터가 아직 생성되지 않았습니다."}
+        )
+
+    metric, _ = RANKING_TYPES[type]
+    return {
+        "success": True,
+        "data": {
+            "ranking_type": type,
+            "rankings": result["rankings"]
+        },
+        "meta": {
+            "period": period,
+            "from_month": result["recent_from"][:7] if result["recent_from"] else None,
+            "to_month": result["base_month"][:7] if result["base_month"] else None,
+            "region": region,
+            "metric": metric,
+            "total": result["total"],
+            "skip": skip,
+            "limit": limit,
+            "data_source": "국토교통부"
+        }
+    }
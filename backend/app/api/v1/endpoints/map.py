@@ -0,0 +1,268 @@
+"""
+지도 API 엔드포인트
+
+담당 기능:
+- 지도 화면 내 아파트 마커 조회 (GET /map/apartments) - P0
+- 마커 클릭 시 아파트 요약 (GET /map/apartments/{apt_id}/summary) - P0
+- 아파트 벡터 타일 (GET /map/tiles/{z}/{x}/{y}.mvt)
+- 가격 히트맵 (GET /map/heatmap) - P2 (Redis 장애 시 503 HEATMAP_UNAVAILABLE)
+
+줌 레벨에 따라 응답 형태가 바뀝니다.
+- zoom >= MAP_MARKER_MIN_ZOOM: 개별 아파트 마커 (최대 MAP_MAX_MARKERS개)
+- zoom <  MAP_MARKER_MIN_ZOOM: 격자 클러스터 (칸별 개수 / 중심 / 평균가, 최대 MAP_MAX_CLUSTERS개)
+어느 줌에서도 응답 크기가 제한됩니다.
+결과는 지도 타일 단위로 Redis에 캐시합니다. (app/services/map_viewport.py)
+"""
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.deps import get_db_readonly
+from app.core.config import settings
+from app.services.apartment_summary import get_summary
+from app.services.heatmap import PERIOD_MONTHS, get_heatmap, grid_to_columns
+from app.services.map_tiles import (
+    TILE_MEDIA_TYPE,
+    get_dataset_state,
+    get_dataset_version,
+    get_tile,
+    is_valid_tile
+)
+from app.services.map_viewport import get_viewport_apartments
+from app.utils.geo import parse_bounds
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    "/apartments",
+    status_code=status.HTTP_200_OK,
+    summary="지도 화면 내 아파트 마커 조회",
+    description="""
+    현재 지도 화면(뷰포트) 안에 있는 아파트를 조회합니다.
+
+    - 확대된 화면: 개별 아파트 마커 (data.apartments)
+    - 축소된 화면: 격자 클러스터 (data.clusters) - 칸별 아파트 수, 중심 좌표, 평균 최근 매매가
+
+    bounds = 서쪽경도,남쪽위도,동쪽경도,북쪽위도 (예: 126.9,37.4,127.1,37.6)
+    """
+)
+async def get_map_apartments(
+    bounds: str = Query(..., description="지도 영역 (서,남,동,북)", example="126.9,37.4,127.1,37.6"),
+    zoom: int = Query(..., ge=1, le=21, description="지도 줌 레벨 (클수록 확대)"),
+    limit: int = Query(200, ge=1, description="최대 마커 수 (개별 마커 모드)"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    지도 뷰포트 아파트 조회 API
+
+    ### Response
+    - mode: marker (개별 마커) / cluster (격자 클러스터)
+    - meta.truncated: 최대 개수에 걸려 일부만 반환했는지 여부
+    """
+    try:
+        viewport = parse_bounds(bounds)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_BOUNDS", "message": str(e)}
+        )
+
+    result = await get_viewport_apartments(db, bounds=viewport, zoom=zoom, limit=limit)
+    meta = {
+        "count": len(result["apartments"]) or len(result["clusters"]),
+        "zoom_level": zoom,
+        "truncated": result["truncated"],
+        "cache": result["cache"]
+    }
+    if result["mode"] == "cluster":
+        meta["apartment_count"] = sum(c["count"] for c in result["clusters"])
+        meta["cell_px"] = settings.MAP_CLUSTER_CELL_PX
+    return {
+        "success": True,
+        "data": {
+            "mode": result["mode"],
+            "apartments": result["apartments"],
+            "clusters": result["clusters"]
+        },
+        "meta": meta
+    }
+
+
+@router.get(
+    "/apartments/{apt_id}/summary",
+    status_code=status.HTTP_200_OK,
+    summary="아파트 요약 정보 (마커 클릭)",
+    description="""
+    마커를 클릭했을 때 사이드바 / 바텀시트에 보여줄 간단한 아파트 정보를 반환합니다.
+
+    - 최근 매매 거래(가격 만원, 전용면적 ㎡, 거래일)와 평당가(만원)
+    - price_change: 최근 N개월과 그 이전 N개월의 평균 평당가 비교 (change_rate는 %)
+
+    미리 만들어 둔 요약 문서를 그대로 반환합니다. (실거래 적재 시 갱신)
+    """,
+    response_class=Response
+)
+async def get_apartment_summary(
+    apt_id: int,
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    아파트 요약 API
+
+    Redis의 요약 문서(JSON 바이트)를 파싱하지 않고 응답 본문에 바로 넣습니다.
+    캐시에 있으면 DB에 접속하지 않습니다. (세션은 첫 쿼리 때 연결)
+    """
+    raw = await get_summary(db, apt_id)
+    if raw is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "APARTMENT_NOT_FOUND", "message": "아파트를 찾을 수 없습니다."}
+        )
+    return Response(content=b'{"success":true,"data":' + raw + b"}", media_type="application/json")
+
+
+@router.get(
+    "/tiles/version",
+    status_code=status.HTTP_200_OK,
+    summary="벡터 타일 버전 조회",
+    description="현재 타일 데이터셋 버전과 버전이 들어간 타일 URL 템플릿을 반환합니다."
+)
+async def get_tiles_version():
+    """
+    벡터 타일 버전 API
+
+    프론트엔드는 tiles의 URL 템플릿을 지도 소스로 쓰고, 버전이 바뀌면 소스를 교체합니다.
+    같은 버전의 타일은 브라우저가 다시 요청하지 않습니다.
+    """
+    version = await get_dataset_version()
+    return {
+        "success": True,
+        "data": {
+            "version": version,
+            "tiles": f"{settings.API_V1_STR}/map/tiles/{{z}}/{{x}}/{{y}}.mvt?v={version}",
+            "layer": "apartments",
+            "minzoom": settings.MAP_TILE_MIN_ZOOM
+        }
+    }
+
+
+@router.get(
+    "/tiles/{z}/{x}/{y}.mvt",
+    status_code=status.HTTP_200_OK,
+    summary="아파트 벡터 타일",
+    description="""
+    아파트 마커 레이어를 Mapbox Vector Tile로 반환합니다. (레이어명: apartments)
+
+    속성: apt_id, apt_name, total_household_cnt, latest_price(만원), latest_deal_date
+
+    - v=현재 버전: 오래 캐시 (immutable)
+    - v 없음 / 이전 버전: 짧게 캐시 (MAP_TILE_MAX_AGE)
+    """,
+    response_class=Response
+)
+async def get_apartment_tile(
+    request: Request,
+    z: int,
+    x: int,
+    y: int,
+    v: Optional[int] = Query(None, description="타일 데이터셋 버전 (/map/tiles/version)"),
+    db: AsyncSession = Depends(get_db_readonly)
+):
+    """
+    아파트 벡터 타일 API
+
+    ETag(데이터셋 버전)를 보내므로 If-None-Match가 같으면 304를 반환합니다.
+    """
+    if not is_valid_tile(z, x, y):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_TILE", "message": "타일 좌표가 범위를 벗어났습니다."}
+        )
+
+    version, min_lsn = await get_dataset_state()
+    etag = f'"apartments-v{version}"'
+    if v == version:
+        cache_control = f"public, max-age={settings.MAP_TILE_VERSIONED_MAX_AGE}, immutable"
+    else:
+        cache_control = f"public, max-age={settings.MAP_TILE_MAX_AGE}"
+    headers = {"Cache-Control": cache_control, "ETag": etag}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # 버전을 올린 직후 복제본이 뒤처져 있으면 Primary에서 그림 (immutable 캐시에 이전 데이터 방지)
+    tile = await get_tile(db, z, x, y, version=version, min_lsn=min_lsn)
+    return Response(content=tile, media_type=TILE_MEDIA_TYPE, headers=headers)
+
+
+@router.get(
+    "/heatmap",
+    status_code=status.HTTP_200_OK,
+    summary="가격 히트맵 데이터",
+    description="""
+    격자 칸별 평당가 중앙값(type=price, 만원) 또는 거래량(type=volume)을 반환합니다.
+
+    배치(scripts/build_heatmap.py)가 미리 계산한 결과를 그대로 반환합니다.
+    요청 줌 이하에서 가장 가까운 미리 계산된 줌의 격자를 사용합니다.
+    응답은 컬럼 형식입니다. (cells.lng[i], cells.lat[i]가 i번째 칸 중심)
+    """
+)
+async def get_map_heatmap(
+    type: str = Query("price", pattern="^(price|volume)$", description="히트맵 유형"),
+    period: str = Query("3m", description="기간 (1m, 3m, 6m)"),
+    zoom: int = Query(11, ge=1, le=21, description="지도 줌 레벨"),
+    bounds: Optional[str] = Query(None, description="지도 영역 (서,남,동,북), 없으면 전체")
+):
+    """
+    가격 히트맵 API
+    """
+    if period not in PERIOD_MONTHS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "INVALID_PERIOD", "message": f"period는 {list(PERIOD_MONTHS)} 중 하나여야 합니다."}
+        )
+    viewport = None
+    if bounds is not None:
+        try:
+            viewport = parse_bounds(bounds)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={"code": "INVALID_BOUNDS", "message": str(e)}
+            )
+
+    try:
+        grid = await get_heatmap(period, zoom)
+    except RedisError as e:
+        logger.warning(f"⚠️ 히트맵 조회 실패 (Redis): {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "HEATMAP_UNAVAILABLE", "message": "히트맵을 일시적으로 조회할 수 없습니다. 잠시 후 다시 시도해주세요."}
+        )
+    if grid is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"code": "HEATMAP_NOT_READY", "message": "히트맵 데이터가 아직 생성되지 않았습니다."}
+        )
+
+    cells = grid.cells if viewport is None else grid.in_bounds(*viewport)
+    return {
+        "success": True,
+        "data": {
+            "type": type,
+            "period": period,
+            "zoom_level": grid.zoom,
+            "cell_size": {"lng": grid.cell_lng, "lat": grid.cell_lat},
+            "build_id": grid.build_id,
+            "cells": grid_to_columns(grid, cells, type)
+        },
+        "meta": {
+            "count": len(cells)
+        }
+    }
@@ -24,7 +24,7 @@ FastAPI 앱에 등록합니다.
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import auth, admin, test_api, search
+from app.api.v1.endpoints import auth, admin, test_api, search, map, apartment, dashboard
 
 # 메인 API 라우터 생성
 # 이 라우터에 모든 하위 라우터를 등록합니다
@@ -60,6 +60,8 @@ api_router.include_router(
 # - DELETE /api/v1/admin/accounts/{id}/hard - 계정 하드 삭제 (개발용)
 # - GET    /api/v1/admin/db/tables          - 테이블 목록
 # - GET    /api/v1/admin/db/query           - 테이블 데이터 조회
+# - GET    /api/v1/admin/db/export          - 테이블 전체 내보내기 (NDJSON/CSV/Arrow 스트리밍)
+# - GET    /api/v1/admin/metrics            - 서버 메트릭 (커넥션 풀 등)
 #
 # 파일 위치: app/api/v1/endpoints/admin.py
 api_router.include_router(
@@ -114,6 +116,59 @@ api_router.include_router(
     tags=["🔍 Search (검색)"]  # Swagger UI에서 그룹화할 태그
 )
 
+# ============================================================
+# 지도 API
+# ============================================================
+# 지도 화면(뷰포트) 기반 아파트 조회
+# 줌 레벨에 따라 개별 마커 또는 격자 클러스터를 반환합니다.
+#
+# 엔드포인트:
+# - GET    /api/v1/map/apartments         - 지도 화면 내 아파트 마커 / 클러스터
+# - GET    /api/v1/map/apartments/{apt_id}/summary - 마커 클릭 시 아파트 요약 (Redis 요약 문서)
+# - GET    /api/v1/map/tiles/version      - 벡터 타일 데이터셋 버전
+# - GET    /api/v1/map/tiles/{z}/{x}/{y}.mvt - 아파트 벡터 타일 (MVT)
+# - GET    /api/v1/map/heatmap            - 가격 히트맵 (배치로 미리 계산한 격자)
+#
+# 파일 위치: app/api/v1/endpoints/map.py
+api_router.include_router(
+    map.router,
+    prefix="/map",  # URL prefix: /api/v1/map/...
+    tags=["🗺️ Map (지도)"]  # Swagger UI에서 그룹화할 태그
+)
+
+# ============================================================
+# 아파트 상세 API
+# ============================================================
+# 아파트 상세 페이지의 차트 / 비교 데이터
+#
+# 엔드포인트:
+# - GET    /api/v1/apartments/{apt_id}/price-trend  - 월별 평당가 추이 (월별 집계 테이블)
+# - GET    /api/v1/apartments/{apt_id}/volume-trend - 월별 거래량 추이 (월별 집계 테이블)
+# - GET    /api/v1/apartments/{apt_id}/nearby-comparison - 주변 500m 단지 평당가 비교 (PostGIS KNN)
+# - GET    /api/v1/apartments/{apt_id}/similar      - 유사 단지 추천 (메모리 특성 행렬 top-k)
+#
+# 파일 위치: app/api/v1/endpoints/apartment.py
+api_router.include_router(
+    apartment.router,
+    prefix="/apartments",  # URL prefix: /api/v1/apartments/...
+    tags=["🏠 Apartment (아파트)"]  # Swagger UI에서 그룹화할 태그
+)
+
+# ============================================================
+# 대시보드 API
+# ============================================================
+# 홈 화면 지표 / 랭킹
+#
+# 엔드포인트:
+# - GET    /api/v1/dashboard/rankings     - 상승률/하락률/거래량/가격 랭킹 (Redis 정렬 집합)
+#
+# 파일 위치: app/api/v1/endpoints/dashboard.py
+api_router.include_router(
+    dashboard.router,
+    prefix="/dashboard",  # URL prefix: /api/v1/dashboard/...
+    tags=["📊 Dashboard (대시보드)"]  # Swagger UI에서 그룹화할 태그
+)
+
 # ============================================================
 # 🧪 테스트 API (Redis + 가짜 데이터)
 # ============================================================
@@ -3,15 +3,18 @@ Clerk 인증 유틸리티
 
 Clerk SDK를 사용하여 사용자 인증 및 검증을 처리합니다.
 """
-from typing import Optional
+import logging
+from typing import Optional, Union
 from fastapi import HTTPException, status, Header
 from jose import jwt, JWTError
+from svix.webhooks import Webhook, WebhookVerificationError
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.backends import default_backend
 import httpx
 import base64
 
 from app.core.config import settings
+from app.core.clerk_client import get_clerk_client
 
 
 def base64url_decode(data: str) -> bytes:
@@ -292,69 +295,8 @@ async def get_clerk_user(user_id: str) -> Optional[dict]:
         return None
     
     try:
-        import asyncio
-        from clerk_backend_sdk import Clerk
-        
-        # Clerk 클라이언트 생성 (동기 방식)
-        clerk = Clerk(secret_key=settings.CLERK_SECRET_KEY)
-        
-        # 동기 함수를 비동기로 실행 (Clerk SDK는 동기 방식)
-        def _get_user():
-            return clerk.users.get(user_id)
-        
-        # 별도 스레드에서 실행하여 블로킹 방지
-        user = await asyncio.to_thread(_get_user)
-        
-        if not user:
-            return None
-        
-        # 이메일 주소 추출 (검증된 이메일 우선)
-        email = None
-        if user.email_addresses:
-            # 검증된 이메일 우선 선택
-            verified_emails = [
-                e.email_address 
-                for e in user.email_addresses 
-                if hasattr(e, 'verification') and e.verification and 
-                   hasattr(e.verification, 'status') and e.verification.status == "verified"
-            ]
-            if verified_emails:
-                email = verified_emails[0]
-            else:
-                # 검증된 이메일이 없으면 첫 번째 이메일 사용
-                email = user.email_addresses[0].email_address
-        
-        # 닉네임 추출 (우선순위: username > first_name + last_name > first_name)
-        nickname = None
-        if user.username:
-            nickname = user.username
-        elif user.first_name or user.last_name:
-            first_name = user.first_name or ""
-            last_name = user.last_name or ""
-            nickname = f"{first_name} {last_name}".strip()
-        elif user.first_name:
-            nickname = user.first_name
-        
-        return {
-            "id": user.id,
-            "email": email,
-            "email_addresses": [
-                {
-                    "email_address": e.email_address,
-                    "verification": (
-                        e.verification.status 
-                        if hasattr(e, 'verification') and e.verification and hasattr(e.verification, 'status')
-                        else None
-                    )
-                }
-                for e in user.email_addresses
-            ] if user.email_addresses else [],
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "username": user.username,
-            "image_url": user.image_url,
-            "nickname": nickname
-        }
+        # 공유 클라이언트 사용 (커넥션 풀링, 동시 요청 제한, TTL 캐시, 중복 요청 병합)
+        return await get_clerk_client().get_user(user_id)
         
     except Exception as e:
         import logging
@@ -364,35 +306,41 @@ async def get_clerk_user(user_id: str) -> Optional[dict]:
 
 
 def verify_webhook_signature(
-    payload: str,
-    signature: str
+    payload: Union[bytes, str],
+    *,
+    svix_id: str,
+    svix_timestamp: str,
+    svix_signature: str
 ) -> bool:
     """
-    Clerk 웹훅 서명 검증
+    Clerk 웹훅 서명 검증 (svix)
     
     웹훅 요청이 실제로 Clerk에서 온 것인지 검증합니다.
+    본문을 한 글자라도 바꾸거나, 타임스탬프가 5분 이상 차이 나면(재전송 공격) 실패합니다.
     
     Args:
-        payload: 웹훅 요청 본문 (raw string)
-        signature: svix_signature 헤더 값
+        payload: 웹훅 요청 본문 (파싱하기 전 원본 그대로)
+        svix_id: svix-id 헤더 값
+        svix_timestamp: svix-timestamp 헤더 값
+        svix_signature: svix-signature 헤더 값
     
     Returns:
         검증 성공: True
-        검증 실패: False
+        검증 실패 (CLERK_WEBHOOK_SECRET 미설정 포함): False
     """
     if not settings.CLERK_WEBHOOK_SECRET:
         return False
     
     try:
-        # svix 라이브러리를 사용하여 서명 검증
-        # 실제 구현은 svix 문서 참조
-        # 예시:
-        # from svix import Webhook
-        # webhook = Webhook(settings.CLERK_WEBHOOK_SECRET)
-        # webhook.verify(payload, signature)
-        
-        # TODO: svix 라이브러리로 실제 검증 구현
+        Webhook(settings.CLERK_WEBHOOK_SECRET).verify(payload, {
+            "svix-id": svix_id,
+            "svix-timestamp": svix_timestamp,
+            "svix-signature": svix_signature
+        })
         return True
-        
-    except Exception:
+    except WebhookVerificationError:
+        return False
+    except Exception as e:
+        # 시크릿 형식 오류 등 설정 문제
+        logging.getLogger(__name__).error(f"웹훅 서명 검증 실패 (설정 확인 필요): {e}")
         return False
@@ -0,0 +1,286 @@
+"""
+Clerk Backend API 클라이언트
+
+Clerk SDK 클라이언트를 호출마다 새로 만들고 스레드에서 실행하던 방식을 대체합니다.
+- httpx.AsyncClient 하나를 재사용 (커넥션 풀링, TLS 세션 재사용)
+- Semaphore로 Clerk API 동시 요청 수 제한
+- 사용자 프로필 TTL 캐시
+- 같은 사용자에 대한 동시 조회는 요청 한 번으로 합침 (single-flight)
+
+사용법:
+    from app.core.clerk_client import get_clerk_client
+    user = await get_clerk_client().get_user("user_2abc123def456")
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_clerk_user(user: dict) -> dict:
+    """
+    Clerk API 사용자 응답을 백엔드에서 쓰는 형태로 변환
+
+    이메일은 검증된 이메일을 우선 사용하고, 없으면 첫 번째 이메일을 사용합니다.
+    닉네임 우선순위: username > first_name + last_name
+
+    Args:
+        user: Clerk API `GET /users/{user_id}` 응답 JSON
+
+    Returns:
+        사용자 정보 딕셔너리 (get_clerk_user 반환 형식과 동일)
+    """
+    email_addresses = [
+        {
+            "email_address": e.get("email_address"),
+            "verification": (e.get("verification") or {}).get("status")
+        }
+        for e in user.get("email_addresses") or []
+    ]
+
+    email = None
+    if email_addresses:
+        verified_emails = [
+            e["email_address"]
+            for e in email_addresses
+            if e["verification"] == "verified"
+        ]
+        email = verified_emails[0] if verified_emails else email_addresses[0]["email_address"]
+
+    first_name = user.get("first_name")
+    last_name = user.get("last_name")
+    username = user.get("username")
+
+    nickname = None
+    if username:
+        nickname = username
+    elif first_name or last_name:
+        nickname = f"{first_name or ''} {last_name or ''}".strip()
+
+    return {
+        "id": user.get("id"),
+        "email": email,
+        "email_addresses": email_addresses,
+        "first_name": first_name,
+        "last_name": last_name,
+        "username": username,
+        "image_url": user.get("image_url"),
+        "nickname": nickname
+    }
+
+
+class ClerkAPIClient:
+    """
+    장기 실행용 Clerk Backend API 클라이언트
+
+    애플리케이션 전체에서 하나의 인스턴스를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        *,
+        base_url: str = "https://api.clerk.com/v1",
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        max_concurrency: int = 10,
+        cache_ttl: float = 300.0,
+        cache_max_size: int = 10000,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            secret_key: Clerk Secret Key
+            base_url: Clerk Backend API 주소 (테스트 시 로컬 stub 서버 주소)
+            timeout: 요청 타임아웃 (초)
+            max_connections: 커넥션 풀 최대 크기
+            max_concurrency: 동시에 진행할 수 있는 Clerk API 요청 수
+            cache_ttl: 사용자 프로필 캐시 유지 시간 (초, 0이면 캐시하지 않음)
+            cache_max_size: 캐시에 보관할 최대 사용자 수
+            transport: httpx transport (테스트용)
+        """
+        self._secret_key = secret_key
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._max_connections = max_connections
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache_ttl = cache_ttl
+        self._cache_max_size = cache_max_size
+        self._cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """HTTP 클라이언트를 처음 사용할 때 생성 (커넥션 풀 공유)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                headers={"Authorization": f"Bearer {self._secret_key}"},
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections
+                ),
+                transport=self._transport
+            )
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[dict] = None
+    ) -> Optional[Any]:
+        """
+        Clerk API 요청 (동시 요청 수 제한 적용)
+
+        Returns:
+            응답 JSON, 404이면 None
+
+        Raises:
+            httpx.HTTPError: 네트워크 오류 또는 4xx/5xx 응답
+        """
+        async with self._semaphore:
+            response = await self._get_http_client().request(method, path, params=params)
+
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    # ============== 캐시 ==============
+
+    def _cache_get(self, user_id: str) -> Optional[dict]:
+        entry = self._cache.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            del self._cache[user_id]
+            return None
+        self._cache.move_to_end(user_id)
+        return user
+
+    def _cache_set(self, user_id: str, user: dict) -> None:
+        if self._cache_ttl <= 0:
+            return
+        self._cache[user_id] = (time.monotonic() + self._cache_ttl, user)
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """캐시에서 사용자 제거 (웹훅으로 변경을 알게 된 경우 등)"""
+        self._cache.pop(user_id, None)
+
+    # ============== 사용자 조회 ==============
+
+    async def _fetch_user(self, user_id: str) -> Optional[dict]:
+        raw = await self.request("GET", f"/users/{user_id}")
+        if not raw:
+            return None
+        user = normalize_clerk_user(raw)
+        self._cache_set(user_id, user)
+        return user
+
+    async def get_user(self, user_id: str) -> Optional[dict]:
+        """
+        Clerk 사용자 정보 조회
+
+        캐시에 있으면 바로 반환하고, 같은 사용자를 이미 조회 중이면
+        진행 중인 요청의 결과를 함께 기다립니다.
+
+        Args:
+            user_id: Clerk 사용자 ID
+
+        Returns:
+            normalize_clerk_user 형식의 사용자 정보, 없으면 None
+        """
+        cached = self._cache_get(user_id)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_user(user_id))
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(user_id, None))
+
+        # 호출자 하나가 취소되어도 다른 대기자의 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    async def list_users(
+        self,
+        *,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "+created_at"
+    ) -> List[dict]:
+        """
+        Clerk 사용자 목록 한 페이지 조회 (`GET /users`)
+
+        가입 순(+created_at)으로 정렬하면 진행 중에 새로 가입한 사용자가
+        뒤쪽에 붙으므로 offset 페이지가 밀리지 않습니다.
+
+        Args:
+            limit: 페이지 크기 (Clerk 최대 500)
+            offset: 건너뛸 사용자 수
+            order_by: 정렬 기준
+
+        Returns:
+            normalize_clerk_user 형식의 사용자 목록
+        """
+        raw = await self.request(
+            "GET",
+            "/users",
+            params={"limit": limit, "offset": offset, "order_by": order_by}
+        )
+        return [normalize_clerk_user(user) for user in raw or []]
+
+    async def count_users(self) -> int:
+        """Clerk 전체 사용자 수 (`GET /users/count`)"""
+        raw = await self.request("GET", "/users/count")
+        return int((raw or {}).get("total_count", 0))
+
+    async def close(self) -> None:
+        """HTTP 커넥션 풀 정리 (애플리케이션 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# 싱글톤 인스턴스
+clerk_client: Optional[ClerkAPIClient] = None
+
+
+def get_clerk_client() -> ClerkAPIClient:
+    """Clerk API 클라이언트 인스턴스 반환"""
+    global clerk_client
+    if clerk_client is None:
+        clerk_client = ClerkAPIClient(
+            settings.CLERK_SECRET_KEY,
+            base_url=settings.CLERK_API_URL,
+            timeout=settings.CLERK_API_TIMEOUT,
+            max_connections=settings.CLERK_API_MAX_CONNECTIONS,
+            max_concurrency=settings.CLERK_API_MAX_CONCURRENCY,
+            cache_ttl=settings.CLERK_USER_CACHE_TTL,
+            cache_max_size=settings.CLERK_USER_CACHE_MAX_SIZE
+        )
+    return clerk_client
+
+
+async def close_clerk_client() -> None:
+    """Clerk API 클라이언트 종료"""
+    global clerk_client
+    if clerk_client is not None:
+        await clerk_client.close()
+        clerk_client = None
@@ -29,6 +29,73 @@ class Settings(BaseSettings):
     # ⚠️ 보안: .env 파일에서 반드시 설정하세요!
     DATABASE_URL: str  # 필수 환경변수
     
+    # 커넥션 풀 (엔진마다, uvicorn 워커마다 따로 생김)
+    DB_POOL_SIZE: int = 5  # 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 10  # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션을 기다리는 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 다시 연결 (-1이면 사용 안 함)
+    DB_POOL_PRE_PING: bool = True  # 체크아웃마다 ping (왕복 1회 추가)
+    DB_POOL_IDLE_CHECK_INTERVAL: int = 0  # 유휴 커넥션 백그라운드 검증 주기 (초, 0이면 사용 안 함)
+    
+    # SQL 문 캐시
+    DB_COMPILED_CACHE_SIZE: int = 1200  # SQLAlchemy 컴파일 캐시 크기 (SQL 문 모양 수)
+    DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg 내부 prepared statement 캐시 (커넥션별)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # SQLAlchemy asyncpg 어댑터 prepared statement 캐시 (커넥션별)
+    
+    # SQL 계측 (app/db/instrumentation.py)
+    DB_SLOW_QUERY_MS: int = 200  # 이 시간(ms)을 넘는 SQL은 경고 로그
+    DB_QUERY_BUDGET: int = 50  # 요청 하나의 SQL 수가 이보다 많으면 경고 (N+1 의심)
+    DB_QUERY_STATS_HEADERS: bool = True  # 응답에 X-DB-Query-Count / X-DB-Time-Ms 헤더 추가
+    
+    # 읽기 전용 복제본 (쉼표로 구분, 비어있으면 Primary만 사용)
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: int = 10  # 복제본 헬스체크 주기 (초)
+    DB_REPLICA_STICKY_SECONDS: float = 5.0  # 쓰기 후 Primary에서 읽는 시간 (초, 0이면 사용 안 함)
+    
+    # 관리자 API
+    ADMIN_COUNT_CACHE_TTL: int = 60  # 추정 개수 캐시 유지 시간 (초)
+    
+    # 지도 API (/map/apartments)
+    MAP_MARKER_MIN_ZOOM: int = 16  # 이 줌 레벨부터 개별 마커, 그 미만은 격자 클러스터
+    MAP_CLUSTER_CELL_PX: int = 64  # 클러스터 격자 한 칸의 화면 크기 (픽셀, 256의 약수)
+    MAP_MAX_MARKERS: int = 500  # 개별 마커 최대 개수
+    MAP_MAX_CLUSTERS: int = 300  # 클러스터 최대 개수
+    MAP_VIEWPORT_CACHE_TTL: int = 600  # 타일 단위 뷰포트 캐시 유지 시간 (초)
+    MAP_VIEWPORT_MAX_TILES: int = 64  # 이보다 많은 타일을 덮는 요청은 캐시 없이 바로 조회
+    MAP_TILE_MARKER_LIMIT: int = 200  # 타일 하나에 캐시할 최대 마커 수
+    
+    # 아파트 요약 카드 (/map/apartments/{apt_id}/summary)
+    APARTMENT_SUMMARY_TTL: int = 604800  # 요약 문서 유지 시간 (초, 재구축 주기보다 길게)
+    APARTMENT_SUMMARY_CHANGE_MONTHS: int = 3  # 최근 가격 변동 비교 기간 (개월)
+    
+    # 지도 벡터 타일 (/map/tiles/{z}/{x}/{y}.mvt)
+    MAP_TILE_MIN_ZOOM: int = 12  # 이 줌 미만은 빈 타일 (축소 화면은 클러스터 API 사용)
+    MAP_TILE_EXTENT: int = 4096  # 타일 내부 좌표 해상도
+    MAP_TILE_BUFFER: int = 64  # 타일 경계 밖으로 포함할 여유 (타일 좌표 단위)
+    MAP_TILE_CACHE_TTL: int = 86400  # Redis 타일 캐시 유지 시간 (초)
+    MAP_TILE_MAX_AGE: int = 300  # 버전 없는 URL의 브라우저 캐시 시간 (초)
+    MAP_TILE_VERSIONED_MAX_AGE: int = 2592000  # ?v=현재버전 URL의 브라우저 캐시 시간 (30일)
+    
+    # 가격 히트맵 (/map/heatmap, scripts/build_heatmap.py)
+    HEATMAP_ZOOMS: str = "7,9,11,13"  # 미리 계산할 줌 레벨
+    HEATMAP_PERIODS: str = "1m,3m,6m"  # 미리 계산할 기간
+    HEATMAP_CELL_PX: int = 32  # 격자 한 칸의 화면 크기 (픽셀)
+    HEATMAP_TTL: int = 172800  # 빌드 결과 유지 시간 (초, 배치 주기보다 길게)
+    
+    # 주변 단지 비교 (/apartments/{apt_id}/nearby-comparison)
+    NEARBY_MAX_NEIGHBORS: int = 30  # 캐시할 최대 이웃 수 (가까운 순)
+    NEARBY_CACHE_TTL: int = 604800  # 이웃 집합 캐시 유지 시간 (초, 단지 위치는 거의 안 바뀜)
+    NEARBY_PRICE_MONTHS: int = 12  # 평당가로 쓸 최근 매매 집계 기간 (개월)
+    
+    # 유사 단지 추천 (/apartments/{apt_id}/similar)
+    SIMILAR_VERSION_CHECK_SECONDS: float = 30.0  # 카탈로그 버전 확인 주기 (초, 이 안에는 메모리 행렬을 그대로 사용)
+    SIMILAR_PRICE_MONTHS: int = 12  # 평당가 수준 특성에 쓸 최근 매매 집계 기간 (개월)
+    
+    # 대시보드 랭킹 (/dashboard/rankings, scripts/build_rankings.py)
+    RANKING_PERIODS: str = "1m,3m"  # 유지할 기간
+    RANKING_MIN_TRANSACTIONS: int = 3  # 상승률/하락률 랭킹에 넣을 최소 거래 건수 (두 기간 각각)
+    RANKING_TTL: int = 172800  # 빌드 결과 유지 시간 (초, 배치 주기보다 길게)
+    
     # Redis
     # ⚠️ 보안: .env 파일에서 반드시 설정하세요!
     REDIS_URL: str  # 필수 환경변수
@@ -39,6 +106,28 @@ class Settings(BaseSettings):
     CLERK_PUBLISHABLE_KEY: Optional[str] = None  # Clerk Publishable Key (Frontend)
     CLERK_WEBHOOK_SECRET: Optional[str] = None  # Clerk Webhook Secret (웹훅 검증용)
     
+    # Clerk Backend API 클라이언트
+    CLERK_API_URL: str = "https://api.clerk.com/v1"
+    CLERK_API_TIMEOUT: float = 5.0  # 초
+    CLERK_API_MAX_CONNECTIONS: int = 20  # 커넥션 풀 크기
+    CLERK_API_MAX_CONCURRENCY: int = 10  # 동시 요청 수 제한
+    CLERK_USER_CACHE_TTL: int = 300  # 사용자 프로필 캐시 유지 시간 (초)
+    CLERK_USER_CACHE_MAX_SIZE: int = 10000  # 캐시할 최대 사용자 수
+    
+    # Clerk 웹훅 비동기 처리 (Redis Stream + scripts/webhook_worker.py)
+    WEBHOOK_QUEUE_ENABLED: bool = False  # True면 웹훅을 큐에 넣고 바로 응답
+    WEBHOOK_STREAM_KEY: str = "clerk:webhooks"
+    WEBHOOK_STREAM_MAXLEN: int = 100000  # 스트림 최대 길이 (대략적으로 잘라냄)
+    WEBHOOK_CONSUMER_GROUP: str = "clerk-webhook-workers"
+    WEBHOOK_BATCH_SIZE: int = 200  # 워커가 한 번에 처리할 이벤트 수
+    WEBHOOK_DEDUP_TTL: int = 86400  # svix_id 중복 확인 유지 시간 (초)
+    WEBHOOK_CONSUMER_NAME: str = "webhook-worker"  # 워커 컨슈머 이름 (재시작해도 같아야 미처리 메시지를 이어받음)
+    WEBHOOK_CLAIM_MIN_IDLE_MS: int = 60000  # 이 시간 이상 ACK 안 된 메시지는 다른 컨슈머 것도 가져옴 (XAUTOCLAIM)
+    WEBHOOK_CLAIM_INTERVAL: int = 30  # XAUTOCLAIM 주기 (초)
+    WEBHOOK_MAX_ATTEMPTS: int = 5  # 사용자 단위 반영이 계속 실패하면 이 횟수 후 dead-letter 스트림으로 이동
+    WEBHOOK_RETRY_DELAY: float = 1.0  # 실패한 메시지 재시도 간격 (초)
+    WEBHOOK_DEAD_LETTER_KEY: str = "clerk:webhooks:dead"
+    
     # JWT 설정 (레거시 호환성, Clerk 사용 시 불필요)
     # ⚠️ 보안: .env 파일에서 반드시 설정하세요!
     SECRET_KEY: str  # 필수 환경변수
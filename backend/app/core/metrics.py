@@ -0,0 +1,188 @@
+"""
+인프로세스 메트릭 (Counter / Gauge / Histogram)
+
+외부 의존성 없이 워커 프로세스 안에서 값을 모으고,
+관리자 API에서 JSON 또는 Prometheus 텍스트 형식으로 내보냅니다.
+⚠️ uvicorn 워커별로 따로 집계됩니다. (워커 수만큼 합산해서 보세요)
+
+사용법:
+    from app.core.metrics import metrics
+    checkout_timeouts = metrics.counter("db_pool_checkout_timeouts_total", "커넥션 대기 타임아웃 수")
+    checkout_timeouts.inc(pool="primary")
+"""
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+
+class Counter:
+    """증가만 하는 값 (예: 타임아웃 횟수)"""
+    kind = "counter"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> List[dict]:
+        return [{"labels": dict(k), "value": v} for k, v in self._values.items()]
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._values.items()]
+
+
+class Gauge:
+    """
+    현재 값 (예: 사용 중인 커넥션 수)
+
+    set()으로 직접 넣거나, set_function()으로 읽을 때마다 계산할 수 있습니다.
+    """
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._values: Dict[LabelKey, float] = {}
+        self._functions: Dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels) -> None:
+        self._values[_label_key(labels)] = value
+
+    def set_function(self, fn: Callable[[], float], **labels) -> None:
+        self._functions[_label_key(labels)] = fn
+
+    def _collect(self) -> Dict[LabelKey, float]:
+        values = dict(self._values)
+        for key, fn in self._functions.items():
+            try:
+                values[key] = float(fn())
+            except Exception:
+                continue
+        return values
+
+    def value(self, **labels) -> float:
+        return self._collect().get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> List[dict]:
+        return [{"labels": dict(k), "value": v} for k, v in self._collect().items()]
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(k)} {v}" for k, v in self._collect().items()]
+
+
+class Histogram:
+    """값 분포 (예: 커넥션 대기 시간)"""
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        # 라벨별 (구간별 개수, 합계, 전체 개수)
+        self._values: Dict[LabelKey, Tuple[List[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0, 0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def snapshot(self) -> List[dict]:
+        result = []
+        for key, (counts, total, count) in self._values.items():
+            cumulative, buckets = 0, {}
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                buckets[str(bound)] = cumulative
+            buckets["+Inf"] = count
+            result.append({
+                "labels": dict(key),
+                "count": count,
+                "sum": round(total, 6),
+                "avg": round(total / count, 6) if count else 0.0,
+                "buckets": buckets
+            })
+        return result
+
+    def render(self) -> List[str]:
+        lines = []
+        for item in self.snapshot():
+            key = _label_key(item["labels"])
+            for bound, n in item["buckets"].items():
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', bound))} {n}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {item['sum']}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {item['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 (이름이 같으면 기존 메트릭 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = cls(name, *args, **kwargs)
+            self._metrics[name] = metric
+        return metric
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(self, name: str, description: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, description, buckets=buckets)
+
+    def snapshot(self, prefix: str = "") -> dict:
+        """JSON 응답용 스냅샷"""
+        return {
+            name: {"type": metric.kind, "description": metric.description, "values": metric.snapshot()}
+            for name, metric in sorted(self._metrics.items())
+            if name.startswith(prefix)
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry()
@@ -0,0 +1,61 @@
+"""
+비동기 Redis 클라이언트
+
+settings.REDIS_URL로 연결하는 redis.asyncio 클라이언트를 공유합니다.
+(app/services/redis_service.py는 가짜 데이터 테스트용 동기 클라이언트입니다)
+
+사용법:
+    from app.core.redis import get_redis
+    redis = get_redis()
+    await redis.get("key")
+
+바이너리 값(벡터 타일, NumPy 배열 등)은 get_redis_bytes()를 사용하세요. (디코딩하지 않음)
+"""
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+# 싱글톤 인스턴스
+_redis: Optional[aioredis.Redis] = None
+_redis_bytes: Optional[aioredis.Redis] = None
+
+
+def get_redis() -> aioredis.Redis:
+    """
+    공유 Redis 클라이언트 반환
+
+    연결은 첫 명령 실행 시 커넥션 풀에서 가져옵니다.
+    """
+    global _redis
+    if _redis is None:
+        _redis = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True
+        )
+    return _redis
+
+
+def get_redis_bytes() -> aioredis.Redis:
+    """
+    바이너리 값용 Redis 클라이언트 반환 (응답을 str로 디코딩하지 않음)
+    """
+    global _redis_bytes
+    if _redis_bytes is None:
+        _redis_bytes = aioredis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False
+        )
+    return _redis_bytes
+
+
+async def close_redis() -> None:
+    """Redis 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    global _redis, _redis_bytes
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+    if _redis_bytes is not None:
+        await _redis_bytes.aclose()
+        _redis_bytes = None
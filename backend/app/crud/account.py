@@ -6,12 +6,14 @@ Clerk 인증을 사용하므로:
 - clerk_user_id 기반 조회
 - 웹훅을 통한 사용자 생성/업데이트
 """
-from typing import Optional
-from sqlalchemy import select
+from datetime import datetime
+from typing import Optional, List
+from sqlalchemy import bindparam, case, select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
 
 from app.crud.base import CRUDBase
+from app.crud.statements import statements
 from app.models.account import Account
 from app.schemas.account import AccountUpdate
 
@@ -42,12 +44,12 @@ class CRUDAccount(CRUDBase[Account, dict, AccountUpdate]):
         Returns:
             사용자 객체 또는 None
         """
-        result = await db.execute(
-            select(Account).where(
-                Account.clerk_user_id == clerk_user_id,
-                Account.is_deleted == False
-            )
-        )
+        # 인증마다 호출되는 조회라 미리 만든 문장 사용
+        stmt = statements.get("account.by_clerk_user_id", lambda: select(Account).where(
+            Account.clerk_user_id == bindparam("clerk_user_id"),
+            Account.is_deleted == False
+        ))
+        result = await db.execute(stmt, {"clerk_user_id": clerk_user_id})
         return result.scalar_one_or_none()
     
     async def get_by_email(
@@ -66,12 +68,11 @@ class CRUDAccount(CRUDBase[Account, dict, AccountUpdate]):
         Returns:
             사용자 객체 또는 None
         """
-        result = await db.execute(
-            select(Account).where(
-                Account.email == email,
-                Account.is_deleted == False
-            )
-        )
+        stmt = statements.get("account.by_email", lambda: select(Account).where(
+            Account.email == bindparam("email"),
+            Account.is_deleted == False
+        ))
+        result = await db.execute(stmt, {"email": email})
         return result.scalar_one_or_none()
     
     async def create_from_clerk(
@@ -86,8 +87,9 @@ class CRUDAccount(CRUDBase[Account, dict, AccountUpdate]):
         """
         Clerk 웹훅을 통해 사용자 생성
         
-        중복 생성 방지: clerk_user_id나 email이 이미 존재하면 기존 사용자를 반환합니다.
+        중복 생성 방지: clerk_user_id가 이미 존재하면 기존 사용자를 그대로 반환합니다.
         (웹훅과 get_current_user가 동시에 호출되는 경우를 대비)
+        upsert_from_clerk(update_existing=False)와 같습니다.
         
         Args:
             db: 데이터베이스 세션
@@ -99,37 +101,63 @@ class CRUDAccount(CRUDBase[Account, dict, AccountUpdate]):
         Returns:
             생성된 또는 기존 사용자 객체
         """
-        # 먼저 기존 사용자 확인 (중복 생성 방지)
-        existing_user = await self.get_by_clerk_user_id(db, clerk_user_id=clerk_user_id)
-        if existing_user:
-            # 이미 존재하는 사용자면 기존 사용자 반환
-            return existing_user
-        
-        # 닉네임이 없으면 이메일 앞부분 사용
-        if not nickname:
-            nickname = email.split("@")[0]
-        
-        db_obj = Account(
+        return await self.upsert_from_clerk(
+            db,
             clerk_user_id=clerk_user_id,
             email=email,
             nickname=nickname,
-            profile_image_url=profile_image_url
+            profile_image_url=profile_image_url,
+            update_existing=False
         )
+    
+    async def upsert_from_clerk(
+        self,
+        db: AsyncSession,
+        *,
+        clerk_user_id: str,
+        email: str,
+        nickname: Optional[str] = None,
+        profile_image_url: Optional[str] = None,
+        update_existing: bool = True,
+        touch_login: bool = False
+    ) -> Account:
+        """
+        Clerk 사용자 생성 또는 동기화 (한 번의 INSERT ... ON CONFLICT ... RETURNING)
         
-        try:
-            db.add(db_obj)
-            await db.commit()
-            await db.refresh(db_obj)
-            return db_obj
-        except IntegrityError as e:
-            # Unique 제약 조건 위반 (동시성 문제로 인한 중복 생성 시도)
-            await db.rollback()
-            # 기존 사용자 다시 조회
-            existing_user = await self.get_by_clerk_user_id(db, clerk_user_id=clerk_user_id)
-            if existing_user:
-                return existing_user
-            # 여전히 없으면 에러 재발생
-            raise e
+        SELECT → INSERT → refresh 순서로 여러 번 왕복하던 것을 한 문장으로 처리합니다.
+        유니크 제약을 DB가 직접 판단하므로 웹훅과 get_current_user가 동시에 와도 안전합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            clerk_user_id: Clerk 사용자 ID
+            email: 이메일 주소
+            nickname: 닉네임 (없으면 이메일 앞부분 사용)
+            profile_image_url: 프로필 이미지 URL
+            update_existing: True면 기존 사용자 정보를 덮어쓰고 소프트 삭제를 복구 (웹훅 동기화),
+                             False면 기존 행을 그대로 반환 (자동 생성)
+            touch_login: True면 같은 문장에서 last_login_at도 기록 (로그인 시 자동 생성)
+        
+        Returns:
+            생성/갱신된 사용자 객체 (update_existing=False일 때는 소프트 삭제된 행일 수 있음)
+        """
+        stmt = self._clerk_upsert_stmt(
+            [{
+                "clerk_user_id": clerk_user_id,
+                "email": email,
+                "nickname": nickname,
+                "profile_image_url": profile_image_url
+            }],
+            update_existing=update_existing,
+            touch_login=touch_login
+        ).returning(Account)
+        
+        result = await db.execute(
+            stmt,
+            execution_options={"populate_existing": True}
+        )
+        user = result.scalar_one()
+        await db.commit()
+        return user
     
     async def update_from_clerk(
         self,
@@ -170,33 +198,198 @@ class CRUDAccount(CRUDBase[Account, dict, AccountUpdate]):
         
         return user
     
-    async def update_last_login(
+    def _clerk_upsert_stmt(
+        self,
+        rows: List[dict],
+        *,
+        update_existing: bool = True,
+        touch_login: bool = False
+    ):
+        """
+        clerk_user_id 기준 INSERT ... ON CONFLICT DO UPDATE 문 생성
+        
+        Clerk가 원본이므로 이메일/닉네임은 덮어쓰고, 프로필 이미지는 값이 있을 때만 갱신합니다.
+        소프트 삭제된 사용자가 다시 동기화되면 복구합니다.
+        
+        Args:
+            rows: clerk_user_id, email, nickname, profile_image_url 키를 가진 딕셔너리 목록
+                  (같은 clerk_user_id가 두 번 들어가면 안 됩니다)
+            update_existing: False면 기존 행은 바꾸지 않음
+                             (DO NOTHING은 RETURNING에 기존 행이 나오지 않으므로 값이 같은 UPDATE 사용)
+            touch_login: True면 last_login_at도 현재 시각으로 기록
+                         (소프트 삭제된 행은 로그인이 거부되므로 기존 값을 유지)
+        """
+        now = datetime.utcnow()
+        values = []
+        for row in rows:
+            value = {
+                "clerk_user_id": row["clerk_user_id"],
+                "email": row["email"],
+                "nickname": row.get("nickname") or row["email"].split("@")[0],
+                "profile_image_url": row.get("profile_image_url"),
+                "created_at": now,
+                "updated_at": now,
+                "is_deleted": False
+            }
+            if touch_login:
+                value["last_login_at"] = now
+            values.append(value)
+        stmt = pg_insert(Account).values(values)
+        excluded = stmt.excluded
+        
+        if not update_existing:
+            set_ = {"clerk_user_id": excluded.clerk_user_id}
+        else:
+            set_ = {
+                "email": excluded.email,
+                "nickname": excluded.nickname,
+                "profile_image_url": func.coalesce(
+                    excluded.profile_image_url,
+                    Account.profile_image_url
+                ),
+                "updated_at": excluded.updated_at,
+                "is_deleted": False
+            }
+        if touch_login:
+            if update_existing:
+                set_["last_login_at"] = excluded.last_login_at
+            else:
+                set_["last_login_at"] = case(
+                    (Account.is_deleted == True, Account.last_login_at),
+                    else_=excluded.last_login_at
+                )
+        return stmt.on_conflict_do_update(
+            index_elements=[Account.clerk_user_id],
+            set_=set_
+        )
+    
+    async def bulk_upsert_from_clerk(
+        self,
+        db: AsyncSession,
+        *,
+        rows: List[dict]
+    ) -> int:
+        """
+        Clerk 사용자 여러 명을 한 번의 INSERT ... ON CONFLICT로 동기화
+        
+        웹훅 큐 워커처럼 여러 건을 모아서 처리하는 곳에서 사용합니다.
+        커밋은 호출자가 배치 단위로 수행합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            rows: clerk_user_id, email, nickname, profile_image_url 키를 가진 딕셔너리 목록
+        
+        Returns:
+            처리된 행 수
+        """
+        if not rows:
+            return 0
+        result = await db.execute(self._clerk_upsert_stmt(rows))
+        return result.rowcount
+    
+    async def bulk_soft_delete_by_clerk_ids(
+        self,
+        db: AsyncSession,
+        *,
+        clerk_user_ids: List[str]
+    ) -> int:
+        """
+        Clerk 사용자 ID 목록으로 한 번에 소프트 삭제
+        
+        커밋은 호출자가 배치 단위로 수행합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            clerk_user_ids: 삭제할 Clerk 사용자 ID 목록
+        
+        Returns:
+            삭제 처리된 행 수
+        """
+        if not clerk_user_ids:
+            return 0
+        result = await db.execute(
+            update(Account)
+            .where(
+                Account.clerk_user_id.in_(clerk_user_ids),
+                Account.is_deleted == False
+            )
+            .values(is_deleted=True, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def soft_delete_by_clerk_id(
         self,
         db: AsyncSession,
         *,
         clerk_user_id: str
-    ) -> Optional[Account]:
+    ) -> Optional[int]:
         """
-        마지막 로그인 시간 업데이트
+        Clerk 사용자 ID로 소프트 삭제 (UPDATE ... RETURNING 한 번)
         
         Args:
             db: 데이터베이스 세션
             clerk_user_id: Clerk 사용자 ID
         
         Returns:
-            업데이트된 사용자 객체 또는 None
+            삭제된 계정 ID, 없거나 이미 삭제된 경우 None
         """
-        from datetime import datetime
+        stmt = statements.get("account.soft_delete_by_clerk_id", lambda: (
+            update(Account)
+            .where(
+                Account.clerk_user_id == bindparam("target_clerk_user_id"),
+                Account.is_deleted == False
+            )
+            .values(is_deleted=True, updated_at=bindparam("now"))
+            .returning(Account.account_id)
+            .execution_options(synchronize_session=False)
+        ))
+        result = await db.execute(stmt, {"target_clerk_user_id": clerk_user_id, "now": datetime.utcnow()})
+        account_id = result.scalar_one_or_none()
+        await db.commit()
+        return account_id
+    
+    async def update_last_login(
+        self,
+        db: AsyncSession,
+        *,
+        clerk_user_id: str,
+        commit: bool = True
+    ) -> Optional[Account]:
+        """
+        마지막 로그인 시간 업데이트 (UPDATE ... RETURNING 한 번)
         
-        user = await self.get_by_clerk_user_id(db, clerk_user_id=clerk_user_id)
-        if not user:
-            return None
+        조회 → 수정 → refresh로 여러 번 왕복하지 않고 갱신된 행을 바로 돌려받습니다.
+        인증마다 호출되므로 get_by_clerk_user_id 대신 이 메서드로 사용자를 조회합니다.
         
-        user.last_login_at = datetime.utcnow()
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        Args:
+            db: 데이터베이스 세션
+            clerk_user_id: Clerk 사용자 ID
+            commit: False면 커밋하지 않음 (요청 끝에 get_db가 커밋)
         
+        Returns:
+            업데이트된 사용자 객체 또는 None (없거나 삭제된 사용자)
+        """
+        stmt = statements.get("account.touch_last_login", lambda: (
+            update(Account)
+            .where(
+                Account.clerk_user_id == bindparam("b_clerk_user_id"),
+                Account.is_deleted == False
+            )
+            .values(last_login_at=bindparam("b_last_login_at"))
+            .returning(Account)
+            # 인증마다 실행되므로 read-your-writes(Primary 고정) 대상에서 제외
+            .execution_options(synchronize_session=False, sticky=False)
+        ))
+        result = await db.execute(
+            stmt,
+            # UPDATE 문에서는 컬럼 이름을 바인드 이름으로 쓸 수 없어서 b_ 접두사 사용
+            {"b_clerk_user_id": clerk_user_id, "b_last_login_at": datetime.utcnow()},
+            execution_options={"populate_existing": True}
+        )
+        user = result.scalar_one_or_none()
+        if commit and user is not None:
+            await db.commit()
         return user
 
 
@@ -0,0 +1,269 @@
+"""
+아파트 CRUD
+
+지도 뷰포트 조회:
+- 공간 조건은 geometry && ST_MakeEnvelope(...)로 걸어서
+  idx_apartments_geometry_active (부분 GiST 인덱스)를 탑니다.
+- 축소된 화면(클러스터 모드)은 줌 레벨별 격자 칸으로 묶어서 칸마다 한 행만 반환합니다.
+  격자는 Web Mercator(EPSG:3857) 픽셀 격자라서 칸이 지도 타일 경계를 넘지 않습니다.
+"""
+from typing import Any, Dict, List
+
+from sqlalchemy import Float, Integer, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.statements import statements
+from app.models.apartment import Apartment
+from app.models.location import State  # noqa: F401  관계 설정용
+from app.models.transaction import Transaction
+from app.utils.geo import MERCATOR_ORIGIN, Bounds
+
+
+def _in_bounds():
+    """뷰포트 조건 (GiST 인덱스 사용, 파라미터: west/south/east/north)"""
+    envelope = func.ST_MakeEnvelope(
+        bindparam("west", type_=Float),
+        bindparam("south", type_=Float),
+        bindparam("east", type_=Float),
+        bindparam("north", type_=Float),
+        4326
+    )
+    return Apartment.geometry.op("&&")(envelope)
+
+
+def _latest_sale_price(apt_id=None):
+    """
+    아파트별 최근 매매가 (만원)
+
+    idx_transactions_apt_id_deal_date_active (apt_id, deal_date DESC)로 한 행만 읽습니다.
+
+    Args:
+        apt_id: 바깥 쿼리의 아파트 ID 컬럼 (기본: Apartment.apt_id)
+    """
+    return (
+        select(Transaction.trans_price)
+        .where(
+            Transaction.apt_id == (Apartment.apt_id if apt_id is None else apt_id),
+            Transaction.trans_type == "SALE",
+            Transaction.is_canceled == False,
+            Transaction.is_deleted == False
+        )
+        .order_by(Transaction.deal_date.desc())
+        .limit(1)
+        .correlate_except(Transaction)
+        .scalar_subquery()
+    )
+
+
+def _bounds_params(bounds: Bounds) -> Dict[str, float]:
+    return {"west": bounds.west, "south": bounds.south, "east": bounds.east, "north": bounds.north}
+
+
+class CRUDApartment(CRUDBase[Apartment, dict, dict]):
+    """
+    아파트 CRUD
+
+    지도 조회는 ORM 객체 대신 필요한 컬럼만 dict로 반환합니다.
+    """
+
+    async def get_markers_in_bounds(
+        self,
+        db: AsyncSession,
+        *,
+        bounds: Bounds,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        뷰포트 안의 개별 아파트 마커 조회 (확대된 화면용)
+
+        세대수가 많은 단지부터 limit개까지 반환합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            bounds: 지도 영역
+            limit: 최대 마커 수
+        """
+        stmt = statements.get("apartment.markers_in_bounds", lambda: (
+            select(
+                Apartment.apt_id,
+                Apartment.apt_name,
+                func.ST_Y(Apartment.geometry).label("lat"),
+                func.ST_X(Apartment.geometry).label("lng"),
+                Apartment.total_household_cnt,
+                _latest_sale_price().label("latest_price")
+            )
+            .where(_in_bounds(), Apartment.is_deleted == False)
+            .order_by(Apartment.total_household_cnt.desc(), Apartment.apt_id)
+            .limit(bindparam("limit", type_=Integer))
+        ))
+        result = await db.execute(stmt, {**_bounds_params(bounds), "limit": limit})
+        return [
+            {
+                "apt_id": row.apt_id,
+                "apt_name": row.apt_name,
+                "location": {"lat": row.lat, "lng": row.lng},
+                "total_household_cnt": row.total_household_cnt,
+                "latest_price": row.latest_price
+            }
+            for row in result
+        ]
+
+    async def get_markers_in_tiles(
+        self,
+        db: AsyncSession,
+        *,
+        bounds: Bounds,
+        tile_m: float,
+        per_tile_limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        영역 안의 마커를 지도 타일별로 세대수가 많은 단지부터 per_tile_limit개씩 조회
+
+        타일마다 따로 자르므로(ROW_NUMBER() OVER (PARTITION BY 타일)) 빽빽한 타일이
+        옆의 한산한 타일 몫을 가져가지 않습니다. 최근 매매가는 잘라낸 뒤에만 계산합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            bounds: 조회 영역 (타일들을 합친 영역)
+            tile_m: 타일 한 변의 크기 (EPSG:3857 미터, mercator_cell_size(zoom, TILE_SIZE))
+            per_tile_limit: 타일당 최대 마커 수
+
+        Returns:
+            마커 목록 (각 마커에 tile=[x, y] 포함)
+        """
+        def build():
+            merc = func.ST_Transform(Apartment.geometry, 3857)
+            tile_m = bindparam("tile_m", type_=Float)
+            tile_x = func.floor((func.ST_X(merc) + MERCATOR_ORIGIN) / tile_m)
+            tile_y = func.floor((MERCATOR_ORIGIN - func.ST_Y(merc)) / tile_m)
+            ranked = (
+                select(
+                    Apartment.apt_id,
+                    Apartment.apt_name,
+                    func.ST_Y(Apartment.geometry).label("lat"),
+                    func.ST_X(Apartment.geometry).label("lng"),
+                    Apartment.total_household_cnt,
+                    tile_x.label("tile_x"),
+                    tile_y.label("tile_y"),
+                    func.row_number().over(
+                        partition_by=(tile_x, tile_y),
+                        order_by=(Apartment.total_household_cnt.desc(), Apartment.apt_id)
+                    ).label("tile_rank")
+                )
+                .where(_in_bounds(), Apartment.is_deleted == False)
+                .subquery()
+            )
+            return (
+                select(
+                    ranked.c.apt_id,
+                    ranked.c.apt_name,
+                    ranked.c.lat,
+                    ranked.c.lng,
+                    ranked.c.total_household_cnt,
+                    ranked.c.tile_x,
+                    ranked.c.tile_y,
+                    _latest_sale_price(ranked.c.apt_id).label("latest_price")
+                )
+                .where(ranked.c.tile_rank <= bindparam("per_tile_limit", type_=Integer))
+                .order_by(ranked.c.tile_x, ranked.c.tile_y, ranked.c.tile_rank)
+            )
+
+        stmt = statements.get("apartment.markers_in_tiles", build)
+        result = await db.execute(stmt, {
+            **_bounds_params(bounds),
+            "tile_m": tile_m,
+            "per_tile_limit": per_tile_limit
+        })
+        return [
+            {
+                "apt_id": row.apt_id,
+                "apt_name": row.apt_name,
+                "location": {"lat": row.lat, "lng": row.lng},
+                "total_household_cnt": row.total_household_cnt,
+                "latest_price": row.latest_price,
+                "tile": [int(row.tile_x), int(row.tile_y)]
+            }
+            for row in result
+        ]
+
+    async def get_clusters_in_bounds(
+        self,
+        db: AsyncSession,
+        *,
+        bounds: Bounds,
+        cell_m: float,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        뷰포트 안의 아파트를 격자 칸별로 묶어서 조회 (축소된 화면용)
+
+        칸 번호는 EPSG:3857 좌표를 왼쪽 위 원점 기준 cell_m으로 나눈 값이므로
+        같은 줌 레벨이면 화면을 움직여도 칸 경계가 바뀌지 않습니다.
+        (타일 좌표와 같은 방향: x는 동쪽, y는 남쪽으로 증가)
+
+        Args:
+            db: 데이터베이스 세션
+            bounds: 지도 영역
+            cell_m: 격자 한 칸의 크기 (EPSG:3857 미터, mercator_cell_size 참고)
+            limit: 최대 클러스터 수 (아파트가 많은 칸부터)
+
+        Returns:
+            칸별 격자 좌표, 아파트 수, 중심 좌표(평균), 범위, 평균 최근 매매가
+        """
+        def build():
+            merc = func.ST_Transform(Apartment.geometry, 3857)
+            cell_m = bindparam("cell_m", type_=Float)
+            lng = func.ST_X(Apartment.geometry)
+            lat = func.ST_Y(Apartment.geometry)
+            points = (
+                select(
+                    func.floor((func.ST_X(merc) + MERCATOR_ORIGIN) / cell_m).label("cell_x"),
+                    func.floor((MERCATOR_ORIGIN - func.ST_Y(merc)) / cell_m).label("cell_y"),
+                    lng.label("lng"),
+                    lat.label("lat"),
+                    Apartment.apt_id,
+                    _latest_sale_price().label("latest_price")
+                )
+                .where(_in_bounds(), Apartment.is_deleted == False)
+                .subquery()
+            )
+            count = func.count().label("count")
+            return (
+                select(
+                    points.c.cell_x,
+                    points.c.cell_y,
+                    count,
+                    func.avg(points.c.lng).label("lng"),
+                    func.avg(points.c.lat).label("lat"),
+                    func.min(points.c.lng).label("west"),
+                    func.min(points.c.lat).label("south"),
+                    func.max(points.c.lng).label("east"),
+                    func.max(points.c.lat).label("north"),
+                    func.avg(points.c.latest_price).label("avg_price"),
+                    func.min(points.c.apt_id).label("apt_id")
+                )
+                .group_by(points.c.cell_x, points.c.cell_y)
+                .order_by(count.desc(), points.c.cell_x, points.c.cell_y)
+                .limit(bindparam("limit", type_=Integer))
+            )
+
+        stmt = statements.get("apartment.clusters_in_bounds", build)
+        result = await db.execute(stmt, {**_bounds_params(bounds), "cell_m": cell_m, "limit": limit})
+        return [
+            {
+                "cell": [int(row.cell_x), int(row.cell_y)],
+                "count": row.count,
+                "location": {"lat": float(row.lat), "lng": float(row.lng)},
+                "bounds": [float(row.west), float(row.south), float(row.east), float(row.north)],
+                "avg_price": round(float(row.avg_price)) if row.avg_price is not None else None,
+                # 단지가 하나뿐인 칸은 클릭 시 바로 상세로 이동할 수 있도록 apt_id 포함
+                "apt_id": row.apt_id if row.count == 1 else None
+            }
+            for row in result
+        ]
+
+
+# 싱글톤 인스턴스 생성
+# 다른 곳에서 from app.crud.apartment import apartment 로 사용
+apartment = CRUDApartment(Apartment)
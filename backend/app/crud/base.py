@@ -3,18 +3,26 @@
 
 모든 CRUD 클래스가 상속받는 기본 클래스입니다.
 """
-from typing import Generic, TypeVar, Type, Optional, List, Any
-from sqlalchemy import select
+from typing import Generic, TypeVar, Type, Optional, List, Any, Sequence, Tuple, Union
+from sqlalchemy import and_, any_, bindparam, column, insert, inspect, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
 from pydantic import BaseModel
 
+from app.crud.statements import statements
 from app.db.base import Base
+from app.utils.pagination import decode_cursor, encode_cursor
 
 # 타입 변수 정의
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# PostgreSQL 한 문장의 바인드 파라미터 최대 개수 (asyncpg 제한)
+MAX_BIND_PARAMS = 32767
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -30,6 +38,19 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: SQLAlchemy 모델 클래스
         """
         self.model = model
+        # 기본키 컬럼은 모델마다 고정이므로 한 번만 찾아둠
+        # (Account 모델은 account_id, 다른 모델은 id를 사용할 수 있음)
+        pk_columns = list(self.model.__table__.primary_key.columns)
+        if not pk_columns:
+            raise ValueError(f"모델 {self.model.__name__}에 기본키가 없습니다.")
+        self._pk_column = pk_columns[0]
+        mapper = inspect(self.model)
+        self._pk_attr = mapper.get_property_by_column(self._pk_column).key
+        # pg_insert().values()가 행마다 직접 채워 넣는 컬럼 (Python 기본값/onupdate)
+        self._generated_attrs = frozenset(
+            key for key, col in mapper.columns.items()
+            if col.default is not None or col.onupdate is not None
+        )
     
     async def get(
         self,
@@ -37,17 +58,44 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         id: int
     ) -> Optional[ModelType]:
         """ID로 단일 항목 조회"""
-        # 모델의 기본키를 동적으로 찾아서 사용
-        # Account 모델은 account_id, 다른 모델은 id를 사용할 수 있음
-        pk_columns = list(self.model.__table__.primary_key.columns)
-        if not pk_columns:
-            raise ValueError(f"모델 {self.model.__name__}에 기본키가 없습니다.")
-        pk_column = pk_columns[0]
-        result = await db.execute(
-            select(self.model).where(pk_column == id)
+        stmt = statements.get(
+            f"{self.model.__name__}.get",
+            lambda: select(self.model).where(self._pk_column == bindparam("pk"))
         )
+        result = await db.execute(stmt, {"pk": id})
         return result.scalar_one_or_none()
     
+    async def get_many(
+        self,
+        db: AsyncSession,
+        ids: Sequence[Any]
+    ) -> List[ModelType]:
+        """
+        여러 ID를 한 번의 쿼리로 조회
+        
+        `WHERE pk = ANY(:ids)`로 배열 하나만 바인딩하므로
+        ID 개수와 관계없이 SQL 문장이 같습니다. (prepared statement 재사용)
+        
+        Args:
+            db: 데이터베이스 세션
+            ids: 조회할 기본키 목록
+        
+        Returns:
+            입력 순서대로 정렬된 항목 목록 (없는 ID는 빠짐, 중복 ID는 한 번만)
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return []
+        stmt = statements.get(
+            f"{self.model.__name__}.get_many",
+            lambda: select(self.model).where(
+                self._pk_column == any_(bindparam("ids", type_=ARRAY(self._pk_column.type)))
+            )
+        )
+        result = await db.execute(stmt, {"ids": unique_ids})
+        by_id = {getattr(obj, self._pk_attr): obj for obj in result.scalars().all()}
+        return [by_id[i] for i in unique_ids if i in by_id]
+    
     async def get_multi(
         self,
         db: AsyncSession,
@@ -63,6 +111,94 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         )
         return list(result.scalars().all())
     
+    def _keyset_columns(self, order_by: Sequence[Any]) -> List[Tuple[Any, bool, str]]:
+        """
+        정렬 기준을 (컬럼, 내림차순 여부, 속성 이름) 목록으로 변환
+        
+        기본키가 없으면 마지막에 추가해서 정렬 키가 항상 유일하도록 합니다.
+        (같은 created_at을 가진 행이 페이지 경계에서 빠지거나 중복되지 않도록)
+        """
+        mapper = inspect(self.model)
+        keys = []
+        for item in order_by:
+            descending = False
+            if isinstance(item, UnaryExpression) and item.modifier in (operators.desc_op, operators.asc_op):
+                descending = item.modifier is operators.desc_op
+                item = item.element
+            column = item.expression if hasattr(item, "expression") else item
+            attr_name = mapper.get_property_by_column(mapper.persist_selectable.c[column.key]).key
+            keys.append((getattr(self.model, attr_name), descending, attr_name))
+        
+        for pk_column in mapper.primary_key:
+            attr_name = mapper.get_property_by_column(pk_column).key
+            if attr_name not in [name for _, _, name in keys]:
+                descending = keys[-1][1] if keys else False
+                keys.append((getattr(self.model, attr_name), descending, attr_name))
+        return keys
+    
+    async def get_multi_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        order_by: Sequence[Any],
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Sequence[Any] = ()
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        커서 기반 페이지네이션 조회
+        
+        OFFSET 대신 "마지막 행의 정렬 키 다음부터" 조건을 사용하므로
+        페이지 깊이와 관계없이 비용이 일정합니다. (정렬 컬럼 순서의 인덱스 필요)
+        정렬 컬럼은 NOT NULL이어야 합니다. (NULL은 비교 조건에서 빠짐)
+        
+        Args:
+            db: 데이터베이스 세션
+            order_by: 정렬 기준 (예: [Account.created_at.desc()]), 기본키는 자동으로 추가됨
+            cursor: 이전 응답의 next_cursor (첫 페이지는 None)
+            limit: 가져올 개수
+            filters: 추가 WHERE 조건
+        
+        Returns:
+            (항목 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        
+        Raises:
+            InvalidCursorError: 잘못된 커서
+        """
+        keys = self._keyset_columns(order_by)
+        query = select(self.model).where(*filters)
+        
+        if cursor:
+            values = decode_cursor(cursor, expected_length=len(keys))
+            directions = {descending for _, descending, _ in keys}
+            if len(directions) == 1:
+                # 정렬 방향이 모두 같으면 행 비교 한 번으로 (인덱스 범위 스캔)
+                columns = tuple_(*[column for column, _, _ in keys])
+                bound = tuple_(*values)
+                query = query.where(columns < bound if directions.pop() else columns > bound)
+            else:
+                # 방향이 섞여 있으면 (a > x) OR (a = x AND b < y) ... 로 펼침
+                conditions = []
+                for i, (column, descending, _) in enumerate(keys):
+                    equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+                    after = column < values[i] if descending else column > values[i]
+                    conditions.append(and_(*equal_prefix, after))
+                query = query.where(or_(*conditions))
+        
+        query = query.order_by(
+            *[column.desc() if descending else column.asc() for column, descending, _ in keys]
+        ).limit(limit + 1)
+        
+        result = await db.execute(query)
+        items = list(result.scalars().all())
+        
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor([getattr(last, name) for _, _, name in keys])
+        return items, next_cursor
+    
     async def create(
         self,
         db: AsyncSession,
@@ -114,3 +250,181 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             await db.delete(obj)
             await db.commit()
         return obj
+    
+    # ============== 대량 처리 (배치 작업용) ==============
+    
+    @staticmethod
+    def _to_row(obj_in: Union[BaseModel, dict]) -> dict:
+        if isinstance(obj_in, dict):
+            return obj_in
+        return obj_in.model_dump(exclude_unset=True)
+    
+    @staticmethod
+    def _chunks(rows: List[dict], chunk_size: int):
+        for start in range(0, len(rows), chunk_size):
+            yield rows[start:start + chunk_size]
+    
+    def _values_chunk_size(self, rows: List[dict], chunk_size: int) -> int:
+        """
+        multi-VALUES 문이 바인드 파라미터 제한을 넘지 않도록 청크 크기 조정
+        
+        행마다 키가 다를 수 있으므로 모든 행의 키 합집합에
+        SQLAlchemy가 행마다 바인드로 채우는 기본값/onupdate 컬럼까지 더해 셉니다.
+        """
+        names = set(self._generated_attrs)
+        for row in rows:
+            names.update(row)
+        columns = max(len(names), 1)
+        return max(1, min(chunk_size, MAX_BIND_PARAMS // columns))
+    
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[CreateSchemaType, dict]],
+        chunk_size: int = 1000,
+        commit: bool = True
+    ) -> List[Any]:
+        """
+        여러 항목 생성
+        
+        create()는 행마다 INSERT + commit + refresh로 왕복이 여러 번이지만,
+        여기서는 청크마다 INSERT ... RETURNING 한 번(executemany)으로 처리합니다.
+        
+        Args:
+            db: 데이터베이스 세션
+            objs_in: 생성할 항목 (스키마 또는 딕셔너리)
+            chunk_size: 한 번에 INSERT할 행 수
+            commit: True면 청크마다 commit (False면 호출자가 트랜잭션 관리)
+        
+        Returns:
+            생성된 기본키 목록 (입력 순서대로)
+        """
+        rows = [self._to_row(obj) for obj in objs_in]
+        if not rows:
+            return []
+        
+        ids: List[Any] = []
+        stmt = insert(self.model).returning(self._pk_column, sort_by_parameter_order=True)
+        for chunk in self._chunks(rows, chunk_size):
+            result = await db.execute(stmt, chunk)
+            ids.extend(result.scalars().all())
+            if commit:
+                await db.commit()
+        return ids
+    
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        rows: Sequence[dict],
+        chunk_size: int = 1000,
+        commit: bool = True
+    ) -> int:
+        """
+        기본키 기준으로 여러 항목 수정
+        
+        각 딕셔너리에 기본키와 바꿀 컬럼을 넣습니다.
+        같은 컬럼 조합끼리 묶어 청크마다 UPDATE ... FROM (VALUES ...) 한 문장으로 실행합니다.
+        (asyncpg의 executemany는 rowcount를 돌려주지 않아 실제 수정된 행 수를 알 수 없음)
+        
+        Args:
+            db: 데이터베이스 세션
+            rows: 기본키 + 수정할 값 딕셔너리 목록 (예: [{"account_id": 1, "nickname": "a"}])
+            chunk_size: 한 문장에 넣을 행 수 (바인드 파라미터 제한에 맞춰 자동으로 줄어듦)
+            commit: True면 청크마다 commit
+        
+        Returns:
+            실제로 수정된 행 수 (기본키가 없는 행은 세지 않음)
+        """
+        pk_name = self._pk_attr
+        groups: dict[Tuple[str, ...], List[dict]] = {}
+        for row in rows:
+            if pk_name not in row:
+                raise ValueError(f"update_many의 모든 행에 기본키({pk_name})가 있어야 합니다.")
+            names = tuple(sorted(name for name in row if name != pk_name))
+            if names:
+                groups.setdefault(names, []).append(row)
+        
+        updated = 0
+        for names, group in groups.items():
+            for chunk in self._chunks(group, self._values_chunk_size(group, chunk_size)):
+                result = await db.execute(self._update_from_values_stmt(names, chunk))
+                updated += result.rowcount
+                if commit:
+                    await db.commit()
+        return updated
+    
+    def _update_from_values_stmt(self, names: Tuple[str, ...], rows: List[dict]):
+        """
+        UPDATE 테이블 SET ... FROM (VALUES ...) AS data WHERE pk = data.pk 문 생성
+        
+        Args:
+            names: 수정할 속성 이름 (기본키 제외)
+            rows: 기본키 + names 키를 가진 딕셔너리 목록
+        """
+        mapper = inspect(self.model)
+        attrs = (self._pk_attr, *names)
+        columns = [mapper.columns[name] for name in attrs]
+        data = values(
+            *[column(col.name, col.type) for col in columns],
+            name="data"
+        ).data([tuple(row[name] for name in attrs) for row in rows])
+        return (
+            update(self.model.__table__)
+            .where(self._pk_column == data.c[self._pk_column.name])
+            .values({col: data.c[col.name] for col in columns[1:]})
+        )
+    
+    async def upsert_many(
+        self,
+        db: AsyncSession,
+        *,
+        rows: Sequence[Union[CreateSchemaType, dict]],
+        index_elements: Sequence[str],
+        update_fields: Optional[Sequence[str]] = None,
+        chunk_size: int = 1000,
+        commit: bool = True
+    ) -> List[Any]:
+        """
+        여러 항목 INSERT ... ON CONFLICT DO UPDATE (PostgreSQL)
+        
+        Args:
+            db: 데이터베이스 세션
+            rows: 저장할 항목 (모든 행의 키가 같아야 함)
+            index_elements: 충돌 판단 컬럼 (UNIQUE 제약이 있어야 함)
+            update_fields: 충돌 시 덮어쓸 컬럼 (기본: 입력 컬럼 중 충돌/기본키 컬럼 제외 전부,
+                           빈 목록이면 기존 행을 바꾸지 않음)
+            chunk_size: 한 문장에 넣을 행 수 (바인드 파라미터 제한에 맞춰 자동으로 줄어듦)
+            commit: True면 청크마다 commit
+        
+        Returns:
+            삽입/수정된 행의 기본키 목록
+            (같은 청크 안에 충돌 키가 중복되면 PostgreSQL 에러가 나므로 미리 중복 제거하세요)
+        """
+        rows = [self._to_row(row) for row in rows]
+        if not rows:
+            return []
+        
+        if update_fields is None:
+            skip = set(index_elements) | {self._pk_attr}
+            update_fields = [name for name in rows[0] if name not in skip]
+        
+        ids: List[Any] = []
+        for chunk in self._chunks(rows, self._values_chunk_size(rows, chunk_size)):
+            stmt = pg_insert(self.model).values(chunk)
+            # 바꿀 컬럼이 없어도 RETURNING에 기존 행이 나오도록 값이 같은 UPDATE 사용
+            set_ = {name: stmt.excluded[name] for name in update_fields}
+            if set_:
+                # onupdate 컬럼(updated_at 등)은 INSERT 기본값(현재 시각)으로 함께 갱신
+                for column in self.model.__table__.columns:
+                    if column.onupdate is not None and column.default is not None and column.key not in set_:
+                        set_[column.key] = stmt.excluded[column.key]
+            else:
+                set_ = {index_elements[0]: stmt.excluded[index_elements[0]]}
+            stmt = stmt.on_conflict_do_update(index_elements=list(index_elements), set_=set_)
+            result = await db.execute(stmt.returning(self._pk_column))
+            ids.extend(result.scalars().all())
+            if commit:
+                await db.commit()
+        return ids
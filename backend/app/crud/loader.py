@@ -0,0 +1,108 @@
+"""
+요청 단위 DataLoader
+
+한 요청 안에서 같은 이벤트 루프 틱에 들어온 기본키 조회를 모아서
+CRUDBase.get_many() 한 번으로 처리합니다. (N+1 쿼리 방지)
+
+사용법:
+    from app.api.v1.deps import get_loader
+
+    @router.get("/favorites")
+    async def list_favorites(loader: DataLoader = Depends(get_loader)):
+        apartments = await asyncio.gather(
+            *[loader.load(apartment_crud, fav.apt_id) for fav in favorites]
+        )   # → SELECT ... WHERE apt_id = ANY(:ids) 한 번
+
+한 번 조회한 항목은 요청이 끝날 때까지 재사용합니다.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+
+
+class DataLoader:
+    """
+    기본키 조회 배칭 + 요청 단위 캐시
+
+    요청마다 새로 만들어야 합니다. (세션과 캐시가 요청에 묶여 있음)
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # (CRUD id, 기본키) → Future
+        self._cache: Dict[Tuple[int, Any], asyncio.Future] = {}
+        # CRUD id → (CRUD, 아직 조회하지 않은 기본키 목록)
+        self._pending: Dict[int, Tuple[CRUDBase, List[Any]]] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self._scheduled = False
+
+    def load(self, crud: CRUDBase, pk: Any) -> "asyncio.Future":
+        """
+        기본키로 항목 조회 예약
+
+        await하면 항목(없으면 None)을 돌려받습니다.
+        같은 틱에 예약된 조회는 모델별로 한 번의 쿼리로 합쳐집니다.
+        """
+        key = (id(crud), pk)
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._cache[key] = future
+        self._pending.setdefault(id(crud), (crud, []))[1].append(pk)
+        self._schedule()
+        return future
+
+    async def load_many(self, crud: CRUDBase, pks: Sequence[Any]) -> List[Optional[Any]]:
+        """여러 기본키 조회 (입력 순서대로, 없으면 None)"""
+        return list(await asyncio.gather(*[self.load(crud, pk) for pk in pks]))
+
+    def prime(self, crud: CRUDBase, obj: Any) -> None:
+        """이미 조회한 항목을 캐시에 넣기 (다른 쿼리로 받은 객체 재사용)"""
+        key = (id(crud), getattr(obj, crud._pk_attr))
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(obj)
+            self._cache[key] = future
+
+    def _schedule(self) -> None:
+        if self._scheduled:
+            return
+        self._scheduled = True
+        # 현재 틱에서 load()를 호출하는 다른 코루틴들이 모두 예약한 뒤에 실행
+        asyncio.get_running_loop().call_soon(self._start_dispatch)
+
+    def _start_dispatch(self) -> None:
+        self._scheduled = False
+        previous = self._dispatch_task
+        self._dispatch_task = asyncio.ensure_future(self._dispatch(previous))
+
+    async def _dispatch(self, previous: Optional[asyncio.Task]) -> None:
+        # AsyncSession은 동시에 쿼리를 실행할 수 없으므로 이전 배치가 끝난 뒤 실행
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+
+        batches, self._pending = self._pending, {}
+        for crud_key, (crud, pks) in batches.items():
+            try:
+                found = {
+                    getattr(obj, crud._pk_attr): obj
+                    for obj in await crud.get_many(self.db, pks)
+                }
+            except Exception as e:
+                # 실패한 키는 캐시에서 빼서 다음 load()에서 다시 조회되도록 함
+                for pk in pks:
+                    future = self._cache.pop((crud_key, pk), None)
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+
+            for pk in pks:
+                future = self._cache[(crud_key, pk)]
+                if not future.done():
+                    future.set_result(found.get(pk))
+
@@ -0,0 +1,46 @@
+"""
+자주 쓰는 SQL 문 레지스트리
+
+select()/update() 객체를 호출마다 새로 만들지 않고, bindparam으로 값만 바꿔서
+한 번 만든 문장 객체를 재사용합니다.
+- 문장 객체 생성 비용이 사라지고
+- SQLAlchemy 컴파일 캐시(query_cache_size)와 asyncpg prepared statement 캐시에
+  항상 같은 SQL 문자열로 적중합니다.
+
+사용법:
+    stmt = statements.get("account.by_clerk_user_id", lambda: (
+        select(Account).where(Account.clerk_user_id == bindparam("clerk_user_id"))
+    ))
+    result = await db.execute(stmt, {"clerk_user_id": clerk_user_id})
+
+⚠️ 빌더 안에서 datetime.utcnow() 같은 값을 고정하지 마세요. 실행 시점 값은 bindparam으로 넘깁니다.
+"""
+from typing import Any, Callable, Dict
+
+
+class StatementRegistry:
+    """이름 → 미리 만든 SQL 문 객체"""
+
+    def __init__(self):
+        self._statements: Dict[str, Any] = {}
+
+    def get(self, key: str, builder: Callable[[], Any]) -> Any:
+        """
+        key로 등록된 문장 반환 (처음 호출 시 builder로 생성)
+
+        Args:
+            key: 문장 이름 (모델명.용도)
+            builder: 문장을 만드는 함수 (bindparam 사용)
+        """
+        stmt = self._statements.get(key)
+        if stmt is None:
+            stmt = builder()
+            self._statements[key] = stmt
+        return stmt
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+# 싱글톤 인스턴스
+statements = StatementRegistry()
@@ -0,0 +1,61 @@
+"""
+실거래 CRUD
+
+국토부 실거래 데이터 적재는 app/services/transaction_ingest.py를 거치세요.
+(적재 후 지도 타일 / 요약 / 집계 갱신 훅이 실행됩니다)
+"""
+from datetime import date
+from typing import List, Sequence
+
+from sqlalchemy import Integer, any_, bindparam, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.statements import statements
+from app.models.transaction import Transaction
+
+
+class CRUDTransaction(CRUDBase[Transaction, dict, dict]):
+    """실거래 CRUD"""
+
+    async def cancel_many(
+        self,
+        db: AsyncSession,
+        *,
+        trans_ids: Sequence[int],
+        cancel_date: date
+    ) -> List[Row]:
+        """
+        거래 취소 처리 (이미 취소된 거래는 건너뜀)
+
+        commit은 호출자가 합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            trans_ids: 취소할 거래 ID 목록
+            cancel_date: 취소일
+
+        Returns:
+            실제로 취소된 거래의 (trans_id, apt_id, trans_type, deal_date) 목록
+        """
+        if not trans_ids:
+            return []
+        stmt = statements.get("transaction.cancel_many", lambda: (
+            update(Transaction)
+            .where(
+                Transaction.trans_id == any_(bindparam("trans_ids", type_=ARRAY(Integer))),
+                Transaction.is_canceled == False,
+                Transaction.is_deleted == False
+            )
+            .values(is_canceled=True, cancel_date=bindparam("cancel_date"))
+            .returning(Transaction.trans_id, Transaction.apt_id, Transaction.trans_type, Transaction.deal_date)
+        ))
+        result = await db.execute(stmt, {"trans_ids": list(trans_ids), "cancel_date": cancel_date})
+        return list(result.all())
+
+
+# 싱글톤 인스턴스 생성
+# 다른 곳에서 from app.crud.transaction import transaction 로 사용
+transaction = CRUDTransaction(Transaction)
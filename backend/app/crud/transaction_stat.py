@@ -0,0 +1,162 @@
+"""
+실거래 월별 집계 CRUD (읽기 전용)
+
+집계 갱신은 app/services/monthly_stats.py가 합니다.
+조회는 기본키 (apt_id, month, trans_type, area_bucket) 범위 스캔이라
+단지의 거래 수와 관계없이 기간의 개월 수만큼만 읽습니다.
+"""
+from datetime import date
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Date, Integer, String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.statements import statements
+from app.models.transaction_stat import ALL_AREAS, TransactionMonthlyStat
+
+
+class CRUDTransactionMonthlyStat(CRUDBase[TransactionMonthlyStat, dict, dict]):
+    """실거래 월별 집계 CRUD"""
+
+    async def get_price_trend(
+        self,
+        db: AsyncSession,
+        *,
+        apt_id: int,
+        trans_type: str,
+        area_bucket: int,
+        since: date
+    ) -> List[Dict[str, Any]]:
+        """
+        월별 평당가 추이 (거래가 있는 달만, 오래된 달부터)
+
+        Args:
+            db: 데이터베이스 세션
+            apt_id: 아파트 ID
+            trans_type: SALE / JEONSE / MONTHLY
+            area_bucket: 전용면적 구간 (0=전체)
+            since: 시작 월 1일
+        """
+        stmt = statements.get("transaction_stat.price_trend", lambda: (
+            select(
+                TransactionMonthlyStat.month,
+                TransactionMonthlyStat.transaction_count,
+                TransactionMonthlyStat.avg_price,
+                TransactionMonthlyStat.avg_price_per_pyeong,
+                TransactionMonthlyStat.median_price_per_pyeong,
+                TransactionMonthlyStat.min_price_per_pyeong,
+                TransactionMonthlyStat.max_price_per_pyeong
+            )
+            .where(
+                TransactionMonthlyStat.apt_id == bindparam("target_apt_id", type_=Integer),
+                TransactionMonthlyStat.trans_type == bindparam("target_trans_type", type_=String),
+                TransactionMonthlyStat.area_bucket == bindparam("target_area_bucket", type_=Integer),
+                TransactionMonthlyStat.month >= bindparam("since", type_=Date)
+            )
+            .order_by(TransactionMonthlyStat.month)
+        ))
+        result = await db.execute(stmt, {
+            "target_apt_id": apt_id,
+            "target_trans_type": trans_type,
+            "target_area_bucket": area_bucket,
+            "since": since
+        })
+        return [
+            {
+                "date": row.month.strftime("%Y-%m"),
+                "avg_price_per_pyeong": round(row.avg_price_per_pyeong),
+                "median_price_per_pyeong": round(row.median_price_per_pyeong),
+                "min_price_per_pyeong": round(row.min_price_per_pyeong),
+                "max_price_per_pyeong": round(row.max_price_per_pyeong),
+                "avg_price": round(row.avg_price),
+                "transaction_count": row.transaction_count
+            }
+            for row in result
+        ]
+
+    async def get_monthly_counts(
+        self,
+        db: AsyncSession,
+        *,
+        apt_id: int,
+        since: date
+    ) -> Dict[date, Dict[str, int]]:
+        """
+        월별 거래유형별 건수 (면적 구분 없는 전체 행)
+
+        Returns:
+            월 1일 → {trans_type: 건수}
+        """
+        stmt = statements.get("transaction_stat.monthly_counts", lambda: (
+            select(
+                TransactionMonthlyStat.month,
+                TransactionMonthlyStat.trans_type,
+                TransactionMonthlyStat.transaction_count
+            )
+            .where(
+                TransactionMonthlyStat.apt_id == bindparam("target_apt_id", type_=Integer),
+                TransactionMonthlyStat.area_bucket == ALL_AREAS,
+                TransactionMonthlyStat.month >= bindparam("since", type_=Date)
+            )
+            .order_by(TransactionMonthlyStat.month)
+        ))
+        result = await db.execute(stmt, {"target_apt_id": apt_id, "since": since})
+        counts: Dict[date, Dict[str, int]] = {}
+        for row in result:
+            counts.setdefault(row.month, {})[row.trans_type] = row.transaction_count
+        return counts
+
+    async def get_latest_price_per_pyeong(
+        self,
+        db: AsyncSession,
+        *,
+        apt_ids: Sequence[int],
+        since: date
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        아파트별 가장 최근 달의 매매 평균 평당가 (면적 구분 없는 전체 행)
+
+        since 이후에 매매가 없는 아파트는 결과에 없습니다.
+
+        Args:
+            db: 데이터베이스 세션
+            apt_ids: 아파트 ID 목록
+            since: 이 월 이후의 집계만 사용
+
+        Returns:
+            apt_id → {month, price_per_pyeong, transaction_count}
+        """
+        if not apt_ids:
+            return {}
+        stmt = statements.get("transaction_stat.latest_price_per_pyeong", lambda: (
+            select(
+                TransactionMonthlyStat.apt_id,
+                TransactionMonthlyStat.month,
+                TransactionMonthlyStat.avg_price_per_pyeong,
+                TransactionMonthlyStat.transaction_count
+            )
+            .where(
+                TransactionMonthlyStat.apt_id == any_(bindparam("apt_ids", type_=ARRAY(Integer))),
+                TransactionMonthlyStat.trans_type == "SALE",
+                TransactionMonthlyStat.area_bucket == ALL_AREAS,
+                TransactionMonthlyStat.month >= bindparam("since", type_=Date)
+            )
+            .distinct(TransactionMonthlyStat.apt_id)
+            .order_by(TransactionMonthlyStat.apt_id, TransactionMonthlyStat.month.desc())
+        ))
+        result = await db.execute(stmt, {"apt_ids": list(apt_ids), "since": since})
+        return {
+            row.apt_id: {
+                "month": row.month.strftime("%Y-%m"),
+                "price_per_pyeong": round(row.avg_price_per_pyeong),
+                "transaction_count": row.transaction_count
+            }
+            for row in result
+        }
+
+
+# 싱글톤 인스턴스 생성
+# 다른 곳에서 from app.crud.transaction_stat import transaction_stat 로 사용
+transaction_stat = CRUDTransactionMonthlyStat(TransactionMonthlyStat)
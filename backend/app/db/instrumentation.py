@@ -0,0 +1,130 @@
+"""
+SQL 실행 계측
+
+엔진 이벤트(before/after_cursor_execute)로 모든 SQL 실행 시간을 잽니다.
+- 느린 쿼리 로그: DB_SLOW_QUERY_MS를 넘으면 정규화한 SQL과 함께 경고 로그
+- 요청 단위 집계: contextvar로 요청별 쿼리 수 / DB 시간 누적
+  (main.py의 DBQueryStatsMiddleware가 응답 헤더로 내보내고, 예산 초과 시 경고)
+- 메트릭: db_query_seconds 히스토그램, db_slow_queries_total 카운터
+
+정규화 SQL은 리터럴/파라미터를 ?로 바꾸고 IN 목록을 하나로 합쳐서
+같은 모양의 쿼리가 같은 문자열이 되도록 만듭니다. (N+1 패턴 찾기용)
+"""
+import logging
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger("app.db.slow_query")
+
+query_seconds = metrics.histogram(
+    "db_query_seconds",
+    "SQL 문 실행 시간",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+slow_queries = metrics.counter("db_slow_queries_total", "DB_SLOW_QUERY_MS를 넘은 SQL 문 수")
+
+
+@dataclass
+class QueryStats:
+    """요청 하나의 SQL 실행 집계"""
+    count: int = 0
+    total_seconds: float = 0.0
+    # 정규화 SQL → 실행 횟수 (같은 쿼리 반복 = N+1 의심)
+    statements: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, sql: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        normalized = normalize_sql(sql)
+        self.statements[normalized] = self.statements.get(normalized, 0) + 1
+
+    def most_repeated(self) -> Optional[tuple]:
+        """가장 많이 반복된 (정규화 SQL, 횟수)"""
+        if not self.statements:
+            return None
+        return max(self.statements.items(), key=lambda item: item[1])
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+def start_request_stats() -> QueryStats:
+    """현재 요청의 SQL 집계 시작 (미들웨어에서 호출)"""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+_CAST = re.compile(r"::(?:(?:TIMESTAMP|TIME) WITH(?:OUT)? TIME ZONE|\w+)(?:\[\])?", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):(?!:)\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str, max_length: int = 1000) -> str:
+    """
+    SQL을 모양 기준으로 정규화
+
+    Example:
+        >>> normalize_sql("SELECT * FROM accounts WHERE id IN ($1, $2, $3) AND email = 'a'")
+        'SELECT * FROM accounts WHERE id IN (?) AND email = ?'
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _CAST.sub("", sql)
+    sql = _PARAMETER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("(?)", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    return sql[:max_length]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    elapsed = time.perf_counter() - started
+    label = conn.engine.url.host or "default"
+
+    query_seconds.observe(elapsed, host=label)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        slow_queries.inc(host=label)
+        logger.warning(
+            f"🐢 느린 쿼리 {elapsed * 1000:.1f}ms"
+            f"{' (executemany)' if executemany else ''}: {normalize_sql(statement)}"
+        )
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리의 시작 시각 정리 (다음 쿼리 시간이 어긋나지 않도록)
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 SQL 계측 이벤트 등록 (Primary / 복제본 엔진마다 한 번)"""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
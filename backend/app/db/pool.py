@@ -0,0 +1,144 @@
+"""
+커넥션 풀 계측 및 유휴 커넥션 검증
+
+- InstrumentedAsyncPool: 커넥션 체크아웃 대기 시간 / 타임아웃 횟수 기록
+- register_pool_metrics: 사용 중 / overflow / 유휴 커넥션 수 게이지 등록
+- IdleConnectionValidator: pool_pre_ping 대신 백그라운드에서 유휴 커넥션 검증
+  (pre_ping은 체크아웃마다 왕복이 한 번 더 생김)
+
+메트릭은 GET /api/v1/admin/metrics 에서 확인할 수 있습니다.
+풀 크기는 (DB_POOL_SIZE + DB_MAX_OVERFLOW) × uvicorn 워커 수가
+PostgreSQL max_connections보다 작도록 잡으세요.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+checkout_wait = metrics.histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 커넥션을 받기까지 걸린 시간",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+)
+checkout_timeouts = metrics.counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 커넥션을 받지 못한 횟수"
+)
+idle_invalidated = metrics.counter(
+    "db_pool_idle_invalidated_total",
+    "백그라운드 검증에서 끊어진 것으로 확인된 유휴 커넥션 수"
+)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    체크아웃 대기 시간을 기록하는 AsyncAdaptedQueuePool
+
+    create_async_engine(..., poolclass=InstrumentedAsyncPool) 후
+    pool.metrics_label을 지정하면 그 라벨로 기록합니다.
+    """
+    metrics_label = "default"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            checkout_timeouts.inc(pool=self.metrics_label)
+            raise
+        finally:
+            checkout_wait.observe(time.perf_counter() - started, pool=self.metrics_label)
+
+    def recreate(self):
+        # engine.dispose() 시 새 풀에도 라벨 유지
+        pool = super().recreate()
+        pool.metrics_label = self.metrics_label
+        return pool
+
+
+def register_pool_metrics(engine: AsyncEngine, label: str) -> None:
+    """
+    엔진의 풀 상태 게이지 등록
+
+    dispose()로 풀이 바뀌어도 현재 풀을 읽도록 값을 읽을 때마다 계산합니다.
+    """
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncPool):
+        pool.metrics_label = label
+
+    def current():
+        return engine.sync_engine.pool
+
+    metrics.gauge("db_pool_size", "풀 기본 크기 (pool_size)").set_function(lambda: current().size(), pool=label)
+    metrics.gauge("db_pool_checked_out", "사용 중인 커넥션 수").set_function(lambda: current().checkedout(), pool=label)
+    metrics.gauge("db_pool_checked_in", "풀에서 대기 중인 유휴 커넥션 수").set_function(lambda: current().checkedin(), pool=label)
+    metrics.gauge("db_pool_overflow", "pool_size를 넘어 추가로 연 커넥션 수 (음수면 아직 덜 채워짐)").set_function(
+        lambda: current().overflow(), pool=label
+    )
+
+
+class IdleConnectionValidator:
+    """
+    유휴 커넥션 백그라운드 검증
+
+    주기마다 풀의 유휴 커넥션 수만큼 하나씩 꺼내서 SELECT 1을 실행합니다.
+    큐 풀은 FIFO라서 꺼냈다 돌려놓기를 반복하면 유휴 커넥션을 한 번씩 모두 확인하게 되고,
+    한 번에 커넥션 하나만 잡으므로 요청 처리에 주는 영향이 작습니다.
+    끊어진 커넥션이 발견되면 SQLAlchemy가 그보다 오래된 커넥션을 모두 무효화하므로
+    해당 엔진의 검사를 그 자리에서 멈춥니다.
+    """
+
+    def __init__(self, engines: Dict[str, AsyncEngine], interval: float):
+        self.engines = engines
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def validate(self, label: str, engine: AsyncEngine) -> int:
+        """
+        엔진 하나의 유휴 커넥션 검증
+
+        Returns:
+            끊어진 것으로 확인된 커넥션 수
+        """
+        for _ in range(engine.sync_engine.pool.checkedin()):
+            try:
+                async with engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            except exc.DBAPIError as e:
+                if e.connection_invalidated:
+                    idle_invalidated.inc(pool=label)
+                    logger.warning(f"⚠️ 끊어진 유휴 DB 커넥션 발견 ({label}), 오래된 커넥션 무효화")
+                    return 1
+                raise
+        return 0
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            for label, engine in self.engines.items():
+                try:
+                    await self.validate(label, engine)
+                except Exception as e:
+                    logger.debug(f"유휴 커넥션 검증 실패 ({label}): {e}")
+
+    def start(self) -> None:
+        """백그라운드 검증 시작 (interval이 0이면 사용 안 함)"""
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,184 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+조회 전용 작업을 복제본으로 보내서 Primary의 부하를 줄입니다.
+- 건강한 복제본 사이에서 라운드로빈
+- 백그라운드 헬스체크 (SELECT 1), 연결 실패한 복제본은 즉시 제외
+- Read-your-writes: 사용자가 쓰기를 한 직후 일정 시간 동안은 Primary에서 읽기
+
+복제본이 설정되지 않았거나 모두 비정상이면 Primary를 사용합니다.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+STICKY_KEY_PREFIX = "db:sticky:"
+
+
+class StickyTracker:
+    """
+    쓰기 직후 Primary 고정(read-your-writes) 추적
+
+    여러 uvicorn 워커가 같은 상태를 보도록 Redis에 저장하고,
+    같은 프로세스 안에서는 메모리에서 먼저 확인합니다.
+    Redis 오류 시에는 안전하게 Primary를 사용합니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._local: Dict[str, float] = {}
+
+    def _prune(self, now: float) -> None:
+        if len(self._local) > 10000:
+            self._local = {k: v for k, v in self._local.items() if v > now}
+
+    async def mark_write(self, key: str) -> None:
+        """쓰기 발생 기록"""
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        self._prune(now)
+        self._local[key] = now + self.ttl
+        try:
+            from app.core.redis import get_redis
+            await get_redis().set(STICKY_KEY_PREFIX + key, 1, px=int(self.ttl * 1000))
+        except Exception as e:
+            logger.debug(f"sticky 기록 실패 (Redis): {e}")
+
+    async def is_sticky(self, key: str) -> bool:
+        """최근에 쓰기를 했으면 True (Primary에서 읽어야 함)"""
+        if self.ttl <= 0:
+            return False
+        expires_at = self._local.get(key)
+        if expires_at is not None and expires_at > time.monotonic():
+            return True
+        try:
+            from app.core.redis import get_redis
+            return bool(await get_redis().exists(STICKY_KEY_PREFIX + key))
+        except Exception:
+            return True
+
+
+class ReplicaRouter:
+    """
+    Primary / 복제본 엔진 선택
+
+    사용법:
+        engine = await replica_router.engine_for_read(sticky_key)
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: List[AsyncEngine],
+        *,
+        health_check_interval: float = 10.0,
+        sticky_seconds: float = 5.0
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.health_check_interval = health_check_interval
+        self.sticky = StickyTracker(sticky_seconds)
+        self._healthy: Dict[int, bool] = {id(r): True for r in replicas}
+        self._counter = itertools.count()
+        self._health_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def healthy_replicas(self) -> List[AsyncEngine]:
+        return [r for r in self.replicas if self._healthy.get(id(r))]
+
+    def next_replica(self) -> AsyncEngine:
+        """라운드로빈으로 건강한 복제본 선택 (없으면 Primary)"""
+        healthy = self.healthy_replicas()
+        if not healthy:
+            return self.primary
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def engine_for_read(self, sticky_key: Optional[str] = None) -> AsyncEngine:
+        """
+        읽기 전용 작업에 사용할 엔진
+
+        Args:
+            sticky_key: 요청자 식별 키 (최근에 쓰기를 했으면 Primary 사용)
+        """
+        if not self.enabled:
+            return self.primary
+        if sticky_key and await self.sticky.is_sticky(sticky_key):
+            return self.primary
+        return self.next_replica()
+
+    def is_replica(self, engine: Optional[AsyncEngine]) -> bool:
+        return engine is not None and id(engine) in self._healthy
+
+    def mark_unhealthy(self, engine: AsyncEngine) -> None:
+        """요청 중 연결 실패한 복제본을 다음 헬스체크 전까지 제외"""
+        if self.is_replica(engine) and self._healthy.get(id(engine)):
+            self._healthy[id(engine)] = False
+            logger.warning(f"⚠️ DB 복제본 제외: {engine.url.render_as_string(hide_password=True)}")
+
+    async def check_health(self) -> None:
+        """모든 복제본에 SELECT 1을 보내서 상태 갱신"""
+        for replica in self.replicas:
+            try:
+                async with replica.connect() as conn:
+                    await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=3.0)
+                healthy = True
+            except Exception as e:
+                healthy = False
+                logger.debug(f"복제본 헬스체크 실패: {e}")
+            if healthy != self._healthy.get(id(replica)):
+                state = "복구" if healthy else "제외"
+                logger.warning(f"DB 복제본 {state}: {replica.url.render_as_string(hide_password=True)}")
+            self._healthy[id(replica)] = healthy
+
+    async def _health_loop(self) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self.health_check_interval)
+
+    def start(self) -> None:
+        """백그라운드 헬스체크 시작 (복제본이 있을 때만)"""
+        if self.enabled and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        """백그라운드 헬스체크 중지 및 복제본 커넥션 풀 정리"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        for replica in self.replicas:
+            await replica.dispose()
+
+
+async def replica_caught_up(db, min_lsn: Optional[str]) -> bool:
+    """
+    세션이 연결된 DB가 min_lsn까지 WAL을 반영했는지 확인
+
+    Primary는 pg_last_wal_replay_lsn()이 NULL이므로 항상 True입니다.
+    같은 세션의 다음 문장은 이 확인 이후의 스냅샷을 보므로, True면 min_lsn 시점 데이터가 보입니다.
+
+    Args:
+        db: 확인할 세션 (복제본일 수도 있는 읽기 세션)
+        min_lsn: 기준 LSN (pg_current_wal_lsn() 문자열, None이면 확인하지 않음)
+    """
+    if not min_lsn:
+        return True
+    result = await db.execute(
+        text("SELECT coalesce(pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn), true)"),
+        {"lsn": min_lsn}
+    )
+    return bool(result.scalar())
@@ -2,28 +2,55 @@
 데이터베이스 세션 관리
 
 비동기 SQLAlchemy 세션을 생성하고 관리합니다.
+- engine: Primary (쓰기 + 기본 읽기)
+- replica_engines / replica_router: 읽기 전용 복제본 (DATABASE_REPLICA_URLS 설정 시)
 """
 import logging
+from typing import Any, Callable, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
+from app.db.instrumentation import instrument_engine
+from app.db.pool import IdleConnectionValidator, InstrumentedAsyncPool, register_pool_metrics
+from app.db.replica import ReplicaRouter
 
 logger = logging.getLogger(__name__)
 
-# 비동기 엔진 생성
-# connect_args에 connect_timeout을 설정하여 연결 실패 시 빠르게 실패하도록 함
-try:
-    engine = create_async_engine(
-        settings.DATABASE_URL,
+def _create_engine(url: str, label: str):
+    """비동기 엔진 생성 (Primary/복제본 공통 설정, 풀 크기는 Settings에서 조정)"""
+    new_engine = create_async_engine(
+        url,
         echo=settings.DEBUG,  # 디버그 모드에서 SQL 쿼리 로그 출력
         future=True,
-        pool_pre_ping=True,  # 연결 전에 ping을 보내서 연결 상태 확인
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        # 연결 전에 ping을 보내서 연결 상태 확인 (DB_POOL_IDLE_CHECK_INTERVAL 사용 시 끄는 것을 권장)
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        # SQLAlchemy 컴파일 캐시 (SQL 문 모양별로 컴파일 결과 재사용)
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
         connect_args={
             "server_settings": {
                 "application_name": "realestate_backend"
-            }
+            },
+            # asyncpg 커넥션별 prepared statement 캐시 (PgBouncer transaction 모드면 둘 다 0)
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
         }
     )
+    register_pool_metrics(new_engine, label)
+    instrument_engine(new_engine)
+    return new_engine
+
+
+# 비동기 엔진 생성
+# connect_args에 connect_timeout을 설정하여 연결 실패 시 빠르게 실패하도록 함
+try:
+    engine = _create_engine(settings.DATABASE_URL, "primary")
     logger.info("✅ 데이터베이스 엔진 생성 완료")
 except Exception as e:
     logger.warning(f"⚠️ 데이터베이스 엔진 생성 중 오류 (연결은 나중에 시도됨): {e}")
@@ -35,6 +62,28 @@ except Exception as e:
         pool_pre_ping=True
     )
 
+# 읽기 전용 복제본 엔진 (DATABASE_REPLICA_URLS, 쉼표로 구분)
+replica_engines = [
+    _create_engine(url.strip(), f"replica{i}")
+    for i, url in enumerate(u for u in settings.DATABASE_REPLICA_URLS.split(",") if u.strip())
+]
+if replica_engines:
+    logger.info(f"✅ 데이터베이스 복제본 엔진 {len(replica_engines)}개 생성 완료")
+
+# 읽기 작업 라우터 (복제본이 없으면 항상 Primary)
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    health_check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+    sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS
+)
+
+# 유휴 커넥션 백그라운드 검증 (DB_POOL_IDLE_CHECK_INTERVAL > 0일 때, 앱 시작 시 start)
+idle_validator = IdleConnectionValidator(
+    {"primary": engine, **{f"replica{i}": e for i, e in enumerate(replica_engines)}},
+    settings.DB_POOL_IDLE_CHECK_INTERVAL
+)
+
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -43,3 +92,84 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
     autoflush=False
 )
+
+
+class ReadOnlySession(Session):
+    """
+    읽기 전용 세션
+
+    트랜잭션이 시작될 때 `SET TRANSACTION READ ONLY`를 먼저 실행합니다.
+    실수로 쓰기 쿼리를 실행하면 PostgreSQL이 에러를 냅니다.
+    """
+
+
+@event.listens_for(ReadOnlySession, "after_begin")
+def _set_transaction_read_only(session, transaction, connection):
+    connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+# 쓰기 여부 추적 (read-your-writes 판단용)
+# 사용자가 다시 읽을 일이 없는 쓰기(로그인 시각 기록 등)는 문장에
+# execution_options(sticky=False)를 달면 Primary 고정 대상에서 빠집니다.
+@event.listens_for(Session, "after_flush")
+def _track_flush_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml_writes(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get("sticky", True) is False:
+        return
+    orm_execute_state.session.info["has_writes"] = True
+
+
+# 읽기 전용 세션 팩토리 (조회 API용, 커밋하지 않음)
+# 복제본으로 보낼 때는 AsyncReadOnlySessionLocal(bind=replica_engine)
+AsyncReadOnlySessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+
+class LazyAsyncSession:
+    """
+    처음 사용할 때 AsyncSession을 만드는 프록시
+
+    AsyncSession과 같은 방식으로 사용합니다 (execute, add, commit 등).
+    캐시에서 바로 응답하는 엔드포인트처럼 세션을 쓰지 않은 요청은
+    세션 생성도, 커넥션 풀 체크아웃도, 종료 시 commit/rollback도 하지 않습니다.
+    """
+
+    def __init__(self, factory: Callable[[], AsyncSession]):
+        self._factory = factory
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def is_started(self) -> bool:
+        """세션이 실제로 만들어졌는지 여부"""
+        return self._session is not None
+
+    def _get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_session(), name)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
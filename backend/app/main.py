@@ -94,6 +94,42 @@ class CORSHeaderMiddleware(BaseHTTPMiddleware):
 app.add_middleware(CORSHeaderMiddleware)
 
 
+# 요청별 SQL 실행 집계 미들웨어
+class DBQueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    요청마다 SQL 실행 수 / DB 시간을 집계해서 응답 헤더로 내보내는 미들웨어
+    
+    - X-DB-Query-Count: 실행한 SQL 수
+    - X-DB-Time-Ms: SQL 실행 시간 합계 (ms)
+    - DB_QUERY_BUDGET을 넘으면 가장 많이 반복된 SQL과 함께 경고 로그 (N+1 의심)
+    
+    ⚠️ 스트리밍 응답은 본문을 보내는 중에 실행된 SQL이 헤더에 포함되지 않습니다.
+    """
+    
+    async def dispatch(self, request: Request, call_next):
+        from app.db.instrumentation import start_request_stats
+        
+        stats = start_request_stats()
+        response = await call_next(request)
+        
+        if settings.DB_QUERY_STATS_HEADERS:
+            response.headers["X-DB-Query-Count"] = str(stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{stats.total_seconds * 1000:.1f}"
+        
+        if stats.count > settings.DB_QUERY_BUDGET:
+            import logging
+            sql, repeated = stats.most_repeated()
+            logging.getLogger(__name__).warning(
+                f"⚠️ 쿼리 예산 초과: {request.method} {request.url.path} "
+                f"쿼리 {stats.count}개 / {stats.total_seconds * 1000:.1f}ms "
+                f"(최다 반복 {repeated}회: {sql[:200]})"
+            )
+        
+        return response
+
+app.add_middleware(DBQueryStatsMiddleware)
+
+
 # 전역 예외 핸들러: 모든 에러 응답에 CORS 헤더 추가
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -166,6 +202,26 @@ async def startup_event():
     #         logger.info("✅ 데이터베이스 테이블 확인 완료!")
     #     except Exception as e:
     #         logger.warning(f"⚠️ 데이터베이스 테이블 생성 실패 (이미 존재할 수 있음): {e}")
+    
+    # DB 복제본 헬스체크 시작 (DATABASE_REPLICA_URLS 설정 시)
+    # 유휴 커넥션 백그라운드 검증 시작 (DB_POOL_IDLE_CHECK_INTERVAL 설정 시)
+    from app.db.session import replica_router, idle_validator
+    replica_router.start()
+    idle_validator.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 실행되는 이벤트"""
+    from app.core.clerk_client import close_clerk_client
+    from app.core.redis import close_redis
+    from app.db.session import replica_router, idle_validator
+    
+    # Clerk API / Redis / DB 복제본 커넥션 풀 정리
+    await close_clerk_client()
+    await close_redis()
+    await idle_validator.stop()
+    await replica_router.stop()
 
 
 # ============================================================
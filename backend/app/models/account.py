@@ -6,7 +6,7 @@ Clerk 인증을 사용하므로 password 필드는 없습니다.
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, Boolean, Integer
+from sqlalchemy import String, DateTime, Boolean, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -33,6 +33,17 @@ class Account(Base):
         - is_deleted: 소프트 삭제 여부
     """
     __tablename__ = "accounts"
+    __table_args__ = (
+        # 소프트 삭제되지 않은 행만 담는 부분 인덱스 (migrations/versions/0001)
+        Index("idx_accounts_clerk_user_id_active", "clerk_user_id", postgresql_where=text("is_deleted = false")),
+        Index("idx_accounts_email_active", "email", postgresql_where=text("is_deleted = false")),
+        Index(
+            "idx_accounts_created_at_account_id",
+            text("created_at DESC"),
+            text("account_id DESC"),
+            postgresql_where=text("is_deleted = false")
+        ),
+    )
     
     # 기본키 (Primary Key)
     account_id: Mapped[int] = mapped_column(
@@ -0,0 +1,140 @@
+"""
+아파트 모델
+
+테이블명: apartments
+PostGIS 공간 데이터를 사용합니다.
+"""
+from datetime import date, datetime
+from typing import Optional
+from sqlalchemy import String, CHAR, Date, DateTime, Boolean, Integer, ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from geoalchemy2 import Geometry
+
+from app.db.base import Base
+
+
+class Apartment(Base):
+    """
+    아파트 단지 테이블
+
+    국토교통부 공동주택 기본정보 / 상세정보 API 데이터를 저장합니다.
+    주소(road_address, jibun_address, zip_code)는 카카오 API로 채웁니다.
+
+    컬럼:
+        - apt_id: 고유 번호
+        - region_id: 지역 FK (states)
+        - apt_name: 아파트 단지명
+        - kapt_code: 국토부 단지코드
+        - geometry: 단지 위치 (PostGIS Point, SRID 4326)
+        - 기본정보: 세대수, 동수, 최고층, 사용승인일, 분양/난방 구분
+        - 상세정보: 주차대수, 건설사, 관리/복도 유형, 지하철, 교육시설
+    """
+    __tablename__ = "apartments"
+    __table_args__ = (
+        # 소프트 삭제되지 않은 행만 담는 부분 인덱스 (migrations/versions/0001, 0002)
+        Index("idx_apartments_region_id_active", "region_id", postgresql_where=text("is_deleted = false")),
+        Index(
+            "idx_apartments_geometry_active",
+            "geometry",
+            postgresql_using="gist",
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index("idx_apartments_kapt_code_active", "kapt_code", postgresql_where=text("is_deleted = false")),
+        # 미터 단위 반경 / 거리순(KNN) 조회용 geography 식 인덱스 (migrations/versions/0004)
+        Index(
+            "idx_apartments_geography_active",
+            text("(geometry::geography)"),
+            postgresql_using="gist",
+            postgresql_where=text("is_deleted = false")
+        ),
+    )
+
+    # 기본키
+    apt_id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="PK"
+    )
+
+    # 지역 FK
+    region_id: Mapped[int] = mapped_column(
+        ForeignKey("states.region_id"),
+        nullable=False
+    )
+
+    # 아파트 단지명
+    apt_name: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="아파트 단지명"
+    )
+
+    # 주소 (카카오 API)
+    road_address: Mapped[str] = mapped_column(String(200), nullable=False, comment="카카오 API")
+    jibun_address: Mapped[str] = mapped_column(String(200), nullable=False, comment="카카오 API")
+    zip_code: Mapped[Optional[str]] = mapped_column(CHAR(5), nullable=True, comment="카카오 API")
+
+    # 기본정보
+    code_sale_nm: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="분양/임대 등, 기본정보")
+    code_heat_nm: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="지역난방/개별난방 등, 기본정보")
+    total_household_cnt: Mapped[int] = mapped_column(Integer, nullable=False, comment="기본정보")
+    total_building_cnt: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="기본정보")
+    highest_floor: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="기본정보")
+    use_approval_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, comment="기본정보")
+
+    # 상세정보
+    total_parking_cnt: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="상세정보")
+    builder_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+    developer_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+    manage_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="자치관리/위탁관리 등, 상세정보")
+    hallway_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="계단식/복도식/혼합식, 상세정보")
+
+    # ⭐ 위치 (PostGIS Point)
+    # SRID 4326 = WGS84 좌표계 (GPS 좌표)
+    # 공간 인덱스는 __table_args__의 부분 GiST 인덱스를 사용합니다
+    geometry: Mapped[str] = mapped_column(
+        Geometry(geometry_type="POINT", srid=4326, spatial_index=False),
+        nullable=False
+    )
+
+    # 국토부 단지코드
+    kapt_code: Mapped[str] = mapped_column(String(20), nullable=False, comment="국토부 단지코드")
+
+    # 지하철 / 교육시설 (상세정보)
+    subway_time: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+    subway_line: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+    subway_station: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+    education_facility: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, comment="상세정보")
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="레코드 생성 일시"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        comment="레코드 수정 일시"
+    )
+
+    is_deleted: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="소프트 삭제"
+    )
+
+    # ===== 관계 (Relationships) =====
+    # 이 아파트가 속한 지역
+    region = relationship("State", back_populates="apartments")
+
+    # 이 아파트의 거래 내역들
+    transactions = relationship("Transaction", back_populates="apartment")
+
+    def __repr__(self):
+        return f"<Apartment(apt_id={self.apt_id}, name='{self.apt_name}')>"
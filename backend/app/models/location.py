@@ -0,0 +1,83 @@
+"""
+지역 모델
+
+테이블명: states
+"""
+from datetime import datetime
+from sqlalchemy import String, CHAR, DateTime, Boolean, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class State(Base):
+    """
+    지역(시군구/동) 테이블
+
+    컬럼:
+        - region_id: 고유 번호
+        - region_name: 시군구명 (예: 강남구, 해운대구)
+        - region_code: 시도코드 2자리 + 시군구 3자리 + 동코드 5자리
+        - city_name: 시도명 (예: 서울특별시)
+        - created_at / updated_at: 레코드 생성 / 수정 일시
+        - is_deleted: 소프트 삭제 여부
+    """
+    __tablename__ = "states"
+
+    # 기본키
+    region_id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="PK"
+    )
+
+    # 시군구명
+    region_name: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="시군구명 (예: 강남구, 해운대구)"
+    )
+
+    # 지역 코드 (법정동 코드 10자리)
+    region_code: Mapped[str] = mapped_column(
+        CHAR(10),
+        unique=True,
+        nullable=False,
+        comment="시도코드 2자리 + 시군구 3자리 + 동코드 5자리"
+    )
+
+    # 시도명
+    city_name: Mapped[str] = mapped_column(
+        String(40),
+        nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="레코드 생성 일시"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        comment="레코드 수정 일시"
+    )
+
+    is_deleted: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="삭제 여부 (소프트 삭제)"
+    )
+
+    # ===== 관계 (Relationships) =====
+    # 이 지역의 아파트들
+    apartments = relationship("Apartment", back_populates="region")
+
+    def __repr__(self):
+        return f"<State(region_id={self.region_id}, region_code='{self.region_code}', name='{self.region_name}')>"
@@ -0,0 +1,136 @@
+"""
+실거래 모델
+
+테이블명: transactions
+국토부 아파트 매매 / 전월세 실거래가 데이터를 저장합니다.
+"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import String, Numeric, Date, DateTime, Boolean, Integer, ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+
+
+class Transaction(Base):
+    """
+    실거래 내역 테이블
+
+    금액 단위는 모두 만원입니다.
+    - 매매(SALE): trans_price
+    - 전세(JEONSE): deposit_price
+    - 월세(MONTHLY): deposit_price + monthly_rent
+
+    컬럼:
+        - trans_id: 고유 번호
+        - apt_id: 아파트 FK
+        - trans_type: SALE=매매, JEONSE=전세, MONTHLY=월세
+        - rent_type: NEW=신규, RENEWAL=갱신 (전월세만 해당)
+        - exclusive_area: 전용면적 (㎡)
+        - deal_date: 거래일 / contract_date: 계약일
+        - is_canceled / cancel_date: 거래 취소 여부 / 취소일
+        - is_deleted: 소프트 삭제 여부
+    """
+    __tablename__ = "transactions"
+    __table_args__ = (
+        # 소프트 삭제되지 않은 행만 담는 부분 인덱스 (migrations/versions/0001, 0002)
+        Index(
+            "idx_transactions_apt_id_deal_date_active",
+            "apt_id",
+            text("deal_date DESC"),
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index(
+            "idx_transactions_deal_date_active",
+            text("deal_date DESC"),
+            postgresql_where=text("is_deleted = false")
+        ),
+    )
+
+    # 기본키
+    trans_id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="PK"
+    )
+
+    # 아파트 FK
+    apt_id: Mapped[int] = mapped_column(
+        ForeignKey("apartments.apt_id"),
+        nullable=False
+    )
+
+    # 거래 유형
+    trans_type: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+        comment="SALE=매매, JEONSE=전세, MONTHLY=월세"
+    )
+    rent_type: Mapped[Optional[str]] = mapped_column(
+        String(10),
+        nullable=True,
+        comment="NEW=신규, RENEWAL=갱신, 전월세만 해당"
+    )
+
+    # 금액 (만원)
+    trans_price: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    deposit_price: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    monthly_rent: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    # 전용면적 (㎡)
+    exclusive_area: Mapped[Decimal] = mapped_column(Numeric(7, 2), nullable=False)
+
+    # 층 / 동 / 호
+    floor: Mapped[int] = mapped_column(Integer, nullable=False)
+    building_num: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    unit_num: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+
+    # 거래일 / 계약일
+    deal_date: Mapped[date] = mapped_column(Date, nullable=False)
+    contract_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    # 계약갱신청구권 사용 여부 (전월세)
+    is_renewal_right: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+
+    # 거래 취소
+    is_canceled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    cancel_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
+
+    # 데이터 출처
+    data_source: Mapped[str] = mapped_column(
+        String(50),
+        default="국토부실거래가",
+        server_default="국토부실거래가",
+        nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="레코드 생성 일시"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+        comment="레코드 수정 일시"
+    )
+
+    is_deleted: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="소프트 삭제"
+    )
+
+    # ===== 관계 (Relationships) =====
+    # 이 거래의 아파트
+    apartment = relationship("Apartment", back_populates="transactions")
+
+    def __repr__(self):
+        return f"<Transaction(trans_id={self.trans_id}, apt_id={self.apt_id}, type='{self.trans_type}', deal_date={self.deal_date})>"
@@ -0,0 +1,85 @@
+"""
+실거래 월별 집계 모델
+
+테이블명: transaction_monthly_stats
+transactions에서 계산한 파생 데이터입니다. (app/services/monthly_stats.py가 갱신)
+"""
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import String, Date, DateTime, Integer, SmallInteger, Float, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+# 전용면적 구간: (구간 번호, 상한 ㎡) - 상한 이하까지 해당 구간, 마지막 구간은 상한 없음
+# 한국부동산원 면적 구분 (60㎡ 이하 / 60~85 / 85~102 / 102~135 / 135㎡ 초과)
+AREA_BUCKETS: List[Tuple[int, Optional[float]]] = [(1, 60), (2, 85), (3, 102), (4, 135), (5, None)]
+
+# 면적 구분 없이 단지 전체를 합친 행의 구간 번호
+ALL_AREAS = 0
+
+
+def area_bucket_of(exclusive_area: float) -> int:
+    """전용면적(㎡) → 구간 번호"""
+    for bucket, upper in AREA_BUCKETS:
+        if upper is None or exclusive_area <= upper:
+            return bucket
+    return AREA_BUCKETS[-1][0]
+
+
+class TransactionMonthlyStat(Base):
+    """
+    아파트 × 월 × 거래유형 × 전용면적 구간별 실거래 집계
+
+    기준 금액은 매매는 trans_price, 전세/월세는 deposit_price(보증금)입니다. (만원)
+    평당가 = 기준 금액 / (전용면적 / 3.305785)
+    취소 / 삭제된 거래는 집계에서 빠집니다.
+
+    컬럼:
+        - apt_id / month(해당 월 1일) / trans_type / area_bucket: 복합 기본키
+          (area_bucket 0 = 면적 구분 없이 전체, 1~5 = AREA_BUCKETS)
+        - transaction_count: 거래 건수
+        - avg/median/min/max_price: 기준 금액 통계
+        - avg/median/min/max_price_per_pyeong: 평당가 통계
+        - avg_monthly_rent: 평균 월세 (월세만 해당)
+    """
+    __tablename__ = "transaction_monthly_stats"
+    __table_args__ = (
+        # 월 단위 전체 집계 (랭킹 등, migrations/versions/0003)
+        Index("idx_transaction_monthly_stats_month", "month", "trans_type", "area_bucket"),
+    )
+
+    apt_id: Mapped[int] = mapped_column(ForeignKey("apartments.apt_id"), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True, comment="해당 월 1일")
+    trans_type: Mapped[str] = mapped_column(String(10), primary_key=True, comment="SALE=매매, JEONSE=전세, MONTHLY=월세")
+    area_bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True, comment="0=전체, 1~5=전용면적 구간")
+
+    transaction_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 기준 금액 (만원)
+    avg_price: Mapped[float] = mapped_column(Float, nullable=False)
+    median_price: Mapped[float] = mapped_column(Float, nullable=False)
+    min_price: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_price: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # 평당가 (만원/평)
+    avg_price_per_pyeong: Mapped[float] = mapped_column(Float, nullable=False)
+    median_price_per_pyeong: Mapped[float] = mapped_column(Float, nullable=False)
+    min_price_per_pyeong: Mapped[float] = mapped_column(Float, nullable=False)
+    max_price_per_pyeong: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # 평균 월세 (만원, 월세만 해당)
+    avg_monthly_rent: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        nullable=False,
+        comment="집계 시각"
+    )
+
+    def __repr__(self):
+        return (
+            f"<TransactionMonthlyStat(apt_id={self.apt_id}, month={self.month}, "
+            f"type='{self.trans_type}', bucket={self.area_bucket}, count={self.transaction_count})>"
+        )
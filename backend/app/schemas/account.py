@@ -45,7 +45,8 @@ class ClerkEmailAddress(BaseModel):
 class ClerkWebhookUser(BaseModel):
     """Clerk 웹훅에서 받는 사용자 정보"""
     id: str = Field(..., description="Clerk 사용자 ID")
-    email_addresses: list[ClerkEmailAddress] = Field(..., description="이메일 주소 목록")
+    # user.deleted 이벤트에는 id만 포함되므로 기본값은 빈 목록
+    email_addresses: list[ClerkEmailAddress] = Field(default_factory=list, description="이메일 주소 목록")
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     image_url: Optional[str] = None
@@ -0,0 +1,256 @@
+"""
+아파트 요약 카드 (/map/apartments/{apt_id}/summary)
+
+마커 클릭은 지도에서 가장 자주 일어나는 요청이라, 요청마다 아파트 + 최근 거래 +
+최근 가격 변동을 조인하지 않고 아파트별 요약 문서를 Redis에 미리 만들어 둡니다.
+- 키: apartment:summary:{apt_id}, 값: 응답 data 그대로의 JSON 바이트
+- API는 GET 한 번으로 받은 바이트를 파싱하지 않고 그대로 응답 본문에 넣습니다.
+- 실거래 적재 후처리 훅(on_transactions_ingested)이 매매 거래가 바뀐 아파트만 다시 만듭니다.
+- 캐시에 없으면(첫 조회, 만료) 그 아파트 하나만 DB에서 만들어 저장합니다.
+- 최근 가격 변동은 오늘 기준 기간으로 계산하므로, scripts/build_apartment_summaries.py로
+  하루 한 번 전체를 다시 만듭니다.
+
+요약 문서:
+    apt_id, apt_name, address, road_address, total_household_cnt, use_approval_date,
+    latest_transaction {price, exclusive_area, deal_date}, price_per_pyeong,
+    price_change {months, recent_price_per_pyeong, previous_price_per_pyeong, change_rate, recent_count},
+    updated_at
+"""
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import orjson
+from dateutil.relativedelta import relativedelta
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import get_redis_bytes
+from app.db.session import AsyncReadOnlySessionLocal
+from app.utils.geo import PYEONG_M2
+
+logger = logging.getLogger(__name__)
+
+summary_requests = metrics.counter(
+    "apartment_summary_requests_total",
+    "아파트 요약 카드 조회 수 (result=hit/miss/not_found)"
+)
+
+_SUMMARY_SELECT = """
+SELECT
+    a.apt_id,
+    a.apt_name,
+    a.road_address,
+    a.jibun_address,
+    a.total_household_cnt,
+    a.use_approval_date,
+    latest.trans_price,
+    latest.exclusive_area::float8 AS exclusive_area,
+    latest.deal_date,
+    change.recent_ppp,
+    change.previous_ppp,
+    change.recent_count
+FROM apartments a
+LEFT JOIN LATERAL (
+    SELECT t.trans_price, t.exclusive_area, t.deal_date
+    FROM transactions t
+    WHERE t.apt_id = a.apt_id
+      AND t.trans_type = 'SALE'
+      AND t.trans_price IS NOT NULL
+      AND t.is_canceled = false
+      AND t.is_deleted = false
+    ORDER BY t.deal_date DESC, t.trans_id DESC
+    LIMIT 1
+) latest ON true
+LEFT JOIN LATERAL (
+    SELECT
+        avg(t.trans_price / (t.exclusive_area / :pyeong_m2)) FILTER (WHERE t.deal_date >= :recent_since) AS recent_ppp,
+        avg(t.trans_price / (t.exclusive_area / :pyeong_m2)) FILTER (WHERE t.deal_date < :recent_since) AS previous_ppp,
+        count(*) FILTER (WHERE t.deal_date >= :recent_since) AS recent_count
+    FROM transactions t
+    WHERE t.apt_id = a.apt_id
+      AND t.trans_type = 'SALE'
+      AND t.deal_date >= :previous_since
+      AND t.trans_price IS NOT NULL
+      AND t.exclusive_area > 0
+      AND t.is_canceled = false
+      AND t.is_deleted = false
+) change ON true
+WHERE a.is_deleted = false
+"""
+
+# 지정한 아파트만 (적재 훅 / 캐시 미스)
+_SUMMARY_BY_IDS_SQL = text(_SUMMARY_SELECT + "  AND a.apt_id IN :apt_ids").bindparams(
+    bindparam("apt_ids", expanding=True)
+)
+
+# 전체 재구축 (apt_id 순으로 스트리밍)
+_SUMMARY_ALL_SQL = text(_SUMMARY_SELECT + "ORDER BY a.apt_id")
+
+
+def _summary_key(apt_id: int) -> str:
+    return f"apartment:summary:{apt_id}"
+
+
+def _window_params(today: Optional[date] = None) -> Dict[str, Any]:
+    """최근 / 이전 기간 경계 (각각 APARTMENT_SUMMARY_CHANGE_MONTHS개월)"""
+    today = today or date.today()
+    months = settings.APARTMENT_SUMMARY_CHANGE_MONTHS
+    return {
+        "pyeong_m2": PYEONG_M2,
+        "recent_since": today - relativedelta(months=months),
+        "previous_since": today - relativedelta(months=months * 2)
+    }
+
+
+def _round_or_none(value: Optional[float]) -> Optional[int]:
+    return round(float(value)) if value is not None else None
+
+
+def build_summary_document(row) -> Dict[str, Any]:
+    """쿼리 결과 한 행 → 요약 문서"""
+    latest_transaction = None
+    price_per_pyeong = None
+    if row.trans_price is not None:
+        latest_transaction = {
+            "price": row.trans_price,
+            "exclusive_area": row.exclusive_area,
+            "deal_date": row.deal_date.isoformat()
+        }
+        if row.exclusive_area:
+            price_per_pyeong = round(row.trans_price / (row.exclusive_area / PYEONG_M2))
+
+    change_rate = None
+    if row.recent_ppp is not None and row.previous_ppp:
+        change_rate = round((float(row.recent_ppp) / float(row.previous_ppp) - 1) * 100, 2)
+
+    return {
+        "apt_id": row.apt_id,
+        "apt_name": row.apt_name,
+        "address": row.jibun_address or row.road_address,
+        "road_address": row.road_address,
+        "total_household_cnt": row.total_household_cnt,
+        "use_approval_date": row.use_approval_date.isoformat() if row.use_approval_date else None,
+        "latest_transaction": latest_transaction,
+        "price_per_pyeong": price_per_pyeong,
+        "price_change": {
+            "months": settings.APARTMENT_SUMMARY_CHANGE_MONTHS,
+            "recent_price_per_pyeong": _round_or_none(row.recent_ppp),
+            "previous_price_per_pyeong": _round_or_none(row.previous_ppp),
+            "change_rate": change_rate,
+            "recent_count": row.recent_count or 0
+        },
+        "updated_at": datetime.utcnow().isoformat(timespec="seconds")
+    }
+
+
+async def _store(documents: Iterable[Dict[str, Any]]) -> Dict[int, bytes]:
+    """요약 문서를 직렬화해서 Redis에 저장 (파이프라인 한 번)"""
+    encoded = {doc["apt_id"]: orjson.dumps(doc) for doc in documents}
+    if encoded:
+        pipe = get_redis_bytes().pipeline(transaction=False)
+        for apt_id, raw in encoded.items():
+            pipe.set(_summary_key(apt_id), raw, ex=settings.APARTMENT_SUMMARY_TTL)
+        await pipe.execute()
+    return encoded
+
+
+async def refresh_summaries(
+    db: AsyncSession,
+    apt_ids: Sequence[int],
+    *,
+    chunk_size: int = 1000
+) -> Dict[int, bytes]:
+    """
+    지정한 아파트의 요약 문서를 다시 만들어 저장
+
+    삭제되었거나 없는 아파트는 캐시에서도 지웁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        apt_ids: 아파트 ID 목록
+        chunk_size: 쿼리 한 번에 넣을 apt_id 수
+
+    Returns:
+        apt_id → 저장한 JSON 바이트
+    """
+    params = _window_params()
+    stored: Dict[int, bytes] = {}
+    ids = sorted(set(apt_ids))
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        result = await db.execute(_SUMMARY_BY_IDS_SQL, {**params, "apt_ids": chunk})
+        stored.update(await _store(build_summary_document(row) for row in result))
+
+    gone = [apt_id for apt_id in ids if apt_id not in stored]
+    if gone:
+        await get_redis_bytes().delete(*(_summary_key(apt_id) for apt_id in gone))
+    return stored
+
+
+async def rebuild_all_summaries(db: AsyncSession, *, batch_size: int = 2000) -> int:
+    """
+    모든 아파트의 요약 문서 재구축 (서버 사이드 커서로 batch_size씩)
+
+    Returns:
+        저장한 문서 수
+    """
+    started = time.perf_counter()
+    total = 0
+    result = await db.stream(_SUMMARY_ALL_SQL.execution_options(yield_per=batch_size), _window_params())
+    async for partition in result.partitions(batch_size):
+        total += len(await _store(build_summary_document(row) for row in partition))
+    logger.info(f"아파트 요약 재구축: {total}건 ({time.perf_counter() - started:.1f}s)")
+    return total
+
+
+async def get_summary(db: AsyncSession, apt_id: int) -> Optional[bytes]:
+    """
+    요약 문서 조회 (JSON 바이트)
+
+    캐시에 있으면 Redis GET 한 번, 없으면 DB에서 만들어 저장합니다.
+
+    Returns:
+        요약 문서 JSON 바이트, 아파트가 없으면 None
+    """
+    try:
+        raw = await get_redis_bytes().get(_summary_key(apt_id))
+    except RedisError as e:
+        logger.warning(f"⚠️ 아파트 요약 캐시 조회 실패: {e}")
+        raw = None
+    if raw is not None:
+        summary_requests.inc(result="hit")
+        return raw
+
+    result = await db.execute(_SUMMARY_BY_IDS_SQL, {**_window_params(), "apt_ids": [apt_id]})
+    row = result.first()
+    if row is None:
+        summary_requests.inc(result="not_found")
+        return None
+
+    summary_requests.inc(result="miss")
+    document = build_summary_document(row)
+    try:
+        return (await _store([document]))[apt_id]
+    except RedisError as e:
+        logger.warning(f"⚠️ 아파트 요약 캐시 저장 실패: {e}")
+        return orjson.dumps(document)
+
+
+async def on_transactions_ingested(result) -> None:
+    """
+    실거래 적재 후처리 훅: 매매 거래가 바뀐 아파트의 요약만 다시 만듦
+
+    훅은 적재 세션이 commit된 뒤에 실행되므로 주 DB의 새 세션으로 읽습니다.
+    """
+    apt_ids: List[int] = sorted({apt_id for apt_id, _, trans_type in result.touched_months if trans_type == "SALE"})
+    if not apt_ids:
+        return
+
+    async with AsyncReadOnlySessionLocal() as db:
+        stored = await refresh_summaries(db, apt_ids)
+    logger.info(f"아파트 요약 갱신: {len(stored)}건")
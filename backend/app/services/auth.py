@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.account import account as account_crud
 from app.models.account import Account
-from app.schemas.account import AccountUpdate
+from app.schemas.account import AccountUpdate, ClerkWebhookUser
 from app.core.exceptions import NotFoundException, AlreadyExistsException
 
 
@@ -25,6 +25,45 @@ class AuthService:
     - 프로필 관리: 백엔드에서 처리
     """
     
+    def build_profile_from_webhook(self, user_data: ClerkWebhookUser) -> dict:
+        """
+        Clerk 웹훅 사용자 데이터에서 DB에 저장할 프로필 추출
+        
+        웹훅 엔드포인트(즉시 처리)와 웹훅 큐 워커가 같은 규칙을 사용합니다.
+        
+        Args:
+            user_data: 웹훅 이벤트의 data
+        
+        Returns:
+            clerk_user_id, email(없으면 None), nickname, profile_image_url 딕셔너리
+        """
+        # 이메일 추출 (첫 번째 이메일 사용)
+        email = user_data.email_addresses[0].email_address if user_data.email_addresses else None
+        
+        # 닉네임 추출 (소셜 로그인 지원)
+        # 우선순위: username > first_name + last_name > 이메일 앞부분
+        nickname = None
+        if user_data.username:
+            nickname = user_data.username
+        elif user_data.first_name or user_data.last_name:
+            first_name = user_data.first_name or ""
+            last_name = user_data.last_name or ""
+            nickname = f"{first_name} {last_name}".strip()
+        
+        # 닉네임이 없거나 비어있으면 기본값 설정
+        if not nickname or not nickname.strip():
+            nickname = email.split("@")[0] if email else "사용자"
+        
+        # 닉네임 길이 제한 (DB 필드 크기에 맞춤: 최대 50자)
+        nickname = nickname[:50]
+        
+        return {
+            "clerk_user_id": user_data.id,
+            "email": email,
+            "nickname": nickname,
+            "profile_image_url": user_data.image_url
+        }
+    
     async def sync_user_from_clerk(
         self,
         db: AsyncSession,
@@ -38,6 +77,7 @@ class AuthService:
         Clerk 웹훅을 통해 사용자 동기화
         
         사용자가 Clerk에서 생성/업데이트될 때 호출됩니다.
+        이미 있는 사용자는 Clerk 정보로 덮어쓰고, 소프트 삭제된 경우 복구합니다.
         
         Args:
             db: 데이터베이스 세션
@@ -49,30 +89,14 @@ class AuthService:
         Returns:
             동기화된 사용자 객체
         """
-        # 기존 사용자 확인
-        existing_user = await account_crud.get_by_clerk_user_id(
+        # INSERT ... ON CONFLICT 한 번으로 생성/업데이트 (조회 후 분기하지 않음)
+        return await account_crud.upsert_from_clerk(
             db,
-            clerk_user_id=clerk_user_id
+            clerk_user_id=clerk_user_id,
+            email=email,
+            nickname=nickname,
+            profile_image_url=profile_image_url
         )
-        
-        if existing_user:
-            # 업데이트
-            return await account_crud.update_from_clerk(
-                db,
-                clerk_user_id=clerk_user_id,
-                email=email,
-                nickname=nickname,
-                profile_image_url=profile_image_url
-            )
-        else:
-            # 새로 생성
-            return await account_crud.create_from_clerk(
-                db,
-                clerk_user_id=clerk_user_id,
-                email=email,
-                nickname=nickname,
-                profile_image_url=profile_image_url
-            )
     
     async def get_user_by_clerk_id(
         self,
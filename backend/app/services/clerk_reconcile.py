@@ -0,0 +1,433 @@
+"""
+Clerk ↔ accounts 대량 동기화(reconciliation)
+
+웹훅이 빠졌거나 처음 데이터를 채울 때 Clerk 전체 사용자와 accounts 테이블을 맞춥니다.
+- Clerk 사용자 목록을 페이지 단위로 동시에 가져옴 (ClerkAPIClient 동시 요청 제한 적용)
+- accounts를 clerk_user_id 기준으로 메모리에 올려서 비교
+- 추가/변경은 INSERT ... ON CONFLICT 배치로, Clerk에 없는 계정은 소프트 삭제
+- 페이지 묶음마다 체크포인트 파일을 저장하므로 중단 후 이어서 실행 가능
+  (이미 본 clerk_user_id는 체크포인트 옆 .seen 파일에 이어 쓰기만 함)
+
+실행: scripts/reconcile_clerk_accounts.py
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+from sqlalchemy import select
+
+from app.core.clerk_client import ClerkAPIClient
+from app.crud.account import account as account_crud
+from app.db.session import AsyncSessionLocal
+from app.models.account import Account
+
+logger = logging.getLogger(__name__)
+
+# 체크포인트 파일 형식 버전
+CHECKPOINT_VERSION = 2
+
+T = TypeVar("T")
+
+
+@dataclass
+class ReconcileStats:
+    """동기화 결과 통계"""
+    clerk_users: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.clerk_users / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Clerk 사용자 {self.clerk_users}명 ({self.rows_per_sec:,.0f} rows/s) | "
+            f"추가 {self.inserted}, 변경 {self.updated}, 동일 {self.unchanged}, "
+            f"삭제 {self.deleted}, 건너뜀 {self.skipped}, 실패 {self.failed}"
+        )
+
+
+@dataclass
+class Checkpoint:
+    """
+    중단 후 이어서 실행하기 위한 진행 상태
+
+    이미 본 clerk_user_id는 체크포인트마다 전체를 다시 쓰지 않고
+    {path}.seen 파일에 한 줄씩 이어 씁니다. seen_bytes는 마지막 체크포인트 시점의 파일 크기로,
+    그 뒤에 쓰다 만 부분은 다음 실행에서 잘라냅니다.
+    """
+    next_offset: int = 0
+    page_size: int = 500
+    seen_bytes: int = 0
+    pages_done: bool = False
+    stats: dict = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> Optional["Checkpoint"]:
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"지원하지 않는 체크포인트 버전입니다: {data.get('version')}")
+        data.pop("version")
+        return cls(**data)
+
+    def save(self, path: Optional[str]) -> None:
+        if not path:
+            return
+        # 임시 파일에 쓴 뒤 교체 (중간에 죽어도 체크포인트가 깨지지 않도록)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CHECKPOINT_VERSION, **asdict(self)}, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def seen_path(path: str) -> str:
+        return f"{path}.seen"
+
+    def load_seen(self, path: Optional[str]) -> set:
+        """체크포인트 시점까지 기록된 clerk_user_id 집합 (그 뒤에 쓴 부분은 잘라냄)"""
+        if not path or not os.path.exists(self.seen_path(path)):
+            self.seen_bytes = 0
+            return set()
+        with open(self.seen_path(path), "r+b") as f:
+            data = f.read(self.seen_bytes)
+            f.truncate(self.seen_bytes)
+        return set(data.decode("utf-8").split())
+
+    def append_seen(self, path: Optional[str], clerk_user_ids: List[str]) -> None:
+        """새로 본 clerk_user_id를 .seen 파일에 추가 (체크포인트 저장 전에 호출)"""
+        if not path or not clerk_user_ids:
+            return
+        with open(self.seen_path(path), "ab") as f:
+            f.write("".join(f"{c}\n" for c in clerk_user_ids).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self.seen_bytes = f.tell()
+
+    @classmethod
+    def remove(cls, path: Optional[str]) -> None:
+        """체크포인트와 .seen 파일 삭제"""
+        if not path:
+            return
+        for file_path in (path, cls.seen_path(path)):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+def build_account_row(user: dict) -> Optional[dict]:
+    """
+    Clerk 사용자 → accounts upsert 행
+
+    닉네임 규칙은 웹훅과 같습니다. (username > first_name + last_name > 이메일 앞부분)
+    이메일이 없으면 None.
+    """
+    email = user.get("email")
+    if not email:
+        return None
+    nickname = (user.get("nickname") or "").strip() or email.split("@")[0]
+    return {
+        "clerk_user_id": user["id"],
+        "email": email,
+        "nickname": nickname[:50],
+        "profile_image_url": user.get("image_url")
+    }
+
+
+class ClerkReconciler:
+    """
+    Clerk 전체 사용자와 accounts 테이블 동기화
+
+    사용법:
+        reconciler = ClerkReconciler(get_clerk_client(), checkpoint_path="reconcile.json")
+        stats = await reconciler.run()
+    """
+
+    def __init__(
+        self,
+        client: ClerkAPIClient,
+        *,
+        session_factory=AsyncSessionLocal,
+        page_size: int = 500,
+        concurrency: int = 4,
+        batch_size: int = 1000,
+        checkpoint_path: Optional[str] = None,
+        apply_deletes: bool = True,
+        dry_run: bool = False,
+        retries: int = 5,
+        retry_delay: float = 1.0
+    ):
+        """
+        Args:
+            client: Clerk API 클라이언트
+            session_factory: DB 세션 팩토리
+            page_size: Clerk 페이지 크기 (최대 500)
+            concurrency: 동시에 가져올 페이지 수
+            batch_size: upsert 한 번에 넣을 행 수 (파라미터 수 제한 때문에 최대 4000)
+            checkpoint_path: 체크포인트 파일 경로 (None이면 저장하지 않음)
+            apply_deletes: Clerk에 없는 계정을 소프트 삭제할지 여부
+            dry_run: True면 DB에 쓰지 않고 통계만 계산
+            retries: Clerk 요청 최대 시도 횟수 (429/5xx/네트워크 오류)
+            retry_delay: 재시도 대기 기본값 (초, 시도마다 2배, Retry-After가 있으면 그 값)
+        """
+        self.client = client
+        self.session_factory = session_factory
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.batch_size = min(batch_size, 4000)
+        self.checkpoint_path = checkpoint_path
+        self.apply_deletes = apply_deletes
+        self.dry_run = dry_run
+        self.retries = retries
+        self.retry_delay = retry_delay
+        # 페이지 조회와 삭제 확인 조회가 함께 쓰는 Clerk 동시 요청 제한
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    # ============== DB ==============
+
+    async def load_accounts(self) -> Dict[str, Tuple[str, str, Optional[str], bool]]:
+        """accounts 전체를 clerk_user_id → (email, nickname, profile_image_url, is_deleted)로 로드"""
+        async with self.session_factory() as db:
+            result = await db.stream(
+                select(
+                    Account.clerk_user_id,
+                    Account.email,
+                    Account.nickname,
+                    Account.profile_image_url,
+                    Account.is_deleted
+                ).execution_options(yield_per=10000)
+            )
+            accounts = {}
+            async for row in result:
+                accounts[row.clerk_user_id] = (row.email, row.nickname, row.profile_image_url, row.is_deleted)
+            return accounts
+
+    @staticmethod
+    def _count_written(changes: List[Tuple[str, dict]], stats: ReconcileStats) -> None:
+        for kind, _ in changes:
+            setattr(stats, kind, getattr(stats, kind) + 1)
+
+    async def _upsert_rows(self, changes: List[Tuple[str, dict]], stats: ReconcileStats) -> None:
+        """
+        batch_size씩 나눠서 upsert, 청크마다 커밋 (실패한 청크는 한 행씩 재시도)
+
+        추가/변경 건수는 커밋에 성공한 행만 셉니다. (dry-run은 쓴 것으로 간주)
+
+        Args:
+            changes: ("inserted" / "updated", upsert 행) 목록
+        """
+        if self.dry_run:
+            self._count_written(changes, stats)
+            return
+        for start in range(0, len(changes), self.batch_size):
+            chunk = changes[start:start + self.batch_size]
+            async with self.session_factory() as db:
+                try:
+                    await account_crud.bulk_upsert_from_clerk(db, rows=[row for _, row in chunk])
+                    await db.commit()
+                    self._count_written(chunk, stats)
+                    continue
+                except Exception as e:
+                    await db.rollback()
+                    logger.warning(f"upsert 청크 실패, 한 행씩 재시도: {e}")
+            for change in chunk:
+                row = change[1]
+                async with self.session_factory() as db:
+                    try:
+                        await account_crud.bulk_upsert_from_clerk(db, rows=[row])
+                        await db.commit()
+                        self._count_written([change], stats)
+                    except Exception as e:
+                        await db.rollback()
+                        stats.failed += 1
+                        logger.error(f"계정 동기화 실패: clerk_user_id={row['clerk_user_id']}, {e}")
+
+    async def _soft_delete(self, clerk_user_ids: List[str]) -> int:
+        """소프트 삭제 후 실제로 삭제 처리된 행 수 반환 (dry-run은 대상 수)"""
+        if self.dry_run:
+            return len(clerk_user_ids)
+        deleted = 0
+        for start in range(0, len(clerk_user_ids), self.batch_size):
+            async with self.session_factory() as db:
+                deleted += await account_crud.bulk_soft_delete_by_clerk_ids(
+                    db,
+                    clerk_user_ids=clerk_user_ids[start:start + self.batch_size]
+                )
+                await db.commit()
+        return deleted
+
+    # ============== Clerk ==============
+
+    async def _call_clerk(self, call: Callable[[], Awaitable[T]], description: str) -> T:
+        """
+        Clerk 요청 하나 실행 (동시 요청 제한 + 429/5xx/네트워크 오류 지수 백오프 재시도)
+
+        재시도 대기 중에는 동시 요청 슬롯을 잡고 있지 않습니다.
+        """
+        for attempt in range(self.retries):
+            try:
+                async with self._semaphore:
+                    return await call()
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code != 429 and status_code < 500 or attempt == self.retries - 1:
+                    raise
+                retry_after = e.response.headers.get("retry-after")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else self.retry_delay * 2 ** attempt
+            except httpx.TransportError:
+                if attempt == self.retries - 1:
+                    raise
+                delay = self.retry_delay * 2 ** attempt
+            logger.warning(f"Clerk 요청 재시도: {description}, {delay}s 후")
+            await asyncio.sleep(delay)
+        raise RuntimeError("retries는 1 이상이어야 합니다.")
+
+    async def _fetch_page(self, offset: int) -> List[dict]:
+        """페이지 하나 조회"""
+        return await self._call_clerk(
+            lambda: self.client.list_users(limit=self.page_size, offset=offset),
+            f"offset={offset}"
+        )
+
+    # ============== 비교 ==============
+
+    def diff_page(
+        self,
+        users: List[dict],
+        accounts: Dict[str, Tuple[str, str, Optional[str], bool]],
+        seen: set,
+        stats: ReconcileStats
+    ) -> List[Tuple[str, dict]]:
+        """
+        Clerk 사용자 페이지를 DB와 비교해서 upsert할 행만 반환
+
+        Returns:
+            ("inserted" / "updated", upsert 행) 목록 (건수는 쓰기에 성공한 뒤 _upsert_rows에서 셈)
+        """
+        rows = []
+        for user in users:
+            clerk_user_id = user.get("id")
+            if not clerk_user_id or clerk_user_id in seen:
+                # 페이지 경계에서 밀린 중복
+                continue
+            seen.add(clerk_user_id)
+            stats.clerk_users += 1
+
+            row = build_account_row(user)
+            if row is None:
+                stats.skipped += 1
+                continue
+
+            current = accounts.get(clerk_user_id)
+            if current is None:
+                rows.append(("inserted", row))
+                continue
+
+            email, nickname, profile_image_url, is_deleted = current
+            # upsert는 프로필 이미지가 None이면 기존 값을 유지하므로 비교도 같은 규칙
+            image_changed = row["profile_image_url"] is not None and row["profile_image_url"] != profile_image_url
+            if is_deleted or email != row["email"] or nickname != row["nickname"] or image_changed:
+                rows.append(("updated", row))
+            else:
+                stats.unchanged += 1
+        return rows
+
+    async def _confirm_missing(self, candidates: List[str]) -> List[str]:
+        """
+        Clerk 목록에 없던 계정을 개별 조회로 한 번 더 확인
+
+        진행 중에 다른 사용자가 삭제되면 offset이 밀려서 목록에서 빠질 수 있으므로,
+        실제로 404인 계정만 삭제 대상으로 남깁니다.
+        """
+        async def check(clerk_user_id: str) -> Optional[str]:
+            user = await self._call_clerk(lambda: self.client.get_user(clerk_user_id), f"user={clerk_user_id}")
+            return clerk_user_id if user is None else None
+
+        results = await asyncio.gather(*[check(c) for c in candidates])
+        return [c for c in results if c is not None]
+
+    # ============== 실행 ==============
+
+    async def run(self) -> ReconcileStats:
+        """동기화 실행 (체크포인트가 있으면 이어서 진행)"""
+        started = time.perf_counter()
+        checkpoint = Checkpoint.load(self.checkpoint_path)
+        if checkpoint and checkpoint.page_size != self.page_size:
+            raise ValueError(
+                f"체크포인트의 페이지 크기({checkpoint.page_size})와 현재 설정({self.page_size})이 다릅니다."
+            )
+        if checkpoint:
+            logger.info(f"체크포인트에서 이어서 실행: offset={checkpoint.next_offset}")
+        else:
+            checkpoint = Checkpoint(page_size=self.page_size)
+
+        stats = ReconcileStats(**checkpoint.stats)
+        resumed_elapsed = stats.elapsed
+        seen = checkpoint.load_seen(self.checkpoint_path)
+
+        accounts = await self.load_accounts()
+        logger.info(f"accounts {len(accounts)}건 로드")
+
+        if not checkpoint.pages_done:
+            total = await self._call_clerk(self.client.count_users, "count")
+            logger.info(f"Clerk 사용자 {total}명")
+            offset = checkpoint.next_offset
+
+            while True:
+                # concurrency개 페이지를 동시에 가져옴 (끝을 넘어가면 빈 페이지)
+                offsets = [offset + i * self.page_size for i in range(self.concurrency)]
+                pages = await asyncio.gather(*[self._fetch_page(o) for o in offsets])
+
+                # 이번 묶음에서 처음 본 ID (체크포인트에는 이것만 이어 씀)
+                new_ids = list(dict.fromkeys(
+                    user["id"] for users in pages for user in users if user.get("id") and user["id"] not in seen
+                ))
+                rows: List[Tuple[str, dict]] = []
+                for users in pages:
+                    rows.extend(self.diff_page(users, accounts, seen, stats))
+                await self._upsert_rows(rows, stats)
+
+                offset = offsets[-1] + self.page_size
+                last_page_full = len(pages[-1]) == self.page_size
+                stats.elapsed = resumed_elapsed + time.perf_counter() - started
+
+                checkpoint.append_seen(self.checkpoint_path, new_ids)
+                checkpoint.next_offset = offset
+                checkpoint.pages_done = not last_page_full
+                checkpoint.stats = asdict(stats)
+                checkpoint.save(self.checkpoint_path)
+                logger.info(f"offset {offset}/{total} | {stats.summary()}")
+
+                if not last_page_full:
+                    break
+
+        if self.apply_deletes:
+            candidates = [
+                clerk_user_id
+                for clerk_user_id, (_, _, _, is_deleted) in accounts.items()
+                if not is_deleted and clerk_user_id not in seen
+            ]
+            # batch_size씩 확인 → 삭제 (확인 요청은 _call_clerk의 동시 요청 제한 / 재시도 적용)
+            for start in range(0, len(candidates), self.batch_size):
+                missing = await self._confirm_missing(candidates[start:start + self.batch_size])
+                stats.deleted += await self._soft_delete(missing)
+
+        stats.elapsed = resumed_elapsed + time.perf_counter() - started
+
+        # 정상 종료 시 체크포인트 제거 (다음 실행은 처음부터)
+        Checkpoint.remove(self.checkpoint_path)
+
+        logger.info(f"동기화 완료: {stats.summary()}")
+        return stats
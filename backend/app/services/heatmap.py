@@ -0,0 +1,287 @@
+"""
+가격 히트맵 (미리 계산한 격자 집계)
+
+요청 시점에 실거래를 공간 집계하지 않고, 배치(scripts/build_heatmap.py)가
+기간(1m/3m/6m) × 줌 레벨마다 격자 칸별 집계를 계산해서 Redis에 저장합니다.
+- 칸별 값: 평당가 중앙값(만원), 거래량
+- 저장 형식: 칸 하나 = 16바이트 고정 길이 레코드 배열 (HEATMAP_DTYPE, little-endian)
+- 키: map:heatmap:{build_id}:{period}:z{zoom}, 현재 build_id는 map:heatmap:current
+  → 새 배치가 끝나면 포인터만 바꾸므로 조회 중에 반쯤 갱신된 데이터를 보지 않습니다.
+
+API는 (기간, 줌) 키 하나를 GET해서 그대로 반환하므로 요청 비용이 데이터 양과 무관합니다.
+디코딩한 배열은 build_id 기준으로 프로세스 메모리에도 캐시합니다.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis_bytes
+from app.utils.geo import PYEONG_M2, degrees_per_pixel
+
+logger = logging.getLogger(__name__)
+
+# 칸 하나의 레코드: 격자 좌표(x, y), 평당가 중앙값, 거래량
+HEATMAP_DTYPE = np.dtype([("x", "<i4"), ("y", "<i4"), ("median", "<f4"), ("count", "<u4")])
+
+# 기간 → 개월 수
+PERIOD_MONTHS = {"1m": 1, "3m": 3, "6m": 6}
+
+# 격자 위도 간격 계산 기준 위도 (한반도 중앙)
+REFERENCE_LAT = 36.5
+
+CURRENT_KEY = "map:heatmap:current"
+
+_Y_OFFSET = 2 ** 31
+
+
+def heatmap_zooms() -> List[int]:
+    """미리 계산하는 줌 레벨 목록 (오름차순)"""
+    return sorted(int(z) for z in settings.HEATMAP_ZOOMS.split(",") if z.strip())
+
+
+def grid_cell_size(zoom: int) -> Tuple[float, float]:
+    """
+    히트맵 격자 한 칸의 크기 (경도 간격, 위도 간격)
+
+    전국을 같은 격자로 나눠야 하므로 위도 보정은 REFERENCE_LAT 하나로 고정합니다.
+    """
+    cell_lng = degrees_per_pixel(zoom) * settings.HEATMAP_CELL_PX
+    return cell_lng, cell_lng * float(np.cos(np.radians(REFERENCE_LAT)))
+
+
+def aggregate_grid(
+    lng: np.ndarray,
+    lat: np.ndarray,
+    values: np.ndarray,
+    cell_lng: float,
+    cell_lat: float
+) -> np.ndarray:
+    """
+    점 데이터를 격자 칸별로 집계 (중앙값 / 개수), 파이썬 반복문 없이 NumPy로 처리
+
+    1. 칸 번호 (floor(경도/간격), floor(위도/간격))를 int64 키 하나로 합침
+    2. (키, 값) 순으로 정렬 → 같은 칸이 연속 구간이 됨
+    3. 구간 시작 위치 / 길이로 가운데 값(들)을 바로 꺼냄
+
+    Returns:
+        HEATMAP_DTYPE 배열 (칸 키 순)
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=HEATMAP_DTYPE)
+
+    cell_x = np.floor(lng / cell_lng).astype(np.int64)
+    cell_y = np.floor(lat / cell_lat).astype(np.int64)
+    keys = cell_x * (2 ** 32) + (cell_y + _Y_OFFSET)
+
+    order = np.lexsort((values, keys))
+    sorted_keys = keys[order]
+    sorted_values = values[order]
+
+    unique_keys, starts, counts = np.unique(sorted_keys, return_index=True, return_counts=True)
+    lower = sorted_values[starts + (counts - 1) // 2]
+    upper = sorted_values[starts + counts // 2]
+
+    grid = np.empty(len(unique_keys), dtype=HEATMAP_DTYPE)
+    grid["x"] = unique_keys // (2 ** 32)
+    grid["y"] = unique_keys % (2 ** 32) - _Y_OFFSET
+    grid["median"] = (lower + upper) / 2
+    grid["count"] = counts
+    return grid
+
+
+@dataclass
+class HeatmapGrid:
+    """Redis에서 읽은 (기간, 줌) 하나의 격자 집계"""
+    build_id: str
+    period: str
+    zoom: int
+    cell_lng: float
+    cell_lat: float
+    cells: np.ndarray
+
+    def in_bounds(self, west: float, south: float, east: float, north: float) -> np.ndarray:
+        """칸 중심이 영역 안에 있는 칸만"""
+        lng, lat = self.centers()
+        mask = (lng >= west) & (lng <= east) & (lat >= south) & (lat <= north)
+        return self.cells[mask]
+
+    def centers(self, cells: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        cells = self.cells if cells is None else cells
+        return (cells["x"] + 0.5) * self.cell_lng, (cells["y"] + 0.5) * self.cell_lat
+
+
+# ============== 배치: 계산 후 Redis 저장 ==============
+
+
+async def load_recent_sales(db: AsyncSession, since: date, batch_size: int = 50000) -> Dict[str, np.ndarray]:
+    """
+    since 이후 매매 거래를 NumPy 배열로 로드 (서버 사이드 커서로 batch_size씩)
+
+    Returns:
+        lng, lat, price_per_pyeong(만원), deal_day(1970-01-01 기준 일수) 배열
+    """
+    sql = text("""
+        SELECT ST_X(a.geometry), ST_Y(a.geometry), t.trans_price, t.exclusive_area::float8,
+               (t.deal_date - DATE '1970-01-01')
+        FROM transactions t
+        JOIN apartments a ON a.apt_id = t.apt_id
+        WHERE t.trans_type = 'SALE'
+          AND t.deal_date >= :since
+          AND t.trans_price IS NOT NULL
+          AND t.exclusive_area > 0
+          AND t.is_canceled = false
+          AND t.is_deleted = false
+          AND a.is_deleted = false
+    """).execution_options(yield_per=batch_size)
+
+    chunks = []
+    result = await db.stream(sql, {"since": since})
+    async for partition in result.partitions(batch_size):
+        chunks.append(np.asarray(partition, dtype=np.float64))
+
+    if not chunks:
+        data = np.empty((0, 5), dtype=np.float64)
+    else:
+        data = np.concatenate(chunks)
+    return {
+        "lng": data[:, 0],
+        "lat": data[:, 1],
+        "price_per_pyeong": data[:, 2] / (data[:, 3] / PYEONG_M2),
+        "deal_day": data[:, 4].astype(np.int64)
+    }
+
+
+def _data_key(build_id: str, period: str, zoom: int) -> str:
+    return f"map:heatmap:{build_id}:{period}:z{zoom}"
+
+
+def _meta_key(build_id: str) -> str:
+    return f"map:heatmap:{build_id}:meta"
+
+
+async def build_heatmaps(db: AsyncSession, *, today: Optional[date] = None) -> Dict[str, int]:
+    """
+    모든 (기간, 줌) 격자 집계를 계산해서 Redis에 저장하고 current 포인터를 바꿈
+
+    가장 긴 기간의 거래를 한 번만 로드하고, 기간별로 날짜 마스크만 적용합니다.
+
+    Returns:
+        "{period}:z{zoom}" → 칸 수
+    """
+    today = today or date.today()
+    periods = [p for p in settings.HEATMAP_PERIODS.split(",") if p in PERIOD_MONTHS]
+    zooms = heatmap_zooms()
+    oldest = min(today - relativedelta(months=PERIOD_MONTHS[p]) for p in periods)
+
+    started = time.perf_counter()
+    sales = await load_recent_sales(db, oldest)
+    logger.info(f"히트맵 원본 로드: {len(sales['lng'])}건 ({time.perf_counter() - started:.1f}s)")
+
+    build_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    redis = get_redis_bytes()
+    pipe = redis.pipeline(transaction=False)
+    summary: Dict[str, int] = {}
+    epoch = date(1970, 1, 1)
+
+    for period in periods:
+        since_day = (today - relativedelta(months=PERIOD_MONTHS[period]) - epoch).days
+        mask = sales["deal_day"] >= since_day
+        lng, lat, values = sales["lng"][mask], sales["lat"][mask], sales["price_per_pyeong"][mask]
+        for zoom in zooms:
+            cell_lng, cell_lat = grid_cell_size(zoom)
+            grid = aggregate_grid(lng, lat, values, cell_lng, cell_lat)
+            pipe.set(_data_key(build_id, period, zoom), grid.tobytes(), ex=settings.HEATMAP_TTL)
+            summary[f"{period}:z{zoom}"] = len(grid)
+
+    pipe.hset(_meta_key(build_id), mapping={
+        "generated_at": datetime.utcnow().isoformat(),
+        "today": today.isoformat(),
+        "cell_px": settings.HEATMAP_CELL_PX,
+        "zooms": ",".join(str(z) for z in zooms),
+        "periods": ",".join(periods)
+    })
+    pipe.expire(_meta_key(build_id), settings.HEATMAP_TTL)
+    await pipe.execute()
+
+    # 새 데이터를 다 쓴 뒤에 포인터 교체 (이전 빌드 키는 TTL로 만료)
+    await redis.set(CURRENT_KEY, build_id)
+    logger.info(f"🔥 히트맵 빌드 완료: {build_id}, {len(summary)}개 격자 ({time.perf_counter() - started:.1f}s)")
+    return summary
+
+
+# ============== API: 조회 ==============
+
+# (build_id, period, zoom) → HeatmapGrid
+_grid_cache: Dict[Tuple[str, str, int], HeatmapGrid] = {}
+
+
+def nearest_zoom(zoom: int) -> int:
+    """미리 계산한 줌 중 요청 줌 이하에서 가장 가까운 값 (없으면 가장 작은 값)"""
+    zooms = heatmap_zooms()
+    candidates = [z for z in zooms if z <= zoom]
+    return candidates[-1] if candidates else zooms[0]
+
+
+async def get_heatmap(period: str, zoom: int) -> Optional[HeatmapGrid]:
+    """
+    (기간, 줌) 격자 조회 - Redis GET 한 번 (같은 빌드면 메모리 캐시)
+
+    Returns:
+        HeatmapGrid, 배치가 아직 안 돌았으면 None
+
+    Raises:
+        RedisError: Redis 장애 (엔드포인트가 503으로 변환)
+    """
+    redis = get_redis_bytes()
+    build_id = await redis.get(CURRENT_KEY)
+    if build_id is None:
+        return None
+    build_id = build_id.decode()
+    zoom = nearest_zoom(zoom)
+
+    cache_key = (build_id, period, zoom)
+    grid = _grid_cache.get(cache_key)
+    if grid is not None:
+        return grid
+
+    raw = await redis.get(_data_key(build_id, period, zoom))
+    if raw is None:
+        return None
+    cell_lng, cell_lat = grid_cell_size(zoom)
+    grid = HeatmapGrid(
+        build_id=build_id,
+        period=period,
+        zoom=zoom,
+        cell_lng=cell_lng,
+        cell_lat=cell_lat,
+        cells=np.frombuffer(raw, dtype=HEATMAP_DTYPE)
+    )
+
+    # 이전 빌드의 캐시는 버림
+    for key in [k for k in _grid_cache if k[0] != build_id]:
+        del _grid_cache[key]
+    _grid_cache[cache_key] = grid
+    return grid
+
+
+def grid_to_columns(grid: HeatmapGrid, cells: np.ndarray, value_type: str) -> Dict[str, Sequence]:
+    """응답용 컬럼 형식 변환 (칸 중심 좌표 + 값 + 거래량)"""
+    lng, lat = grid.centers(cells)
+    if value_type == "price":
+        value = np.round(cells["median"].astype(np.float64), 1)
+    else:
+        value = cells["count"]
+    return {
+        "lng": np.round(lng, 6).tolist(),
+        "lat": np.round(lat, 6).tolist(),
+        "value": value.tolist(),
+        "count": cells["count"].tolist()
+    }
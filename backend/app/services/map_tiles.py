@@ -0,0 +1,223 @@
+"""
+아파트 벡터 타일 (Mapbox Vector Tile)
+
+PostGIS ST_AsMVT로 z/x/y 타일을 만들고 Redis에 캐시합니다.
+- 타일 속성: apt_id, apt_name, total_household_cnt, latest_price(만원), latest_deal_date
+- 캐시 키에 데이터셋 버전이 들어가므로, 버전만 올리면 이전 타일은 전부 무효화됩니다.
+  (이전 버전 키는 MAP_TILE_CACHE_TTL 후 자연히 만료)
+- 실거래 적재 후처리 훅(on_transactions_ingested)이 매매 거래가 바뀌면 버전을 올립니다.
+- 버전을 올릴 때 Primary의 WAL LSN을 함께 기록합니다. 캐시 미스 때 읽기 세션(복제본)이
+  그 LSN까지 따라잡지 못했으면 Primary에서 그리므로, 새 버전 키에 이전 데이터가 저장되지 않습니다.
+
+프론트엔드는 /map/tiles/version의 URL 템플릿(?v=버전)을 쓰면
+같은 버전 동안 브라우저 캐시만으로 타일을 다시 받지 않습니다.
+"""
+import logging
+import time
+from typing import Optional, Tuple
+
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import get_redis_bytes
+from app.db.replica import replica_caught_up
+from app.db.session import AsyncReadOnlySessionLocal, replica_router
+
+logger = logging.getLogger(__name__)
+
+TILE_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+TILE_LAYER = "apartments"
+VERSION_KEY = "map:tiles:apartments:version"
+VERSION_LSN_KEY = "map:tiles:apartments:version_lsn"
+
+tile_requests = metrics.counter("map_tile_requests_total", "벡터 타일 요청 수 (result=hit/miss/empty)")
+tile_primary_renders = metrics.counter(
+    "map_tile_primary_renders_total", "복제본 지연으로 Primary에서 그린 타일 수"
+)
+tile_render_seconds = metrics.histogram("map_tile_render_seconds", "벡터 타일 생성(ST_AsMVT) 시간")
+
+_TILE_SQL = text("""
+WITH features AS (
+    SELECT
+        ST_AsMVTGeom(
+            ST_Transform(a.geometry, 3857),
+            ST_TileEnvelope(:z, :x, :y),
+            :extent,
+            :buffer,
+            true
+        ) AS geom,
+        a.apt_id,
+        a.apt_name,
+        a.total_household_cnt,
+        latest.trans_price AS latest_price,
+        to_char(latest.deal_date, 'YYYY-MM-DD') AS latest_deal_date
+    FROM apartments a
+    LEFT JOIN LATERAL (
+        SELECT t.trans_price, t.deal_date
+        FROM transactions t
+        WHERE t.apt_id = a.apt_id
+          AND t.trans_type = 'SALE'
+          AND t.is_canceled = false
+          AND t.is_deleted = false
+        ORDER BY t.deal_date DESC
+        LIMIT 1
+    ) latest ON true
+    WHERE a.geometry && ST_Transform(ST_TileEnvelope(:z, :x, :y, margin => :margin), 4326)
+      AND a.is_deleted = false
+)
+SELECT ST_AsMVT(features, :layer, :extent, 'geom') FROM features
+""")
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    """z/x/y가 Web Mercator 타일 범위 안인지 확인"""
+    return 0 <= z <= 22 and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+async def get_dataset_state() -> Tuple[int, Optional[str]]:
+    """
+    현재 타일 데이터셋 버전과 그 버전을 올릴 때의 Primary WAL LSN
+
+    Returns:
+        (버전, LSN) - Redis 장애 시 (0, None), 복제본이 없으면 LSN은 None
+    """
+    try:
+        version, lsn = await get_redis_bytes().mget(VERSION_KEY, VERSION_LSN_KEY)
+    except RedisError as e:
+        logger.warning(f"⚠️ 타일 버전 조회 실패: {e}")
+        return 0, None
+    return (int(version) if version else 0), (lsn.decode() if lsn else None)
+
+
+async def get_dataset_version() -> int:
+    """현재 타일 데이터셋 버전 (Redis 장애 시 0)"""
+    version, _ = await get_dataset_state()
+    return version
+
+
+async def _primary_wal_lsn() -> Optional[str]:
+    """Primary의 현재 WAL 위치 (복제본이 없거나 조회 실패 시 None)"""
+    if not replica_router.enabled:
+        return None
+    try:
+        async with AsyncReadOnlySessionLocal() as db:
+            result = await db.execute(text("SELECT pg_current_wal_lsn()::text"))
+            return result.scalar()
+    except Exception as e:
+        logger.warning(f"⚠️ WAL LSN 조회 실패 (복제본 지연 확인 없이 버전 갱신): {e}")
+        return None
+
+
+async def bump_dataset_version() -> int:
+    """
+    타일 데이터셋 버전 올리기 (캐시된 타일 전부 무효화)
+
+    아파트 정보(이름, 위치, 삭제 여부)가 바뀌었을 때도 호출하세요. (변경을 커밋한 뒤)
+    LSN과 버전을 한 트랜잭션(MULTI)으로 기록하므로 새 버전은 항상 새 LSN과 함께 보입니다.
+    """
+    lsn = await _primary_wal_lsn()
+    pipe = get_redis_bytes().pipeline(transaction=True)
+    if lsn:
+        pipe.set(VERSION_LSN_KEY, lsn)
+    else:
+        pipe.delete(VERSION_LSN_KEY)
+    pipe.incr(VERSION_KEY)
+    _, version = await pipe.execute()
+    logger.info(f"🗺️ 지도 타일 버전 갱신: v{version}")
+    return version
+
+
+def _cache_key(version: int, z: int, x: int, y: int) -> str:
+    return f"map:tiles:apartments:v{version}:{z}:{x}:{y}"
+
+
+async def render_tile(db: AsyncSession, z: int, x: int, y: int) -> bytes:
+    """ST_AsMVT로 타일 생성 (캐시 없이)"""
+    extent = settings.MAP_TILE_EXTENT
+    buffer = settings.MAP_TILE_BUFFER
+    started = time.perf_counter()
+    result = await db.execute(_TILE_SQL, {
+        "z": z,
+        "x": x,
+        "y": y,
+        "extent": extent,
+        "buffer": buffer,
+        "margin": buffer / extent,
+        "layer": TILE_LAYER
+    })
+    tile = result.scalar()
+    tile_render_seconds.observe(time.perf_counter() - started)
+    return bytes(tile) if tile else b""
+
+
+async def render_fresh_tile(db: AsyncSession, z: int, x: int, y: int, min_lsn: Optional[str]) -> bytes:
+    """
+    min_lsn 시점 이후 데이터로 타일 생성
+
+    db가 아직 min_lsn을 반영하지 못한 복제본이면 Primary(읽기 전용)에서 그립니다.
+    버전이 들어간 캐시 키에 저장할 타일은 이 함수로 만들어야 합니다.
+    """
+    if await replica_caught_up(db, min_lsn):
+        return await render_tile(db, z, x, y)
+    tile_primary_renders.inc()
+    async with AsyncReadOnlySessionLocal() as primary:
+        return await render_tile(primary, z, x, y)
+
+
+async def get_tile(
+    db: AsyncSession,
+    z: int,
+    x: int,
+    y: int,
+    version: Optional[int] = None,
+    min_lsn: Optional[str] = None
+) -> bytes:
+    """
+    타일 조회 (Redis 캐시 → 없으면 생성 후 저장)
+
+    MAP_TILE_MIN_ZOOM 미만은 빈 타일을 반환합니다. (축소 화면은 /map/apartments 클러스터 사용)
+
+    Args:
+        db: 데이터베이스 세션
+        z, x, y: 타일 좌표
+        version: 데이터셋 버전 (None이면 LSN과 함께 조회)
+        min_lsn: 그 버전을 올릴 때 기록된 LSN (get_dataset_state)
+    """
+    if z < settings.MAP_TILE_MIN_ZOOM:
+        tile_requests.inc(result="empty")
+        return b""
+
+    if version is None:
+        version, min_lsn = await get_dataset_state()
+    key = _cache_key(version, z, x, y)
+    redis = get_redis_bytes()
+
+    try:
+        cached = await redis.get(key)
+    except RedisError as e:
+        logger.warning(f"⚠️ 타일 캐시 조회 실패: {e}")
+        cached = None
+    if cached is not None:
+        tile_requests.inc(result="hit")
+        return cached
+
+    tile_requests.inc(result="miss")
+    tile = await render_fresh_tile(db, z, x, y, min_lsn)
+    try:
+        await redis.set(key, tile, ex=settings.MAP_TILE_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"⚠️ 타일 캐시 저장 실패: {e}")
+    return tile
+
+
+async def on_transactions_ingested(result) -> None:
+    """
+    실거래 적재 후처리 훅: 매매 거래가 바뀌면 타일 버전을 올림
+
+    타일에는 최근 매매가만 들어가므로 전월세 적재는 타일을 무효화하지 않습니다.
+    """
+    if any(trans_type == "SALE" for _, _, trans_type in result.touched_months):
+        await bump_dataset_version()
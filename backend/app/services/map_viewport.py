@@ -0,0 +1,284 @@
+"""
+지도 뷰포트 조회 + 타일 단위 캐시 (/map/apartments)
+
+지도를 드래그할 때마다 bounds가 몇 미터씩 달라지므로 bounds 원본을 캐시 키로 쓰면
+거의 적중하지 않습니다. 그래서 뷰포트를 해당 줌의 Web Mercator 타일 격자로 나눠서
+타일마다 결과를 캐시하고, 요청마다 덮는 타일들의 결과를 합칩니다.
+- 겹치는 뷰포트는 겹치는 타일의 캐시를 그대로 재사용
+- 없는 타일만 DB에서 한 번에 조회 (없는 타일들을 덮는 영역으로 쿼리 1번)
+- 마커 수 한도(MAP_TILE_MARKER_LIMIT)는 타일마다 적용하고, 한도에 걸린 타일은 캐시 값에
+  truncated로 남겨서 그 타일을 쓰는 응답의 meta.truncated에 반영합니다.
+- 클러스터 격자 칸(MAP_CLUSTER_CELL_PX)은 256의 약수라서 타일 경계를 넘지 않으므로
+  타일별 결과를 합쳐도 DB에서 한 번에 집계한 결과와 같습니다.
+- 캐시 키에 지도 타일 데이터셋 버전(app/services/map_tiles.py)이 들어가므로
+  실거래 적재로 버전이 오르면 함께 무효화됩니다.
+  버전을 올린 직후 읽기 세션(복제본)이 그 시점 LSN을 따라잡지 못했으면 없는 타일은 Primary에서 채웁니다.
+
+메트릭:
+- map_viewport_tile_requests_total{result=hit|miss|bypass}: 타일 캐시 결과
+- map_viewport_raw_key_requests_total{result=hit|miss}: bounds 원본을 키로 썼다면의 결과 (비교용)
+- map_viewport_cache_hit_ratio{strategy=tile|raw_bbox}: 두 방식의 적중률
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.redis import get_redis
+from app.crud.apartment import apartment as apartment_crud
+from app.db.replica import replica_caught_up
+from app.db.session import AsyncReadOnlySessionLocal
+from app.services.map_tiles import get_dataset_state
+from app.utils.geo import (
+    TILE_SIZE,
+    Bounds,
+    mercator_cell_size,
+    tile_bounds,
+    tile_count,
+    tiles_covering,
+    union_bounds
+)
+
+logger = logging.getLogger(__name__)
+
+Tile = Tuple[int, int]
+
+tile_requests = metrics.counter(
+    "map_viewport_tile_requests_total",
+    "지도 뷰포트 타일 캐시 조회 수 (result=hit/miss/bypass)"
+)
+raw_key_requests = metrics.counter(
+    "map_viewport_raw_key_requests_total",
+    "bounds 원본을 캐시 키로 썼다면의 조회 결과 (비교용, result=hit/miss)"
+)
+hit_ratio = metrics.gauge("map_viewport_cache_hit_ratio", "지도 뷰포트 캐시 적중률 (strategy=tile/raw_bbox)")
+
+
+def _ratio(counter) -> float:
+    hits = counter.value(result="hit")
+    total = hits + counter.value(result="miss")
+    return hits / total if total else 0.0
+
+
+hit_ratio.set_function(lambda: _ratio(tile_requests), strategy="tile")
+hit_ratio.set_function(lambda: _ratio(raw_key_requests), strategy="raw_bbox")
+
+
+class _RawKeyTracker:
+    """
+    bounds 원본 키 캐시를 흉내 내는 프로세스 내 기록 (적중률 비교용, 값은 저장하지 않음)
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+    def record(self, key: str, ttl: float) -> None:
+        now = time.monotonic()
+        expires_at = self._seen.get(key)
+        raw_key_requests.inc(result="hit" if expires_at is not None and expires_at > now else "miss")
+        self._seen[key] = now + ttl
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+
+
+_raw_keys = _RawKeyTracker()
+
+
+def _cache_key(version: int, mode: str, zoom: int, tile: Tile) -> str:
+    # 값 형식: {"items": [...], "truncated": bool} (이전 목록 형식 키와 겹치지 않도록 :t)
+    return f"map:viewport:v{version}:{mode}:{zoom}:{tile[0]}:{tile[1]}:t"
+
+
+async def _load_marker_tiles(db: AsyncSession, zoom: int, tiles: Sequence[Tile]) -> Dict[Tile, dict]:
+    """
+    없는 타일들의 마커를 쿼리 한 번으로 조회해서 타일별로 나눔
+
+    MAP_TILE_MARKER_LIMIT은 타일마다 따로 적용합니다. (한 개 더 가져와서 잘렸는지 확인)
+
+    Returns:
+        타일 → {"items": 마커 목록, "truncated": 타일 한도에 걸렸는지}
+    """
+    area = union_bounds([tile_bounds(zoom, x, y) for x, y in tiles])
+    limit = settings.MAP_TILE_MARKER_LIMIT
+    markers = await apartment_crud.get_markers_in_tiles(
+        db,
+        bounds=area,
+        tile_m=mercator_cell_size(zoom, TILE_SIZE),
+        per_tile_limit=limit + 1
+    )
+    by_tile: Dict[Tile, List[dict]] = {tile: [] for tile in tiles}
+    for marker in markers:
+        tile = tuple(marker.pop("tile"))
+        if tile in by_tile:
+            by_tile[tile].append(marker)
+    return {
+        tile: {"items": items[:limit], "truncated": len(items) > limit}
+        for tile, items in by_tile.items()
+    }
+
+
+async def _load_cluster_tiles(db: AsyncSession, zoom: int, tiles: Sequence[Tile]) -> Dict[Tile, dict]:
+    """
+    없는 타일들의 클러스터를 쿼리 한 번으로 조회해서 타일별로 나눔
+
+    타일 하나에는 격자 칸이 최대 (256 / MAP_CLUSTER_CELL_PX)²개뿐이므로 영역 전체 칸 수를
+    한도로 주면 잘리지 않습니다. 그래도 한도를 넘으면(한 개 더 가져와서 확인) 모든 타일을 잘림으로 표시합니다.
+
+    Returns:
+        타일 → {"items": 클러스터 목록, "truncated": 한도에 걸렸는지}
+    """
+    area = union_bounds([tile_bounds(zoom, x, y) for x, y in tiles])
+    cells_per_tile = TILE_SIZE // settings.MAP_CLUSTER_CELL_PX
+    limit = cells_per_tile * cells_per_tile * tile_count(area, zoom)
+    clusters = await apartment_crud.get_clusters_in_bounds(
+        db,
+        bounds=area,
+        cell_m=mercator_cell_size(zoom, settings.MAP_CLUSTER_CELL_PX),
+        limit=limit + 1
+    )
+    truncated = len(clusters) > limit
+    by_tile: Dict[Tile, List[dict]] = {tile: [] for tile in tiles}
+    for cluster in clusters[:limit]:
+        cell_x, cell_y = cluster["cell"]
+        tile = (cell_x // cells_per_tile, cell_y // cells_per_tile)
+        if tile in by_tile:
+            by_tile[tile].append(cluster)
+    return {tile: {"items": items, "truncated": truncated} for tile, items in by_tile.items()}
+
+
+async def _query_direct(db: AsyncSession, mode: str, zoom: int, bounds: Bounds, limit: int) -> List[dict]:
+    """캐시 없이 뷰포트 전체를 바로 조회 (타일이 너무 많은 요청)"""
+    if mode == "marker":
+        return await apartment_crud.get_markers_in_bounds(db, bounds=bounds, limit=limit)
+    return await apartment_crud.get_clusters_in_bounds(
+        db,
+        bounds=bounds,
+        cell_m=mercator_cell_size(zoom, settings.MAP_CLUSTER_CELL_PX),
+        limit=limit
+    )
+
+
+async def _get_tiles(
+    db: AsyncSession,
+    mode: str,
+    zoom: int,
+    tiles: List[Tile]
+) -> Tuple[List[dict], int, bool]:
+    """
+    타일별 결과를 캐시에서 가져오고, 없는 타일만 DB에서 채운 뒤 합쳐서 반환
+
+    Returns:
+        (합친 항목 목록, 캐시 적중 타일 수, 타일 한도에 걸려 잘린 타일이 있는지)
+    """
+    version, min_lsn = await get_dataset_state()
+    keys = [_cache_key(version, mode, zoom, tile) for tile in tiles]
+    redis = get_redis()
+
+    try:
+        cached: List[Optional[str]] = await redis.mget(keys)
+        cache_ok = True
+    except RedisError as e:
+        logger.warning(f"⚠️ 뷰포트 캐시 조회 실패: {e}")
+        cached = [None] * len(tiles)
+        cache_ok = False
+
+    items: List[dict] = []
+    truncated = False
+    missing: List[Tile] = []
+    for tile, value in zip(tiles, cached):
+        if value is None:
+            missing.append(tile)
+        else:
+            entry = orjson.loads(value)
+            items.extend(entry["items"])
+            truncated = truncated or entry["truncated"]
+    hits = len(tiles) - len(missing)
+    tile_requests.inc(hits, result="hit")
+
+    if missing:
+        tile_requests.inc(len(missing), result="miss")
+        loader = _load_marker_tiles if mode == "marker" else _load_cluster_tiles
+        if await replica_caught_up(db, min_lsn):
+            loaded = await loader(db, zoom, missing)
+        else:
+            # 새 버전 키에 복제본의 이전 데이터가 저장되지 않도록 Primary에서 채움
+            async with AsyncReadOnlySessionLocal() as primary:
+                loaded = await loader(primary, zoom, missing)
+        for entry in loaded.values():
+            items.extend(entry["items"])
+            truncated = truncated or entry["truncated"]
+
+        if cache_ok:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for tile, entry in loaded.items():
+                    pipe.set(
+                        _cache_key(version, mode, zoom, tile),
+                        orjson.dumps(entry),
+                        ex=settings.MAP_VIEWPORT_CACHE_TTL
+                    )
+                await pipe.execute()
+            except RedisError as e:
+                logger.warning(f"⚠️ 뷰포트 캐시 저장 실패: {e}")
+
+    return items, hits, truncated
+
+
+async def get_viewport_apartments(
+    db: AsyncSession,
+    *,
+    bounds: Bounds,
+    zoom: int,
+    limit: int
+) -> Dict[str, Any]:
+    """
+    지도 뷰포트 조회 (타일 캐시 사용)
+
+    Args:
+        db: 데이터베이스 세션
+        bounds: 지도 영역
+        zoom: 줌 레벨
+        limit: 최대 마커 수 (개별 마커 모드)
+
+    Returns:
+        mode, apartments, clusters, truncated, cache(타일 수 / 적중 수)
+    """
+    mode = "marker" if zoom >= settings.MAP_MARKER_MIN_ZOOM else "cluster"
+    max_items = min(limit, settings.MAP_MAX_MARKERS) if mode == "marker" else settings.MAP_MAX_CLUSTERS
+    _raw_keys.record(f"{mode}:{zoom}:{bounds.west}:{bounds.south}:{bounds.east}:{bounds.north}",
+                     settings.MAP_VIEWPORT_CACHE_TTL)
+
+    n_tiles = tile_count(bounds, zoom)
+    if n_tiles > settings.MAP_VIEWPORT_MAX_TILES:
+        # 비정상적으로 넓은 영역: 캐시하지 않고 바로 조회 (한 개 더 가져와서 잘렸는지 확인)
+        tile_requests.inc(result="bypass")
+        items = await _query_direct(db, mode, zoom, bounds, max_items + 1)
+        hits = 0
+        tiles_truncated = False
+    else:
+        items, hits, tiles_truncated = await _get_tiles(db, mode, zoom, tiles_covering(bounds, zoom))
+        # 가장자리 타일에서 화면 밖으로 나간 항목 제거
+        items = [item for item in items if bounds.contains(item["location"]["lng"], item["location"]["lat"])]
+        if mode == "marker":
+            items.sort(key=lambda m: (-m["total_household_cnt"], m["apt_id"]))
+        else:
+            items.sort(key=lambda c: (-c["count"], c["cell"][0], c["cell"][1]))
+
+    # 타일 캐시에 잘린 타일이 있으면 화면에 보이지 않는 항목이 있을 수 있음
+    truncated = len(items) > max_items or tiles_truncated
+    items = items[:max_items]
+    return {
+        "mode": mode,
+        "apartments": items if mode == "marker" else [],
+        "clusters": items if mode == "cluster" else [],
+        "truncated": truncated,
+        "cache": {"tiles": n_tiles, "hits": hits}
+    }
@@ -0,0 +1,210 @@
+"""
+실거래 월별 집계 갱신 (transaction_monthly_stats)
+
+추이 차트(/apartments/{apt_id}/price-trend, /volume-trend)가 요청마다 단지의 모든 거래를
+읽어서 평당가를 계산하지 않도록, (apt_id, 월, 거래유형, 전용면적 구간)별 집계를 테이블에 둡니다.
+
+- 실거래 적재 / 취소 후처리 훅이 바뀐 (apt_id, 월, 거래유형) 칸만 다시 집계합니다.
+  (해당 칸을 지우고 그 달의 거래로 다시 INSERT, 한 트랜잭션)
+  훅 두 개가 같은 칸을 동시에 다시 집계하면 READ COMMITTED에서 뒤쪽 DELETE가 앞쪽이 방금 넣은
+  행을 못 보고 INSERT가 기본키 충돌로 실패하므로, DELETE 전에 칸별 advisory lock을 잡습니다.
+  (잠금 순서를 정렬해 두어 교착 상태가 생기지 않음, 트랜잭션이 끝나면 자동 해제)
+- 전체 재구축은 scripts/build_monthly_stats.py (처음 한 번, 이후 보정용)
+
+전용면적 구간은 app/models/transaction_stat.py의 AREA_BUCKETS를 따르고,
+구간별 행과 함께 면적 구분 없는 전체 행(area_bucket=0)도 같이 만듭니다.
+"""
+import logging
+import time
+import zlib
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Date, Integer, String, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.models.transaction_stat import ALL_AREAS, AREA_BUCKETS
+from app.utils.geo import PYEONG_M2
+
+logger = logging.getLogger(__name__)
+
+MonthKey = Tuple[int, date, str]
+
+# pg_advisory_xact_lock(classid, objid)의 classid (다른 advisory lock과 겹치지 않도록)
+LOCK_CLASS_ID = zlib.crc32(b"transaction_monthly_stats") - 2 ** 31
+
+
+def _area_bucket_case() -> str:
+    """AREA_BUCKETS → SQL CASE 식"""
+    whens = " ".join(
+        f"WHEN t.exclusive_area <= {upper} THEN {bucket}" for bucket, upper in AREA_BUCKETS if upper is not None
+    )
+    return f"CASE {whens} ELSE {AREA_BUCKETS[-1][0]} END"
+
+
+# {source}: transactions t를 포함한 FROM 절, {where}: 추가 조건
+_AGGREGATE_SQL = """
+INSERT INTO transaction_monthly_stats (
+    apt_id, month, trans_type, area_bucket, transaction_count,
+    avg_price, median_price, min_price, max_price,
+    avg_price_per_pyeong, median_price_per_pyeong, min_price_per_pyeong, max_price_per_pyeong,
+    avg_monthly_rent, updated_at
+)
+SELECT
+    t.apt_id,
+    date_trunc('month', t.deal_date)::date,
+    t.trans_type,
+    b.area_bucket,
+    count(*),
+    avg(p.price),
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY p.price),
+    min(p.price),
+    max(p.price),
+    avg(p.price_per_pyeong),
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY p.price_per_pyeong),
+    min(p.price_per_pyeong),
+    max(p.price_per_pyeong),
+    avg(t.monthly_rent) FILTER (WHERE t.trans_type = 'MONTHLY'),
+    now() AT TIME ZONE 'UTC'
+FROM {source}
+CROSS JOIN LATERAL (
+    SELECT
+        CASE WHEN t.trans_type = 'SALE' THEN t.trans_price ELSE t.deposit_price END AS price,
+        CASE WHEN t.trans_type = 'SALE' THEN t.trans_price ELSE t.deposit_price END
+            / (t.exclusive_area::float8 / :pyeong_m2) AS price_per_pyeong
+) p
+CROSS JOIN LATERAL (VALUES ({all_areas}), ({bucket_case})) b(area_bucket)
+WHERE p.price IS NOT NULL
+  AND t.exclusive_area > 0
+  AND t.is_canceled = false
+  AND t.is_deleted = false
+  {where}
+GROUP BY t.apt_id, date_trunc('month', t.deal_date), t.trans_type, b.area_bucket
+"""
+
+_KEYS_CTE = """
+WITH keys AS (
+    SELECT *
+    FROM unnest(CAST(:apt_ids AS integer[]), CAST(:months AS date[]), CAST(:trans_types AS varchar[]))
+        AS k(apt_id, month, trans_type)
+)
+"""
+
+_KEY_PARAMS = (
+    bindparam("apt_ids", type_=ARRAY(Integer)),
+    bindparam("months", type_=ARRAY(Date)),
+    bindparam("trans_types", type_=ARRAY(String))
+)
+
+# 칸별 잠금 (배열 순서대로 하나씩 잡음, 같은 칸을 다시 집계하는 다른 트랜잭션은 commit까지 대기)
+_LOCK_KEYS_SQL = text("""
+SELECT pg_advisory_xact_lock(:class_id, l.lock_id)
+FROM unnest(CAST(:lock_ids AS integer[])) AS l(lock_id)
+""").bindparams(bindparam("class_id", type_=Integer), bindparam("lock_ids", type_=ARRAY(Integer)))
+
+# 바뀐 칸만 다시 집계
+_DELETE_KEYS_SQL = text(_KEYS_CTE + """
+DELETE FROM transaction_monthly_stats s
+USING keys k
+WHERE s.apt_id = k.apt_id AND s.month = k.month AND s.trans_type = k.trans_type
+""").bindparams(*_KEY_PARAMS)
+
+# (apt_id, deal_date) 인덱스로 해당 월의 거래만 읽음
+_INSERT_KEYS_SQL = text(_KEYS_CTE + _AGGREGATE_SQL.format(
+    source="""keys k
+JOIN transactions t
+  ON t.apt_id = k.apt_id
+ AND t.trans_type = k.trans_type
+ AND t.deal_date >= k.month
+ AND t.deal_date < (k.month + interval '1 month')""",
+    where="",
+    all_areas=ALL_AREAS,
+    bucket_case=_area_bucket_case()
+)).bindparams(*_KEY_PARAMS)
+
+# 전체 재구축 (since 이후)
+_DELETE_SINCE_SQL = text("DELETE FROM transaction_monthly_stats WHERE month >= :since")
+_INSERT_SINCE_SQL = text(_AGGREGATE_SQL.format(
+    source="transactions t",
+    where="AND t.deal_date >= :since",
+    all_areas=ALL_AREAS,
+    bucket_case=_area_bucket_case()
+))
+
+
+def _lock_id(key: MonthKey) -> int:
+    """(apt_id, 월, 거래유형) → advisory lock 키 (int4, 모든 프로세스에서 같은 값)"""
+    apt_id, month, trans_type = key
+    return zlib.crc32(f"{apt_id}:{month.isoformat()}:{trans_type}".encode()) - 2 ** 31
+
+
+async def refresh_months(
+    db: AsyncSession,
+    keys: Iterable[MonthKey],
+    *,
+    chunk_size: int = 5000
+) -> int:
+    """
+    (apt_id, 월 1일, 거래유형) 칸들을 다시 집계
+
+    commit은 호출자가 합니다. 칸별 잠금은 commit / rollback 때 풀립니다.
+    모든 호출이 잠금 키 오름차순으로 잠그므로 청크가 여러 개여도 교착 상태가 생기지 않습니다.
+
+    Args:
+        db: 쓰기 가능한 데이터베이스 세션
+        keys: 다시 집계할 (apt_id, 월 1일, trans_type) 목록
+        chunk_size: 쿼리 한 번에 넣을 칸 수
+
+    Returns:
+        새로 쓴 집계 행 수
+    """
+    ordered: List[MonthKey] = sorted(set(keys), key=lambda key: (_lock_id(key), key))
+    written = 0
+    for start in range(0, len(ordered), chunk_size):
+        chunk = ordered[start:start + chunk_size]
+        await db.execute(_LOCK_KEYS_SQL, {
+            "class_id": LOCK_CLASS_ID,
+            "lock_ids": [_lock_id(key) for key in chunk]
+        })
+        params = {
+            "apt_ids": [apt_id for apt_id, _, _ in chunk],
+            "months": [month for _, month, _ in chunk],
+            "trans_types": [trans_type for _, _, trans_type in chunk]
+        }
+        await db.execute(_DELETE_KEYS_SQL, params)
+        result = await db.execute(_INSERT_KEYS_SQL, {**params, "pyeong_m2": PYEONG_M2})
+        written += result.rowcount
+    return written
+
+
+async def rebuild_monthly_stats(db: AsyncSession, *, since: Optional[date] = None) -> int:
+    """
+    since가 속한 달 이후의 집계를 전부 다시 계산 (since가 없으면 전체)
+
+    commit은 호출자가 합니다.
+
+    Returns:
+        새로 쓴 집계 행 수
+    """
+    since = (since or date(1900, 1, 1)).replace(day=1)
+    started = time.perf_counter()
+    await db.execute(_DELETE_SINCE_SQL, {"since": since})
+    result = await db.execute(_INSERT_SINCE_SQL, {"since": since, "pyeong_m2": PYEONG_M2})
+    logger.info(f"월별 집계 재구축: {result.rowcount}행 ({time.perf_counter() - started:.1f}s)")
+    return result.rowcount
+
+
+async def on_transactions_ingested(result) -> None:
+    """
+    실거래 적재 후처리 훅: 거래가 추가 / 취소된 (apt_id, 월, 거래유형)만 다시 집계
+
+    적재 세션은 이미 commit되었으므로 새 쓰기 세션에서 갱신하고 commit합니다.
+    """
+    if not result.touched_months:
+        return
+    async with AsyncSessionLocal() as db:
+        written = await refresh_months(db, result.touched_months)
+        await db.commit()
+    logger.info(f"월별 집계 갱신: {len(result.touched_months)}칸 → {written}행")
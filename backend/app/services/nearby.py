@@ -0,0 +1,152 @@
+"""
+주변 단지 비교 (/apartments/{apt_id}/nearby-comparison)
+
+1. 이웃 집합: 반경 안의 단지를 가까운 순으로 (PostGIS KNN)
+   - ST_DWithin(geography) + ORDER BY geography <-> geography LIMIT n
+   - 둘 다 idx_apartments_geography_active ((geometry::geography) GiST) 인덱스를 탑니다.
+   - 단지 위치는 거의 바뀌지 않으므로 (apt_id, 반경)별로 Redis에 오래 캐시합니다.
+     키: apartment:nearby:{apt_id}:r{radius}
+2. 시세: 이웃마다 실거래를 읽지 않고 월별 집계(transaction_monthly_stats)에서
+   최근 달의 평균 평당가를 한 번에 읽습니다. (시세는 적재 때마다 바뀌므로 캐시하지 않음)
+"""
+import logging
+from datetime import date
+from typing import Any, Dict, Optional
+
+import orjson
+from dateutil.relativedelta import relativedelta
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis_bytes
+from app.crud.transaction_stat import transaction_stat as transaction_stat_crud
+
+logger = logging.getLogger(__name__)
+
+# 대상 단지 + 반경 안의 이웃 (가까운 순)
+# geography 식은 인덱스 정의와 같은 a.geometry::geography 형태로 써야 합니다.
+_NEIGHBORS_SQL = text("""
+SELECT
+    t.apt_id AS target_id,
+    t.apt_name AS target_name,
+    n.apt_id,
+    n.apt_name,
+    n.distance
+FROM apartments t
+LEFT JOIN LATERAL (
+    SELECT
+        a.apt_id,
+        a.apt_name,
+        ST_Distance(a.geometry::geography, t.geometry::geography) AS distance
+    FROM apartments a
+    WHERE a.is_deleted = false
+      AND a.apt_id <> t.apt_id
+      AND ST_DWithin(a.geometry::geography, t.geometry::geography, :radius)
+    ORDER BY a.geometry::geography <-> t.geometry::geography
+    LIMIT :limit
+) n ON true
+WHERE t.apt_id = :apt_id
+  AND t.is_deleted = false
+""")
+
+
+def _neighbors_key(apt_id: int, radius: int) -> str:
+    return f"apartment:nearby:{apt_id}:r{radius}"
+
+
+async def get_neighbors(db: AsyncSession, apt_id: int, radius: int) -> Optional[Dict[str, Any]]:
+    """
+    반경 안의 이웃 단지 (캐시 사용)
+
+    Returns:
+        {"target": {apt_id, apt_name}, "neighbors": [{apt_id, apt_name, distance}]}
+        대상 아파트가 없으면 None
+    """
+    redis = get_redis_bytes()
+    key = _neighbors_key(apt_id, radius)
+    try:
+        raw = await redis.get(key)
+    except RedisError as e:
+        logger.warning(f"⚠️ 주변 단지 캐시 조회 실패: {e}")
+        raw = None
+    if raw is not None:
+        return orjson.loads(raw)
+
+    result = await db.execute(_NEIGHBORS_SQL, {
+        "apt_id": apt_id,
+        "radius": radius,
+        "limit": settings.NEARBY_MAX_NEIGHBORS
+    })
+    rows = result.all()
+    if not rows:
+        return None
+
+    neighbor_set = {
+        "target": {"apt_id": rows[0].target_id, "apt_name": rows[0].target_name},
+        "neighbors": [
+            {"apt_id": row.apt_id, "apt_name": row.apt_name, "distance": round(row.distance)}
+            for row in rows
+            if row.apt_id is not None
+        ]
+    }
+    try:
+        await redis.set(key, orjson.dumps(neighbor_set), ex=settings.NEARBY_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"⚠️ 주변 단지 캐시 저장 실패: {e}")
+    return neighbor_set
+
+
+def _difference_rate(price: Optional[int], base: Optional[int]) -> Optional[float]:
+    if price is None or not base:
+        return None
+    return round((price / base - 1) * 100, 1)
+
+
+async def get_nearby_comparison(
+    db: AsyncSession,
+    apt_id: int,
+    *,
+    radius: int,
+    limit: int
+) -> Optional[Dict[str, Any]]:
+    """
+    대상 단지와 주변 단지의 평당가 비교
+
+    평당가는 최근 NEARBY_PRICE_MONTHS개월 안에서 매매가 있었던 가장 최근 달의 평균입니다.
+    difference_rate = (이웃 평당가 / 대상 평당가 - 1) × 100
+
+    Returns:
+        target_apartment, nearby_apartments (가까운 순) / 대상 아파트가 없으면 None
+    """
+    neighbor_set = await get_neighbors(db, apt_id, radius)
+    if neighbor_set is None:
+        return None
+
+    neighbors = neighbor_set["neighbors"][:limit]
+    since = date.today().replace(day=1) - relativedelta(months=settings.NEARBY_PRICE_MONTHS - 1)
+    prices = await transaction_stat_crud.get_latest_price_per_pyeong(
+        db, apt_ids=[apt_id] + [n["apt_id"] for n in neighbors], since=since
+    )
+
+    target_price = prices.get(apt_id, {})
+    target_ppp = target_price.get("price_per_pyeong")
+    nearby = []
+    for neighbor in neighbors:
+        price = prices.get(neighbor["apt_id"], {})
+        nearby.append({
+            **neighbor,
+            "price_per_pyeong": price.get("price_per_pyeong"),
+            "price_month": price.get("month"),
+            "difference_rate": _difference_rate(price.get("price_per_pyeong"), target_ppp)
+        })
+
+    return {
+        "target_apartment": {
+            **neighbor_set["target"],
+            "price_per_pyeong": target_ppp,
+            "price_month": target_price.get("month")
+        },
+        "nearby_apartments": nearby
+    }
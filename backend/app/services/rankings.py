@@ -0,0 +1,347 @@
+"""
+대시보드 랭킹 (/dashboard/rankings)
+
+요청마다 전체 거래를 집계하지 않고, 기간 × 지역 × 지표별 Redis 정렬 집합(ZSET)을 유지합니다.
+API는 ZREVRANGE / ZRANGE 한 번 + 상세 HMGET 한 번으로 O(log n + N)에 한 페이지를 꺼냅니다.
+
+- 지표(metric): change(평당가 변동률 %), volume(매매 건수), price(평균 평당가)
+  rise / fall = change 내림차순 / 오름차순, price_high / price_low = price 내림차순 / 오름차순
+- 지역: all(전국) 또는 시군구 코드 5자리 (states.region_code 앞 5자리)
+- 값은 월별 집계(transaction_monthly_stats, 매매, 면적 전체 행)에서 계산합니다.
+  최근 기간 = 기준 월까지 N개월, 이전 기간 = 그 앞 N개월
+- 키: dashboard:rankings:{build_id}:{period}:{region}:{metric}
+      dashboard:rankings:{build_id}:{period}:detail (apt_id → 상세 JSON)
+      dashboard:rankings:{build_id}:meta (기준 월, 기간별 시작 월)
+  현재 build_id는 dashboard:rankings:current (히트맵과 같은 포인터 교체 방식)
+
+갱신:
+- 실거래 적재 훅이 매매가 바뀐 아파트의 점수만 현재 빌드에 다시 씁니다. (월별 집계 훅 다음에 실행)
+- 달이 바뀌면 기간이 밀리므로 scripts/build_rankings.py로 하루 한 번 전체를 다시 만듭니다. (보정 겸용)
+"""
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import orjson
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.db.session import AsyncReadOnlySessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 기간 → 개월 수
+RANKING_PERIOD_MONTHS = {"1m": 1, "3m": 3}
+
+# 랭킹 유형 → (지표, 내림차순 여부)
+RANKING_TYPES: Dict[str, Tuple[str, bool]] = {
+    "rise": ("change", True),
+    "fall": ("change", False),
+    "volume": ("volume", True),
+    "price_high": ("price", True),
+    "price_low": ("price", False)
+}
+
+METRICS = ("change", "volume", "price")
+
+ALL_REGIONS = "all"
+
+CURRENT_KEY = "dashboard:rankings:current"
+
+_SCORES_SELECT = """
+SELECT
+    s.apt_id,
+    a.apt_name,
+    st.region_code,
+    st.region_name,
+    sum(s.transaction_count) FILTER (WHERE s.month >= :recent_from) AS recent_count,
+    sum(s.transaction_count) FILTER (WHERE s.month < :recent_from) AS previous_count,
+    sum(s.avg_price_per_pyeong * s.transaction_count) FILTER (WHERE s.month >= :recent_from)
+        / NULLIF(sum(s.transaction_count) FILTER (WHERE s.month >= :recent_from), 0) AS recent_ppp,
+    sum(s.avg_price_per_pyeong * s.transaction_count) FILTER (WHERE s.month < :recent_from)
+        / NULLIF(sum(s.transaction_count) FILTER (WHERE s.month < :recent_from), 0) AS previous_ppp,
+    sum(s.avg_price * s.transaction_count) FILTER (WHERE s.month >= :recent_from)
+        / NULLIF(sum(s.transaction_count) FILTER (WHERE s.month >= :recent_from), 0) AS recent_price
+FROM transaction_monthly_stats s
+JOIN apartments a ON a.apt_id = s.apt_id AND a.is_deleted = false
+JOIN states st ON st.region_id = a.region_id
+WHERE s.trans_type = 'SALE'
+  AND s.area_bucket = 0
+  AND s.month >= :previous_from
+  AND s.month <= :base_month
+"""
+
+_GROUP_BY = "GROUP BY s.apt_id, a.apt_name, st.region_code, st.region_name"
+
+_SCORES_ALL_SQL = text(_SCORES_SELECT + _GROUP_BY)
+
+_SCORES_BY_IDS_SQL = text(_SCORES_SELECT + "  AND s.apt_id IN :apt_ids\n" + _GROUP_BY).bindparams(
+    bindparam("apt_ids", expanding=True)
+)
+
+
+def ranking_periods() -> List[str]:
+    """랭킹을 유지하는 기간 목록"""
+    return [p for p in settings.RANKING_PERIODS.split(",") if p in RANKING_PERIOD_MONTHS]
+
+
+def _set_key(build_id: str, period: str, region: str, metric: str) -> str:
+    return f"dashboard:rankings:{build_id}:{period}:{region}:{metric}"
+
+
+def _detail_key(build_id: str, period: str) -> str:
+    return f"dashboard:rankings:{build_id}:{period}:detail"
+
+
+def _meta_key(build_id: str) -> str:
+    return f"dashboard:rankings:{build_id}:meta"
+
+
+def _windows(base_month: date, period: str) -> Dict[str, date]:
+    """기준 월 기준 최근 / 이전 기간의 시작 월"""
+    months = RANKING_PERIOD_MONTHS[period]
+    return {
+        "base_month": base_month,
+        "recent_from": base_month - relativedelta(months=months - 1),
+        "previous_from": base_month - relativedelta(months=months * 2 - 1)
+    }
+
+
+def compute_scores(row) -> Tuple[Dict[str, float], Dict[str, Any]]:
+    """
+    집계 한 행 → (지표별 점수, 상세)
+
+    최근 기간에 거래가 없으면 점수가 없고,
+    변동률은 두 기간 모두 RANKING_MIN_TRANSACTIONS건 이상일 때만 계산합니다.
+    """
+    recent_count = int(row.recent_count or 0)
+    previous_count = int(row.previous_count or 0)
+    scores: Dict[str, float] = {}
+    change_rate = None
+
+    if recent_count > 0:
+        scores["volume"] = recent_count
+        scores["price"] = round(float(row.recent_ppp), 1)
+        if (
+            recent_count >= settings.RANKING_MIN_TRANSACTIONS
+            and previous_count >= settings.RANKING_MIN_TRANSACTIONS
+            and row.previous_ppp
+        ):
+            change_rate = round((float(row.recent_ppp) / float(row.previous_ppp) - 1) * 100, 2)
+            scores["change"] = change_rate
+
+    detail = {
+        "apt_id": row.apt_id,
+        "apt_name": row.apt_name,
+        "region_code": row.region_code[:5],
+        "sigungu_name": row.region_name,
+        "avg_price": round(float(row.recent_price)) if row.recent_price is not None else None,
+        "price_per_pyeong": round(float(row.recent_ppp)) if row.recent_ppp is not None else None,
+        "previous_price_per_pyeong": round(float(row.previous_ppp)) if row.previous_ppp is not None else None,
+        "change_rate": change_rate,
+        "transaction_count": recent_count
+    }
+    return scores, detail
+
+
+def _write_rows(
+    pipe,
+    build_id: str,
+    period: str,
+    rows: Sequence,
+    *,
+    remove_missing: bool,
+    written_keys: Optional[Set[str]] = None
+) -> int:
+    """
+    집계 행들을 파이프라인에 기록 (전국 + 시군구 ZSET, 상세 해시)
+
+    remove_missing이면 점수가 없어진 지표는 ZREM합니다. (증분 갱신)
+
+    Returns:
+        점수가 하나라도 있는 아파트 수
+    """
+    ranked = 0
+    details: Dict[str, bytes] = {}
+    for row in rows:
+        scores, detail = compute_scores(row)
+        member = str(row.apt_id)
+        for region in (ALL_REGIONS, detail["region_code"]):
+            for metric in METRICS:
+                key = _set_key(build_id, period, region, metric)
+                if metric in scores:
+                    pipe.zadd(key, {member: scores[metric]})
+                    if written_keys is not None:
+                        written_keys.add(key)
+                elif remove_missing:
+                    pipe.zrem(key, member)
+        if scores:
+            ranked += 1
+            details[member] = orjson.dumps(detail)
+        elif remove_missing:
+            pipe.hdel(_detail_key(build_id, period), member)
+    if details:
+        pipe.hset(_detail_key(build_id, period), mapping=details)
+    return ranked
+
+
+# ============== 배치: 전체 재구축 ==============
+
+
+async def build_rankings(db: AsyncSession, *, today: Optional[date] = None) -> Dict[str, int]:
+    """
+    모든 기간의 랭킹을 새 빌드로 만들고 current 포인터를 바꿈
+
+    Returns:
+        기간 → 점수가 있는 아파트 수
+    """
+    base_month = (today or date.today()).replace(day=1)
+    build_id = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    redis = get_redis()
+    started = time.perf_counter()
+    summary: Dict[str, int] = {}
+    meta: Dict[str, str] = {"base_month": base_month.isoformat(), "generated_at": datetime.utcnow().isoformat()}
+    written_keys: Set[str] = set()
+
+    for period in ranking_periods():
+        windows = _windows(base_month, period)
+        meta[f"{period}:recent_from"] = windows["recent_from"].isoformat()
+        result = await db.execute(_SCORES_ALL_SQL, windows)
+        pipe = redis.pipeline(transaction=False)
+        summary[period] = _write_rows(
+            pipe, build_id, period, result.all(), remove_missing=False, written_keys=written_keys
+        )
+        written_keys.add(_detail_key(build_id, period))
+        await pipe.execute()
+
+    # 새 빌드의 키에 TTL (이전 빌드는 TTL로 만료)
+    pipe = redis.pipeline(transaction=False)
+    pipe.hset(_meta_key(build_id), mapping=meta)
+    for key in written_keys | {_meta_key(build_id)}:
+        pipe.expire(key, settings.RANKING_TTL)
+    await pipe.execute()
+
+    await redis.set(CURRENT_KEY, build_id)
+    logger.info(f"🏆 랭킹 빌드 완료: {build_id}, {summary} ({time.perf_counter() - started:.1f}s)")
+    return summary
+
+
+# ============== 증분 갱신 ==============
+
+
+async def refresh_rankings(db: AsyncSession, apt_ids: Sequence[int]) -> int:
+    """
+    현재 빌드에서 지정한 아파트의 점수만 다시 계산해서 반영
+
+    빌드의 기준 월을 그대로 쓰므로 같은 빌드 안의 점수끼리 기간이 맞습니다.
+    현재 빌드가 없으면 아무것도 하지 않습니다. (전체 재구축 필요)
+
+    Returns:
+        다시 계산한 아파트 수
+    """
+    redis = get_redis()
+    build_id = await redis.get(CURRENT_KEY)
+    if build_id is None:
+        return 0
+    base_month = await redis.hget(_meta_key(build_id), "base_month")
+    if base_month is None:
+        return 0
+    base_month = date.fromisoformat(base_month)
+
+    ids = sorted(set(apt_ids))
+    members = [str(apt_id) for apt_id in ids]
+    written_keys: Set[str] = set()
+    pipe = redis.pipeline(transaction=False)
+    for period in ranking_periods():
+        # 이전 상세의 시군구 (거래가 모두 취소됐거나 지역이 바뀐 아파트를 이전 지역 랭킹에서 빼기 위해)
+        previous = await redis.hmget(_detail_key(build_id, period), members)
+        result = await db.execute(_SCORES_BY_IDS_SQL, {**_windows(base_month, period), "apt_ids": ids})
+        rows = result.all()
+        current_regions = {str(row.apt_id): row.region_code[:5] for row in rows}
+
+        for member, raw in zip(members, previous):
+            old_region = orjson.loads(raw)["region_code"] if raw is not None else None
+            stale_regions = [r for r in (old_region,) if r is not None and r != current_regions.get(member)]
+            if member not in current_regions:
+                stale_regions.append(ALL_REGIONS)
+                pipe.hdel(_detail_key(build_id, period), member)
+            for region in stale_regions:
+                for metric in METRICS:
+                    pipe.zrem(_set_key(build_id, period, region, metric), member)
+
+        _write_rows(pipe, build_id, period, rows, remove_missing=True, written_keys=written_keys)
+    # 빌드 후 처음 생긴 키(새 시군구 등)에도 빌드와 같은 수명을 줌 (기존 TTL은 유지)
+    for key in written_keys:
+        pipe.expire(key, settings.RANKING_TTL, nx=True)
+    await pipe.execute()
+    return len(ids)
+
+
+async def on_transactions_ingested(result) -> None:
+    """
+    실거래 적재 후처리 훅: 매매 거래가 바뀐 아파트의 랭킹 점수 갱신
+
+    월별 집계 훅이 먼저 실행되어야 합니다. (transaction_ingest._ingest_hooks 순서)
+    """
+    apt_ids = sorted({apt_id for apt_id, _, trans_type in result.touched_months if trans_type == "SALE"})
+    if not apt_ids:
+        return
+    async with AsyncReadOnlySessionLocal() as db:
+        count = await refresh_rankings(db, apt_ids)
+    logger.info(f"랭킹 점수 갱신: {count}건")
+
+
+# ============== API: 조회 ==============
+
+
+async def get_rankings(
+    ranking_type: str,
+    *,
+    period: str,
+    region: str = ALL_REGIONS,
+    skip: int = 0,
+    limit: int = 10
+) -> Optional[Dict[str, Any]]:
+    """
+    랭킹 한 페이지 조회 (ZREVRANGE/ZRANGE + HMGET)
+
+    Returns:
+        rankings, total, base_month, recent_from / 빌드가 없으면 None
+
+    Raises:
+        RedisError: Redis 장애 (엔드포인트가 503으로 변환)
+    """
+    redis = get_redis()
+    build_id = await redis.get(CURRENT_KEY)
+    if build_id is None:
+        return None
+
+    metric, descending = RANKING_TYPES[ranking_type]
+    key = _set_key(build_id, period, region, metric)
+    pipe = redis.pipeline(transaction=False)
+    if descending:
+        pipe.zrevrange(key, skip, skip + limit - 1, withscores=True)
+    else:
+        pipe.zrange(key, skip, skip + limit - 1, withscores=True)
+    pipe.zcard(key)
+    pipe.hmget(_meta_key(build_id), ["base_month", f"{period}:recent_from"])
+    members, total, (base_month, recent_from) = await pipe.execute()
+
+    details = await redis.hmget(_detail_key(build_id, period), [m for m, _ in members]) if members else []
+    rankings = []
+    for rank, ((member, score), raw) in enumerate(zip(members, details), start=skip + 1):
+        detail = orjson.loads(raw) if raw is not None else {"apt_id": int(member)}
+        detail["rank"] = rank
+        detail["value"] = int(score) if metric == "volume" else score
+        rankings.append(detail)
+
+    return {
+        "rankings": rankings,
+        "total": total,
+        "base_month": base_month,
+        "recent_from": recent_from
+    }
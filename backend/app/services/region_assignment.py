@@ -0,0 +1,296 @@
+"""
+아파트 → 지역(시군구/동) 공간 조인 (scripts/assign_regions.py)
+
+주소 API 결과에 의존하던 apartments.region_id를 행정구역 경계 폴리곤으로 다시 계산합니다.
+
+1. 경계 GeoJSON을 읽어서 shapely STRtree를 만듭니다. (폴리곤 수천 개, 1회)
+2. 아파트 좌표 전체를 shapely.points로 한 번에 만들고
+   tree.query(points, predicate="within")로 일괄 조인합니다. (행마다 반복하지 않음)
+   - 경계선 위 / 경계 데이터 오차로 어느 폴리곤에도 안 들어간 점은
+     max_distance 안의 가장 가까운 폴리곤(query_nearest)으로 보정합니다.
+3. 동 폴리곤의 법정동 코드(10자리) → states.region_id로 바꾸고 저장된 값과 비교합니다.
+   - 시군구는 동 코드 앞 5자리입니다. 시군구 경계 파일을 주면 동 결과와 교차 검증하고,
+     동을 못 찾은 아파트는 시군구 대표 코드(XXXXX00000)로 배정합니다.
+4. 바뀐 아파트만 CRUDBase.update_many로 일괄 반영합니다. (dry-run이면 보고서만)
+
+반영 후에는 지역을 쓰는 파생 데이터도 맞춥니다.
+- 유사 단지 행렬: 카탈로그 버전 올림 (시군구 필터)
+- 대시보드 랭킹: 바뀐 아파트만 현재 빌드에서 다시 계산 (이전 시군구 랭킹에서 제거)
+"""
+import json
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import shape
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.apartment import apartment as apartment_crud
+from app.services.rankings import refresh_rankings
+from app.services.similar import bump_catalog_version
+
+logger = logging.getLogger(__name__)
+
+# 경계 파일에서 지역 코드를 찾을 속성 이름 (앞에서부터 먼저 있는 것)
+# EMD_CD / SIG_CD: 국가공간정보포털 법정동 / 시군구 경계, adm_cd2 등: 자주 쓰는 공개 GeoJSON
+DONG_CODE_PROPERTIES = ("EMD_CD", "BJCD", "adm_cd2", "region_code", "code")
+SIGUNGU_CODE_PROPERTIES = ("SIG_CD", "SIGUNGU_CD", "sgg", "region_code", "code")
+
+# 경위도 1도 ≈ 111km (보정 거리 환산용 근사치)
+METERS_PER_DEGREE = 111_320
+
+_DIGITS = re.compile(r"\D")
+
+_APARTMENT_POINTS_SQL = text("""
+SELECT
+    a.apt_id,
+    a.apt_name,
+    a.region_id,
+    st.region_code,
+    ST_X(a.geometry) AS lng,
+    ST_Y(a.geometry) AS lat
+FROM apartments a
+LEFT JOIN states st ON st.region_id = a.region_id
+WHERE a.is_deleted = false
+ORDER BY a.apt_id
+""")
+
+_STATES_SQL = text("""
+SELECT region_id, region_code
+FROM states
+WHERE is_deleted = false
+""")
+
+
+def normalize_code(value: Any, length: int) -> Optional[str]:
+    """
+    경계 파일의 지역 코드 → 자릿수 맞춘 코드
+
+    법정동 코드 8자리(EMD_CD)는 리 코드 "00"을 붙여 10자리로,
+    시군구는 앞 5자리만 씁니다. 숫자가 아니면 None
+    """
+    if value is None:
+        return None
+    digits = _DIGITS.sub("", str(value))
+    if len(digits) < 5:
+        return None
+    return digits[:length].ljust(length, "0")
+
+
+@dataclass
+class RegionBoundaries:
+    """지역 코드별 경계 폴리곤 + STRtree (geometries[i]의 코드가 codes[i])"""
+    codes: np.ndarray
+    tree: STRtree
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+def load_boundaries(path: str, *, code_length: int, code_property: Optional[str] = None) -> RegionBoundaries:
+    """
+    GeoJSON FeatureCollection → RegionBoundaries
+
+    Args:
+        path: GeoJSON 파일 경로 (WGS84 경위도)
+        code_length: 10(법정동) 또는 5(시군구)
+        code_property: 지역 코드 속성 이름 (없으면 알려진 이름에서 찾음)
+    """
+    with open(path, encoding="utf-8") as f:
+        collection = json.load(f)
+
+    candidates = (code_property,) if code_property else (
+        DONG_CODE_PROPERTIES if code_length == 10 else SIGUNGU_CODE_PROPERTIES
+    )
+    codes: List[str] = []
+    geometries = []
+    skipped = 0
+    for feature in collection.get("features", []):
+        properties = feature.get("properties") or {}
+        name = next((c for c in candidates if properties.get(c) is not None), None)
+        code = normalize_code(properties.get(name), code_length) if name else None
+        if code is None or not feature.get("geometry"):
+            skipped += 1
+            continue
+        codes.append(code)
+        geometries.append(shape(feature["geometry"]))
+
+    if not geometries:
+        raise ValueError(f"{path}: 지역 코드 속성({', '.join(candidates)})이 있는 폴리곤이 없습니다.")
+    if skipped:
+        logger.warning(f"⚠️ {path}: 코드나 도형이 없는 feature {skipped}개 건너뜀")
+
+    geometries = shapely.make_valid(np.array(geometries, dtype=object))
+    return RegionBoundaries(codes=np.array(codes), tree=STRtree(geometries))
+
+
+def locate(
+    boundaries: RegionBoundaries,
+    points: np.ndarray,
+    *,
+    max_distance: float = 0.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    점 배열 → 포함하는 폴리곤 번호 (일괄)
+
+    폴리곤이 겹치면 STRtree가 먼저 돌려준 폴리곤을 씁니다.
+
+    Args:
+        points: shapely Point 배열
+        max_distance: 어느 폴리곤에도 안 들어간 점을 가장 가까운 폴리곤으로 보정할 최대 거리 (도)
+
+    Returns:
+        (폴리곤 번호 배열 (못 찾으면 -1), 가까운 폴리곤으로 보정했는지 여부 배열)
+    """
+    located = np.full(len(points), -1, dtype=np.int64)
+    point_idx, polygon_idx = boundaries.tree.query(points, predicate="within")
+    # 같은 점의 첫 결과가 남도록 뒤에서부터 대입
+    located[point_idx[::-1]] = polygon_idx[::-1]
+
+    nearest = np.zeros(len(points), dtype=bool)
+    missing = np.flatnonzero(located < 0)
+    if max_distance > 0 and missing.size:
+        near_point_idx, near_polygon_idx = boundaries.tree.query_nearest(
+            points[missing], max_distance=max_distance, all_matches=False
+        )
+        located[missing[near_point_idx]] = near_polygon_idx
+        nearest[missing[near_point_idx]] = True
+    return located, nearest
+
+
+@dataclass
+class RegionAssignmentReport:
+    """지역 재배정 결과"""
+    apartments: int = 0
+    unchanged: int = 0
+    changed_dong: int = 0  # 같은 시군구 안에서 동만 바뀜
+    changed_sigungu: int = 0  # 시군구가 바뀜
+    nearest: int = 0  # 경계 밖이라 가장 가까운 폴리곤으로 보정
+    sigungu_fallback: int = 0  # 동을 못 찾아 시군구 대표 코드로 배정
+    sigungu_conflict: int = 0  # 동 폴리곤과 시군구 폴리곤의 시군구가 다름 (동 결과 사용)
+    unmatched: int = 0  # 어느 폴리곤에도 없음 (기존 값 유지)
+    unknown_code: int = 0  # 폴리곤은 찾았지만 states에 없는 코드 (기존 값 유지)
+    updated: int = 0
+    elapsed: float = 0.0
+    mismatches: List[Dict[str, Any]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (
+            f"아파트 {self.apartments}개 | 동일 {self.unchanged}, "
+            f"동 변경 {self.changed_dong}, 시군구 변경 {self.changed_sigungu}, 반영 {self.updated} | "
+            f"경계 보정 {self.nearest}, 시군구 대체 {self.sigungu_fallback}, 시군구 불일치 {self.sigungu_conflict}, "
+            f"미배정 {self.unmatched}, 미등록 코드 {self.unknown_code}"
+        )
+
+
+async def _load_apartments(db: AsyncSession) -> Dict[str, np.ndarray]:
+    """삭제되지 않은 아파트 전체의 좌표 / 현재 지역 (열 배열)"""
+    rows = (await db.execute(_APARTMENT_POINTS_SQL)).all()
+    return {
+        "apt_id": np.array([row.apt_id for row in rows], dtype=np.int64),
+        "apt_name": np.array([row.apt_name for row in rows], dtype=object),
+        "region_id": np.array([row.region_id for row in rows], dtype=np.int64),
+        "region_code": np.array([row.region_code or "" for row in rows], dtype=object),
+        "lng": np.array([row.lng for row in rows], dtype=np.float64),
+        "lat": np.array([row.lat for row in rows], dtype=np.float64)
+    }
+
+
+async def assign_regions(
+    db: AsyncSession,
+    *,
+    dong: RegionBoundaries,
+    sigungu: Optional[RegionBoundaries] = None,
+    max_distance_m: float = 50.0,
+    dry_run: bool = False,
+    chunk_size: int = 1000
+) -> RegionAssignmentReport:
+    """
+    아파트 전체를 경계 폴리곤과 공간 조인해서 region_id를 다시 계산하고 반영
+
+    Args:
+        db: 쓰기 가능한 데이터베이스 세션
+        dong: 법정동 경계
+        sigungu: 시군구 경계 (선택, 교차 검증 / 동 미배정 대체용)
+        max_distance_m: 경계 밖 점을 보정할 최대 거리 (미터)
+        dry_run: True면 DB에 쓰지 않고 보고서만
+        chunk_size: update_many 청크 크기
+
+    Returns:
+        RegionAssignmentReport (mismatches: 바뀌거나 배정 못 한 아파트 목록)
+    """
+    started = time.perf_counter()
+    report = RegionAssignmentReport()
+    apartments = await _load_apartments(db)
+    region_ids = {row.region_code: row.region_id for row in (await db.execute(_STATES_SQL)).all()}
+    report.apartments = len(apartments["apt_id"])
+    if report.apartments == 0:
+        return report
+
+    points = shapely.points(apartments["lng"], apartments["lat"])
+    max_distance = max_distance_m / METERS_PER_DEGREE
+
+    dong_idx, dong_nearest = locate(dong, points, max_distance=max_distance)
+    assigned = np.where(dong_idx >= 0, dong.codes[np.maximum(dong_idx, 0)], "")
+    report.nearest = int(dong_nearest.sum())
+
+    if sigungu is not None:
+        sigungu_idx, _ = locate(sigungu, points, max_distance=max_distance)
+        sigungu_codes = np.where(sigungu_idx >= 0, sigungu.codes[np.maximum(sigungu_idx, 0)], "")
+        has_both = (dong_idx >= 0) & (sigungu_idx >= 0)
+        conflict = has_both & (np.array([code[:5] for code in assigned]) != sigungu_codes)
+        report.sigungu_conflict = int(conflict.sum())
+        fallback = (dong_idx < 0) & (sigungu_idx >= 0)
+        assigned = np.where(fallback, np.char.add(sigungu_codes.astype(str), "00000"), assigned)
+        report.sigungu_fallback = int(fallback.sum())
+
+    updates: List[Dict[str, int]] = []
+    for i, code in enumerate(assigned.tolist()):
+        stored_code = apartments["region_code"][i]
+        entry = {
+            "apt_id": int(apartments["apt_id"][i]),
+            "apt_name": apartments["apt_name"][i],
+            "stored_region_code": stored_code or None,
+            "assigned_region_code": code or None
+        }
+        if not code:
+            report.unmatched += 1
+            report.mismatches.append({**entry, "kind": "unmatched"})
+            continue
+        region_id = region_ids.get(code)
+        if region_id is None:
+            report.unknown_code += 1
+            report.mismatches.append({**entry, "kind": "unknown_code"})
+            continue
+        if region_id == apartments["region_id"][i]:
+            report.unchanged += 1
+            continue
+
+        if stored_code[:5] == code[:5]:
+            report.changed_dong += 1
+            kind = "changed_dong"
+        else:
+            report.changed_sigungu += 1
+            kind = "changed_sigungu"
+        report.mismatches.append({**entry, "kind": kind})
+        updates.append({"apt_id": entry["apt_id"], "region_id": region_id})
+
+    if updates and not dry_run:
+        report.updated = await apartment_crud.update_many(db, rows=updates, chunk_size=chunk_size)
+        await _refresh_derived([row["apt_id"] for row in updates], db)
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+async def _refresh_derived(apt_ids: Sequence[int], db: AsyncSession) -> None:
+    """지역이 바뀐 아파트의 파생 데이터 갱신 (유사 단지 행렬 / 대시보드 랭킹)"""
+    await bump_catalog_version()
+    count = await refresh_rankings(db, apt_ids)
+    logger.info(f"지역 변경 반영: 랭킹 {count}건 갱신, 유사 단지 카탈로그 버전 올림")
@@ -0,0 +1,329 @@
+"""
+유사 단지 추천 (/apartments/{apt_id}/similar)
+
+apartments 전체를 프로세스 메모리의 NumPy 특성 행렬로 올려 두고,
+요청마다 행렬 연산 한 번으로 거리가 가장 가까운 k개를 찾습니다. (2만 단지 기준 1ms 안팎)
+
+특성 (열마다 평균 0 / 표준편차 1로 표준화 후 가중치 곱):
+- 세대수(log), 준공연도, 최고층, 세대당 주차대수, 지하철 도보시간(분), 평당가 수준(log)
+- 난방방식 one-hot (지역난방 / 개별난방 / 중앙난방 / 기타)
+값이 없는 칸은 표준화 후 0(평균)으로 채웁니다.
+
+거리: 가중 유클리드 거리, ||x - q||² = ||x||² - 2x·q + ||q||² (행 노름은 미리 계산)
+top-k: np.argpartition으로 k개만 고른 뒤 그 k개만 정렬 (여러 단지를 한 번에 조회 가능)
+
+행렬은 카탈로그 버전(Redis apartments:catalog:version)이 바뀌면 다시 읽습니다.
+- 버전 확인은 SIMILAR_VERSION_CHECK_SECONDS마다 한 번 (GET 한 번)
+- 매매 적재 훅이 버전을 올립니다. (평당가 수준이 바뀜)
+- 단지 정보를 직접 고친 작업(지역 재배정 등)은 bump_catalog_version()을 호출하세요.
+"""
+import asyncio
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from redis.exceptions import RedisError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "apartments:catalog:version"
+
+# 난방방식 one-hot 범주 (그 외 값은 "기타", 값 없음은 전부 0)
+HEATING_TYPES = ("지역난방", "개별난방", "중앙난방", "기타")
+
+# 특성별 가중치 (표준화 후 곱함, 클수록 유사도에 크게 반영)
+FEATURE_WEIGHTS = {
+    "households": 1.0,
+    "build_year": 1.0,
+    "highest_floor": 0.7,
+    "parking_per_household": 0.7,
+    "subway_minutes": 0.7,
+    "price_level": 1.2,
+    "heating": 0.5
+}
+
+NUMERIC_FEATURES = ("households", "build_year", "highest_floor", "parking_per_household", "subway_minutes", "price_level")
+
+_CATALOG_SQL = text("""
+SELECT
+    a.apt_id,
+    a.apt_name,
+    st.region_code,
+    st.region_name,
+    a.total_household_cnt,
+    a.highest_floor,
+    a.total_parking_cnt,
+    a.use_approval_date,
+    a.code_heat_nm,
+    a.subway_time,
+    price.avg_price_per_pyeong
+FROM apartments a
+JOIN states st ON st.region_id = a.region_id
+LEFT JOIN LATERAL (
+    SELECT s.avg_price_per_pyeong
+    FROM transaction_monthly_stats s
+    WHERE s.apt_id = a.apt_id
+      AND s.trans_type = 'SALE'
+      AND s.area_bucket = 0
+      AND s.month >= :price_since
+    ORDER BY s.month DESC
+    LIMIT 1
+) price ON true
+WHERE a.is_deleted = false
+ORDER BY a.apt_id
+""")
+
+_MINUTES = re.compile(r"\d+")
+
+
+def parse_subway_minutes(value: Optional[str]) -> float:
+    """
+    지하철 도보시간 문자열 → 분 (예: "5~10분이내" → 10, "20분초과" → 25)
+
+    숫자가 없으면 NaN
+    """
+    if not value:
+        return math.nan
+    numbers = [int(n) for n in _MINUTES.findall(value)]
+    if not numbers:
+        return math.nan
+    minutes = float(max(numbers))
+    return minutes + 5 if "초과" in value else minutes
+
+
+@dataclass
+class SimilarIndex:
+    """
+    표준화된 특성 행렬과 단지 메타데이터
+
+    features[i]는 apt_ids[i] 단지의 특성 벡터 (apt_ids 오름차순)
+    """
+    version: str
+    apt_ids: np.ndarray
+    sigungu: np.ndarray
+    features: np.ndarray
+    norms: np.ndarray
+    info: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.apt_ids)
+
+    def rows_of(self, apt_ids: Sequence[int]) -> np.ndarray:
+        """apt_id → 행 번호 (없는 apt_id는 -1)"""
+        ids = np.asarray(apt_ids, dtype=np.int64)
+        rows = np.searchsorted(self.apt_ids, ids)
+        rows = np.minimum(rows, len(self.apt_ids) - 1)
+        return np.where(self.apt_ids[rows] == ids, rows, -1)
+
+    def top_k(self, rows: np.ndarray, k: int, *, same_sigungu: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 단지의 top-k 유사 단지를 한 번에 계산
+
+        Args:
+            rows: 기준 단지의 행 번호 배열 (길이 m)
+            k: 단지당 결과 수
+            same_sigungu: 기준 단지와 같은 시군구만 후보로
+
+        Returns:
+            (행 번호 (m, k), 거리 (m, k)) - 가까운 순, 후보가 k개보다 적으면 -1 / inf로 채움
+        """
+        query = self.features[rows]
+        # ||x - q||² = ||x||² - 2x·q + ||q||²
+        dist = self.norms[None, :] - 2.0 * (query @ self.features.T) + self.norms[rows][:, None]
+        dist[np.arange(len(rows)), rows] = np.inf  # 자기 자신 제외
+        if same_sigungu:
+            dist[self.sigungu[None, :] != self.sigungu[rows][:, None]] = np.inf
+
+        k = min(k, len(self) - 1)
+        if k <= 0:
+            return np.full((len(rows), 0), -1), np.full((len(rows), 0), np.inf)
+        part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        part_dist = np.take_along_axis(dist, part, axis=1)
+        order = np.argsort(part_dist, axis=1)
+        top_rows = np.take_along_axis(part, order, axis=1)
+        top_dist = np.take_along_axis(part_dist, order, axis=1)
+        top_rows = np.where(np.isfinite(top_dist), top_rows, -1)
+        return top_rows, np.sqrt(np.maximum(top_dist, 0))
+
+
+def _standardize(column: np.ndarray) -> np.ndarray:
+    """평균 0 / 표준편차 1로 변환, NaN은 0(평균)으로"""
+    valid = ~np.isnan(column)
+    if not valid.any():
+        return np.zeros_like(column)
+    mean = column[valid].mean()
+    std = column[valid].std()
+    scaled = (column - mean) / (std if std > 0 else 1.0)
+    return np.where(valid, scaled, 0.0)
+
+
+def build_index(rows: Sequence, version: str) -> SimilarIndex:
+    """
+    카탈로그 행들(apt_id 오름차순) → SimilarIndex
+
+    행은 _CATALOG_SQL의 컬럼을 속성으로 가진 객체입니다.
+    """
+    n = len(rows)
+
+    def column(getter) -> np.ndarray:
+        return np.array([getter(row) for row in rows], dtype=np.float64).reshape(n)
+
+    def or_nan(value) -> float:
+        return math.nan if value is None else float(value)
+
+    households = column(lambda r: or_nan(r.total_household_cnt))
+    raw = {
+        "households": np.log1p(households),
+        "build_year": column(lambda r: r.use_approval_date.year if r.use_approval_date else math.nan),
+        "highest_floor": column(lambda r: or_nan(r.highest_floor)),
+        "parking_per_household": column(
+            lambda r: r.total_parking_cnt / r.total_household_cnt
+            if r.total_parking_cnt is not None and r.total_household_cnt else math.nan
+        ),
+        "subway_minutes": column(lambda r: parse_subway_minutes(r.subway_time)),
+        "price_level": np.log(column(
+            lambda r: r.avg_price_per_pyeong if r.avg_price_per_pyeong and r.avg_price_per_pyeong > 0 else math.nan
+        ))
+    }
+
+    heating = np.zeros((n, len(HEATING_TYPES)), dtype=np.float64)
+    for i, row in enumerate(rows):
+        if row.code_heat_nm:
+            name = row.code_heat_nm if row.code_heat_nm in HEATING_TYPES else "기타"
+            heating[i, HEATING_TYPES.index(name)] = 1.0
+
+    features = np.column_stack(
+        [_standardize(raw[name]) * FEATURE_WEIGHTS[name] for name in NUMERIC_FEATURES]
+        + [heating * FEATURE_WEIGHTS["heating"]]
+    ).astype(np.float32)
+
+    info = [
+        {
+            "apt_id": row.apt_id,
+            "apt_name": row.apt_name,
+            "sigungu_name": row.region_name,
+            "total_household_cnt": row.total_household_cnt,
+            "build_year": row.use_approval_date.year if row.use_approval_date else None,
+            "highest_floor": row.highest_floor,
+            "code_heat_nm": row.code_heat_nm,
+            "subway_time": row.subway_time,
+            "price_per_pyeong": round(float(row.avg_price_per_pyeong)) if row.avg_price_per_pyeong else None
+        }
+        for row in rows
+    ]
+    return SimilarIndex(
+        version=version,
+        apt_ids=np.array([row.apt_id for row in rows], dtype=np.int64),
+        sigungu=np.array([int(row.region_code[:5]) for row in rows], dtype=np.int32),
+        features=features,
+        norms=(features.astype(np.float64) ** 2).sum(axis=1).astype(np.float32),
+        info=info
+    )
+
+
+# ============== 카탈로그 버전 / 행렬 캐시 ==============
+
+_index: Optional[SimilarIndex] = None
+_checked_at = 0.0
+_lock = asyncio.Lock()
+
+
+async def get_catalog_version() -> str:
+    """현재 카탈로그 버전 (Redis 장애 시 "0")"""
+    try:
+        return await get_redis().get(CATALOG_VERSION_KEY) or "0"
+    except RedisError as e:
+        logger.warning(f"⚠️ 카탈로그 버전 조회 실패: {e}")
+        return "0"
+
+
+async def bump_catalog_version() -> None:
+    """카탈로그 버전 올리기 (각 서버의 유사 단지 행렬이 다음 확인 때 다시 로드됨)"""
+    await get_redis().incr(CATALOG_VERSION_KEY)
+
+
+async def load_index(db: AsyncSession, version: str) -> SimilarIndex:
+    """DB에서 카탈로그를 읽어서 특성 행렬 생성"""
+    started = time.perf_counter()
+    price_since = date.today().replace(day=1) - relativedelta(months=settings.SIMILAR_PRICE_MONTHS - 1)
+    result = await db.execute(_CATALOG_SQL, {"price_since": price_since})
+    index = build_index(result.all(), version)
+    logger.info(f"유사 단지 행렬 로드: {len(index)}개 단지, 버전 {version} ({time.perf_counter() - started:.2f}s)")
+    return index
+
+
+async def get_index(db: AsyncSession) -> SimilarIndex:
+    """
+    현재 카탈로그 버전의 특성 행렬
+
+    SIMILAR_VERSION_CHECK_SECONDS 안에는 버전도 확인하지 않고 메모리의 행렬을 씁니다.
+    """
+    global _index, _checked_at
+    now = time.monotonic()
+    if _index is not None and now - _checked_at < settings.SIMILAR_VERSION_CHECK_SECONDS:
+        return _index
+
+    async with _lock:
+        if _index is not None and time.monotonic() - _checked_at < settings.SIMILAR_VERSION_CHECK_SECONDS:
+            return _index
+        version = await get_catalog_version()
+        if _index is None or _index.version != version:
+            _index = await load_index(db, version)
+        _checked_at = time.monotonic()
+        return _index
+
+
+async def find_similar(
+    db: AsyncSession,
+    apt_id: int,
+    *,
+    limit: int,
+    same_sigungu: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    유사 단지 조회
+
+    similarity = 1 / (1 + 거리), 1에 가까울수록 유사
+
+    Returns:
+        target, similar_apartments, version / 대상 단지가 행렬에 없으면 None
+    """
+    index = await get_index(db)
+    if len(index) == 0:
+        return None
+    row = int(index.rows_of([apt_id])[0])
+    if row < 0:
+        return None
+
+    top_rows, top_dist = index.top_k(np.array([row]), limit, same_sigungu=same_sigungu)
+    similar = [
+        {**index.info[r], "similarity": round(1.0 / (1.0 + float(d)), 4)}
+        for r, d in zip(top_rows[0], top_dist[0])
+        if r >= 0
+    ]
+    return {
+        "target": index.info[row],
+        "similar_apartments": similar,
+        "version": index.version
+    }
+
+
+async def on_transactions_ingested(result) -> None:
+    """
+    실거래 적재 후처리 훅: 매매가 바뀌면 카탈로그 버전을 올림 (평당가 수준 특성)
+
+    월별 집계 훅 다음에 실행되어야 새 평당가로 다시 로드됩니다.
+    """
+    if any(trans_type == "SALE" for _, _, trans_type in result.touched_months):
+        await bump_catalog_version()
@@ -0,0 +1,244 @@
+"""
+테이블 스트리밍 내보내기 (NDJSON / CSV / Arrow IPC)
+
+서버 사이드 커서(asyncpg cursor)로 batch_size 행씩 읽어서 바로 인코딩해 내보내므로
+테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+
+⚠️ FastAPI는 StreamingResponse 본문을 보내기 전에 yield 의존성(get_db 등)을 정리하므로
+   세션은 의존성으로 받지 않고 스트림 생성기 안에서 직접 만듭니다.
+
+사용법:
+    stream = export_table_stream("transactions", "ndjson", batch_size=5000)
+    return StreamingResponse(stream, media_type=EXPORT_MEDIA_TYPES["ndjson"])
+"""
+import csv
+import io
+import logging
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.session import AsyncReadOnlySessionLocal
+
+logger = logging.getLogger(__name__)
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream"
+}
+
+EXPORT_EXTENSIONS = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}
+
+
+def arrow_available() -> bool:
+    """pyarrow 설치 여부 (Arrow 형식은 선택 기능)"""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _to_plain(value: Any) -> Any:
+    """JSON/CSV로 표현할 수 없는 DB 값 변환"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # PostGIS geometry(WKB) 등 바이너리는 16진수 문자열로
+        return bytes(value).hex()
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+# ============== 인코더 (배치 → bytes) ==============
+
+
+class NDJSONEncoder:
+    """한 줄에 JSON 객체 하나"""
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        out = bytearray()
+        for row in rows:
+            out += orjson.dumps(
+                dict(zip(self.columns, row)),
+                default=_to_plain,
+                option=orjson.OPT_NON_STR_KEYS
+            )
+            out += b"\n"
+        return bytes(out)
+
+    def footer(self) -> bytes:
+        return b""
+
+
+class CSVEncoder:
+    """첫 줄에 컬럼명, 엑셀에서 한글이 깨지지 않도록 BOM 포함"""
+
+    def __init__(self, columns: List[str]):
+        self.columns = columns
+
+    def _write(self, rows) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def header(self) -> bytes:
+        return b"\xef\xbb\xbf" + self._write([self.columns])
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        return self._write([["" if v is None else _to_plain(v) for v in row] for row in rows])
+
+    def footer(self) -> bytes:
+        return b""
+
+
+class _ChunkSink:
+    """pyarrow가 쓴 바이트를 모아뒀다가 배치마다 꺼내는 file-like 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ArrowEncoder:
+    """
+    Arrow IPC 스트림 (pyarrow 필요)
+
+    스키마는 첫 배치에서 추론합니다. 첫 배치에서 전부 NULL이던 컬럼과
+    Arrow 타입으로 바꿀 수 없는 컬럼은 문자열로 내보냅니다.
+    """
+
+    def __init__(self, columns: List[str]):
+        import pyarrow as pa
+
+        self.pa = pa
+        self.columns = columns
+        self.sink = _ChunkSink()
+        self.schema = None
+        self.writer = None
+
+    def header(self) -> bytes:
+        return b""
+
+    def _infer_schema(self, rows):
+        pa = self.pa
+        fields = []
+        for i, name in enumerate(self.columns):
+            try:
+                arrow_type = pa.array([_arrow_value(row[i]) for row in rows]).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrow_type = pa.string()
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+            fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if not rows:
+            return b""
+        if self.schema is None:
+            self.schema = self._infer_schema(rows)
+            self.writer = self.pa.ipc.new_stream(self.sink, self.schema)
+        arrays = []
+        for i, field in enumerate(self.schema):
+            column = [row[i] for row in rows]
+            if self.pa.types.is_string(field.type):
+                column = [None if v is None else (v if isinstance(v, str) else str(_to_plain(v))) for v in column]
+            arrays.append(self.pa.array([_arrow_value(v) for v in column], type=field.type))
+        self.writer.write_batch(self.pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        return self.sink.drain()
+
+    def footer(self) -> bytes:
+        if self.writer is None:
+            # 행이 없는 테이블: 컬럼명만 있는 빈 스트림
+            self.schema = self.pa.schema([self.pa.field(name, self.pa.string()) for name in self.columns])
+            self.writer = self.pa.ipc.new_stream(self.sink, self.schema)
+        self.writer.close()
+        return self.sink.drain()
+
+
+def _arrow_value(value: Any) -> Any:
+    # numeric은 배치마다 정밀도가 달라질 수 있으므로 float로 통일
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+ENCODERS: dict[str, Callable[[List[str]], Any]] = {
+    "ndjson": NDJSONEncoder,
+    "csv": CSVEncoder,
+    "arrow": ArrowEncoder
+}
+
+
+async def export_table_stream(
+    table_name: str,
+    fmt: str,
+    *,
+    batch_size: int = 5000,
+    limit: Optional[int] = None,
+    bind: Optional[AsyncEngine] = None
+) -> AsyncIterator[bytes]:
+    """
+    테이블 전체를 batch_size 행씩 인코딩해서 내보내는 비동기 생성기
+
+    Args:
+        table_name: 테이블명 (⚠️ 화이트리스트를 거친 값만 넘기세요)
+        fmt: ndjson / csv / arrow
+        batch_size: 서버 사이드 커서에서 한 번에 가져올 행 수
+        limit: 최대 행 수 (None이면 전체)
+        bind: 사용할 엔진 (복제본 등, None이면 Primary)
+
+    Yields:
+        인코딩된 바이트 청크
+    """
+    sql = f"SELECT * FROM {table_name}"
+    params = {}
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+
+    session_kwargs = {"bind": bind} if bind is not None else {}
+    async with AsyncReadOnlySessionLocal(**session_kwargs) as db:
+        # yield_per: 서버 사이드 커서로 batch_size씩 가져옴 (전체를 메모리에 올리지 않음)
+        result = await db.stream(text(sql).execution_options(yield_per=batch_size), params)
+        encoder = ENCODERS[fmt](list(result.keys()))
+
+        yield encoder.header()
+        exported = 0
+        async for partition in result.partitions(batch_size):
+            exported += len(partition)
+            yield encoder.encode(partition)
+        yield encoder.footer()
+
+    logger.info(f"테이블 내보내기 완료: {table_name} ({fmt}), {exported}행")
@@ -0,0 +1,129 @@
+"""
+관리자 API용 테이블 통계 (빠른 개수 추정 / 샘플링)
+
+정확한 COUNT(*)는 테이블 전체를 읽으므로 transactions처럼 큰 테이블에서는
+페이지를 넘길 때마다 풀 스캔이 됩니다. 관리 화면에서는 대략적인 개수로 충분하므로:
+- 테이블 전체 개수: pg_class.reltuples (ANALYZE/autovacuum 기준 통계)
+- 조건이 있는 개수: EXPLAIN의 예상 행 수 (Plan Rows)
+결과는 프로세스 메모리에 TTL 동안 캐시합니다.
+
+정확한 개수가 필요하면 count_mode=exact로 요청하세요.
+"""
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+# count_mode 값
+COUNT_MODES = ("estimate", "exact", "none")
+
+# 캐시: 키 → (만료 시각, 개수)
+_count_cache: Dict[str, Tuple[float, int]] = {}
+
+
+def _cache_get(key: str) -> Optional[int]:
+    entry = _count_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def _cache_set(key: str, value: int) -> None:
+    if settings.ADMIN_COUNT_CACHE_TTL > 0:
+        _count_cache[key] = (time.monotonic() + settings.ADMIN_COUNT_CACHE_TTL, value)
+
+
+async def explain_row_estimate(db: AsyncSession, sql: str, params: Optional[dict] = None) -> int:
+    """
+    EXPLAIN으로 쿼리의 예상 행 수 조회 (쿼리는 실행하지 않음)
+
+    Args:
+        db: 데이터베이스 세션
+        sql: SELECT 문
+        params: 바인드 파라미터
+    """
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params or {})
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def estimate_table_rows(db: AsyncSession, table_name: str) -> int:
+    """
+    테이블 전체 행 수 추정 (pg_class.reltuples)
+
+    한 번도 ANALYZE되지 않은 테이블(reltuples = -1)은 EXPLAIN 추정으로 대신합니다.
+    ⚠️ table_name은 화이트리스트를 거친 값만 넘기세요.
+    """
+    cache_key = f"table:{table_name}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table_name}
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        estimate = await explain_row_estimate(db, f"SELECT 1 FROM {table_name}")
+
+    _cache_set(cache_key, int(estimate))
+    return int(estimate)
+
+
+async def estimate_select_rows(db: AsyncSession, query: Select, cache_key: str) -> int:
+    """
+    조건이 있는 SELECT의 결과 행 수 추정 (EXPLAIN Plan Rows)
+
+    Args:
+        db: 데이터베이스 세션
+        query: 개수를 셀 SELECT (ORDER BY / LIMIT 없이)
+        cache_key: 캐시 키 (같은 조건이면 같은 키)
+    """
+    cache_key = f"query:{cache_key}"
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    estimate = await explain_row_estimate(db, str(compiled))
+    _cache_set(cache_key, estimate)
+    return estimate
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    *,
+    mode: str,
+    cache_key: str,
+    table_name: Optional[str] = None
+) -> Tuple[Optional[int], bool]:
+    """
+    count_mode에 따라 행 수 계산
+
+    Args:
+        db: 데이터베이스 세션
+        query: 개수를 셀 SELECT (ORDER BY / LIMIT 없이)
+        mode: estimate (기본, 통계 기반) / exact (COUNT(*)) / none (세지 않음)
+        cache_key: 추정값 캐시 키
+        table_name: 조건 없는 테이블 전체 개수면 테이블명 (reltuples 사용)
+
+    Returns:
+        (개수, 추정값 여부) - mode=none이면 (None, False)
+    """
+    if mode == "none":
+        return None, False
+    if mode == "exact":
+        result = await db.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar(), False
+    if table_name is not None:
+        return await estimate_table_rows(db, table_name), True
+    return await estimate_select_rows(db, query, cache_key), True
@@ -0,0 +1,140 @@
+"""
+실거래 적재 서비스
+
+국토부 실거래 데이터를 transactions 테이블에 넣거나 취소 처리하고,
+commit 후에 적재 후처리 훅을 실행합니다.
+(월별 집계, 랭킹, 지도 타일 캐시 무효화, 아파트 요약 갱신 등, 파생 데이터를 바뀐 부분만 갱신)
+
+훅은 commit 이후에 실행되므로 훅이 실패해도 적재는 되돌리지 않습니다.
+실패한 훅은 로그만 남기고, 파생 데이터는 각 재구축 스크립트로 바로잡습니다.
+
+사용법:
+    result = await ingest_transactions(db, rows)
+    result = await cancel_transactions(db, [101, 102], cancel_date=date.today())
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Awaitable, Callable, List, Sequence, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.transaction import transaction as transaction_crud
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngestResult:
+    """적재 / 취소로 바뀐 범위"""
+    inserted_ids: List[int] = field(default_factory=list)
+    canceled_ids: List[int] = field(default_factory=list)
+    # 거래가 바뀐 아파트
+    apt_ids: Set[int] = field(default_factory=set)
+    # 거래가 바뀐 (apt_id, 거래월 1일, trans_type)
+    touched_months: Set[Tuple[int, date, str]] = field(default_factory=set)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.inserted_ids and not self.canceled_ids
+
+    def touch(self, apt_id: int, deal_date: date, trans_type: str) -> None:
+        self.apt_ids.add(apt_id)
+        self.touched_months.add((apt_id, deal_date.replace(day=1), trans_type))
+
+
+IngestHook = Callable[[IngestResult], Awaitable[None]]
+
+
+def _ingest_hooks() -> List[IngestHook]:
+    """
+    적재 후처리 훅 목록 (순서대로 실행)
+
+    순환 import를 피하려고 여기서 import합니다.
+    """
+    from app.services.apartment_summary import on_transactions_ingested as refresh_apartment_summaries
+    from app.services.map_tiles import on_transactions_ingested as refresh_map_tiles
+    from app.services.monthly_stats import on_transactions_ingested as refresh_monthly_stats
+    from app.services.rankings import on_transactions_ingested as refresh_rankings
+    from app.services.similar import on_transactions_ingested as bump_similar_catalog
+
+    # 월별 집계를 읽는 훅(랭킹)은 월별 집계 훅 다음에 둡니다
+    return [
+        refresh_monthly_stats,
+        refresh_rankings,
+        refresh_map_tiles,
+        refresh_apartment_summaries,
+        bump_similar_catalog
+    ]
+
+
+async def run_ingest_hooks(result: IngestResult) -> None:
+    """적재 후처리 훅 실행 (실패해도 다음 훅은 계속 실행)"""
+    if result.is_empty:
+        return
+    for hook in _ingest_hooks():
+        try:
+            await hook(result)
+        except Exception as e:
+            logger.error(f"❌ 실거래 적재 후처리 실패 ({hook.__module__}.{hook.__name__}): {e}", exc_info=True)
+
+
+async def ingest_transactions(
+    db: AsyncSession,
+    rows: Sequence[dict],
+    *,
+    chunk_size: int = 1000
+) -> IngestResult:
+    """
+    실거래 적재 (한 트랜잭션으로 INSERT 후 commit, 그 다음 훅 실행)
+
+    Args:
+        db: 데이터베이스 세션
+        rows: transactions 컬럼 딕셔너리 목록 (apt_id, trans_type, deal_date 필수)
+        chunk_size: 한 번에 INSERT할 행 수
+
+    Returns:
+        적재 결과 (바뀐 아파트 / 거래월)
+    """
+    result = IngestResult()
+    if not rows:
+        return result
+
+    result.inserted_ids = await transaction_crud.create_many(
+        db, objs_in=rows, chunk_size=chunk_size, commit=False
+    )
+    await db.commit()
+
+    for row in rows:
+        result.touch(row["apt_id"], row["deal_date"], row["trans_type"])
+
+    logger.info(f"실거래 적재: {len(result.inserted_ids)}건, 아파트 {len(result.apt_ids)}곳")
+    await run_ingest_hooks(result)
+    return result
+
+
+async def cancel_transactions(
+    db: AsyncSession,
+    trans_ids: Sequence[int],
+    *,
+    cancel_date: date
+) -> IngestResult:
+    """
+    거래 취소 반영 (commit 후 훅 실행)
+
+    Args:
+        db: 데이터베이스 세션
+        trans_ids: 취소된 거래 ID 목록
+        cancel_date: 취소일
+    """
+    result = IngestResult()
+    canceled = await transaction_crud.cancel_many(db, trans_ids=trans_ids, cancel_date=cancel_date)
+    await db.commit()
+
+    for row in canceled:
+        result.canceled_ids.append(row.trans_id)
+        result.touch(row.apt_id, row.deal_date, row.trans_type)
+
+    logger.info(f"실거래 취소: {len(result.canceled_ids)}건")
+    await run_ingest_hooks(result)
+    return result
@@ -0,0 +1,418 @@
+"""
+Clerk 웹훅 비동기 처리 큐 (Redis Stream)
+
+웹훅 엔드포인트는 서명 검증 후 이벤트를 Redis Stream에 넣고 바로 응답합니다.
+별도 워커 프로세스(scripts/webhook_worker.py)가 스트림을 읽어서:
+- svix_id로 중복 이벤트 제거 (Svix 재전송 대비)
+- 배치 안에서 사용자별로 마지막 이벤트만 남김 (사용자별 순서 보장)
+- INSERT ... ON CONFLICT 한 번 + 소프트 삭제 UPDATE 한 번으로 배치 반영
+
+흐름:
+    Clerk → POST /auth/webhook → XADD clerk:webhooks → 200 OK
+    워커 → XREADGROUP → 중복 제거/병합 → 배치 upsert → 커밋 → XACK
+
+실패 처리:
+- DB 연결 끊김 / Redis 오류처럼 일시적인 오류: 배치 전체를 ACK하지 않고 같은 배치를 다시 처리
+  (pending 목록을 비울 때까지 새 메시지를 읽지 않으므로 사용자별 순서가 유지됨)
+- 이메일 UNIQUE 충돌처럼 특정 사용자만 실패: 그 사용자의 메시지만 ACK / 중복 확인 표시를 하지 않고
+  재시도, WEBHOOK_MAX_ATTEMPTS번 실패하면 dead-letter 스트림(WEBHOOK_DEAD_LETTER_KEY)으로 옮김
+- 워커가 죽으면: 같은 컨슈머 이름(WEBHOOK_CONSUMER_NAME)으로 재시작할 때 pending 목록부터 처리하고,
+  다른 컨슈머에 오래 남은 메시지도 XAUTOCLAIM으로 가져옵니다. (시작 시 + 주기적으로)
+
+⚠️ 사용자별 순서는 스트림을 한 워커가 순서대로 처리할 때 보장됩니다.
+   워커는 한 개만 실행하세요. (컨슈머 그룹은 장애 복구용)
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core.config import settings
+from app.crud.account import account as account_crud
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 처리하는 이벤트 타입
+UPSERT_EVENTS = ("user.created", "user.updated")
+DELETE_EVENTS = ("user.deleted",)
+
+DEDUP_KEY_PREFIX = "clerk:webhook:seen:"
+
+
+async def enqueue_webhook_event(
+    redis: aioredis.Redis,
+    *,
+    svix_id: str,
+    event_type: str,
+    profile: dict
+) -> str:
+    """
+    검증된 웹훅 이벤트를 스트림에 추가
+
+    Args:
+        redis: Redis 클라이언트
+        svix_id: Svix 이벤트 ID (중복 제거 키)
+        event_type: 이벤트 타입 (user.created 등)
+        profile: AuthService.build_profile_from_webhook 결과
+
+    Returns:
+        스트림 메시지 ID
+    """
+    fields = {
+        "svix_id": svix_id,
+        "type": event_type,
+        "clerk_user_id": profile["clerk_user_id"],
+        "email": profile.get("email") or "",
+        "nickname": profile.get("nickname") or "",
+        "profile_image_url": profile.get("profile_image_url") or ""
+    }
+    return await redis.xadd(
+        settings.WEBHOOK_STREAM_KEY,
+        fields,
+        maxlen=settings.WEBHOOK_STREAM_MAXLEN,
+        approximate=True
+    )
+
+
+@dataclass
+class BatchPlan:
+    """배치 하나를 DB에 반영할 계획"""
+    upserts: List[dict] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    svix_ids: List[str] = field(default_factory=list)
+    # 사용자별로 병합된 메시지 (clerk_user_id → [(메시지 ID, svix_id)])
+    # 사용자 반영이 실패하면 이 메시지들만 ACK하지 않고 남깁니다
+    sources: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    duplicates: int = 0
+    skipped: int = 0
+
+
+def plan_batch(
+    messages: List[Tuple[str, dict]],
+    already_seen: set
+) -> BatchPlan:
+    """
+    스트림 메시지 배치를 사용자별 최종 상태로 병합
+
+    스트림 순서대로 보면서 사용자별 마지막 이벤트만 남기므로,
+    같은 배치 안에서 created → updated → deleted 순서가 그대로 반영됩니다.
+
+    Args:
+        messages: (메시지 ID, 필드) 목록 (스트림 순서)
+        already_seen: 이미 처리된 svix_id 집합
+
+    Returns:
+        BatchPlan
+    """
+    plan = BatchPlan()
+    latest: Dict[str, dict] = {}
+    seen_in_batch = set()
+
+    for message_id, fields in messages:
+        svix_id = fields.get("svix_id", "")
+        if svix_id in already_seen or svix_id in seen_in_batch:
+            plan.duplicates += 1
+            continue
+        seen_in_batch.add(svix_id)
+        plan.svix_ids.append(svix_id)
+
+        event_type = fields.get("type")
+        clerk_user_id = fields.get("clerk_user_id")
+        if not clerk_user_id or event_type not in UPSERT_EVENTS + DELETE_EVENTS:
+            plan.skipped += 1
+            continue
+        if event_type in UPSERT_EVENTS and not fields.get("email"):
+            # 이메일 없는 생성/수정 이벤트는 저장할 수 없음
+            plan.skipped += 1
+            continue
+
+        # dict는 삽입 순서를 유지하므로 다시 넣어서 순서를 마지막으로 옮김
+        latest.pop(clerk_user_id, None)
+        latest[clerk_user_id] = fields
+        plan.sources.setdefault(clerk_user_id, []).append((message_id, svix_id))
+
+    for clerk_user_id, fields in latest.items():
+        if fields["type"] in DELETE_EVENTS:
+            plan.deletes.append(clerk_user_id)
+        else:
+            plan.upserts.append({
+                "clerk_user_id": clerk_user_id,
+                "email": fields["email"],
+                "nickname": fields.get("nickname") or None,
+                "profile_image_url": fields.get("profile_image_url") or None
+            })
+
+    return plan
+
+
+class WebhookIngestWorker:
+    """
+    Clerk 웹훅 스트림 소비 워커
+
+    사용법:
+        worker = WebhookIngestWorker(get_redis())
+        await worker.run()
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        *,
+        stream_key: Optional[str] = None,
+        group: Optional[str] = None,
+        consumer: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        block_ms: int = 1000,
+        session_factory=AsyncSessionLocal
+    ):
+        self.redis = redis
+        self.stream_key = stream_key or settings.WEBHOOK_STREAM_KEY
+        self.group = group or settings.WEBHOOK_CONSUMER_GROUP
+        # 재시작해도 같은 이름이어야 이전 실행의 pending 메시지를 이어받음
+        self.consumer = consumer or settings.WEBHOOK_CONSUMER_NAME
+        self.batch_size = batch_size or settings.WEBHOOK_BATCH_SIZE
+        self.block_ms = block_ms
+        self.session_factory = session_factory
+        self._stopped = asyncio.Event()
+        # 사용자 단위 반영에 실패한 메시지별 시도 횟수 (메시지 ID → 횟수)
+        self._attempts: Dict[str, int] = {}
+        # 처리 통계 (burst replay 하네스에서 사용)
+        self.stats = {
+            "messages": 0, "applied": 0, "duplicates": 0, "skipped": 0,
+            "failed": 0, "dead_lettered": 0, "claimed": 0, "batches": 0
+        }
+
+    async def ensure_group(self) -> None:
+        """컨슈머 그룹 생성 (이미 있으면 무시)"""
+        try:
+            await self.redis.xgroup_create(self.stream_key, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def stop(self) -> None:
+        """다음 배치가 끝나면 종료"""
+        self._stopped.set()
+
+    async def _filter_seen(self, svix_ids: List[str]) -> set:
+        """이미 처리된 svix_id 조회"""
+        if not svix_ids:
+            return set()
+        values = await self.redis.mget([DEDUP_KEY_PREFIX + s for s in svix_ids])
+        return {s for s, v in zip(svix_ids, values) if v is not None}
+
+    async def _mark_seen(self, svix_ids: List[str]) -> None:
+        if not svix_ids:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for svix_id in svix_ids:
+                pipe.set(DEDUP_KEY_PREFIX + svix_id, 1, ex=settings.WEBHOOK_DEDUP_TTL)
+            await pipe.execute()
+
+    async def _apply(self, plan: BatchPlan) -> None:
+        """배치를 한 트랜잭션으로 반영"""
+        async with self.session_factory() as db:
+            try:
+                await account_crud.bulk_upsert_from_clerk(db, rows=plan.upserts)
+                await account_crud.bulk_soft_delete_by_clerk_ids(db, clerk_user_ids=plan.deletes)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+    async def _apply_one_by_one(self, plan: BatchPlan) -> Dict[str, str]:
+        """
+        배치 반영 실패 시 사용자 단위로 다시 시도
+
+        이메일 UNIQUE 충돌처럼 한 사용자 때문에 배치 전체가 막히지 않도록 합니다.
+        데이터 때문에 실패한 사용자(IntegrityError / DataError)만 모아서 돌려주고,
+        DB 연결 오류 같은 나머지 예외는 그대로 올려서 배치 전체를 다시 처리하게 합니다.
+
+        Returns:
+            실패한 clerk_user_id → 오류 메시지
+        """
+        failed: Dict[str, str] = {}
+        for row in plan.upserts:
+            try:
+                await self._apply(BatchPlan(upserts=[row]))
+            except (IntegrityError, DataError) as e:
+                failed[row["clerk_user_id"]] = str(e)
+                logger.error(f"웹훅 사용자 동기화 실패: clerk_user_id={row['clerk_user_id']}, {e}")
+        for clerk_user_id in plan.deletes:
+            try:
+                await self._apply(BatchPlan(deletes=[clerk_user_id]))
+            except (IntegrityError, DataError) as e:
+                failed[clerk_user_id] = str(e)
+                logger.error(f"웹훅 사용자 삭제 실패: clerk_user_id={clerk_user_id}, {e}")
+        return failed
+
+    async def _dead_letter(self, messages: List[Tuple[str, dict]], errors: Dict[str, str]) -> None:
+        """재시도 횟수를 넘긴 메시지를 dead-letter 스트림으로 복사 (원본은 호출한 쪽에서 ACK)"""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for message_id, fields in messages:
+                pipe.xadd(
+                    settings.WEBHOOK_DEAD_LETTER_KEY,
+                    {**fields, "source_id": message_id, "error": errors.get(fields["clerk_user_id"], "")[:1000]},
+                    maxlen=settings.WEBHOOK_STREAM_MAXLEN,
+                    approximate=True
+                )
+            await pipe.execute()
+        logger.error(f"웹훅 메시지 {len(messages)}건을 dead-letter로 이동: {settings.WEBHOOK_DEAD_LETTER_KEY}")
+
+    async def process(self, messages: List[Tuple[str, dict]]) -> bool:
+        """
+        메시지 배치 하나 처리 후 ACK
+
+        반영에 성공했거나 처리할 필요가 없는 메시지만 ACK하고 svix_id를 처리됨으로 표시합니다.
+        사용자 단위 반영에 실패한 메시지는 pending으로 남기고,
+        WEBHOOK_MAX_ATTEMPTS번째 실패에서 dead-letter 스트림으로 옮긴 뒤 ACK합니다.
+
+        Returns:
+            배치의 모든 메시지를 ACK했으면 True (재시도할 메시지가 남았으면 False)
+
+        Raises:
+            일시적인 오류 (DB 연결, Redis 등): 배치 전체가 ACK되지 않은 채로 남음
+        """
+        if not messages:
+            return True
+
+        # 스트림 길이 제한으로 잘려서 본문이 없는 pending 메시지는 그냥 ACK
+        trimmed = [message_id for message_id, fields in messages if not fields]
+        messages = [(message_id, fields) for message_id, fields in messages if fields]
+
+        svix_ids = [fields.get("svix_id", "") for _, fields in messages]
+        plan = plan_batch(messages, await self._filter_seen(svix_ids))
+
+        failed: Dict[str, str] = {}
+        if plan.upserts or plan.deletes:
+            try:
+                await self._apply(plan)
+            except Exception as e:
+                logger.warning(f"웹훅 배치 반영 실패, 사용자 단위로 재시도: {e}")
+                failed = await self._apply_one_by_one(plan)
+
+        failed_sources = [source for clerk_user_id in failed for source in plan.sources[clerk_user_id]]
+        failed_ids = {message_id for message_id, _ in failed_sources}
+        failed_svix_ids = {svix_id for _, svix_id in failed_sources}
+
+        retry_ids = set()
+        exhausted = []
+        for message_id, fields in messages:
+            if message_id not in failed_ids:
+                continue
+            self._attempts[message_id] = self._attempts.get(message_id, 0) + 1
+            if self._attempts[message_id] >= settings.WEBHOOK_MAX_ATTEMPTS:
+                exhausted.append((message_id, fields))
+            else:
+                retry_ids.add(message_id)
+        if exhausted:
+            await self._dead_letter(exhausted, failed)
+
+        await self._mark_seen([svix_id for svix_id in plan.svix_ids if svix_id not in failed_svix_ids])
+        ack_ids = trimmed + [message_id for message_id, _ in messages if message_id not in retry_ids]
+        if ack_ids:
+            await self.redis.xack(self.stream_key, self.group, *ack_ids)
+        for message_id in ack_ids:
+            self._attempts.pop(message_id, None)
+
+        self.stats["messages"] += len(messages)
+        self.stats["applied"] += len(plan.upserts) + len(plan.deletes) - len(failed)
+        self.stats["duplicates"] += plan.duplicates
+        self.stats["skipped"] += plan.skipped
+        self.stats["failed"] += len(failed)
+        self.stats["dead_lettered"] += len(exhausted)
+        self.stats["batches"] += 1
+        return not retry_ids
+
+    async def _read(self, stream_id: str) -> List[Tuple[str, dict]]:
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {self.stream_key: stream_id},
+            count=self.batch_size,
+            block=None if stream_id == "0" else self.block_ms
+        )
+        if not response:
+            return []
+        _, messages = response[0]
+        return messages
+
+    async def claim_stale(self) -> int:
+        """
+        오래 ACK되지 않은 메시지를 이 컨슈머로 가져옴 (XAUTOCLAIM)
+
+        다른 이름으로 실행됐다가 죽은 워커의 pending 메시지를 복구합니다.
+        가져온 메시지는 이 컨슈머의 pending 목록에 들어가므로 _read("0")로 처리합니다.
+
+        Returns:
+            가져온 메시지 수
+        """
+        claimed = 0
+        start_id = "0-0"
+        while True:
+            response = await self.redis.xautoclaim(
+                self.stream_key,
+                self.group,
+                self.consumer,
+                min_idle_time=settings.WEBHOOK_CLAIM_MIN_IDLE_MS,
+                start_id=start_id,
+                count=self.batch_size,
+                justid=True
+            )
+            next_id, message_ids = response[0], response[1]
+            claimed += len(message_ids)
+            if next_id in ("0-0", b"0-0"):
+                break
+            start_id = next_id
+        if claimed:
+            self.stats["claimed"] += claimed
+            logger.warning(f"웹훅 워커: 오래 처리되지 않은 메시지 {claimed}건을 가져옴 (consumer={self.consumer})")
+        return claimed
+
+    async def run(self) -> None:
+        """
+        워커 실행
+
+        이 컨슈머의 미처리(pending) 메시지를 먼저 모두 처리한 다음에 새 메시지를 읽습니다.
+        (시작 시, 처리 중 오류가 난 뒤, 실패한 메시지가 남았을 때, XAUTOCLAIM으로 가져온 뒤)
+        pending 목록이 빌 때까지 새 메시지를 읽지 않으므로 같은 사용자의 이벤트 순서가 유지됩니다.
+        """
+        await self.ensure_group()
+        logger.info(f"웹훅 워커 시작: stream={self.stream_key}, group={self.group}, consumer={self.consumer}")
+
+        drain_pending = True
+        last_claim_at = None
+        while not self._stopped.is_set():
+            try:
+                if last_claim_at is None or time.monotonic() - last_claim_at >= settings.WEBHOOK_CLAIM_INTERVAL:
+                    if await self.claim_stale():
+                        drain_pending = True
+                    last_claim_at = time.monotonic()
+
+                if drain_pending:
+                    messages = await self._read("0")
+                    if not messages:
+                        drain_pending = False
+                        continue
+                else:
+                    messages = await self._read(">")
+
+                if not await self.process(messages):
+                    # 실패한 메시지를 새 메시지보다 먼저 다시 처리
+                    drain_pending = True
+                    await asyncio.sleep(settings.WEBHOOK_RETRY_DELAY)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Redis / DB 일시 장애 등: 같은 배치를 pending 목록에서 다시 처리
+                logger.error(f"웹훅 워커 처리 오류: {e}", exc_info=True)
+                drain_pending = True
+                await asyncio.sleep(settings.WEBHOOK_RETRY_DELAY)
+
+        logger.info(f"웹훅 워커 종료: {self.stats}")
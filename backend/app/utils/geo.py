@@ -0,0 +1,130 @@
+"""
+지도 / 좌표 유틸리티
+
+- bounds 파라미터(서,남,동,북) 파싱
+- Web Mercator 타일 계산 (줌이 클수록 확대, z/x/y는 XYZ 규칙)
+- 줌 레벨별 클러스터 격자 크기 계산
+- 평 환산
+
+좌표는 모두 WGS84 경위도(SRID 4326)입니다.
+"""
+import math
+from typing import List, NamedTuple, Tuple
+
+# 1평 = 3.305785㎡
+PYEONG_M2 = 3.305785
+
+# Web Mercator 타일 한 장의 픽셀 크기
+TILE_SIZE = 256
+
+# Web Mercator로 표현 가능한 최대 위도
+MAX_LATITUDE = 85.05112878
+
+# EPSG:3857 좌표 범위의 절반 (미터)
+MERCATOR_ORIGIN = 20037508.342789244
+
+
+class Bounds(NamedTuple):
+    """지도 영역 (서쪽경도, 남쪽위도, 동쪽경도, 북쪽위도)"""
+    west: float
+    south: float
+    east: float
+    north: float
+
+    def contains(self, lng: float, lat: float) -> bool:
+        return self.west <= lng <= self.east and self.south <= lat <= self.north
+
+
+def parse_bounds(value: str) -> Bounds:
+    """
+    "서,남,동,북" 문자열을 Bounds로 변환
+
+    Args:
+        value: 예) "126.9,37.4,127.1,37.6"
+
+    Raises:
+        ValueError: 형식이 틀리거나 좌표 범위를 벗어난 경우
+    """
+    parts = value.split(",")
+    if len(parts) != 4:
+        raise ValueError("bounds는 '서쪽경도,남쪽위도,동쪽경도,북쪽위도' 4개 값이어야 합니다.")
+    try:
+        west, south, east, north = (float(p) for p in parts)
+    except ValueError:
+        raise ValueError("bounds 값은 숫자여야 합니다.")
+
+    if not all(math.isfinite(v) for v in (west, south, east, north)):
+        raise ValueError("bounds 값은 유한한 숫자여야 합니다.")
+    if not (-180 <= west <= 180 and -180 <= east <= 180 and -90 <= south <= 90 and -90 <= north <= 90):
+        raise ValueError("bounds 좌표가 경위도 범위를 벗어났습니다.")
+    if west >= east or south >= north:
+        raise ValueError("bounds는 서쪽 < 동쪽, 남쪽 < 북쪽이어야 합니다.")
+    return Bounds(west, south, east, north)
+
+
+def degrees_per_pixel(zoom: int) -> float:
+    """해당 줌 레벨에서 화면 1픽셀이 차지하는 경도(도)"""
+    return 360.0 / (TILE_SIZE * (2 ** zoom))
+
+
+def mercator_cell_size(zoom: int, cell_px: int) -> float:
+    """
+    줌 레벨별 클러스터 격자 한 칸의 크기 (EPSG:3857 미터)
+
+    화면 픽셀 격자와 같으므로 cell_px가 256의 약수이면 격자 칸이 타일 안에 딱 맞게 들어갑니다.
+    """
+    return 2 * MERCATOR_ORIGIN / (2 ** zoom * TILE_SIZE / cell_px)
+
+
+def lnglat_to_tile(lng: float, lat: float, zoom: int) -> Tuple[int, int]:
+    """경위도 → 해당 줌의 타일 좌표 (x, y)"""
+    n = 2 ** zoom
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(zoom: int, x: int, y: int) -> Bounds:
+    """타일 → 경위도 영역"""
+    n = 2 ** zoom
+
+    def lat_of(tile_y: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return Bounds(x / n * 360.0 - 180.0, lat_of(y + 1), (x + 1) / n * 360.0 - 180.0, lat_of(y))
+
+
+def tiles_covering(bounds: Bounds, zoom: int) -> List[Tuple[int, int]]:
+    """영역을 덮는 타일 목록 (x, y)"""
+    x0, y0 = lnglat_to_tile(bounds.west, bounds.north, zoom)
+    x1, y1 = lnglat_to_tile(bounds.east, bounds.south, zoom)
+    return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+
+def union_bounds(boxes: List[Bounds]) -> Bounds:
+    """여러 영역을 모두 포함하는 영역"""
+    return Bounds(
+        min(b.west for b in boxes),
+        min(b.south for b in boxes),
+        max(b.east for b in boxes),
+        max(b.north for b in boxes)
+    )
+
+
+def tile_count(bounds: Bounds, zoom: int) -> int:
+    """영역을 덮는 타일 수 (목록을 만들지 않고 계산)"""
+    x0, y0 = lnglat_to_tile(bounds.west, bounds.north, zoom)
+    x1, y1 = lnglat_to_tile(bounds.east, bounds.south, zoom)
+    return (x1 - x0 + 1) * (y1 - y0 + 1)
+
+
+def price_per_pyeong(price: float, exclusive_area_m2: float) -> float:
+    """
+    평당가 계산
+
+    Args:
+        price: 거래 금액 (만원)
+        exclusive_area_m2: 전용면적 (㎡)
+    """
+    return price / (exclusive_area_m2 / PYEONG_M2)
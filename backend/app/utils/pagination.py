@@ -0,0 +1,84 @@
+"""
+커서(keyset) 페이지네이션 헬퍼
+
+OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 뒤 페이지일수록 느려집니다.
+커서 방식은 "마지막으로 본 행의 정렬 키보다 뒤" 조건으로 인덱스에서 바로 시작하므로
+몇 번째 페이지든 첫 페이지와 비용이 같습니다.
+
+커서는 정렬 키 값을 JSON으로 만들어 base64url로 인코딩한 불투명 문자열입니다.
+클라이언트는 응답의 next_cursor를 그대로 다음 요청에 넘기기만 하면 됩니다.
+
+사용법:
+    cursor = encode_cursor([account.created_at, account.account_id])
+    created_at, account_id = decode_cursor(cursor)
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def _encode_value(value: Any) -> Any:
+    # JSON에 없는 타입은 태그를 붙여서 원래 타입으로 되돌릴 수 있게 함
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$d" in value:
+            return date.fromisoformat(value["$d"])
+        if "$dec" in value:
+            return Decimal(value["$dec"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    정렬 키 값 목록을 커서 문자열로 변환
+
+    Args:
+        values: 마지막 행의 정렬 컬럼 값 (정렬 순서대로)
+
+    Returns:
+        base64url 커서 (패딩 없음)
+    """
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: Optional[int] = None) -> List[Any]:
+    """
+    커서 문자열을 정렬 키 값 목록으로 변환
+
+    Args:
+        cursor: encode_cursor로 만든 문자열
+        expected_length: 정렬 컬럼 수 (다르면 에러)
+
+    Raises:
+        InvalidCursorError: 형식이 잘못된 커서
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list):
+            raise ValueError("cursor is not a list")
+        values = [_decode_value(v) for v in values]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"잘못된 커서입니다: {e}") from e
+
+    if expected_length is not None and len(values) != expected_length:
+        raise InvalidCursorError("커서의 정렬 키 개수가 맞지 않습니다.")
+    return values
@@ -0,0 +1,87 @@
+"""
+Alembic 실행 환경
+
+- DB 접속 정보: app.core.config의 DATABASE_URL (postgresql+asyncpg)
+- 비교 대상 메타데이터: app.db.base.Base.metadata (모든 모델 import 필요)
+- PostGIS가 만드는 테이블(spatial_ref_sys, topology 등)은 autogenerate에서 제외합니다.
+"""
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.base import Base
+from app.models.account import Account  # noqa: F401  모든 모델 import
+from app.models.location import State  # noqa: F401
+from app.models.apartment import Apartment  # noqa: F401
+from app.models.transaction import Transaction  # noqa: F401
+from app.models.transaction_stat import TransactionMonthlyStat  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """모델에 없는 테이블(PostGIS 시스템 테이블 등)은 autogenerate에서 무시"""
+    if type_ == "table" and reflected and compare_to is None:
+        return False
+    return True
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL만 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+        # CONCURRENTLY 인덱스는 autocommit_block으로 트랜잭션 밖에서 실행되므로
+        # 마이그레이션마다 트랜잭션을 나눕니다
+        transaction_per_migration=True
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        compare_type=True,
+        transaction_per_migration=True
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """asyncpg 엔진으로 마이그레이션 실행"""
+    connectable = create_async_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    try:
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,85 @@
+"""소프트 삭제 hot path용 부분 인덱스 (WHERE is_deleted = false)
+
+조회 API는 거의 항상 is_deleted = false 조건을 붙이므로, 삭제된 행을 뺀
+부분 인덱스가 더 작고 캐시에 잘 올라갑니다.
+
+- accounts: clerk_user_id / email / (created_at DESC, account_id DESC)
+- apartments: region_id / geometry(GiST) / kapt_code
+- transactions: (apt_id, deal_date DESC) / deal_date DESC
+
+⚠️ 운영 테이블이 잠기지 않도록 CREATE INDEX CONCURRENTLY로 만듭니다.
+   CONCURRENTLY는 트랜잭션 안에서 실행할 수 없으므로 autocommit_block을 사용합니다.
+   아직 없는 테이블(apartments / transactions)은 건너뜁니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스명, 테이블, 정의) - 정의는 "USING ..." 또는 컬럼 목록
+PARTIAL_INDEXES = [
+    ("idx_accounts_clerk_user_id_active", "accounts", "(clerk_user_id)"),
+    ("idx_accounts_email_active", "accounts", "(email)"),
+    # 관리자 계정 목록 커서 페이지네이션 (init_db.sql에도 같은 이름으로 존재)
+    ("idx_accounts_created_at_account_id", "accounts", "(created_at DESC, account_id DESC)"),
+    ("idx_apartments_region_id_active", "apartments", "(region_id)"),
+    ("idx_apartments_geometry_active", "apartments", "USING gist (geometry)"),
+    ("idx_apartments_kapt_code_active", "apartments", "(kapt_code)"),
+    ("idx_transactions_apt_id_deal_date_active", "transactions", "(apt_id, deal_date DESC)"),
+    ("idx_transactions_deal_date_active", "transactions", "(deal_date DESC)"),
+]
+
+
+def _existing_tables() -> set:
+    """현재 DB에 있는 테이블 (--sql 오프라인 모드면 전부 있다고 가정)"""
+    if context.is_offline_mode():
+        return {table for _, table, _ in PARTIAL_INDEXES}
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _drop_if_invalid(name: str) -> None:
+    """
+    이전에 실패한 CONCURRENTLY 빌드가 남긴 INVALID 인덱스 제거
+
+    INVALID 인덱스가 남아 있으면 IF NOT EXISTS가 건너뛰어 버리므로 먼저 지웁니다.
+    """
+    if context.is_offline_mode():
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name}
+    ).scalar()
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+    with op.get_context().autocommit_block():
+        for name, table, definition in PARTIAL_INDEXES:
+            if table not in tables:
+                continue
+            _drop_if_invalid(name)
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} {definition} WHERE is_deleted = false"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(PARTIAL_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
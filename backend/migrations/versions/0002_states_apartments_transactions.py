@@ -0,0 +1,131 @@
+"""지역 / 아파트 / 실거래 테이블
+
+states, apartments, transactions 테이블을 만듭니다. (ERD: .agent/data.sql)
+create_tables.py 등으로 이미 만들어진 테이블은 건너뜁니다.
+그래서 되돌릴 때도 테이블을 지우지 않습니다. (이 리비전이 만들었는지 알 수 없으므로
+실데이터가 들어 있는 테이블을 지울 수 있음, 필요하면 직접 DROP TABLE 하세요)
+
+새로 만든 테이블은 비어 있으므로 부분 인덱스를 CONCURRENTLY 없이 바로 만듭니다.
+(이미 있던 테이블의 부분 인덱스는 0001에서 만들어집니다)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("is_deleted = false")
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now(), comment="레코드 생성 일시"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now(), comment="레코드 수정 일시"),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False, server_default=sa.false(), comment="소프트 삭제"),
+    ]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+
+    if context.is_offline_mode():
+        existing = set()
+    else:
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "states" not in existing:
+        op.create_table(
+            "states",
+            sa.Column("region_id", sa.Integer(), primary_key=True, autoincrement=True, comment="PK"),
+            sa.Column("region_name", sa.String(20), nullable=False, comment="시군구명 (예: 강남구, 해운대구)"),
+            sa.Column("region_code", sa.CHAR(10), nullable=False, unique=True,
+                      comment="시도코드 2자리 + 시군구 3자리 + 동코드 5자리"),
+            sa.Column("city_name", sa.String(40), nullable=False),
+            *_timestamps()
+        )
+
+    if "apartments" not in existing:
+        op.create_table(
+            "apartments",
+            sa.Column("apt_id", sa.Integer(), primary_key=True, autoincrement=True, comment="PK"),
+            sa.Column("region_id", sa.Integer(), sa.ForeignKey("states.region_id"), nullable=False),
+            sa.Column("apt_name", sa.String(100), nullable=False, comment="아파트 단지명"),
+            sa.Column("road_address", sa.String(200), nullable=False, comment="카카오 API"),
+            sa.Column("jibun_address", sa.String(200), nullable=False, comment="카카오 API"),
+            sa.Column("zip_code", sa.CHAR(5), nullable=True, comment="카카오 API"),
+            sa.Column("code_sale_nm", sa.String(20), nullable=True, comment="분양/임대 등, 기본정보"),
+            sa.Column("code_heat_nm", sa.String(20), nullable=True, comment="지역난방/개별난방 등, 기본정보"),
+            sa.Column("total_household_cnt", sa.Integer(), nullable=False, comment="기본정보"),
+            sa.Column("total_building_cnt", sa.Integer(), nullable=True, comment="기본정보"),
+            sa.Column("highest_floor", sa.Integer(), nullable=True, comment="기본정보"),
+            sa.Column("use_approval_date", sa.Date(), nullable=True, comment="기본정보"),
+            sa.Column("total_parking_cnt", sa.Integer(), nullable=True, comment="상세정보"),
+            sa.Column("builder_name", sa.String(100), nullable=True, comment="상세정보"),
+            sa.Column("developer_name", sa.String(100), nullable=True, comment="상세정보"),
+            sa.Column("manage_type", sa.String(20), nullable=True, comment="자치관리/위탁관리 등, 상세정보"),
+            sa.Column("hallway_type", sa.String(20), nullable=True, comment="계단식/복도식/혼합식, 상세정보"),
+            sa.Column("geometry", Geometry(geometry_type="POINT", srid=4326, spatial_index=False), nullable=False),
+            sa.Column("kapt_code", sa.String(20), nullable=False, comment="국토부 단지코드"),
+            sa.Column("subway_time", sa.String(100), nullable=True, comment="상세정보"),
+            sa.Column("subway_line", sa.String(100), nullable=True, comment="상세정보"),
+            sa.Column("subway_station", sa.String(100), nullable=True, comment="상세정보"),
+            sa.Column("education_facility", sa.String(100), nullable=True, comment="상세정보"),
+            *_timestamps()
+        )
+        op.create_index("idx_apartments_region_id_active", "apartments", ["region_id"], postgresql_where=ACTIVE)
+        op.create_index(
+            "idx_apartments_geometry_active", "apartments", ["geometry"],
+            postgresql_using="gist", postgresql_where=ACTIVE
+        )
+        op.create_index("idx_apartments_kapt_code_active", "apartments", ["kapt_code"], postgresql_where=ACTIVE)
+
+    if "transactions" not in existing:
+        op.create_table(
+            "transactions",
+            sa.Column("trans_id", sa.Integer(), primary_key=True, autoincrement=True, comment="PK"),
+            sa.Column("apt_id", sa.Integer(), sa.ForeignKey("apartments.apt_id"), nullable=False),
+            sa.Column("trans_type", sa.String(10), nullable=False, comment="SALE=매매, JEONSE=전세, MONTHLY=월세"),
+            sa.Column("rent_type", sa.String(10), nullable=True, comment="NEW=신규, RENEWAL=갱신, 전월세만 해당"),
+            sa.Column("trans_price", sa.Integer(), nullable=True),
+            sa.Column("deposit_price", sa.Integer(), nullable=True),
+            sa.Column("monthly_rent", sa.Integer(), nullable=True),
+            sa.Column("exclusive_area", sa.Numeric(7, 2), nullable=False),
+            sa.Column("floor", sa.Integer(), nullable=False),
+            sa.Column("building_num", sa.String(10), nullable=True),
+            sa.Column("unit_num", sa.String(10), nullable=True),
+            sa.Column("deal_date", sa.Date(), nullable=False),
+            sa.Column("contract_date", sa.Date(), nullable=True),
+            sa.Column("is_renewal_right", sa.Boolean(), nullable=True),
+            sa.Column("is_canceled", sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column("cancel_date", sa.Date(), nullable=True),
+            sa.Column("data_source", sa.String(50), nullable=False, server_default="국토부실거래가"),
+            *_timestamps()
+        )
+        op.create_index(
+            "idx_transactions_apt_id_deal_date_active", "transactions",
+            ["apt_id", sa.text("deal_date DESC")], postgresql_where=ACTIVE
+        )
+        op.create_index(
+            "idx_transactions_deal_date_active", "transactions",
+            [sa.text("deal_date DESC")], postgresql_where=ACTIVE
+        )
+
+
+def downgrade() -> None:
+    # upgrade()가 기존 테이블을 건너뛰므로 여기서 지우면 이 리비전이 만들지 않은 데이터까지 사라짐
+    logger.warning(
+        "0002 downgrade: states / apartments / transactions 테이블은 지우지 않습니다. "
+        "필요하면 직접 DROP TABLE transactions, apartments, states 를 실행하세요."
+    )
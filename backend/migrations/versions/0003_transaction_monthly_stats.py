@@ -0,0 +1,51 @@
+"""실거래 월별 집계 테이블
+
+transaction_monthly_stats 테이블을 만듭니다. (app/models/transaction_stat.py)
+(apt_id, 월, 거래유형, 전용면적 구간)별 건수 / 평균 / 중앙값 / 최소 / 최대를 담습니다.
+
+테이블은 비어 있는 상태로 만들어집니다. 기존 거래의 집계는
+scripts/build_monthly_stats.py로 한 번 채우세요. 이후에는 실거래 적재 훅이 갱신합니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transaction_monthly_stats",
+        sa.Column("apt_id", sa.Integer(), sa.ForeignKey("apartments.apt_id"), primary_key=True),
+        sa.Column("month", sa.Date(), primary_key=True, comment="해당 월 1일"),
+        sa.Column("trans_type", sa.String(10), primary_key=True, comment="SALE=매매, JEONSE=전세, MONTHLY=월세"),
+        sa.Column("area_bucket", sa.SmallInteger(), primary_key=True, comment="0=전체, 1~5=전용면적 구간"),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.Column("avg_price", sa.Float(), nullable=False),
+        sa.Column("median_price", sa.Float(), nullable=False),
+        sa.Column("min_price", sa.Integer(), nullable=False),
+        sa.Column("max_price", sa.Integer(), nullable=False),
+        sa.Column("avg_price_per_pyeong", sa.Float(), nullable=False),
+        sa.Column("median_price_per_pyeong", sa.Float(), nullable=False),
+        sa.Column("min_price_per_pyeong", sa.Float(), nullable=False),
+        sa.Column("max_price_per_pyeong", sa.Float(), nullable=False),
+        sa.Column("avg_monthly_rent", sa.Float(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now(), comment="집계 시각"),
+        if_not_exists=True
+    )
+    op.create_index(
+        "idx_transaction_monthly_stats_month", "transaction_monthly_stats",
+        ["month", "trans_type", "area_bucket"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("transaction_monthly_stats")
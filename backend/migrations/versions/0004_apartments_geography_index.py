@@ -0,0 +1,47 @@
+"""아파트 geography GiST 인덱스 (주변 단지 KNN)
+
+/apartments/{apt_id}/nearby-comparison은 미터 단위 반경(ST_DWithin)과
+거리순 정렬(<->)을 geography로 계산합니다. geometry 인덱스로는 미터 기준 조건을
+쓸 수 없으므로 (geometry::geography) 식 인덱스를 만듭니다.
+쿼리의 식도 반드시 a.geometry::geography 형태여야 이 인덱스를 탑니다.
+
+⚠️ 0001과 같이 CREATE INDEX CONCURRENTLY (autocommit_block)로 만듭니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "idx_apartments_geography_active"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        if not context.is_offline_mode():
+            invalid = op.get_bind().execute(
+                sa.text(
+                    "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE c.relname = :name AND NOT i.indisvalid"
+                ),
+                {"name": INDEX_NAME}
+            ).scalar()
+            if invalid:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            "ON apartments USING gist ((geometry::geography)) WHERE is_deleted = false"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+아파트 지역(region_id) 재배정 스크립트
+
+행정구역 경계 GeoJSON과 아파트 좌표를 공간 조인(shapely STRtree)해서
+apartments.region_id를 다시 계산하고, 저장된 값과 다른 아파트를 일괄 수정합니다.
+(app/services/region_assignment.py)
+
+경계 파일 예시 (WGS84 경위도로 변환한 GeoJSON):
+- 법정동: 국가공간정보포털 LSMD_ADM_SECT_UMD (EMD_CD 8자리 → 법정동 코드 10자리)
+- 시군구: LSMD_ADM_SECT_SGG / SIG (SIG_CD 5자리)
+
+사용법:
+    python scripts/assign_regions.py --dong data/emd.geojson --dry-run --report mismatches.csv
+    python scripts/assign_regions.py --dong data/emd.geojson --sigungu data/sig.geojson
+    python scripts/assign_regions.py --dong data/emd.geojson --code-property adm_cd2 --max-distance 100
+"""
+import argparse
+import asyncio
+import csv
+import logging
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.redis import close_redis
+from app.db.session import AsyncSessionLocal, engine
+from app.services.region_assignment import assign_regions, load_boundaries
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+REPORT_FIELDS = ["apt_id", "apt_name", "stored_region_code", "assigned_region_code", "kind"]
+
+
+def write_report(path: str, mismatches: list) -> None:
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(mismatches)
+
+
+async def main(args):
+    """재배정 실행"""
+    started = time.perf_counter()
+    dong = load_boundaries(args.dong, code_length=10, code_property=args.code_property)
+    sigungu = load_boundaries(args.sigungu, code_length=5) if args.sigungu else None
+    print(f"경계 로드: 동 {len(dong)}개" + (f", 시군구 {len(sigungu)}개" if sigungu else "")
+          + f" ({time.perf_counter() - started:.1f}s)")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            report = await assign_regions(
+                db,
+                dong=dong,
+                sigungu=sigungu,
+                max_distance_m=args.max_distance,
+                dry_run=args.dry_run,
+                chunk_size=args.chunk_size
+            )
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+    if args.report:
+        write_report(args.report, report.mismatches)
+
+    print()
+    print("=" * 50)
+    print(f"✅ {'[DRY RUN] ' if args.dry_run else ''}지역 재배정 완료 ({report.elapsed:.1f}s)")
+    print(f"   {report.summary()}")
+    if args.report:
+        print(f"   불일치 보고서: {args.report} ({len(report.mismatches)}건)")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아파트 지역(region_id) 재배정")
+    parser.add_argument("--dong", required=True, help="법정동 경계 GeoJSON 경로")
+    parser.add_argument("--sigungu", help="시군구 경계 GeoJSON 경로 (선택, 교차 검증용)")
+    parser.add_argument("--code-property", help="법정동 경계의 지역 코드 속성 이름 (기본: 자동 탐색)")
+    parser.add_argument("--max-distance", type=float, default=50.0,
+                        help="경계 밖 좌표를 가장 가까운 동으로 보정할 최대 거리 (미터, 0이면 보정 안 함)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="일괄 수정 청크 크기")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 결과만 계산")
+    parser.add_argument("--report", help="불일치 목록을 저장할 CSV 경로")
+    asyncio.run(main(parser.parse_args()))
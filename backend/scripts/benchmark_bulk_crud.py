@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+CRUDBase 대량 처리 벤치마크
+
+행마다 create()/update()를 호출하는 방식과
+create_many / update_many / upsert_many를 같은 데이터로 비교합니다.
+
+accounts 테이블에 합성 계정(bench_*@example.com)을 만들고, 끝나면 모두 하드 삭제합니다.
+
+사용법:
+    python scripts/benchmark_bulk_crud.py --rows 5000 --chunk-size 1000
+
+⚠️ 개발 DB에서만 실행하세요.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete
+
+from app.crud.account import account as account_crud
+from app.db.session import AsyncSessionLocal, engine
+from app.models.account import Account
+
+BENCH_PREFIX = "bench_"
+
+
+def make_rows(count: int, run_id: str, label: str) -> list:
+    return [
+        {
+            "clerk_user_id": f"{BENCH_PREFIX}{run_id}_{label}_{i}",
+            "email": f"{BENCH_PREFIX}{run_id}_{label}_{i}@example.com",
+            "nickname": f"벤치{i}"
+        }
+        for i in range(count)
+    ]
+
+
+async def per_row_create(rows: list) -> list:
+    """CRUDBase.create()와 같은 방식: 행마다 INSERT + commit + refresh"""
+    ids = []
+    async with AsyncSessionLocal() as db:
+        for row in rows:
+            obj = Account(**row)
+            db.add(obj)
+            await db.commit()
+            await db.refresh(obj)
+            ids.append(obj.account_id)
+    return ids
+
+
+async def per_row_update(ids: list) -> None:
+    """CRUDBase.update()와 같은 방식: 행마다 SELECT + UPDATE + commit + refresh"""
+    async with AsyncSessionLocal() as db:
+        for account_id in ids:
+            obj = await account_crud.get(db, account_id)
+            await account_crud.update(db, db_obj=obj, obj_in={"nickname": "수정"})
+
+
+async def timed(label: str, count: int, coro):
+    started = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed:8.2f}s  {count / elapsed:10,.0f} rows/s")
+    return result, elapsed
+
+
+async def main(args):
+    run_id = uuid.uuid4().hex[:8]
+    chunk = args.chunk_size
+    per_row_count = min(args.rows, args.per_row_rows)
+
+    print(f"📦 rows={args.rows} (행 단위 방식은 {per_row_count}행), chunk_size={chunk}")
+    try:
+        print("\n[INSERT]")
+        per_row_ids, per_row_insert = await timed(
+            "create() x N", per_row_count, per_row_create(make_rows(per_row_count, run_id, "row"))
+        )
+        async with AsyncSessionLocal() as db:
+            bulk_ids, bulk_insert = await timed(
+                "create_many()", args.rows,
+                account_crud.create_many(db, objs_in=make_rows(args.rows, run_id, "bulk"), chunk_size=chunk)
+            )
+
+        print("\n[UPDATE]")
+        _, per_row_upd = await timed("update() x N", per_row_count, per_row_update(per_row_ids))
+        async with AsyncSessionLocal() as db:
+            _, bulk_upd = await timed(
+                "update_many()", len(bulk_ids),
+                account_crud.update_many(
+                    db, rows=[{"account_id": i, "nickname": "수정"} for i in bulk_ids], chunk_size=chunk
+                )
+            )
+
+        print("\n[UPSERT] (절반은 기존 행, 절반은 새 행)")
+        half = args.rows // 2
+        upsert_rows = make_rows(args.rows, run_id, "bulk")[:half] + make_rows(args.rows - half, run_id, "new")
+        async with AsyncSessionLocal() as db:
+            await timed(
+                "upsert_many()", len(upsert_rows),
+                account_crud.upsert_many(db, rows=upsert_rows, index_elements=["clerk_user_id"], chunk_size=chunk)
+            )
+
+        print("\n[비교] 행당 시간")
+        print(f"  INSERT: {per_row_insert / per_row_count * 1000:.3f}ms → {bulk_insert / args.rows * 1000:.3f}ms "
+              f"({(per_row_insert / per_row_count) / (bulk_insert / args.rows):.1f}x)")
+        print(f"  UPDATE: {per_row_upd / per_row_count * 1000:.3f}ms → {bulk_upd / len(bulk_ids) * 1000:.3f}ms "
+              f"({(per_row_upd / per_row_count) / (bulk_upd / len(bulk_ids)):.1f}x)")
+    finally:
+        # 합성 계정 정리
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Account).where(Account.clerk_user_id.like(f"{BENCH_PREFIX}{run_id}_%")))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CRUDBase 대량 처리 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000, help="대량 처리 행 수")
+    parser.add_argument("--per-row-rows", type=int, default=1000, help="행 단위 방식으로 처리할 최대 행 수 (느림)")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
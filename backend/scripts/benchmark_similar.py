@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+유사 단지 추천 벤치마크
+
+합성 단지 카탈로그로 특성 행렬을 만들고 /apartments/{apt_id}/similar 한 건의
+top-k 계산 시간(전국 / 같은 시군구)과 여러 단지 일괄 계산 시간을 측정합니다.
+DB / Redis 없이 실행됩니다.
+
+사용법:
+    python scripts/benchmark_similar.py --rows 20000 --queries 500 --k 5
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.services.similar import build_index
+
+HEATING = ["지역난방", "개별난방", "중앙난방", "기타난방", None]
+SUBWAY = ["5분이내", "5~10분이내", "10~15분이내", "15~20분이내", "20분초과", None]
+
+
+def make_rows(count: int) -> list:
+    rng = random.Random(42)
+    return [
+        SimpleNamespace(
+            apt_id=i + 1,
+            apt_name=f"벤치아파트{i + 1}",
+            region_code=f"11{rng.randint(0, 250):03d}10100",
+            region_name="벤치구",
+            total_household_cnt=rng.randint(20, 5000),
+            highest_floor=rng.randint(3, 60),
+            total_parking_cnt=rng.choice([None, rng.randint(10, 8000)]),
+            use_approval_date=date(rng.randint(1975, 2024), 1, 1),
+            code_heat_nm=rng.choice(HEATING),
+            subway_time=rng.choice(SUBWAY),
+            avg_price_per_pyeong=rng.choice([None, rng.uniform(800, 12000)])
+        )
+        for i in range(count)
+    ]
+
+
+def measure(index, rows: np.ndarray, k: int, same_sigungu: bool) -> list:
+    timings = []
+    for row in rows:
+        started = time.perf_counter()
+        index.top_k(np.array([row]), k, same_sigungu=same_sigungu)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main(args):
+    started = time.perf_counter()
+    index = build_index(make_rows(args.rows), version="bench")
+    print(f"행렬 생성: {len(index)}개 단지 x {index.features.shape[1]}개 특성 ({time.perf_counter() - started:.2f}s)")
+
+    rows = np.random.default_rng(0).integers(0, len(index), size=args.queries)
+    print("=" * 50)
+    for label, same_sigungu in (("전국", False), ("같은 시군구", True)):
+        timings = sorted(measure(index, rows, args.k, same_sigungu))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{label:8s} 단건: 평균 {statistics.mean(timings):.2f}ms / p95 {p95:.2f}ms")
+
+    started = time.perf_counter()
+    index.top_k(rows, args.k)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"일괄 {len(rows)}건: {elapsed:.1f}ms (건당 {elapsed / len(rows):.3f}ms)")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="유사 단지 추천 벤치마크")
+    parser.add_argument("--rows", type=int, default=20000, help="합성 단지 수 (기본: 20000)")
+    parser.add_argument("--queries", type=int, default=500, help="측정할 조회 수 (기본: 500)")
+    parser.add_argument("--k", type=int, default=5, help="추천 단지 수 (기본: 5)")
+    main(parser.parse_args())
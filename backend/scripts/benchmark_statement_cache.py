@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+SQL 문 캐시 벤치마크
+
+hot path 조회(get_by_clerk_user_id)를
+- 호출마다 select()를 새로 만드는 방식 (이전 방식)
+- app/crud/statements.py 레지스트리의 미리 만든 문장을 쓰는 방식
+으로 각각 동시에 실행해서 처리량과 지연시간을 비교합니다.
+
+--offline: DB 없이 문장 생성 + 컴파일 캐시 키 계산 비용만 비교
+--statement-cache-size / --prepared-cache-size: asyncpg 캐시 크기를 바꿔가며 비교
+
+사용법:
+    python scripts/benchmark_statement_cache.py --offline
+    python scripts/benchmark_statement_cache.py --requests 20000 --concurrency 50
+    python scripts/benchmark_statement_cache.py --prepared-cache-size 0   # prepared statement 캐시 끔
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.crud.account import account as account_crud
+from app.models.account import Account
+
+
+def build_per_call(clerk_user_id: str):
+    """이전 방식: 호출마다 새 select()"""
+    return select(Account).where(
+        Account.clerk_user_id == clerk_user_id,
+        Account.is_deleted == False
+    ), {}
+
+
+_cached = select(Account).where(
+    Account.clerk_user_id == bindparam("clerk_user_id"),
+    Account.is_deleted == False
+)
+
+
+def build_cached(clerk_user_id: str):
+    """미리 만든 문장 + 파라미터"""
+    return _cached, {"clerk_user_id": clerk_user_id}
+
+
+def run_offline(iterations: int) -> None:
+    """문장 생성 + 캐시 키 계산 비용 (SQLAlchemy가 실행마다 하는 작업)"""
+    for label, builder in (("per-call select()", build_per_call), ("cached statement", build_cached)):
+        started = time.perf_counter()
+        for i in range(iterations):
+            stmt, _ = builder(f"user_{i % 1000}")
+            stmt._generate_cache_key()
+        elapsed = time.perf_counter() - started
+        print(f"  {label:<20} {elapsed / iterations * 1e6:8.2f}µs/호출")
+
+
+async def run_load(session_factory, builder, clerk_user_ids, requests: int, concurrency: int):
+    """concurrency개 세션이 requests번 조회"""
+    latencies = []
+    counter = iter(range(requests))
+
+    async def worker():
+        async with session_factory() as db:
+            for i in counter:
+                stmt, params = builder(clerk_user_ids[i % len(clerk_user_ids)])
+                started = time.perf_counter()
+                result = await db.execute(stmt, params)
+                result.scalar_one_or_none()
+                latencies.append(time.perf_counter() - started)
+                db.expunge_all()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return time.perf_counter() - started, latencies
+
+
+async def main(args):
+    if args.offline:
+        print(f"📦 오프라인 비교 ({args.requests}회)")
+        run_offline(args.requests)
+        return
+
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        connect_args={
+            "statement_cache_size": args.statement_cache_size,
+            "prepared_statement_cache_size": args.prepared_cache_size
+        }
+    )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with session_factory() as db:
+            accounts, _ = await account_crud.get_multi_keyset(
+                db, order_by=[Account.account_id], limit=1000, filters=[Account.is_deleted == False]
+            )
+        clerk_user_ids = [a.clerk_user_id for a in accounts] or ["user_missing"]
+        print(
+            f"📦 조회 {args.requests}회, 동시성 {args.concurrency}, 대상 계정 {len(clerk_user_ids)}명 "
+            f"(statement_cache_size={args.statement_cache_size}, "
+            f"prepared_statement_cache_size={args.prepared_cache_size})"
+        )
+
+        # 커넥션/캐시 워밍업
+        await run_load(session_factory, build_cached, clerk_user_ids, args.concurrency * 10, args.concurrency)
+
+        for label, builder in (("per-call select()", build_per_call), ("cached statement", build_cached)):
+            elapsed, latencies = await run_load(
+                session_factory, builder, clerk_user_ids, args.requests, args.concurrency
+            )
+            ordered = sorted(latencies)
+            print(
+                f"  {label:<20} {args.requests / elapsed:9,.0f} q/s  "
+                f"p50={statistics.median(ordered) * 1000:.2f}ms "
+                f"p99={ordered[int(len(ordered) * 0.99) - 1] * 1000:.2f}ms"
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQL 문 캐시 벤치마크")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--statement-cache-size", type=int, default=settings.DB_STATEMENT_CACHE_SIZE)
+    parser.add_argument("--prepared-cache-size", type=int, default=settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+    parser.add_argument("--offline", action="store_true", help="DB 없이 문장 생성 비용만 비교")
+    asyncio.run(main(parser.parse_args()))
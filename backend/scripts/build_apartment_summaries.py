@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+아파트 요약 카드 재구축
+
+/map/apartments/{apt_id}/summary가 읽는 아파트별 요약 문서를 다시 만들어 Redis에 저장합니다.
+실거래 적재 때는 바뀐 아파트만 갱신되지만, 최근 가격 변동은 오늘 기준 기간이라
+하루 한 번 전체를 다시 만들어야 합니다. (Redis 초기화 후에도 실행)
+
+사용법:
+    python scripts/build_apartment_summaries.py
+    python scripts/build_apartment_summaries.py --apt-id 101 --apt-id 102   # 지정한 아파트만
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.redis import close_redis
+from app.db.session import AsyncReadOnlySessionLocal, engine
+from app.services.apartment_summary import rebuild_all_summaries, refresh_summaries
+
+
+async def main(args):
+    """요약 재구축 실행"""
+    try:
+        async with AsyncReadOnlySessionLocal() as db:
+            if args.apt_id:
+                count = len(await refresh_summaries(db, args.apt_id))
+            else:
+                count = await rebuild_all_summaries(db, batch_size=args.batch_size)
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+    print()
+    print("=" * 50)
+    print("✅ 아파트 요약 재구축 완료")
+    print(f"   저장한 요약: {count:,}건")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="아파트 요약 카드 재구축")
+    parser.add_argument("--apt-id", type=int, action="append", help="지정한 아파트만 (여러 번 사용 가능)")
+    parser.add_argument("--batch-size", type=int, default=2000, help="한 번에 읽을 아파트 수")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(main(parser.parse_args()))
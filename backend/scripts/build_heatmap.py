@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+가격 히트맵 배치
+
+최근 매매 거래를 NumPy로 격자 집계(평당가 중앙값, 거래량)해서
+기간(HEATMAP_PERIODS) × 줌(HEATMAP_ZOOMS)별로 Redis에 저장합니다.
+/map/heatmap은 이 결과만 읽습니다. 하루 한 번(실거래 적재 후) 실행하세요.
+
+사용법:
+    python scripts/build_heatmap.py
+    python scripts/build_heatmap.py --today 2026-09-30   # 기준일 지정
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.redis import close_redis
+from app.db.session import AsyncReadOnlySessionLocal, engine
+from app.services.heatmap import build_heatmaps
+
+
+async def main(args):
+    """히트맵 빌드 실행"""
+    today = date.fromisoformat(args.today) if args.today else None
+    try:
+        async with AsyncReadOnlySessionLocal() as db:
+            summary = await build_heatmaps(db, today=today)
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+    print()
+    print("=" * 50)
+    print("✅ 히트맵 빌드 완료")
+    for key, cells in summary.items():
+        print(f"   {key:<10} {cells:>8,}칸")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가격 히트맵 배치")
+    parser.add_argument("--today", default=None, help="기준일 (YYYY-MM-DD, 기본: 오늘)")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(main(parser.parse_args()))
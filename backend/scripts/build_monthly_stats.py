@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+실거래 월별 집계 재구축
+
+transaction_monthly_stats를 transactions에서 다시 계산합니다.
+평소에는 실거래 적재 훅이 바뀐 달만 갱신하므로, 처음 테이블을 만든 뒤 한 번,
+그리고 훅 실패나 직접 수정한 데이터를 바로잡을 때 실행하세요.
+
+사용법:
+    python scripts/build_monthly_stats.py                    # 전체
+    python scripts/build_monthly_stats.py --since 2025-01-01 # 해당 월 이후만
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.db.session import AsyncSessionLocal, engine
+from app.services.monthly_stats import rebuild_monthly_stats
+
+
+async def main(args):
+    """월별 집계 재구축 실행 (한 트랜잭션)"""
+    since = date.fromisoformat(args.since) if args.since else None
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = await rebuild_monthly_stats(db, since=since)
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    print()
+    print("=" * 50)
+    print("✅ 월별 집계 재구축 완료")
+    print(f"   범위: {since.replace(day=1) if since else '전체'} ~")
+    print(f"   집계 행: {rows:,}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="실거래 월별 집계 재구축")
+    parser.add_argument("--since", default=None, help="이 날짜가 속한 달부터 다시 계산 (YYYY-MM-DD)")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(main(parser.parse_args()))
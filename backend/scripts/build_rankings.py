@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+대시보드 랭킹 재구축
+
+월별 집계(transaction_monthly_stats)에서 기간 × 지역별 랭킹 정렬 집합을 새로 만들고
+current 포인터를 바꿉니다. 실거래 적재 때는 바뀐 아파트만 갱신되지만,
+달이 바뀌면 기간이 밀리므로 하루 한 번 실행하세요. (월별 집계 재구축 후에도 실행)
+
+사용법:
+    python scripts/build_rankings.py
+    python scripts/build_rankings.py --today 2026-09-30   # 기준일 지정
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.redis import close_redis
+from app.db.session import AsyncReadOnlySessionLocal, engine
+from app.services.rankings import build_rankings
+
+
+async def main(args):
+    """랭킹 빌드 실행"""
+    today = date.fromisoformat(args.today) if args.today else None
+    try:
+        async with AsyncReadOnlySessionLocal() as db:
+            summary = await build_rankings(db, today=today)
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+    print()
+    print("=" * 50)
+    print("✅ 랭킹 빌드 완료")
+    for period, count in summary.items():
+        print(f"   {period:<4} {count:>8,}개 단지")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 랭킹 재구축")
+    parser.add_argument("--today", default=None, help="기준일 (YYYY-MM-DD, 기본: 오늘)")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    asyncio.run(main(parser.parse_args()))
@@ -3,6 +3,7 @@
 
 SQLAlchemy 모델을 기반으로 데이터베이스 테이블을 생성합니다.
 개발 환경에서만 사용하세요. 프로덕션에서는 Alembic 마이그레이션을 사용합니다.
+(backend 디렉토리에서 alembic upgrade head, migrations/ 참고)
 
 사용법:
     python -m app.scripts.create_tables
@@ -21,6 +22,10 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from app.db.base import Base
 from app.core.config import settings
 from app.models.account import Account  # 모든 모델 import
+from app.models.location import State  # noqa: F401
+from app.models.apartment import Apartment  # noqa: F401
+from app.models.transaction import Transaction  # noqa: F401
+from app.models.transaction_stat import TransactionMonthlyStat  # noqa: F401
 
 
 async def create_tables():
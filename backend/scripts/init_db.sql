@@ -30,6 +30,11 @@ CREATE TABLE IF NOT EXISTS accounts (
 CREATE INDEX IF NOT EXISTS idx_accounts_clerk_user_id ON accounts(clerk_user_id);
 CREATE INDEX IF NOT EXISTS idx_accounts_email ON accounts(email);
 CREATE INDEX IF NOT EXISTS idx_accounts_is_deleted ON accounts(is_deleted);
+-- 소프트 삭제되지 않은 계정 조회용 부분 인덱스 (운영 DB는 alembic upgrade head로 생성)
+CREATE INDEX IF NOT EXISTS idx_accounts_clerk_user_id_active ON accounts(clerk_user_id) WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_accounts_email_active ON accounts(email) WHERE is_deleted = FALSE;
+-- 관리자 계정 목록 커서 페이지네이션 (created_at, account_id 내림차순)
+CREATE INDEX IF NOT EXISTS idx_accounts_created_at_account_id ON accounts(created_at DESC, account_id DESC) WHERE is_deleted = FALSE;
 
 -- 코멘트 추가
 COMMENT ON TABLE accounts IS '사용자 계정 테이블 (Clerk 인증 사용)';
@@ -37,11 +42,119 @@ COMMENT ON COLUMN accounts.clerk_user_id IS 'Clerk 사용자 ID (유니크)';
 COMMENT ON COLUMN accounts.email IS '이메일 주소 (유니크)';
 COMMENT ON COLUMN accounts.is_deleted IS '소프트 삭제 여부';
 
+-- ============================================================
+-- STATES 테이블 (지역)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS states (
+    region_id SERIAL PRIMARY KEY,
+    region_name VARCHAR(20) NOT NULL,
+    region_code CHAR(10) UNIQUE NOT NULL,
+    city_name VARCHAR(40) NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+COMMENT ON COLUMN states.region_code IS '시도코드 2자리 + 시군구 3자리 + 동코드 5자리';
+
+-- ============================================================
+-- APARTMENTS 테이블 (아파트 단지)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS apartments (
+    apt_id SERIAL PRIMARY KEY,
+    region_id INTEGER NOT NULL REFERENCES states(region_id),
+    apt_name VARCHAR(100) NOT NULL,
+    road_address VARCHAR(200) NOT NULL,
+    jibun_address VARCHAR(200) NOT NULL,
+    zip_code CHAR(5),
+    code_sale_nm VARCHAR(20),
+    code_heat_nm VARCHAR(20),
+    total_household_cnt INTEGER NOT NULL,
+    total_building_cnt INTEGER,
+    highest_floor INTEGER,
+    use_approval_date DATE,
+    total_parking_cnt INTEGER,
+    builder_name VARCHAR(100),
+    developer_name VARCHAR(100),
+    manage_type VARCHAR(20),
+    hallway_type VARCHAR(20),
+    geometry GEOMETRY(POINT, 4326) NOT NULL,
+    kapt_code VARCHAR(20) NOT NULL,
+    subway_time VARCHAR(100),
+    subway_line VARCHAR(100),
+    subway_station VARCHAR(100),
+    education_facility VARCHAR(100),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+-- 지도 뷰포트 조회 (geometry && ST_MakeEnvelope)
+CREATE INDEX IF NOT EXISTS idx_apartments_geometry_active ON apartments USING GIST (geometry) WHERE is_deleted = FALSE;
+-- 주변 단지 반경 / 거리순 조회 (geometry::geography, ST_DWithin / <->)
+CREATE INDEX IF NOT EXISTS idx_apartments_geography_active ON apartments USING GIST ((geometry::geography)) WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_apartments_region_id_active ON apartments(region_id) WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_apartments_kapt_code_active ON apartments(kapt_code) WHERE is_deleted = FALSE;
+
+-- ============================================================
+-- TRANSACTIONS 테이블 (실거래, 금액 단위: 만원)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS transactions (
+    trans_id SERIAL PRIMARY KEY,
+    apt_id INTEGER NOT NULL REFERENCES apartments(apt_id),
+    trans_type VARCHAR(10) NOT NULL,
+    rent_type VARCHAR(10),
+    trans_price INTEGER,
+    deposit_price INTEGER,
+    monthly_rent INTEGER,
+    exclusive_area NUMERIC(7, 2) NOT NULL,
+    floor INTEGER NOT NULL,
+    building_num VARCHAR(10),
+    unit_num VARCHAR(10),
+    deal_date DATE NOT NULL,
+    contract_date DATE,
+    is_renewal_right BOOLEAN,
+    is_canceled BOOLEAN NOT NULL DEFAULT FALSE,
+    cancel_date DATE,
+    data_source VARCHAR(50) NOT NULL DEFAULT '국토부실거래가',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+-- 아파트별 최근 거래 (apt_id, deal_date 내림차순)
+CREATE INDEX IF NOT EXISTS idx_transactions_apt_id_deal_date_active ON transactions(apt_id, deal_date DESC) WHERE is_deleted = FALSE;
+CREATE INDEX IF NOT EXISTS idx_transactions_deal_date_active ON transactions(deal_date DESC) WHERE is_deleted = FALSE;
+
+-- ============================================================
+-- 실거래 월별 집계 (transactions 파생, app/services/monthly_stats.py가 갱신)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS transaction_monthly_stats (
+    apt_id INTEGER NOT NULL REFERENCES apartments(apt_id),
+    month DATE NOT NULL,
+    trans_type VARCHAR(10) NOT NULL,
+    area_bucket SMALLINT NOT NULL,
+    transaction_count INTEGER NOT NULL,
+    avg_price DOUBLE PRECISION NOT NULL,
+    median_price DOUBLE PRECISION NOT NULL,
+    min_price INTEGER NOT NULL,
+    max_price INTEGER NOT NULL,
+    avg_price_per_pyeong DOUBLE PRECISION NOT NULL,
+    median_price_per_pyeong DOUBLE PRECISION NOT NULL,
+    min_price_per_pyeong DOUBLE PRECISION NOT NULL,
+    max_price_per_pyeong DOUBLE PRECISION NOT NULL,
+    avg_monthly_rent DOUBLE PRECISION,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (apt_id, month, trans_type, area_bucket)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transaction_monthly_stats_month ON transaction_monthly_stats(month, trans_type, area_bucket);
+
 -- ============================================================
 -- 완료 메시지
 -- ============================================================
 DO $$
 BEGIN
     RAISE NOTICE '데이터베이스 초기화 완료!';
-    RAISE NOTICE 'accounts 테이블이 생성되었습니다.';
+    RAISE NOTICE 'accounts, states, apartments, transactions, transaction_monthly_stats 테이블이 생성되었습니다.';
 END $$;
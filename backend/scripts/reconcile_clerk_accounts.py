@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Clerk ↔ accounts 동기화(reconciliation) 스크립트
+
+Clerk 전체 사용자를 페이지 단위로 가져와서 accounts 테이블과 비교하고,
+추가/변경/소프트 삭제를 배치로 반영합니다. 중단되면 같은 명령으로 이어서 실행됩니다.
+
+사용법:
+    python scripts/reconcile_clerk_accounts.py
+    python scripts/reconcile_clerk_accounts.py --dry-run
+    python scripts/reconcile_clerk_accounts.py --concurrency 8 --no-delete
+    python scripts/reconcile_clerk_accounts.py --reset   # 체크포인트 무시하고 처음부터
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.clerk_client import get_clerk_client, close_clerk_client
+from app.db.session import engine
+from app.services.clerk_reconcile import Checkpoint, ClerkReconciler
+
+
+async def main(args):
+    """동기화 실행"""
+    if args.reset:
+        Checkpoint.remove(args.checkpoint)
+    
+    reconciler = ClerkReconciler(
+        get_clerk_client(),
+        page_size=args.page_size,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        apply_deletes=not args.no_delete,
+        dry_run=args.dry_run
+    )
+    
+    try:
+        stats = await reconciler.run()
+    finally:
+        await close_clerk_client()
+        await engine.dispose()
+    
+    print()
+    print("=" * 50)
+    print(f"✅ {'[DRY RUN] ' if args.dry_run else ''}동기화 완료 ({stats.elapsed:.1f}s)")
+    print(f"   {stats.summary()}")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clerk ↔ accounts 동기화")
+    parser.add_argument("--page-size", type=int, default=500, help="Clerk 페이지 크기 (최대 500)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 가져올 페이지 수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="upsert 배치 크기")
+    parser.add_argument("--checkpoint", default="reconcile_clerk_accounts.checkpoint.json", help="체크포인트 파일")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 실행")
+    parser.add_argument("--no-delete", action="store_true", help="Clerk에 없는 계정을 삭제하지 않음")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 결과만 계산")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main(args))
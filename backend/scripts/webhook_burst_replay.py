@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Clerk 웹훅 burst replay 하네스
+
+Clerk 대량 가져오기(bulk import) 때처럼 웹훅이 몰리는 상황을 재현해서
+웹훅 엔드포인트의 접수 처리량과, 큐 모드일 때 워커까지의 전체 처리량을 측정합니다.
+
+- 이벤트는 합성하거나(--events, --users) NDJSON 파일에서 읽습니다(--file).
+  파일 형식: 한 줄에 {"svix_id": "...", "payload": {Clerk 웹훅 본문}}
+- 합성 이벤트에는 Svix 재전송을 흉내낸 중복 svix_id가 섞입니다(--duplicate-rate).
+- --wait-drain을 주면 Redis 컨슈머 그룹의 lag/pending이 0이 될 때까지 기다립니다.
+
+사용법:
+    python scripts/webhook_burst_replay.py --url http://localhost:8000/api/v1/auth/webhook \\
+        --events 5000 --users 2000 --concurrency 100 --wait-drain
+
+⚠️ 대상 서버의 DB에 합성 사용자(burst_*@example.com)가 생성됩니다. 개발 환경에서만 사용하세요.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import List, Tuple
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+import httpx
+
+
+def synthesize_events(
+    events: int,
+    users: int,
+    duplicate_rate: float,
+    seed: int = 42
+) -> List[Tuple[str, dict]]:
+    """
+    합성 웹훅 이벤트 생성
+
+    사용자마다 user.created가 먼저 오고, 이후 user.updated / user.deleted가 섞여서 옵니다.
+    """
+    rng = random.Random(seed)
+    created = set()
+    result: List[Tuple[str, dict]] = []
+
+    while len(result) < events:
+        user_no = rng.randrange(users)
+        clerk_user_id = f"user_burst_{user_no:07d}"
+        if clerk_user_id not in created:
+            event_type = "user.created"
+            created.add(clerk_user_id)
+        else:
+            event_type = "user.deleted" if rng.random() < 0.05 else "user.updated"
+
+        if event_type == "user.deleted":
+            data = {"id": clerk_user_id, "deleted": True}
+        else:
+            data = {
+                "id": clerk_user_id,
+                "email_addresses": [
+                    {"id": f"idn_{user_no}", "email_address": f"burst_{user_no}@example.com"}
+                ],
+                "first_name": "버스트",
+                "last_name": str(rng.randrange(1000)),
+                "image_url": None,
+                "username": None
+            }
+
+        svix_id = f"msg_{uuid.uuid4().hex}"
+        result.append((svix_id, {"type": event_type, "data": data}))
+
+        # Svix 재전송 흉내 (같은 svix_id로 한 번 더)
+        if rng.random() < duplicate_rate and len(result) < events:
+            result.append((svix_id, {"type": event_type, "data": data}))
+
+    return result
+
+
+def load_events(path: str) -> List[Tuple[str, dict]]:
+    """NDJSON 파일에서 녹화된 웹훅 이벤트 읽기"""
+    result = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                result.append((record["svix_id"], record["payload"]))
+    return result
+
+
+async def replay(
+    url: str,
+    events: List[Tuple[str, dict]],
+    concurrency: int
+) -> Tuple[float, List[float], int]:
+    """
+    이벤트를 최대 concurrency개씩 동시에 전송
+
+    Returns:
+        (총 소요 시간, 요청별 지연시간 목록, 실패 수)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+
+        async def send(svix_id: str, payload: dict):
+            nonlocal failures
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            headers = {
+                "content-type": "application/json",
+                "svix-id": svix_id,
+                "svix-timestamp": str(int(time.time())),
+                "svix-signature": "v1,burst-replay"
+            }
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, content=body, headers=headers)
+                    if response.status_code >= 300:
+                        failures += 1
+                except httpx.HTTPError:
+                    failures += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[send(svix_id, payload) for svix_id, payload in events])
+        elapsed = time.perf_counter() - started
+
+    return elapsed, latencies, failures
+
+
+async def wait_drain(redis_url: str, timeout: float) -> float:
+    """
+    컨슈머 그룹이 스트림을 모두 처리할 때까지 대기
+
+    Returns:
+        대기 시간 (초)
+    """
+    import redis.asyncio as aioredis
+    from app.core.config import settings
+
+    redis = aioredis.Redis.from_url(redis_url, decode_responses=True)
+    started = time.perf_counter()
+    try:
+        while time.perf_counter() - started < timeout:
+            groups = await redis.xinfo_groups(settings.WEBHOOK_STREAM_KEY)
+            group = next((g for g in groups if g["name"] == settings.WEBHOOK_CONSUMER_GROUP), None)
+            if group is not None and not group.get("lag") and not group.get("pending"):
+                break
+            await asyncio.sleep(0.2)
+    finally:
+        await redis.aclose()
+    return time.perf_counter() - started
+
+
+def percentile(values: List[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def main(args):
+    if args.file:
+        events = load_events(args.file)
+    else:
+        events = synthesize_events(args.events, args.users, args.duplicate_rate)
+
+    print(f"📦 이벤트 {len(events)}건 전송 (동시성 {args.concurrency}) → {args.url}")
+    elapsed, latencies, failures = await replay(args.url, events, args.concurrency)
+
+    print(f"✅ 접수 완료: {elapsed:.2f}s, {len(events) / elapsed:,.0f} req/s, 실패 {failures}건")
+    print(
+        f"   지연시간 p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.1f}ms "
+        f"max={max(latencies) * 1000:.1f}ms"
+    )
+
+    if args.wait_drain:
+        from app.core.config import settings
+        drain = await wait_drain(args.redis_url or settings.REDIS_URL, args.drain_timeout)
+        total = elapsed + drain
+        print(f"🏁 워커 처리 완료까지: {total:.2f}s, {len(events) / total:,.0f} events/s (전송 후 대기 {drain:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clerk 웹훅 burst replay 하네스")
+    parser.add_argument("--url", default="http://localhost:8000/api/v1/auth/webhook")
+    parser.add_argument("--file", help="녹화된 웹훅 NDJSON 파일")
+    parser.add_argument("--events", type=int, default=5000, help="합성 이벤트 수")
+    parser.add_argument("--users", type=int, default=2000, help="합성 사용자 수")
+    parser.add_argument("--duplicate-rate", type=float, default=0.05, help="중복 svix_id 비율")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--wait-drain", action="store_true", help="워커가 큐를 비울 때까지 대기")
+    parser.add_argument("--drain-timeout", type=float, default=300.0)
+    parser.add_argument("--redis-url", help="기본값: settings.REDIS_URL")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Clerk 웹훅 큐 워커
+
+Redis Stream(settings.WEBHOOK_STREAM_KEY)에 쌓인 웹훅 이벤트를 배치로 DB에 반영합니다.
+웹훅 엔드포인트가 큐 모드(WEBHOOK_QUEUE_ENABLED=true)일 때 함께 실행하세요.
+
+⚠️ 사용자별 이벤트 순서를 지키기 위해 워커는 한 개만 실행합니다.
+   컨슈머 이름(--consumer, 기본 WEBHOOK_CONSUMER_NAME)은 재시작해도 같게 유지하세요.
+   이전 실행에서 ACK하지 못한 메시지를 이어서 처리합니다.
+
+사용법:
+    python scripts/webhook_worker.py
+    python scripts/webhook_worker.py --batch-size 500
+    python scripts/webhook_worker.py --consumer worker-a
+"""
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+from pathlib import Path
+
+# 프로젝트 루트(backend)를 path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.redis import get_redis, close_redis
+from app.db.session import engine
+from app.services.webhook_queue import WebhookIngestWorker
+
+
+async def main(batch_size: int = None, consumer: str = None):
+    """워커 실행 (SIGINT/SIGTERM 시 현재 배치 처리 후 종료)"""
+    worker = WebhookIngestWorker(get_redis(), batch_size=batch_size, consumer=consumer)
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            # Windows에서는 signal handler를 지원하지 않음 (Ctrl+C로 종료)
+            pass
+    
+    try:
+        await worker.run()
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clerk 웹훅 큐 워커")
+    parser.add_argument("--batch-size", type=int, default=None, help="한 번에 처리할 이벤트 수")
+    parser.add_argument("--consumer", default=None, help="컨슈머 이름 (기본: WEBHOOK_CONSUMER_NAME)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main(batch_size=args.batch_size, consumer=args.consumer))
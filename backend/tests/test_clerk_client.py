@@ -0,0 +1,263 @@
+"""
+ClerkAPIClient 테스트
+
+Clerk 대신 httpx.MockTransport로 만든 로컬 stub 서버를 사용합니다.
+"""
+import asyncio
+
+import httpx
+
+from app.core import clerk_client as clerk_client_module
+from app.core.clerk_client import ClerkAPIClient
+
+
+def clerk_user(user_id: str) -> dict:
+    return {
+        "id": user_id,
+        "email_addresses": [{"email_address": f"{user_id}@example.com", "verification": {"status": "verified"}}],
+        "first_name": "길동",
+        "last_name": "홍",
+        "username": None,
+        "image_url": None
+    }
+
+
+class StubClerk:
+    """
+    Clerk Backend API stub
+
+    GET /users/{id}: users에 있으면 200, 없으면 404
+    gate가 있으면 응답 전에 gate가 열릴 때까지 기다립니다. (진행 중 요청 재현용)
+    """
+
+    def __init__(self, users=(), gate: asyncio.Event = None):
+        self.users = {user_id: clerk_user(user_id) for user_id in users}
+        self.gate = gate
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            else:
+                await asyncio.sleep(0.01)
+            user_id = request.url.path.rsplit("/", 1)[-1]
+            if user_id not in self.users:
+                return httpx.Response(404, json={"errors": [{"code": "resource_not_found"}]})
+            return httpx.Response(200, json=self.users[user_id])
+        finally:
+            self.active -= 1
+
+    def client(self, **kwargs) -> ClerkAPIClient:
+        return ClerkAPIClient(
+            "sk_test_stub",
+            base_url="http://clerk.stub/v1",
+            transport=httpx.MockTransport(self.handler),
+            **kwargs
+        )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_get_user_normalizes_and_sends_secret_key():
+    seen_headers = []
+    stub = StubClerk(users=["user_1"])
+
+    async def handler(request):
+        seen_headers.append(request.headers["Authorization"])
+        return await stub.handler(request)
+
+    async def scenario():
+        client = ClerkAPIClient("sk_test_stub", base_url="http://clerk.stub/v1", transport=httpx.MockTransport(handler))
+        try:
+            return await client.get_user("user_1")
+        finally:
+            await client.close()
+
+    user = asyncio.run(scenario())
+    assert user["email"] == "user_1@example.com"
+    assert user["nickname"] == "길동 홍"
+    assert seen_headers == ["Bearer sk_test_stub"]
+
+
+def test_cache_hit_and_expiry(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(clerk_client_module, "time", clock)
+    stub = StubClerk(users=["user_1"])
+
+    async def scenario():
+        client = stub.client(cache_ttl=60)
+        try:
+            await client.get_user("user_1")
+            clock.now += 59
+            await client.get_user("user_1")
+            assert len(stub.requests) == 1  # TTL 안: 캐시 hit
+
+            clock.now += 2
+            await client.get_user("user_1")
+            assert len(stub.requests) == 2  # TTL 지남: 다시 조회
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_cache_disabled_and_invalidate():
+    stub = StubClerk(users=["user_1"])
+
+    async def scenario():
+        no_cache = stub.client(cache_ttl=0)
+        cached = stub.client(cache_ttl=60)
+        try:
+            await no_cache.get_user("user_1")
+            await no_cache.get_user("user_1")
+            assert len(stub.requests) == 2
+
+            await cached.get_user("user_1")
+            cached.invalidate("user_1")
+            await cached.get_user("user_1")
+            assert len(stub.requests) == 4
+        finally:
+            await no_cache.close()
+            await cached.close()
+
+    asyncio.run(scenario())
+
+
+def test_concurrency_is_bounded():
+    users = [f"user_{i}" for i in range(20)]
+    stub = StubClerk(users=users)
+
+    async def scenario():
+        client = stub.client(max_concurrency=3)
+        try:
+            results = await asyncio.gather(*(client.get_user(user_id) for user_id in users))
+        finally:
+            await client.close()
+        return results
+
+    results = asyncio.run(scenario())
+    assert [user["id"] for user in results] == users
+    assert len(stub.requests) == 20
+    assert stub.max_active == 3
+
+
+def test_single_flight_deduplicates_concurrent_lookups():
+    stub = StubClerk(users=["user_1"])
+
+    async def scenario():
+        client = stub.client(cache_ttl=0)  # 캐시 없이도 동시 조회는 한 번으로 합쳐짐
+        try:
+            return await asyncio.gather(*(client.get_user("user_1") for _ in range(50)))
+        finally:
+            await client.close()
+
+    results = asyncio.run(scenario())
+    assert len(stub.requests) == 1
+    assert all(user == results[0] for user in results)
+
+
+def test_not_found_returns_none():
+    stub = StubClerk(users=[])
+
+    async def scenario():
+        client = stub.client()
+        try:
+            assert await client.get_user("user_missing") is None
+            # 없는 사용자는 캐시하지 않음
+            assert await client.get_user("user_missing") is None
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    assert len(stub.requests) == 2
+
+
+def test_cancelled_caller_does_not_cancel_inflight_request():
+    async def scenario():
+        gate = asyncio.Event()
+        stub = StubClerk(users=["user_1"], gate=gate)
+        client = stub.client(cache_ttl=60)
+        try:
+            first = asyncio.create_task(client.get_user("user_1"))
+            second = asyncio.create_task(client.get_user("user_1"))
+            await asyncio.sleep(0.01)
+            assert stub.active == 1
+
+            # 먼저 기다리던 호출자가 취소되어도 진행 중인 요청은 계속됨
+            first.cancel()
+            await asyncio.sleep(0)
+            assert first.cancelled()
+
+            gate.set()
+            user = await second
+            assert user["id"] == "user_1"
+            assert len(stub.requests) == 1
+
+            # 요청 결과가 캐시에 들어가고 inflight 목록에서 빠짐
+            assert await client.get_user("user_1") == user
+            assert len(stub.requests) == 1
+            assert client._inflight == {}
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_cancel_only_caller_still_completes_request():
+    async def scenario():
+        gate = asyncio.Event()
+        stub = StubClerk(users=["user_1"], gate=gate)
+        client = stub.client(cache_ttl=60)
+        try:
+            caller = asyncio.create_task(client.get_user("user_1"))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            await asyncio.sleep(0)
+
+            gate.set()
+            await asyncio.sleep(0.01)
+            assert client._inflight == {}
+            assert await client.get_user("user_1") is not None
+            assert len(stub.requests) == 1
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_server_error_raises_and_is_not_cached():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=clerk_user("user_1"))
+
+    async def scenario():
+        client = ClerkAPIClient("sk_test_stub", base_url="http://clerk.stub/v1", transport=httpx.MockTransport(handler))
+        try:
+            try:
+                await client.get_user("user_1")
+            except httpx.HTTPStatusError as e:
+                assert e.response.status_code == 503
+            else:
+                raise AssertionError("503 응답은 예외여야 합니다")
+            assert (await client.get_user("user_1"))["id"] == "user_1"
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
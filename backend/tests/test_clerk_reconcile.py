@@ -0,0 +1,293 @@
+"""
+Clerk ↔ accounts 동기화 테스트
+
+Clerk는 httpx.MockTransport stub(GET /users, /users/count, /users/{id})으로,
+accounts 테이블은 메모리 딕셔너리로 대신합니다.
+"""
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+from app.core.clerk_client import ClerkAPIClient
+from app.services import clerk_reconcile
+from app.services.clerk_reconcile import Checkpoint, ClerkReconciler
+
+
+def clerk_user(index: int, email: Optional[str] = None) -> dict:
+    return {
+        "id": f"user_{index:05d}",
+        "email_addresses": [{"email_address": email or f"u{index}@example.com", "verification": {"status": "verified"}}],
+        "first_name": None,
+        "last_name": None,
+        "username": f"nick{index}",
+        "image_url": None
+    }
+
+
+class StubClerk:
+    """
+    Clerk 사용자 목록 stub
+
+    failures: 요청 키("offset=100", "user=user_00001", "count")별로 먼저 돌려줄 상태 코드 목록
+    """
+
+    def __init__(self, users: List[dict]):
+        self.users = users
+        self.hidden: Dict[str, dict] = {}  # 목록에는 없지만 개별 조회는 되는 사용자
+        self.failures: Dict[str, List[int]] = {}
+        self.page_offsets: List[int] = []
+        self.user_lookups: List[str] = []
+        self.active_lookups = 0
+        self.max_active_lookups = 0
+
+    def _fail(self, key: str) -> Optional[httpx.Response]:
+        statuses = self.failures.get(key)
+        if statuses:
+            return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"} if statuses else {})
+        return None
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/users/count"):
+            return self._fail("count") or httpx.Response(200, json={"total_count": len(self.users)})
+        if path.endswith("/users"):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            failure = self._fail(f"offset={offset}")
+            if failure is not None:
+                return failure
+            self.page_offsets.append(offset)
+            return httpx.Response(200, json=self.users[offset:offset + limit])
+
+        user_id = path.rsplit("/", 1)[-1]
+        self.user_lookups.append(user_id)
+        self.active_lookups += 1
+        self.max_active_lookups = max(self.max_active_lookups, self.active_lookups)
+        try:
+            await asyncio.sleep(0.005)
+            failure = self._fail(f"user={user_id}")
+            if failure is not None:
+                return failure
+            user = next((u for u in self.users if u["id"] == user_id), None) or self.hidden.get(user_id)
+            return httpx.Response(200, json=user) if user else httpx.Response(404)
+        finally:
+            self.active_lookups -= 1
+
+    def client(self) -> ClerkAPIClient:
+        return ClerkAPIClient(
+            "sk_test_stub",
+            base_url="http://clerk.stub/v1",
+            transport=httpx.MockTransport(self.handler),
+            max_concurrency=100,
+            cache_ttl=0
+        )
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class FakeAccounts:
+    """accounts 테이블 대신 쓰는 clerk_user_id → 행 딕셔너리"""
+
+    def __init__(self):
+        self.rows: Dict[str, dict] = {}
+        self.upsert_calls = 0
+        self.fail_ids = set()
+
+    def seed(self, clerk_user_id: str, email: str, nickname: str, is_deleted: bool = False):
+        self.rows[clerk_user_id] = {
+            "email": email, "nickname": nickname, "profile_image_url": None, "is_deleted": is_deleted
+        }
+
+    async def bulk_upsert_from_clerk(self, db, *, rows):
+        self.upsert_calls += 1
+        if any(row["clerk_user_id"] in self.fail_ids for row in rows):
+            raise RuntimeError("duplicate key value violates unique constraint")
+        for row in rows:
+            self.rows[row["clerk_user_id"]] = {
+                "email": row["email"], "nickname": row["nickname"],
+                "profile_image_url": row["profile_image_url"], "is_deleted": False
+            }
+        return len(rows)
+
+    async def bulk_soft_delete_by_clerk_ids(self, db, *, clerk_user_ids):
+        deleted = 0
+        for clerk_user_id in clerk_user_ids:
+            row = self.rows.get(clerk_user_id)
+            if row and not row["is_deleted"]:
+                row["is_deleted"] = True
+                deleted += 1
+        return deleted
+
+    async def load(self):
+        return {
+            clerk_user_id: (row["email"], row["nickname"], row["profile_image_url"], row["is_deleted"])
+            for clerk_user_id, row in self.rows.items()
+        }
+
+
+@pytest.fixture
+def accounts(monkeypatch) -> FakeAccounts:
+    fake = FakeAccounts()
+    monkeypatch.setattr(clerk_reconcile.account_crud, "bulk_upsert_from_clerk", fake.bulk_upsert_from_clerk)
+    monkeypatch.setattr(clerk_reconcile.account_crud, "bulk_soft_delete_by_clerk_ids", fake.bulk_soft_delete_by_clerk_ids)
+    return fake
+
+
+def make_reconciler(stub: StubClerk, accounts: FakeAccounts, **kwargs) -> ClerkReconciler:
+    options = {"page_size": 100, "concurrency": 3, "batch_size": 250, "retry_delay": 0}
+    options.update(kwargs)
+    reconciler = ClerkReconciler(stub.client(), session_factory=FakeSession, **options)
+    reconciler.load_accounts = accounts.load
+    return reconciler
+
+
+def run(reconciler: ClerkReconciler):
+    async def scenario():
+        try:
+            return await reconciler.run()
+        finally:
+            await reconciler.client.close()
+
+    return asyncio.run(scenario())
+
+
+def test_pages_through_all_users(accounts):
+    stub = StubClerk([clerk_user(i) for i in range(1234)])
+    stats = run(make_reconciler(stub, accounts))
+
+    assert stats.clerk_users == 1234
+    assert stats.inserted == 1234
+    assert len(accounts.rows) == 1234
+    # 마지막 묶음에서 끝을 넘는 빈 페이지까지 한 번씩만 조회
+    assert sorted(stub.page_offsets) == list(range(0, 1500, 100))
+    assert stats.rows_per_sec > 0
+
+
+def test_diff_inserts_updates_and_soft_deletes(accounts):
+    users = [clerk_user(0), clerk_user(1, email="changed@example.com"), clerk_user(2), clerk_user(3)]
+    users.append({**clerk_user(4), "email_addresses": []})  # 이메일 없음 → 건너뜀
+    stub = StubClerk(users)
+    stub.hidden["user_00008"] = clerk_user(8)  # 목록에서 밀렸지만 Clerk에는 있음
+
+    accounts.seed("user_00000", "u0@example.com", "nick0")  # 동일
+    accounts.seed("user_00001", "u1@example.com", "nick1")  # 이메일 변경
+    accounts.seed("user_00002", "u2@example.com", "nick2", is_deleted=True)  # 삭제됐던 계정 복구
+    accounts.seed("user_00008", "u8@example.com", "nick8")  # 개별 조회로 확인 → 유지
+    accounts.seed("user_00009", "u9@example.com", "nick9")  # Clerk에 없음 → 소프트 삭제
+
+    stats = run(make_reconciler(stub, accounts))
+
+    assert (stats.inserted, stats.updated, stats.unchanged, stats.skipped, stats.deleted) == (1, 2, 1, 1, 1)
+    assert accounts.rows["user_00001"]["email"] == "changed@example.com"
+    assert accounts.rows["user_00002"]["is_deleted"] is False
+    assert accounts.rows["user_00003"]["nickname"] == "nick3"
+    assert accounts.rows["user_00008"]["is_deleted"] is False
+    assert accounts.rows["user_00009"]["is_deleted"] is True
+    assert sorted(stub.user_lookups) == ["user_00008", "user_00009"]
+
+
+def test_dry_run_writes_nothing(accounts):
+    stub = StubClerk([clerk_user(i) for i in range(5)])
+    accounts.seed("user_00099", "gone@example.com", "gone")
+    stats = run(make_reconciler(stub, accounts, dry_run=True))
+
+    assert (stats.inserted, stats.deleted) == (5, 1)
+    assert list(accounts.rows) == ["user_00099"]
+    assert accounts.rows["user_00099"]["is_deleted"] is False
+
+
+def test_resumes_from_checkpoint(accounts, tmp_path):
+    checkpoint_path = str(tmp_path / "reconcile.json")
+    stub = StubClerk([clerk_user(i) for i in range(1000)])
+    stub.failures["offset=600"] = [400]  # 재시도하지 않는 오류로 중단
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(make_reconciler(stub, accounts, checkpoint_path=checkpoint_path))
+
+    checkpoint = Checkpoint.load(checkpoint_path)
+    assert checkpoint.next_offset == 600
+    assert checkpoint.stats["inserted"] == 600
+    assert len(checkpoint.load_seen(checkpoint_path)) == 600
+    assert os.path.getsize(Checkpoint.seen_path(checkpoint_path)) == checkpoint.seen_bytes
+
+    stub.page_offsets.clear()
+    stats = run(make_reconciler(stub, accounts, checkpoint_path=checkpoint_path))
+
+    assert min(stub.page_offsets) == 600  # 앞 페이지는 다시 가져오지 않음
+    assert stats.clerk_users == 1000
+    assert stats.inserted == 1000
+    assert len(accounts.rows) == 1000
+    assert not os.path.exists(checkpoint_path)
+    assert not os.path.exists(Checkpoint.seen_path(checkpoint_path))
+
+
+def test_seen_file_drops_entries_written_after_last_checkpoint(tmp_path):
+    checkpoint_path = str(tmp_path / "reconcile.json")
+    checkpoint = Checkpoint()
+    checkpoint.append_seen(checkpoint_path, ["user_a", "user_b"])
+    checkpoint.save(checkpoint_path)
+    # 체크포인트 저장 전에 죽은 묶음
+    Checkpoint(seen_bytes=checkpoint.seen_bytes).append_seen(checkpoint_path, ["user_c"])
+
+    loaded = Checkpoint.load(checkpoint_path)
+    assert loaded.load_seen(checkpoint_path) == {"user_a", "user_b"}
+    assert os.path.getsize(Checkpoint.seen_path(checkpoint_path)) == checkpoint.seen_bytes
+
+
+def test_retries_429_and_5xx(accounts):
+    stub = StubClerk([clerk_user(i) for i in range(250)])
+    stub.failures["count"] = [503]
+    stub.failures["offset=100"] = [429, 502]
+    stub.failures["user=user_00777"] = [429, 503]
+    accounts.seed("user_00777", "gone@example.com", "gone")
+
+    stats = run(make_reconciler(stub, accounts))
+
+    assert stats.inserted == 250
+    assert stats.deleted == 1
+    assert stub.failures == {"count": [], "offset=100": [], "user=user_00777": []}
+
+
+def test_retry_gives_up_after_max_attempts(accounts):
+    stub = StubClerk([clerk_user(i) for i in range(10)])
+    stub.failures["offset=0"] = [503, 503, 503]
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(make_reconciler(stub, accounts, retries=3))
+
+
+def test_confirm_missing_is_bounded(accounts):
+    stub = StubClerk([clerk_user(0)])
+    for i in range(1, 60):
+        accounts.seed(f"user_{i:05d}", f"u{i}@example.com", f"nick{i}")
+
+    stats = run(make_reconciler(stub, accounts, concurrency=4))
+
+    assert stats.deleted == 59
+    assert stub.max_active_lookups <= 4
+
+
+def test_failed_rows_are_not_counted(accounts):
+    stub = StubClerk([clerk_user(i) for i in range(5)])
+    accounts.fail_ids = {"user_00003"}
+
+    stats = run(make_reconciler(stub, accounts))
+
+    assert stats.inserted == 4
+    assert stats.failed == 1
+    assert "user_00003" not in accounts.rows
@@ -0,0 +1,75 @@
+"""
+CRUDBase 대량 처리 테스트
+
+DB 없이 PostgreSQL(asyncpg) 방언으로 컴파일한 문장과 세션 stub으로 확인합니다.
+"""
+import asyncio
+from typing import List
+
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.crud.account import account
+from app.crud.base import MAX_BIND_PARAMS
+from app.models.account import Account
+
+
+class FakeResult:
+    def __init__(self, rowcount: int):
+        self.rowcount = rowcount
+
+
+class FakeSession:
+    """실행한 문장을 기록하고, 기본키가 existing에 있는 행만 수정된 것으로 셈"""
+
+    def __init__(self, existing: set):
+        self.existing = existing
+        self.statements: List = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None, **kwargs):
+        compiled = stmt.compile(dialect=asyncpg.dialect())
+        self.statements.append(compiled)
+        ids = [value for key, value in compiled.params.items() if isinstance(value, int)]
+        return FakeResult(sum(1 for pk in ids if pk in self.existing))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_values_chunk_size_counts_union_of_keys_and_defaults():
+    rows = [{"clerk_user_id": "a", "email": "a@x"}] + [
+        {"clerk_user_id": "b", "email": "b@x", "nickname": "n", "profile_image_url": "p"}
+    ]
+    # 키 합집합 4개 + created_at/updated_at/is_deleted 3개
+    assert account._values_chunk_size(rows, 100000) == MAX_BIND_PARAMS // 7
+
+
+def test_values_chunk_size_respects_bind_limit():
+    rows = [{"clerk_user_id": f"u{i}", "email": f"u{i}@x"} for i in range(10)]
+    size = account._values_chunk_size(rows, 100000)
+    stmt = pg_insert(Account).values(rows[:1] * size)
+    assert len(stmt.compile(dialect=asyncpg.dialect()).params) <= MAX_BIND_PARAMS
+
+
+def test_update_many_returns_real_rowcount():
+    db = FakeSession(existing={1, 2})
+    rows = [
+        {"account_id": 1, "nickname": "a"},
+        {"account_id": 2, "nickname": "b"},
+        {"account_id": 99, "nickname": "gone"},
+    ]
+    assert asyncio.run(account.update_many(db, rows=rows)) == 2
+    assert len(db.statements) == 1
+    sql = str(db.statements[0])
+    assert "FROM (VALUES" in sql and "updated_at=" in sql
+
+
+def test_update_many_groups_by_columns_and_chunks():
+    db = FakeSession(existing=set(range(10)))
+    rows = [{"account_id": i, "nickname": f"n{i}"} for i in range(5)]
+    rows += [{"account_id": i, "email": f"{i}@x", "nickname": f"n{i}"} for i in range(5, 10)]
+    rows.append({"account_id": 3})  # 바꿀 컬럼이 없는 행은 건너뜀
+    assert asyncio.run(account.update_many(db, rows=rows, chunk_size=2)) == 10
+    assert len(db.statements) == 6
+    assert db.commits == 6
@@ -0,0 +1,33 @@
+"""
+대시보드 랭킹 엔드포인트 테스트
+
+Redis 장애가 500이 아니라 503 RANKINGS_UNAVAILABLE로 바뀌는지 확인합니다.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api.v1.endpoints import dashboard
+
+
+def test_redis_failure_returns_503(monkeypatch):
+    async def broken(*args, **kwargs):
+        raise RedisConnectionError("connection refused")
+
+    monkeypatch.setattr(dashboard, "get_rankings", broken)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(dashboard.get_dashboard_rankings(type="rise", region=None, period="1m", skip=0, limit=10))
+    assert exc.value.status_code == 503
+    assert exc.value.detail["code"] == "RANKINGS_UNAVAILABLE"
+
+
+def test_missing_build_is_still_404(monkeypatch):
+    async def empty(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(dashboard, "get_rankings", empty)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(dashboard.get_dashboard_rankings(type="rise", region=None, period="1m", skip=0, limit=10))
+    assert exc.value.status_code == 404
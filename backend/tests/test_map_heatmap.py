@@ -0,0 +1,33 @@
+"""
+가격 히트맵 엔드포인트 테스트
+
+Redis 장애가 500이 아니라 503 HEATMAP_UNAVAILABLE로 바뀌는지 확인합니다.
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.api.v1.endpoints import map as map_endpoints
+
+
+def test_redis_failure_returns_503(monkeypatch):
+    async def broken(*args, **kwargs):
+        raise RedisTimeoutError("timed out")
+
+    monkeypatch.setattr(map_endpoints, "get_heatmap", broken)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(map_endpoints.get_map_heatmap(type="price", period="3m", zoom=11, bounds=None))
+    assert exc.value.status_code == 503
+    assert exc.value.detail["code"] == "HEATMAP_UNAVAILABLE"
+
+
+def test_missing_build_is_still_404(monkeypatch):
+    async def empty(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(map_endpoints, "get_heatmap", empty)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(map_endpoints.get_map_heatmap(type="price", period="3m", zoom=11, bounds=None))
+    assert exc.value.status_code == 404
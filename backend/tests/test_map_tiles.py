@@ -0,0 +1,144 @@
+"""
+벡터 타일 캐시 테스트
+
+버전을 올린 직후 복제본이 뒤처져 있으면 Primary에서 그려서 캐시하는지 확인합니다.
+Redis와 세션은 메모리 stub으로 대신합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from app.services import map_tiles
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeSession:
+    """
+    replay_lsn까지 반영된 DB 세션 stub (None이면 Primary)
+
+    LSN은 비교하기 쉽게 정수 문자열을 씁니다.
+    """
+
+    def __init__(self, name: str, tile: bytes, replay_lsn: Optional[int] = None):
+        self.name = name
+        self.tile = tile
+        self.replay_lsn = replay_lsn
+        self.calls: List[str] = []
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if "pg_last_wal_replay_lsn" in sql:
+            self.calls.append("lsn")
+            if self.replay_lsn is None:
+                return FakeResult(True)
+            return FakeResult(self.replay_lsn >= int(params["lsn"]))
+        if "pg_current_wal_lsn" in sql:
+            return FakeResult("100")
+        self.calls.append("render")
+        return FakeResult(self.tile)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.ops = []
+
+    def set(self, key, value):
+        self.ops.append(("set", key, value))
+
+    def delete(self, key):
+        self.ops.append(("delete", key))
+
+    def incr(self, key):
+        self.ops.append(("incr", key))
+
+    async def execute(self):
+        results = []
+        for op, key, *rest in self.ops:
+            if op == "set":
+                self.redis.data[key] = str(rest[0]).encode()
+                results.append(True)
+            elif op == "delete":
+                results.append(int(self.redis.data.pop(key, None) is not None))
+            else:
+                value = int(self.redis.data.get(key, b"0")) + 1
+                self.redis.data[key] = str(value).encode()
+                results.append(value)
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: Dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def setup(monkeypatch, replicas: bool = True):
+    redis = FakeRedis()
+    primary = FakeSession("primary", b"fresh")
+    monkeypatch.setattr(map_tiles, "get_redis_bytes", lambda: redis)
+    monkeypatch.setattr(map_tiles, "AsyncReadOnlySessionLocal", lambda: primary)
+    monkeypatch.setattr(map_tiles.replica_router, "replicas", [object()] if replicas else [])
+    monkeypatch.setattr(map_tiles.settings, "MAP_TILE_MIN_ZOOM", 0)
+    return redis, primary
+
+
+def test_bump_records_primary_lsn(monkeypatch):
+    redis, _ = setup(monkeypatch)
+    assert asyncio.run(map_tiles.bump_dataset_version()) == 1
+    assert asyncio.run(map_tiles.get_dataset_state()) == (1, "100")
+
+
+def test_bump_without_replicas_clears_lsn(monkeypatch):
+    redis, _ = setup(monkeypatch, replicas=False)
+    redis.data[map_tiles.VERSION_LSN_KEY] = b"50"
+    asyncio.run(map_tiles.bump_dataset_version())
+    assert asyncio.run(map_tiles.get_dataset_state()) == (1, None)
+
+
+def test_lagging_replica_renders_on_primary(monkeypatch):
+    redis, primary = setup(monkeypatch)
+    asyncio.run(map_tiles.bump_dataset_version())
+    replica = FakeSession("replica", b"stale", replay_lsn=99)
+
+    assert asyncio.run(map_tiles.get_tile(replica, 10, 1, 1)) == b"fresh"
+    assert replica.calls == ["lsn"]
+    assert primary.calls == ["render"]
+    # 캐시에 들어간 것도 Primary에서 그린 타일
+    assert redis.data[map_tiles._cache_key(1, 10, 1, 1)] == b"fresh"
+
+
+def test_caught_up_replica_renders_itself(monkeypatch):
+    redis, primary = setup(monkeypatch)
+    asyncio.run(map_tiles.bump_dataset_version())
+    replica = FakeSession("replica", b"replica", replay_lsn=100)
+
+    assert asyncio.run(map_tiles.get_tile(replica, 10, 1, 1)) == b"replica"
+    assert replica.calls == ["lsn", "render"]
+    assert primary.calls == []
+    # 캐시 히트면 DB를 보지 않음
+    assert asyncio.run(map_tiles.get_tile(replica, 10, 1, 1)) == b"replica"
+    assert replica.calls == ["lsn", "render"]
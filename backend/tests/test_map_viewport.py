@@ -0,0 +1,143 @@
+"""
+지도 뷰포트 타일 캐시 테스트
+
+버전을 올린 직후 복제본이 뒤처져 있으면 없는 타일을 Primary에서 채우는지 확인합니다.
+"""
+import asyncio
+from typing import Dict, Optional
+
+from app.services import map_viewport
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeSession:
+    """replay_lsn까지 반영된 세션 stub (LSN은 정수 문자열)"""
+
+    def __init__(self, replay_lsn: Optional[int] = None):
+        self.replay_lsn = replay_lsn
+
+    async def execute(self, stmt, params=None):
+        if self.replay_lsn is None:
+            return FakeResult(True)
+        return FakeResult(self.replay_lsn >= int(params["lsn"]))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+
+    def set(self, key, value, ex=None):
+        self.redis.data[key] = value
+
+    async def execute(self):
+        return []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: Dict[str, bytes] = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+def setup(monkeypatch, replica: FakeSession):
+    redis = FakeRedis()
+    primary = FakeSession()
+    sessions = []
+
+    async def dataset_state():
+        return 3, "100"
+
+    async def load(db, zoom, tiles):
+        sessions.append(db)
+        source = "primary" if db is primary else "replica"
+        return {tile: {"items": [{"tile": list(tile), "source": source}], "truncated": False} for tile in tiles}
+
+    monkeypatch.setattr(map_viewport, "get_redis", lambda: redis)
+    monkeypatch.setattr(map_viewport, "get_dataset_state", dataset_state)
+    monkeypatch.setattr(map_viewport, "AsyncReadOnlySessionLocal", lambda: primary)
+    monkeypatch.setattr(map_viewport, "_load_marker_tiles", load)
+    return redis, primary, sessions
+
+
+def test_lagging_replica_fills_tiles_from_primary(monkeypatch):
+    replica = FakeSession(replay_lsn=99)
+    redis, primary, sessions = setup(monkeypatch, replica)
+
+    items, hits, _ = asyncio.run(map_viewport._get_tiles(replica, "marker", 15, [(1, 1), (1, 2)]))
+    assert hits == 0
+    assert sessions == [primary]
+    assert {item["source"] for item in items} == {"primary"}
+    assert len(redis.data) == 2
+
+
+def test_caught_up_replica_fills_tiles_itself(monkeypatch):
+    replica = FakeSession(replay_lsn=100)
+    redis, primary, sessions = setup(monkeypatch, replica)
+
+    items, _, _ = asyncio.run(map_viewport._get_tiles(replica, "marker", 15, [(1, 1)]))
+    assert sessions == [replica]
+    assert items[0]["source"] == "replica"
+
+    # 두 번째 요청은 캐시에서
+    _, hits, _ = asyncio.run(map_viewport._get_tiles(replica, "marker", 15, [(1, 1)]))
+    assert hits == 1
+    assert sessions == [replica]
+
+
+def test_marker_limit_is_per_tile_and_truncation_is_cached(monkeypatch):
+    redis = FakeRedis()
+    replica = FakeSession()
+    dense, sparse = (10, 10), (11, 10)
+    calls = []
+
+    async def dataset_state():
+        return 3, None
+
+    async def markers_in_tiles(db, *, bounds, tile_m, per_tile_limit):
+        calls.append(per_tile_limit)
+        rows = []
+        for tile, count in ((dense, 10), (sparse, 2)):
+            for i in range(min(count, per_tile_limit)):
+                rows.append({
+                    "apt_id": tile[0] * 100 + i,
+                    "location": {"lat": 0.0, "lng": 0.0},
+                    "total_household_cnt": 1000 - i,
+                    "tile": list(tile)
+                })
+        return rows
+
+    monkeypatch.setattr(map_viewport, "get_redis", lambda: redis)
+    monkeypatch.setattr(map_viewport, "get_dataset_state", dataset_state)
+    monkeypatch.setattr(map_viewport.settings, "MAP_TILE_MARKER_LIMIT", 3)
+    monkeypatch.setattr(map_viewport.apartment_crud, "get_markers_in_tiles", markers_in_tiles)
+
+    items, _, truncated = asyncio.run(map_viewport._get_tiles(replica, "marker", 16, [dense, sparse]))
+    assert calls == [4]
+    assert truncated
+    # 빽빽한 타일은 3개로 잘리고, 한산한 타일은 전부
+    assert sorted(item["apt_id"] for item in items) == [1000, 1001, 1002, 1100, 1101]
+    assert all("tile" not in item for item in items)
+
+    # 캐시에서 읽어도 잘림 표시가 유지됨
+    _, hits, truncated = asyncio.run(map_viewport._get_tiles(replica, "marker", 16, [dense]))
+    assert hits == 1 and truncated
+    _, hits, truncated = asyncio.run(map_viewport._get_tiles(replica, "marker", 16, [sparse]))
+    assert hits == 1 and not truncated
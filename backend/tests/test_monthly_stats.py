@@ -0,0 +1,149 @@
+"""
+월별 집계 부분 갱신 동시성 테스트
+
+같은 (apt_id, 월, 거래유형)을 두 훅이 동시에 다시 집계해도 기본키 충돌이 나지 않는지 확인합니다.
+PostgreSQL 대신 READ COMMITTED의 보이는 범위와 advisory lock만 흉내 내는 세션 stub을 씁니다.
+"""
+import asyncio
+from datetime import date
+from typing import Dict, List, Set
+
+import pytest
+
+from app.services import monthly_stats
+from app.services.monthly_stats import refresh_months
+
+KEYS = [(1, date(2026, 9, 1), "SALE"), (1, date(2026, 10, 1), "SALE"), (2, date(2026, 10, 1), "JEONSE")]
+
+
+class UniqueViolation(Exception):
+    pass
+
+
+class FakeResult:
+    def __init__(self, rowcount: int):
+        self.rowcount = rowcount
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.committed: Set[tuple] = set(KEYS)
+        self.locks: Dict[tuple, asyncio.Lock] = {}
+        self.lock_calls: List[List[int]] = []
+
+    def session(self) -> "FakeSession":
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, database: FakeDatabase):
+        self.database = database
+        self.deleted: Set[tuple] = set()
+        self.inserted: Set[tuple] = set()
+        self.held: List[asyncio.Lock] = []
+
+    @staticmethod
+    def _keys(params) -> List[tuple]:
+        return list(zip(params["apt_ids"], params["months"], params["trans_types"]))
+
+    def _others_pending(self) -> Set[tuple]:
+        return set().union(*(s.inserted for s in ACTIVE if s is not self)) if ACTIVE else set()
+
+    async def execute(self, stmt, params):
+        if stmt is monthly_stats._LOCK_KEYS_SQL:
+            self.database.lock_calls.append(list(params["lock_ids"]))
+            for lock_id in params["lock_ids"]:
+                lock = self.database.locks.setdefault((params["class_id"], lock_id), asyncio.Lock())
+                if lock in self.held:
+                    continue  # 같은 트랜잭션 안에서는 다시 잡아도 됨
+                await lock.acquire()
+                self.held.append(lock)
+            return FakeResult(len(params["lock_ids"]))
+        if stmt is monthly_stats._DELETE_KEYS_SQL:
+            # 커밋된 행만 보임 (다른 트랜잭션이 방금 넣은 행은 안 보임)
+            keys = set(self._keys(params)) & self.database.committed
+            self.deleted |= keys
+            await asyncio.sleep(0)
+            return FakeResult(len(keys))
+        if stmt is monthly_stats._INSERT_KEYS_SQL:
+            visible = (self.database.committed - self.deleted) | self._others_pending()
+            keys = set(self._keys(params))
+            if keys & visible:
+                raise UniqueViolation("duplicate key value violates unique constraint")
+            self.inserted |= keys
+            await asyncio.sleep(0)
+            return FakeResult(len(keys))
+        raise AssertionError(f"예상하지 못한 문장: {stmt}")
+
+    async def commit(self):
+        self.database.committed = (self.database.committed - self.deleted) | self.inserted
+        self.inserted = set()
+        self.deleted = set()
+        for lock in self.held:
+            lock.release()
+        self.held = []
+
+
+ACTIVE: List[FakeSession] = []
+
+
+async def run_hook(database: FakeDatabase, keys, chunk_size: int = 5000) -> None:
+    db = database.session()
+    ACTIVE.append(db)
+    try:
+        await refresh_months(db, keys, chunk_size=chunk_size)
+        await asyncio.sleep(0)
+        await db.commit()
+    finally:
+        ACTIVE.remove(db)
+
+
+def test_concurrent_refresh_of_same_months_does_not_conflict():
+    database = FakeDatabase()
+
+    async def scenario():
+        await asyncio.gather(run_hook(database, KEYS), run_hook(database, list(reversed(KEYS)), chunk_size=1))
+
+    asyncio.run(scenario())
+    assert database.committed == set(KEYS)
+    assert all(not lock.locked() for lock in database.locks.values())
+
+
+def test_without_lock_concurrent_refresh_conflicts():
+    """잠금을 건너뛰면 stub이 실제 경합(기본키 충돌)을 재현하는지 확인"""
+    database = FakeDatabase()
+
+    async def hook():
+        db = database.session()
+        original = db.execute
+
+        async def execute(stmt, params):
+            if stmt is monthly_stats._LOCK_KEYS_SQL:
+                return FakeResult(0)
+            return await original(stmt, params)
+
+        db.execute = execute
+        ACTIVE.append(db)
+        try:
+            await refresh_months(db, KEYS)
+            await asyncio.sleep(0)
+            await db.commit()
+        finally:
+            ACTIVE.remove(db)
+
+    async def scenario():
+        await asyncio.gather(hook(), hook())
+
+    with pytest.raises(UniqueViolation):
+        asyncio.run(scenario())
+
+
+def test_locks_are_taken_in_ascending_order_across_chunks():
+    database = FakeDatabase()
+    keys = [(apt_id, date(2026, month, 1), "SALE") for apt_id in range(1, 6) for month in (9, 10)]
+    asyncio.run(run_hook(database, keys, chunk_size=3))
+
+    lock_ids = [lock_id for call in database.lock_calls for lock_id in call]
+    assert len(database.lock_calls) == 4
+    assert lock_ids == sorted(lock_ids)
+    assert len(lock_ids) == len(keys)
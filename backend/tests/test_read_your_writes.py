@@ -0,0 +1,98 @@
+"""
+read-your-writes(Primary 고정) 테스트
+
+인증마다 실행되는 로그인 시각 기록은 사용자를 Primary에 고정하지 않고,
+실제 쓰기는 고정하는지 확인합니다. 세션 이벤트가 그대로 돌도록 SQLite 메모리 DB를 씁니다.
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.v1 import deps
+from app.models.account import Account
+
+
+class FakeRequest:
+    def __init__(self, token: str):
+        self.headers = {"authorization": f"Bearer {token}"}
+        self.client = SimpleNamespace(host="127.0.0.1")
+
+
+async def make_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Account.__table__.create)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as db:
+        db.add(Account(clerk_user_id="user_1", email="u1@example.com", nickname="u1"))
+        await db.commit()
+    return engine, factory
+
+
+def setup(monkeypatch, factory) -> List[str]:
+    marked: List[str] = []
+
+    async def mark_write(key: str) -> None:
+        marked.append(key)
+
+    async def verify(authorization: str):
+        return {"sub": "user_1"}
+
+    monkeypatch.setattr(deps, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(deps, "verify_clerk_token", verify)
+    monkeypatch.setattr(deps.replica_router, "replicas", [object()])
+    monkeypatch.setattr(deps.replica_router.sticky, "mark_write", mark_write)
+    return marked
+
+
+async def finish(dependency) -> None:
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+
+def test_authenticated_get_does_not_mark_sticky(monkeypatch):
+    async def scenario():
+        engine, factory = await make_factory()
+        marked = setup(monkeypatch, factory)
+
+        dependency = deps.get_db(FakeRequest("token"))
+        db = await dependency.__anext__()
+        user = await deps.get_current_user(
+            db=db,
+            credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+        )
+        await finish(dependency)
+
+        async with factory() as check:
+            last_login_at = await check.scalar(
+                select(Account.last_login_at).where(Account.clerk_user_id == "user_1")
+            )
+        await engine.dispose()
+        return user, marked, last_login_at
+
+    user, marked, last_login_at = asyncio.run(scenario())
+    assert user.clerk_user_id == "user_1"
+    assert last_login_at is not None
+    assert marked == []
+
+
+def test_real_write_marks_sticky(monkeypatch):
+    async def scenario():
+        engine, factory = await make_factory()
+        marked = setup(monkeypatch, factory)
+
+        dependency = deps.get_db(FakeRequest("token"))
+        db = await dependency.__anext__()
+        await db.execute(
+            update(Account).where(Account.clerk_user_id == "user_1").values(nickname="renamed")
+        )
+        await finish(dependency)
+        await engine.dispose()
+        return marked
+
+    assert len(asyncio.run(scenario())) == 1
@@ -0,0 +1,246 @@
+"""
+Clerk 웹훅 큐 워커 테스트
+
+Redis Stream은 아래 FakeStreamRedis(컨슈머 그룹 하나)로, DB 반영은 _apply 교체로 대신합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.services.webhook_queue import DEDUP_KEY_PREFIX, BatchPlan, WebhookIngestWorker, plan_batch
+
+STREAM = "test:webhooks"
+GROUP = "test-group"
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeStreamRedis"):
+        self.redis = redis
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.calls.append(("set", key, value))
+
+    def xadd(self, key, fields, **kwargs):
+        self.calls.append(("xadd", key, fields))
+
+    async def execute(self):
+        for call in self.calls:
+            if call[0] == "set":
+                self.redis.kv[call[1]] = call[2]
+            else:
+                self.redis.streams.setdefault(call[1], []).append((f"dead-{len(self.redis.streams.get(call[1], []))}", call[2]))
+        self.calls = []
+
+
+class FakeStreamRedis:
+    """XADD / XREADGROUP / XACK / XAUTOCLAIM / MGET만 흉내낸 Redis (컨슈머 그룹 하나)"""
+
+    def __init__(self):
+        self.kv: Dict[str, object] = {}
+        self.streams: Dict[str, List[Tuple[str, dict]]] = {}
+        self.delivered = 0  # 그룹이 마지막으로 전달한 위치
+        self.pel: Dict[str, str] = {}  # 메시지 ID → 컨슈머 (전달 순서 유지)
+        self.seq = 0
+
+    def add(self, fields: dict) -> str:
+        self.seq += 1
+        message_id = f"{self.seq}-0"
+        self.streams.setdefault(STREAM, []).append((message_id, fields))
+        return message_id
+
+    async def xgroup_create(self, *args, **kwargs):
+        return True
+
+    async def xreadgroup(self, group, consumer, streams, count=None, block=None):
+        (key, stream_id), = streams.items()
+        entries = self.streams.get(key, [])
+        if stream_id == ">":
+            batch = entries[self.delivered:self.delivered + count]
+            self.delivered += len(batch)
+            for message_id, _ in batch:
+                self.pel[message_id] = consumer
+        else:
+            by_id = dict(entries)
+            batch = [(mid, by_id.get(mid)) for mid, owner in self.pel.items() if owner == consumer][:count]
+        return [(key, batch)] if batch else []
+
+    async def xack(self, key, group, *message_ids):
+        return sum(self.pel.pop(message_id, None) is not None for message_id in message_ids)
+
+    async def xautoclaim(self, key, group, consumer, min_idle_time, start_id="0-0", count=None, justid=False):
+        claimed = [message_id for message_id, owner in self.pel.items() if owner != consumer]
+        for message_id in claimed:
+            self.pel[message_id] = consumer
+        return ["0-0", claimed, []]
+
+    async def mget(self, keys):
+        return [self.kv.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def event(svix_id: str, clerk_user_id: str, email: Optional[str] = None, event_type: str = "user.updated") -> dict:
+    return {
+        "svix_id": svix_id,
+        "type": event_type,
+        "clerk_user_id": clerk_user_id,
+        "email": email or f"{clerk_user_id}@example.com",
+        "nickname": "",
+        "profile_image_url": ""
+    }
+
+
+def make_worker(redis: FakeStreamRedis, consumer: Optional[str] = None) -> Tuple[WebhookIngestWorker, List[BatchPlan]]:
+    worker = WebhookIngestWorker(redis, stream_key=STREAM, group=GROUP, consumer=consumer, batch_size=10, block_ms=0)
+    applied: List[BatchPlan] = []
+
+    async def apply(plan: BatchPlan) -> None:
+        applied.append(plan)
+
+    worker._apply = apply
+    return worker, applied
+
+
+def integrity_error(message: str) -> IntegrityError:
+    return IntegrityError("INSERT INTO accounts ...", {}, Exception(message))
+
+
+@pytest.fixture(autouse=True)
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(settings, "WEBHOOK_RETRY_DELAY", 0)
+    monkeypatch.setattr(settings, "WEBHOOK_MAX_ATTEMPTS", 3)
+
+
+def test_plan_batch_keeps_last_event_per_user_and_sources():
+    messages = [
+        ("1-0", event("a", "user_1", event_type="user.created")),
+        ("2-0", event("b", "user_2")),
+        ("3-0", event("c", "user_1", email="new@example.com")),
+        ("4-0", event("a", "user_1")),  # 재전송 (같은 svix_id)
+        ("5-0", event("d", "user_2", event_type="user.deleted"))
+    ]
+    plan = plan_batch(messages, already_seen=set())
+    assert plan.upserts == [
+        {"clerk_user_id": "user_1", "email": "new@example.com", "nickname": None, "profile_image_url": None}
+    ]
+    assert plan.deletes == ["user_2"]
+    assert plan.duplicates == 1
+    assert plan.sources == {"user_1": [("1-0", "a"), ("3-0", "c")], "user_2": [("2-0", "b"), ("5-0", "d")]}
+
+
+def test_consumer_name_is_stable_across_restarts():
+    redis = FakeStreamRedis()
+    assert make_worker(redis)[0].consumer == make_worker(redis)[0].consumer == settings.WEBHOOK_CONSUMER_NAME
+
+
+def test_failed_user_is_not_acked_or_marked_seen_then_dead_lettered():
+    redis = FakeStreamRedis()
+    worker, _ = make_worker(redis)
+    redis.add(event("ok", "user_ok"))
+    bad_id = redis.add(event("bad", "user_bad"))
+
+    async def apply(plan: BatchPlan) -> None:
+        if any(row["clerk_user_id"] == "user_bad" for row in plan.upserts):
+            raise integrity_error("duplicate key value violates unique constraint accounts_email_key")
+
+    worker._apply = apply
+
+    async def scenario():
+        assert await worker.process(await worker._read(">")) is False
+        # 성공한 사용자만 ACK / 처리됨 표시
+        assert list(redis.pel) == [bad_id]
+        assert DEDUP_KEY_PREFIX + "ok" in redis.kv
+        assert DEDUP_KEY_PREFIX + "bad" not in redis.kv
+
+        # 재시도: WEBHOOK_MAX_ATTEMPTS(3)번째 실패에서 dead-letter로 옮기고 ACK
+        assert await worker.process(await worker._read("0")) is False
+        assert await worker.process(await worker._read("0")) is True
+
+    asyncio.run(scenario())
+    assert redis.pel == {}
+    assert DEDUP_KEY_PREFIX + "bad" not in redis.kv
+    dead = redis.streams[settings.WEBHOOK_DEAD_LETTER_KEY]
+    assert len(dead) == 1
+    assert dead[0][1]["source_id"] == bad_id
+    assert "unique constraint" in dead[0][1]["error"]
+    assert worker.stats["dead_lettered"] == 1
+
+
+def test_transient_error_leaves_whole_batch_pending():
+    redis = FakeStreamRedis()
+    worker, _ = make_worker(redis)
+    redis.add(event("a", "user_1"))
+    redis.add(event("b", "user_2"))
+
+    async def apply(plan: BatchPlan) -> None:
+        raise ConnectionError("connection reset by peer")
+
+    worker._apply = apply
+
+    async def scenario():
+        with pytest.raises(ConnectionError):
+            await worker.process(await worker._read(">"))
+
+    asyncio.run(scenario())
+    assert len(redis.pel) == 2
+    assert not any(key.startswith(DEDUP_KEY_PREFIX) for key in redis.kv)
+
+
+def test_run_retries_failed_batch_before_newer_events():
+    """일시 장애로 실패한 배치를 같은 사용자의 새 이벤트보다 먼저 다시 반영"""
+    redis = FakeStreamRedis()
+    worker, _ = make_worker(redis)
+    redis.add(event("a", "user_1", email="first@example.com"))
+    applied_emails = []
+    calls = {"n": 0}
+
+    async def apply(plan: BatchPlan) -> None:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            # 첫 반영 중 장애 + 그 사이 같은 사용자의 새 이벤트 도착
+            redis.add(event("b", "user_1", email="second@example.com"))
+            raise ConnectionError("server closed the connection")
+        applied_emails.extend(row["email"] for row in plan.upserts)
+        if len(applied_emails) == 2:
+            worker.stop()
+
+    worker._apply = apply
+    asyncio.run(asyncio.wait_for(worker.run(), timeout=5))
+    assert applied_emails == ["first@example.com", "second@example.com"]
+    assert redis.pel == {}
+
+
+def test_run_claims_pending_messages_of_other_consumer():
+    """다른 이름으로 실행됐다가 죽은 워커의 pending 메시지를 XAUTOCLAIM으로 이어서 처리"""
+    redis = FakeStreamRedis()
+    redis.add(event("a", "user_1"))
+
+    async def crashed_worker():
+        old_worker, _ = make_worker(redis, consumer="old-host-12345")
+        await old_worker._read(">")  # 읽기만 하고 ACK 전에 종료
+
+    asyncio.run(crashed_worker())
+    assert list(redis.pel.values()) == ["old-host-12345"]
+
+    worker, applied = make_worker(redis)
+
+    async def apply(plan: BatchPlan) -> None:
+        applied.append(plan)
+        worker.stop()
+
+    worker._apply = apply
+    asyncio.run(asyncio.wait_for(worker.run(), timeout=5))
+    assert [row["clerk_user_id"] for row in applied[0].upserts] == ["user_1"]
+    assert redis.pel == {}
+    assert worker.stats["claimed"] == 1
@@ -0,0 +1,104 @@
+"""
+Clerk 웹훅 서명 검증 테스트
+
+svix로 서명한 요청만 큐에 들어가고, 본문을 바꾸거나 서명이 없으면
+enqueue_webhook_event가 불리기 전에 401이 나는지 확인합니다.
+"""
+import base64
+from datetime import datetime, timezone
+from typing import List
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from svix.webhooks import Webhook
+
+from app.api.v1 import deps
+from app.api.v1.endpoints import auth as auth_endpoints
+
+SECRET = "whsec_" + base64.b64encode(b"test-webhook-secret-0123456789ab").decode()
+
+EVENT = {
+    "type": "user.deleted",
+    "data": {"id": "user_1", "email_addresses": []}
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    enqueued: List[dict] = []
+
+    async def enqueue(redis, *, svix_id, event_type, profile):
+        enqueued.append({"svix_id": svix_id, "type": event_type, "profile": profile})
+
+    async def no_db():
+        yield None
+
+    monkeypatch.setattr(auth_endpoints.settings, "CLERK_WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(auth_endpoints.settings, "WEBHOOK_QUEUE_ENABLED", True)
+    monkeypatch.setattr(auth_endpoints, "enqueue_webhook_event", enqueue)
+    monkeypatch.setattr(auth_endpoints, "get_redis", lambda: None)
+
+    app = FastAPI()
+    app.include_router(auth_endpoints.router)
+    app.dependency_overrides[deps.get_db] = no_db
+    with TestClient(app) as test_client:
+        test_client.enqueued = enqueued
+        yield test_client
+
+
+def signed_headers(body: bytes, msg_id: str = "msg_1") -> dict:
+    now = datetime.now(timezone.utc)
+    signature = Webhook(SECRET).sign(msg_id, now, body.decode())
+    return {
+        "svix-id": msg_id,
+        "svix-timestamp": str(int(now.timestamp())),
+        "svix-signature": signature,
+        "content-type": "application/json"
+    }
+
+
+def test_valid_signature_is_enqueued(client):
+    body = orjson.dumps(EVENT)
+    response = client.post("/webhook", content=body, headers=signed_headers(body))
+    assert response.status_code == 200
+    assert response.json()["data"]["queued"] is True
+    assert client.enqueued == [{
+        "svix_id": "msg_1",
+        "type": "user.deleted",
+        "profile": client.enqueued[0]["profile"]
+    }]
+
+
+def test_tampered_body_is_rejected_before_enqueue(client):
+    body = orjson.dumps(EVENT)
+    headers = signed_headers(body)
+    tampered = orjson.dumps({**EVENT, "data": {"id": "user_2", "email_addresses": []}})
+    response = client.post("/webhook", content=tampered, headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"]["code"] == "INVALID_WEBHOOK_SIGNATURE"
+    assert client.enqueued == []
+
+
+def test_forged_signature_is_rejected(client):
+    body = orjson.dumps(EVENT)
+    headers = signed_headers(body)
+    headers["svix-signature"] = "v1," + base64.b64encode(b"0" * 32).decode()
+    response = client.post("/webhook", content=body, headers=headers)
+    assert response.status_code == 401
+    assert client.enqueued == []
+
+
+def test_stale_timestamp_is_rejected(client):
+    body = orjson.dumps(EVENT)
+    old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    headers = {
+        "svix-id": "msg_1",
+        "svix-timestamp": str(int(old.timestamp())),
+        "svix-signature": Webhook(SECRET).sign("msg_1", old, body.decode()),
+        "content-type": "application/json"
+    }
+    response = client.post("/webhook", content=body, headers=headers)
+    assert response.status_code == 401
+    assert client.enqueued == []